@@ -38,11 +38,13 @@ def pytest_configure(config) -> None:
 
     config._inicache["cache_dir"] = str(run_root / "pytest-cache")
     os.environ["YTP_FILE_LOGGING"] = "false"
+    os.environ["YTP_EXTRACT_INFO_CACHE_TTL"] = "0"
 
 
 def pytest_unconfigure(config) -> None:
     del config
     os.environ.pop("YTP_FILE_LOGGING", None)
+    os.environ.pop("YTP_EXTRACT_INFO_CACHE_TTL", None)
     cleanup_test_run_root()
 
 
@@ -1,4 +1,3 @@
-import copy
 import json
 import re
 import time
@@ -21,6 +20,9 @@ if TYPE_CHECKING:
 
 LOG = get_logger()
 
+_UNTRACKED_FIELDS: tuple[str, ...] = ("_revision", "_serialized")
+"ItemDTO bookkeeping attributes for the serialization cache, never serialized themselves."
+
 
 @dataclass(kw_only=True)
 class Item:
@@ -419,19 +421,66 @@ class ItemDTO:
     _recomputed: bool = False
     _archive_file: str | None = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name not in _UNTRACKED_FIELDS:
+            object.__setattr__(self, "_revision", self.__dict__.get("_revision", 0) + 1)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Get the state of the item for pickling and copying, without the serialization cache.
+
+        Returns:
+            dict: The item state.
+
+        """
+        return {k: v for k, v in self.__dict__.items() if k not in _UNTRACKED_FIELDS}
+
+    def _encoded(self) -> str:
+        """
+        Get the compact JSON encoding of the item, re-encoding only if it changed since the last call.
+
+        Attribute assignments are tracked directly, the mutable ``options``, ``extras`` and ``sidecar``
+        dicts are compared against the snapshot taken when the cache was built to catch in-place edits.
+
+        Returns:
+            str: The JSON string, keys sorted.
+
+        """
+        revision: int = self.__dict__.get("_revision", 0)
+        cached: tuple | None = self.__dict__.get("_serialized")
+        if cached and cached[0] == revision and cached[1] == (self.options, self.extras, self.sidecar):
+            return cached[2]
+
+        item, _ = clean_item(self.__getstate__(), ItemDTO.removed_fields())
+        encoded: str = Encoder(sort_keys=True, separators=(",", ":")).encode(item)
+        snapshot: tuple = (item.get("options"), item.get("extras"), item.get("sidecar"))
+        object.__setattr__(self, "_serialized", (revision, snapshot, encoded))
+
+        return encoded
+
     def serialize(self) -> dict:
         """
         Serialize the item to a dictionary.
 
         Returns:
-            dict: The serialized item.
+            dict: The serialized item, a fresh copy the caller is free to modify.
+
+        """
+        return json.loads(self.encoded())
+
+    def encoded(self) -> str:
+        """
+        Get the compact JSON encoding of the item, for callers that send it on without modifying it.
+
+        Returns:
+            str: The JSON string, reused until the item changes.
 
         """
         if "finished" == self.status and not self._recomputed:
             self.archive_status()
 
-        item, _ = clean_item(self.__dict__.copy(), ItemDTO.removed_fields())
-        return item
+        return self._encoded()
 
     def json(self) -> str:
         """
@@ -447,17 +496,16 @@ class ItemDTO:
         """Convert this in-memory item to its persisted representation."""
         from app.features.downloads.models import DownloadModel
 
-        stored = copy.deepcopy(self)
-        stored_data = stored.serialize()
+        stored_data: dict = self.serialize()
         stored_data.pop("datetime", None)
-        if stored.status == "finished":
+        if self.status == "finished":
             stored_data.pop("live_in", None)
 
         return DownloadModel(
-            id=stored._id,
+            id=self._id,
             type=type_value,
-            url=stored.url,
-            data=json.loads(Encoder(sort_keys=True).encode(stored_data)),
+            url=self.url,
+            data=stored_data,
             created_at=datetime.now(UTC).replace(microsecond=0),
         )
 
@@ -699,6 +747,7 @@ class ItemDTO:
             "temp_path",
             "_recomputed",
             "_archive_file",
+            *_UNTRACKED_FIELDS,
         )
 
     def __post_init__(self):
@@ -2,23 +2,28 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, delete, func, or_, select
+from sqlalchemy import Integer, column, delete, func, literal, literal_column, or_, select, table, text, tuple_
 from sqlalchemy.dialects.sqlite import insert
 
 from app.features.core.models import utcnow
 from app.features.downloads.models import DownloadModel
 from app.library.logging import get_logger
+from app.library.metrics import MetricsRegistry
 from app.library.operations import Operation, matches_condition
+from app.library.Scheduler import Scheduler
 from app.library.Singleton import Singleton
+from app.library.sqlite_store import SqliteStore
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
     from contextlib import AbstractAsyncContextManager
 
     from aiohttp import web
-    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy import Select
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
     from sqlalchemy.sql.elements import ColumnElement
 
     from app.features.downloads.items import ItemDTO
@@ -26,6 +31,7 @@ if TYPE_CHECKING:
     SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
 
 LOG = get_logger()
+_PENDING_DOC = "Queued download writes not yet applied."
 
 
 def _status_clause(status_filter: str | None) -> ColumnElement[bool] | None:
@@ -40,6 +46,60 @@ def _status_clause(status_filter: str | None) -> ColumnElement[bool] | None:
     return path.in_(values) if values else None
 
 
+_SEARCH = table("history_search", column("rowid"))
+_SEARCH_RANK = func.bm25(literal_column("history_search"), 10.0, 4.0, 2.0, 2.0, 1.0)
+"Rank by BM25, weighting title matches above channel, url, filename and preset ones."
+
+
+async def rebuild_search_index(conn: AsyncConnection) -> None:
+    """Rebuild the history search index, as a full VACUUM may renumber the rowids it points to."""
+    await conn.execute(text("""INSERT INTO "history_search" ("history_search") VALUES ('rebuild')"""))
+
+
+def _search_expression(search: str | None) -> str | None:
+    # Quote every word so FTS5 syntax in user input is matched literally, and match words as prefixes.
+    terms: list[str] = [term.replace('"', '""') for term in (search or "").split()]
+    return " ".join(f'"{term}"*' for term in terms) or None
+
+
+def _filtered[T: Select](query: T, type_value: str, status_filter: str | None, search: str | None) -> T:
+    query = query.where(DownloadModel.type == type_value)
+    if (clause := _status_clause(status_filter)) is not None:
+        query = query.where(clause)
+    if search:
+        query = query.join(_SEARCH, _SEARCH.c.rowid == literal_column("history.rowid")).where(
+            literal_column("history_search").op("MATCH")(search)
+        )
+    return query
+
+
+_COUNTS = table("history_counts", column("type"), column("status"), column("total"))
+_CREATED_AT = literal_column('"history"."created_at"')
+"The stored created_at text, compared as is so cursors round-trip exactly whatever format a row was written in."
+_ROWID = literal_column('"history"."rowid"')
+"Insertion order, breaking created_at ties the same way whichever index the planner picks."
+
+
+def _sum_counts(counts: dict[str, int], status_filter: str | None) -> int:
+    # Mirrors _status_clause, where items without a status (counted under "") never match a status filter.
+    entries: list[str] = [entry.strip() for entry in (status_filter or "").split(",") if entry.strip()]
+    if not entries:
+        return sum(counts.values())
+    if all(entry.startswith("!") for entry in entries):
+        values: list[str] = [entry[1:].strip() for entry in entries if entry[1:].strip()]
+        if not values:
+            return sum(counts.values())
+        return sum(total for status, total in counts.items() if status and status not in values)
+    values: list[str] = [entry for entry in entries if not entry.startswith("!")]
+    return sum(counts.get(value, 0) for value in set(values))
+
+
+def _ordering(order: str) -> tuple[ColumnElement, ColumnElement]:
+    if order == "ASC":
+        return _CREATED_AT.asc(), DownloadModel.id.asc()
+    return _CREATED_AT.desc(), DownloadModel.id.desc()
+
+
 class _Operation:
     def __init__(self, kind: str, type_value: str, model: DownloadModel | None = None, key: str | None = None) -> None:
         self.kind, self.type_value, self.model, self.key = kind, type_value, model, key
@@ -72,6 +132,12 @@ class DownloadsRepository(metaclass=Singleton):
 
     def attach(self, app: web.Application) -> None:
         app.on_shutdown.append(self.on_shutdown)
+        SqliteStore.get_instance().add_vacuum_hook(rebuild_search_index)
+        Scheduler.get_instance().add(
+            timer="41 */6 * * *",
+            func=self.reconcile_counts,
+            id=f"{type(self).__name__}.{type(self).reconcile_counts.__name__}",
+        )
 
     async def on_shutdown(self, _: web.Application) -> None:
         await self.shutdown()
@@ -81,9 +147,9 @@ class DownloadsRepository(metaclass=Singleton):
             query = select(DownloadModel).where(DownloadModel.type == type_value)
             if type_value == "queue":
                 position = func.json_extract(DownloadModel.data, "$.queue_position")
-                query = query.order_by(position.is_(None), position.cast(Integer), DownloadModel.created_at)
+                query = query.order_by(position.is_(None), position.cast(Integer), DownloadModel.created_at, _ROWID)
             else:
-                query = query.order_by(DownloadModel.created_at)
+                query = query.order_by(DownloadModel.created_at, _ROWID)
             result = await session.execute(query)
             return [(model.id, model.to_item()) for model in result.scalars()]
 
@@ -125,7 +191,7 @@ class DownloadsRepository(metaclass=Singleton):
             query = select(DownloadModel).where(DownloadModel.type == type_value)
             if (clause := _status_clause(status_filter)) is not None:
                 query = query.where(clause)
-            result = await session.execute(query.order_by(DownloadModel.created_at.desc()))
+            result = await session.execute(query.order_by(DownloadModel.created_at.desc(), _ROWID.desc()))
             return [(model.id, model.to_item()) for model in result.scalars()]
 
     async def get_item(self, type_value: str, **kwargs: tuple | str | float | bool) -> ItemDTO | None:
@@ -171,7 +237,7 @@ class DownloadsRepository(metaclass=Singleton):
             result = await session.execute(
                 select(DownloadModel)
                 .where(DownloadModel.type == type_value, or_(*clauses))
-                .order_by(DownloadModel.created_at)
+                .order_by(DownloadModel.created_at, _ROWID)
                 .limit(1)
             )
             model = result.scalar_one_or_none()
@@ -180,31 +246,87 @@ class DownloadsRepository(metaclass=Singleton):
         item = model.to_item()
         return item if any(matches_condition(key, value, item.__dict__) for key, value in kwargs.items()) else None
 
-    async def count(self, type_value: str, status_filter: str | None = None) -> int:
+    async def count(self, type_value: str, status_filter: str | None = None, search: str | None = None) -> int:
         async with self.session() as session:
-            query = select(func.count()).select_from(DownloadModel).where(DownloadModel.type == type_value)
-            if (clause := _status_clause(status_filter)) is not None:
-                query = query.where(clause)
-            return int((await session.execute(query)).scalar_one())
+            if expression := _search_expression(search):
+                query = _filtered(
+                    select(func.count()).select_from(DownloadModel), type_value, status_filter, expression
+                )
+                return int((await session.execute(query)).scalar_one())
+
+            result = await session.execute(
+                select(_COUNTS.c.status, _COUNTS.c.total).where(_COUNTS.c.type == type_value)
+            )
+            return _sum_counts({status: int(total) for status, total in result.all()}, status_filter)
 
     async def paginate(
-        self, type_value: str, page: int, per_page: int, order: str, status_filter: str | None = None
+        self,
+        type_value: str,
+        page: int,
+        per_page: int,
+        order: str,
+        status_filter: str | None = None,
+        search: str | None = None,
     ) -> tuple[list[tuple[str, ItemDTO]], int, int, int]:
-        total = await self.count(type_value, status_filter)
+        total = await self.count(type_value, status_filter, search)
         pages = (total + per_page - 1) // per_page if total else 1
         page = min(page, pages) if total else page
+        expression: str | None = _search_expression(search)
         async with self.session() as session:
-            query = select(DownloadModel).where(DownloadModel.type == type_value)
-            if (clause := _status_clause(status_filter)) is not None:
-                query = query.where(clause)
-            query = (
-                query.order_by(DownloadModel.created_at.asc() if order == "ASC" else DownloadModel.created_at.desc())
-                .limit(per_page)
-                .offset((page - 1) * per_page)
-            )
+            query = _filtered(select(DownloadModel), type_value, status_filter, expression)
+            if expression:
+                query = query.order_by(_SEARCH_RANK)
+            query = query.order_by(*_ordering(order)).limit(per_page).offset((page - 1) * per_page)
             result = await session.execute(query)
             return [(model.id, model.to_item()) for model in result.scalars()], total, page, pages
 
+    async def paginate_after(
+        self,
+        type_value: str,
+        per_page: int,
+        order: str,
+        status_filter: str | None = None,
+        cursor: tuple[str, str] | None = None,
+    ) -> tuple[list[tuple[str, ItemDTO]], tuple[str, str] | None]:
+        async with self.session() as session:
+            query = _filtered(select(DownloadModel, _CREATED_AT), type_value, status_filter, None)
+            position = tuple_(_CREATED_AT, DownloadModel.id)
+            if cursor:
+                after = tuple_(literal(cursor[0]), literal(cursor[1]))
+                query = query.where(position > after if order == "ASC" else position < after)
+            query = query.order_by(*_ordering(order)).limit(per_page + 1)
+            rows = (await session.execute(query)).all()
+
+        next_cursor: tuple[str, str] | None = (
+            (str(rows[per_page - 1][1]), rows[per_page - 1][0].id) if len(rows) > per_page else None
+        )
+        return [(model.id, model.to_item()) for model, _ in rows[:per_page]], next_cursor
+
+    async def reconcile_counts(self) -> int:
+        await self.flush()
+        status = func.ifnull(func.json_extract(DownloadModel.data, "$.status"), "")
+        expected = select(DownloadModel.type, status, func.count()).group_by(DownloadModel.type, status)
+        async with self.session() as session:
+            actual = {
+                (type_value, status): int(total)
+                for type_value, status, total in (await session.execute(select(_COUNTS))).all()
+                if total
+            }
+            wanted = {
+                (type_value, status): int(total)
+                for type_value, status, total in (await session.execute(expected)).all()
+            }
+            if actual == wanted:
+                return 0
+
+            drift: int = sum(1 for key in actual.keys() | wanted.keys() if actual.get(key) != wanted.get(key))
+            await session.execute(delete(_COUNTS))
+            await session.execute(insert(_COUNTS).from_select(["type", "status", "total"], expected))
+            await session.commit()
+
+        LOG.warning("Reconciled %d drifted history count(s).", drift)
+        return drift
+
     async def enqueue_upsert(self, type_value: str, model: DownloadModel) -> None:
         await self._enqueue(_Operation("upsert", type_value, model=model))
 
@@ -242,19 +364,28 @@ class DownloadsRepository(metaclass=Singleton):
             self._queue = asyncio.Queue(maxsize=self._max_pending)
             self._task = asyncio.create_task(self._writer(), name="downloads-writer")
         await self._queue.put(operation)
+        MetricsRegistry.get_instance().gauge("db_write_pending", _PENDING_DOC).set(self._queue.qsize())
 
     async def _writer(self) -> None:
+        metrics: MetricsRegistry = MetricsRegistry.get_instance()
+        pending = metrics.gauge("db_write_pending", _PENDING_DOC)
+        duration = metrics.histogram(
+            "db_write_duration_seconds", "Time spent applying download writes.", ("operation",)
+        )
         while self._queue:
             operation = await self._queue.get()
             try:
                 if isinstance(operation, _Stop):
                     return
+                started: float = time.perf_counter()
                 async with self._lock:
                     await self._apply(operation)
+                duration.observe(time.perf_counter() - started, operation.kind)
             except Exception:
                 LOG.exception("Failed to apply queued download write.")
             finally:
                 self._queue.task_done()
+                pending.set(self._queue.qsize())
                 await asyncio.sleep(self._flush_interval)
 
     async def _apply(self, operation: _Operation) -> None:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import _thread
 import asyncio
+import copy
 import logging
 import os
 import signal
@@ -25,11 +26,13 @@ from app.library.Utils import create_cookies_file
 
 from .bootstrap import ensure_download_runtime
 from .hooks import HookHandlers, NestedLogger
+from .info_cache import InfoCache
 from .process_manager import ProcessManager
 from .status_tracker import StatusTracker
 from .temp_manager import TempManager
 from .types import Terminator
 from .utils import BAD_LIVE_STREAM_OPTIONS, GENERIC_EXTRACTORS, is_download_stale
+from .worker_pool import DownloadWorker, WorkerPool
 
 if TYPE_CHECKING:
     import multiprocessing
@@ -74,6 +77,8 @@ class Download:
         self.max_workers = int(config.max_workers)
         self.is_live: bool = bool(info.is_live) or info.live_in is not None
         self.info_dict: dict | None = info_dict
+        self._info_key: str | None = None
+        "Key of the info dict in the on-disk cache while it is spilled."
         self.logger: logging.Logger = get_logger()
         self.started_time = 0
         self.queue_time: datetime = datetime.now(tz=UTC)
@@ -96,6 +101,64 @@ class Download:
         self._status_tracker: StatusTracker | None = None
         self._hook_handlers: HookHandlers | None = None
 
+    async def spill_info_dict(self) -> bool:
+        """
+        Move the pre-extracted info dict to the on-disk cache while the download waits in the queue.
+
+        Returns:
+            True if the info dict was spilled, False if it stays in memory.
+
+        """
+        if not isinstance(self.info_dict, dict) or self._info_key is not None:
+            return False
+
+        if not await asyncio.to_thread(InfoCache.get_instance().put, self.id, self.info_dict):
+            return False
+
+        self._info_key = self.id
+        self.info_dict = None
+        return True
+
+    async def _restore_info_dict(self) -> None:
+        if self._info_key is None:
+            return
+
+        key, self._info_key = self._info_key, None
+        self.info_dict = await asyncio.to_thread(InfoCache.get_instance().pop, key)
+
+    def _as_job(self) -> Download:
+        """
+        Get a copy of the download that can be sent to a pooled worker over a pipe.
+
+        Multiprocessing primitives can only be inherited at process creation, so they are stripped here
+        and re-attached by :meth:`bind_worker` inside the worker.
+        """
+        job: Download = copy.copy(self)
+        job.status_queue = None
+        job._hook_handlers = None
+        job._status_tracker = None
+        job._process_manager = None  # type: ignore[assignment]
+        return job
+
+    def bind_worker(self, status_queue: Any, cancel_event: Any) -> None:
+        """
+        Attach the worker-owned status queue and cancel event to a job received by a pooled worker.
+
+        Args:
+            status_queue: The worker status queue
+            cancel_event: The worker cancel event
+
+        """
+        self.status_queue = status_queue
+        self._hook_handlers = HookHandlers(
+            download_id=self.id,
+            status_queue=status_queue,
+            logger=self.logger,
+            debug=self.debug,
+        )
+        self._process_manager = ProcessManager(download_id=self.id, is_live=self.is_live, logger=self.logger)
+        self._process_manager._cancel_event = cancel_event
+
     def _download(self) -> None:
         """
         Execute the download in a subprocess.
@@ -528,7 +591,16 @@ class Download:
             Process exit code or None
 
         """
-        status_queue: Any = self._process_manager.create_queue()
+        await self._restore_info_dict()
+
+        pool: WorkerPool = WorkerPool.get_instance()
+        worker: DownloadWorker | None = pool.acquire() if pool.enabled() else None
+
+        if worker is not None:
+            self._process_manager.use_worker(worker)
+            status_queue: Any = worker.status_queue
+        else:
+            status_queue = self._process_manager.create_queue()
         self.status_queue = status_queue
 
         temp_path = self._temp_manager.create_temp_path()
@@ -551,8 +623,11 @@ class Download:
             debug=self.debug,
         )
 
-        self._process_manager.create_process(target=self._download)
-        self._process_manager.start()
+        if worker is not None:
+            worker.submit(self._as_job())
+        else:
+            self._process_manager.create_process(target=self._download)
+            self._process_manager.start()
         self.started_time = int(time.time())
         self.info.status = "preparing"
 
@@ -560,7 +635,16 @@ class Download:
         progress_task = asyncio.create_task(status_tracker.progress_update(), name=f"update-{self.id}")
 
         proc = self._process_manager.proc
-        ret = await asyncio.get_running_loop().run_in_executor(None, proc.join) if proc else None
+        ret = None
+        if worker is not None:
+            if await worker.wait_job():
+                ret = 0
+            else:
+                ret = worker.proc.exitcode
+                status_tracker.put_terminator()
+        elif proc:
+            await self._process_manager.wait()
+            ret = proc.exitcode
 
         wait_for_status = not self._process_manager.is_cancelled() or self.is_live
         if wait_for_status and isinstance(progress_task, asyncio.Future):
@@ -585,17 +669,22 @@ class Download:
         """Check if download process has been started."""
         return self._process_manager.started()
 
-    def cancel(self) -> bool:
+    async def cancel(self) -> bool:
         """Cancel the download task."""
-        return self._process_manager.cancel()
+        return await self._process_manager.cancel()
 
     async def close(self) -> bool:
         """Close download process and clean up resources."""
+        if self._info_key is not None:
+            InfoCache.get_instance().delete(self._info_key)
+            self._info_key = None
+
         started = self.started()
         if self._process_manager.cancel_in_progress or (not started and self.status_queue is None):
             return False
 
         closed = False
+        pooled: bool = self._process_manager.worker is not None
         try:
             if self._status_tracker:
                 self._status_tracker.cancel_update_task()
@@ -620,9 +709,11 @@ class Download:
                 },
             )
         finally:
-            status_queue = self.status_queue
+            status_queue = None if pooled else self.status_queue
             try:
-                if self._status_tracker:
+                if pooled:
+                    pass
+                elif self._status_tracker:
                     self._status_tracker.put_terminator()
                 elif status_queue:
                     status_queue.put(Terminator())
@@ -649,8 +740,8 @@ class Download:
     def is_cancelled(self) -> bool:
         return self._process_manager.is_cancelled()
 
-    def kill(self) -> bool:
-        return self._process_manager.kill()
+    async def kill(self) -> bool:
+        return await self._process_manager.kill()
 
     def delete_temp(self, by_pass: bool = False) -> None:
         self._temp_manager.delete_temp(by_pass=by_pass)
@@ -0,0 +1,126 @@
+"""Compressed on-disk storage for the yt-dlp info dicts of queued downloads."""
+
+import contextlib
+import gzip
+import json
+import re
+import shutil
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from app.library.config import Config
+from app.library.logging import get_logger
+from app.library.Singleton import ThreadSafe
+
+LOG = get_logger()
+
+INFO_CACHE_DIR = "info_cache"
+
+
+def _encode(obj: Any) -> Any:
+    if isinstance(obj, (set, frozenset, Sequence)):
+        return list(obj)
+
+    return repr(obj)
+
+
+class InfoCache(metaclass=ThreadSafe):
+    """
+    Holds pre-extracted info dicts of queued downloads as gzip'd JSON blobs under ``temp_path``.
+
+    Queued items keep only their key in memory; the info dict is loaded back when the download starts.
+    Blobs older than ``download_info_expires`` are treated as missing so the download re-extracts.
+    """
+
+    def __init__(self, path: Path | None = None, expires: int | None = None) -> None:
+        config: Config = Config.get_instance()
+        self._path: Path = path or Path(config.temp_path) / INFO_CACHE_DIR
+        self._expires: int = int(config.download_info_expires if expires is None else expires)
+
+    @staticmethod
+    def get_instance() -> "InfoCache":
+        return InfoCache()
+
+    def _file(self, key: str) -> Path:
+        return self._path / f"{re.sub(r'[^\w.-]', '_', key)}.json.gz"
+
+    def put(self, key: str, info: dict) -> bool:
+        """
+        Store an info dict.
+
+        Args:
+            key (str): The download id.
+            info (dict): The yt-dlp info dict. Values JSON cannot represent are stored as lists or their repr.
+
+        Returns:
+            bool: True if the info dict was written, False if it should stay in memory.
+
+        """
+        file: Path = self._file(key)
+        try:
+            data: bytes = gzip.compress(
+                json.dumps(info, separators=(",", ":"), default=_encode).encode("utf-8"), compresslevel=3
+            )
+            self._path.mkdir(parents=True, exist_ok=True)
+            temp_file: Path = file.with_suffix(".tmp")
+            temp_file.write_bytes(data)
+            temp_file.replace(file)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            LOG.warning(
+                "Failed to spill info dict of '%s' to '%s'.",
+                key,
+                file,
+                extra={"download_id": key, "file": str(file), "exception_type": type(e).__name__},
+            )
+            return False
+
+    def pop(self, key: str) -> dict | None:
+        """
+        Load and remove an info dict.
+
+        Args:
+            key (str): The download id.
+
+        Returns:
+            dict | None: The info dict, or None if it is missing, unreadable or expired.
+
+        """
+        file: Path = self._file(key)
+        try:
+            if self._expires > 0 and (time.time() - file.stat().st_mtime) > self._expires:
+                LOG.info("Spilled info dict of '%s' has expired.", key, extra={"download_id": key})
+                return None
+
+            info = json.loads(gzip.decompress(file.read_bytes()))
+            return info if isinstance(info, dict) else None
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            LOG.warning(
+                "Failed to load spilled info dict of '%s' from '%s'.",
+                key,
+                file,
+                extra={"download_id": key, "file": str(file), "exception_type": type(e).__name__},
+            )
+            return None
+        finally:
+            self.delete(key)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an info dict, if stored.
+
+        Args:
+            key (str): The download id.
+
+        """
+        with contextlib.suppress(OSError):
+            self._file(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all stored info dicts. Called on startup, when no queued download can reference them."""
+        if self._path.exists():
+            shutil.rmtree(self._path, ignore_errors=True)
@@ -25,6 +25,7 @@ from .video_processor import LIGHT_EXTRACT_KEY, add_video
 if TYPE_CHECKING:
     from app.features.downloads.items import Item
     from app.features.presets.schemas import Preset
+    from app.features.ytdlp.extractor import ExtractorBatch
 
     from .queue_manager import DownloadQueue
 
@@ -152,7 +153,11 @@ async def add_item(
 
 
 async def add(
-    queue: "DownloadQueue", item: "Item", already: set | None = None, entry: dict | None = None
+    queue: "DownloadQueue",
+    item: "Item",
+    already: set | None = None,
+    entry: dict | None = None,
+    batch: "ExtractorBatch | None" = None,
 ) -> dict[str, Any]:
     """
     Add an item to the download queue.
@@ -162,6 +167,7 @@ async def add(
         item: Item to be added to the queue
         already: Set of already downloaded items
         entry: Entry associated with the item (if already extracted)
+        batch: Optional extractor batch shared with other adds
 
     Returns:
         dict[str, str]: Status dict with "status" and optional "msg" keys
@@ -334,7 +340,9 @@ async def add(
                 follow_redirect=True,
                 capture_logs=logging.WARNING,
                 budget_sleep=True,
+                refresh=bool(item.requeued),
                 suppress_logs=_task_ignored_logs(item),
+                batch=batch,
             )
 
             if entry and light_extract:
@@ -425,7 +433,7 @@ async def add(
         if not item.requeued and (
             condition := await Conditions.get_instance().match(info=entry, ignore_conditions=ignored_conditions)
         ):
-            already.pop()
+            already.discard(item.url)
 
             display = str(entry.get("title") or entry.get("webpage_url") or entry.get("url") or item.url)
 
@@ -494,7 +502,9 @@ async def add(
             if isinstance(condition_cookies, str) and condition_cookies.strip():
                 item = item.new_with(cookies=condition_cookies)
 
-            return await add(queue=queue, item=item.new_with(requeued=True, cli=condition.cli), already=already)
+            return await add(
+                queue=queue, item=item.new_with(requeued=True, cli=condition.cli), already=already, batch=batch
+            )
 
         _status, _msg = ytdlp_reject(entry=entry, yt_params=yt_conf)
         if not _status:
@@ -1,5 +1,6 @@
 """Queue monitoring functions."""
 
+import shutil
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -413,21 +414,36 @@ async def delete_old_history(queue: "DownloadQueue") -> None:
         )
 
 
-async def cleanup_thumbnails(queue: "DownloadQueue") -> None:
+async def generate_trickplay(queue: "DownloadQueue", item: ItemDTO) -> None:
     """
-    Remove cached generated thumbnails whose history item no longer exists.
+    Generate the timeline preview sprite sheets for a finished download.
 
     Args:
         queue: DownloadQueue instance.
+        item: The finished item.
 
     """
-    if queue.config.thumb_sidecar:
-        return
+    from app.features.streaming.library.trickplay import ensure_trickplay
 
-    cache_root = Path(queue.config.temp_path) / "thumbnails"
-    if not cache_root.exists() or not cache_root.is_dir():
+    filepath: Path | None = item.get_file(download_path=Path(queue.config.download_path))
+    if not filepath or not filepath.is_file():
         return
 
+    try:
+        await ensure_trickplay(filepath, Path(queue.config.temp_path) / "thumbnails", item._id)
+    except OSError as exc:
+        LOG.warning(
+            "Failed to generate trickplay sprites for '%s'. %s",
+            filepath,
+            exc,
+            extra={"item_id": item._id, "file_path": str(filepath), "exception_type": type(exc).__name__},
+        )
+
+
+async def _remove_orphaned_thumbnails(queue: "DownloadQueue", cache_root: Path) -> int:
+    if queue.config.thumb_sidecar:
+        return 0
+
     removed = 0
     for thumb in cache_root.glob("*.jpg"):
         if not thumb.is_file():
@@ -446,5 +462,39 @@ async def cleanup_thumbnails(queue: "DownloadQueue") -> None:
                 extra={"file_path": str(thumb), "exception_type": type(exc).__name__},
             )
 
+    return removed
+
+
+async def cleanup_thumbnails(queue: "DownloadQueue") -> None:
+    """
+    Remove cached generated thumbnails and trickplay sprites whose history item no longer exists.
+
+    Args:
+        queue: DownloadQueue instance.
+
+    """
+    cache_root = Path(queue.config.temp_path) / "thumbnails"
+    if not cache_root.exists() or not cache_root.is_dir():
+        return
+
+    removed = 0
+    trickplay_root: Path = cache_root / "trickplay"
+    if trickplay_root.is_dir():
+        for sprites in trickplay_root.iterdir():
+            if not sprites.is_dir() or await queue.done.get_by_id(sprites.name.removesuffix(".tmp")):
+                continue
+
+            try:
+                shutil.rmtree(sprites)
+                removed += 1
+            except OSError as exc:
+                LOG.exception(
+                    "Failed to remove orphaned trickplay sprites '%s'.",
+                    sprites,
+                    extra={"file_path": str(sprites), "exception_type": type(exc).__name__},
+                )
+
+    removed += await _remove_orphaned_thumbnails(queue, cache_root)
+
     if removed > 0:
         LOG.info("Removed %s orphaned cached thumbnail(s).", removed, extra={"removed_count": removed})
@@ -1,12 +1,18 @@
 """Playlist processing."""
 
+import asyncio
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
-from app.features.ytdlp.utils import ytdlp_reject
+from app.features.ytdlp.utils import archive_read, ytdlp_reject
 from app.library.logging import get_logger
 from app.library.Utils import merge_dict
 
+from .scan_marks import ScanMarks, entry_archive_id, entry_timestamp
+
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from app.features.downloads.items import Item
 
     from .queue_manager import DownloadQueue
@@ -14,6 +20,217 @@ if TYPE_CHECKING:
 LOG = get_logger()
 
 
+class EntrySequencer:
+    """Lets concurrently processed playlist entries enter the download queue in playlist order."""
+
+    def __init__(self, order: list[int]) -> None:
+        self._order: list[int] = order
+        self._rank: dict[int, int] = {index: pos for pos, index in enumerate(order)}
+        self._pos: int = 0
+        "Position in ``order`` of the first entry that has not finished."
+        self._finished: set[int] = set()
+        self._changed = asyncio.Condition()
+
+    async def wait(self, index: int) -> None:
+        """Wait until every entry listed before ``index`` has finished processing."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._pos >= self._rank.get(index, 0))
+
+    async def finish(self, index: int) -> None:
+        """Mark an entry as finished, whether or not it was queued."""
+        async with self._changed:
+            self._finished.add(index)
+            while self._pos < len(self._order) and self._order[self._pos] in self._finished:
+                self._pos += 1
+            self._changed.notify_all()
+
+
+QUEUE_TURN: ContextVar[tuple[EntrySequencer, int] | None] = ContextVar("playlist_queue_turn", default=None)
+"The sequencer and index of the playlist entry being processed in the current task, if any."
+
+
+async def wait_queue_turn() -> None:
+    """Wait, if processing a playlist entry, until the entries before it have been queued or skipped."""
+    if turn := QUEUE_TURN.get():
+        await turn[0].wait(turn[1])
+
+
+def _concurrency(queue: "DownloadQueue") -> int:
+    """
+    Get how many playlist entries may be processed at once.
+
+    Returns:
+        int: ``extract_info_concurrency``, or 1 if it is not set.
+
+    """
+    limit = getattr(queue.config, "extract_info_concurrency", 1)
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        return 1
+
+    return limit
+
+
+async def _process_entries(
+    entries: list[tuple[int, dict]],
+    process_item: "Callable[[int, dict], Awaitable[dict[str, str]]]",
+    concurrency: int,
+) -> list[dict[str, str]]:
+    """
+    Process playlist entries with bounded concurrency.
+
+    Workers take entries in order, and each entry only enters the download queue once every entry before it
+    has finished, so results, queue order and ``playlist_index`` extras match sequential processing.
+
+    Args:
+        entries: The (playlist index, entry) pairs to process, in order.
+        process_item: The per-entry processor.
+        concurrency: The maximum number of entries processed at once.
+
+    Returns:
+        list: The status of each entry, in the order of ``entries``.
+
+    """
+    if concurrency < 2 or len(entries) < 2:
+        return [await process_item(i, etr) for i, etr in entries]
+
+    sequencer = EntrySequencer([i for i, _ in entries])
+    results: list[dict[str, str] | None] = [None] * len(entries)
+    pending = iter(enumerate(entries))
+
+    async def worker() -> None:
+        for pos, (i, etr) in pending:
+            token = QUEUE_TURN.set((sequencer, i))
+            try:
+                results[pos] = await process_item(i, etr)
+            finally:
+                QUEUE_TURN.reset(token)
+                await sequencer.finish(i)
+
+    workers: list[asyncio.Task] = [
+        asyncio.create_task(worker(), name=f"playlist_entry_worker_{n}") for n in range(min(concurrency, len(entries)))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+
+    return [res for res in results if res is not None]
+
+
+def _incremental_limit(queue: "DownloadQueue", item: "Item", archive_file: Any) -> int:
+    """
+    Get the number of consecutive archived entries after which a re-scan stops.
+
+    Incremental scans only apply to scheduled sources (tasks and task handlers) that use an archive file.
+
+    Returns:
+        int: The stop threshold, or 0 if the playlist must be fully processed.
+
+    """
+    limit = getattr(queue.config, "playlist_incremental_stop", 0)
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        return 0
+
+    extras = item.extras if isinstance(item.extras, dict) else {}
+    if not extras.get("source_handler") or not archive_file or not isinstance(archive_file, str):
+        return 0
+
+    return limit
+
+
+async def _scan_incremental(
+    entry: dict,
+    entries: list[tuple[int, dict]],
+    process_item: "Callable[[int, dict], Awaitable[dict[str, str]]]",
+    *,
+    archive_file: str,
+    limit: int,
+    reverse: bool = False,
+    concurrency: int = 1,
+) -> list[dict[str, str]]:
+    """
+    Process playlist entries newest first, skipping archived ones and stopping after a run of known entries.
+
+    Args:
+        entry: The playlist entry.
+        entries: The (playlist index, entry) pairs to consider.
+        process_item: The per-entry processor.
+        archive_file: The download archive file.
+        limit: Stop after this many consecutive known entries.
+        reverse: Whether the entries are listed oldest first.
+        concurrency: The maximum number of entries processed at once.
+
+    Returns:
+        list: The status of each processed entry.
+
+    """
+    archive_ids: dict[int, str | None] = {i: entry_archive_id(etr) for i, etr in entries}
+    archived: set[str] = set(archive_read(archive_file, [x for x in archive_ids.values() if x]))
+    stamps: dict[int, float | None] = {i: entry_timestamp(etr) for i, etr in entries}
+
+    if entries and all(ts is not None for ts in stamps.values()):
+        order = sorted(entries, key=lambda x: stamps[x[0]] or 0.0, reverse=True)
+    else:
+        order = list(reversed(entries)) if reverse else list(entries)
+
+    marks: ScanMarks = ScanMarks.get_instance()
+    mark_key: str | None = entry_archive_id(entry)
+    mark: dict[str, Any] | None = marks.get(mark_key) if mark_key else None
+    mark_ts = mark.get("timestamp") if mark else None
+
+    selected: list[tuple[int, dict]] = []
+    behind: bool = False
+    streak: int = 0
+    skipped: int = 0
+    stopped_at: int | None = None
+
+    for i, etr in order:
+        archive_id: str | None = archive_ids.get(i)
+        if mark and archive_id and archive_id == mark.get("id"):
+            behind = True
+
+        is_archived: bool = bool(archive_id) and archive_id in archived
+        ts: float | None = stamps.get(i)
+        known: bool = is_archived or behind or (ts is not None and isinstance(mark_ts, (int, float)) and ts <= mark_ts)
+        streak = streak + 1 if known else 0
+
+        if is_archived:
+            skipped += 1
+        else:
+            selected.append((i, etr))
+
+        if streak >= limit:
+            stopped_at = i
+            break
+
+    results: list[dict[str, str]] = await _process_entries(selected, process_item, concurrency)
+
+    if mark_key and order and (newest_id := archive_ids.get(order[0][0])):
+        marks.set(mark_key, newest_id, stamps.get(order[0][0]))
+
+    LOG.info(
+        "Incremental scan of '%s: %s' processed %s new entrie(s) and skipped %s archived.",
+        entry.get("id"),
+        entry.get("title"),
+        len(results),
+        skipped,
+        extra={
+            "playlist_id": entry.get("id"),
+            "playlist_title": entry.get("title"),
+            "processed_count": len(results),
+            "archived_count": skipped,
+            "entry_count": len(entries),
+            "stopped_at": stopped_at,
+            "stop_after": limit,
+        },
+    )
+
+    return results
+
+
 async def process_playlist(
     queue: "DownloadQueue", entry: dict, item: "Item", already=None, yt_params: dict | None = None
 ) -> dict[str, str]:
@@ -133,11 +350,27 @@ async def process_playlist(
         max_downloads = ytdlp_opts["max_downloads"]
 
     results: list[dict[str, str]] = []
-    for i, etr in enumerate(entries, start=1):
-        if max_downloads > 0 and i > max_downloads:
-            break
-
-        results.append(await process_item(i, etr))
+    archive_file = ytdlp_opts.get("download_archive")
+    if (incremental := _incremental_limit(queue, item, archive_file)) > 0:
+        results = await _scan_incremental(
+            entry,
+            [
+                (i, etr)
+                for i, etr in enumerate(entries, start=1)
+                if isinstance(etr, dict) and (max_downloads < 1 or i <= max_downloads)
+            ],
+            process_item,
+            archive_file=archive_file,
+            limit=incremental,
+            reverse=bool(ytdlp_opts.get("playlistreverse")),
+            concurrency=_concurrency(queue),
+        )
+    else:
+        results = await _process_entries(
+            [(i, etr) for i, etr in enumerate(entries, start=1) if max_downloads < 1 or i <= max_downloads],
+            process_item,
+            _concurrency(queue),
+        )
 
     skipped = 0
     if max_downloads > 0 and len(entries) > max_downloads:
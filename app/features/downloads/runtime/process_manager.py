@@ -1,13 +1,19 @@
 """Process lifecycle management for downloads."""
 
+import asyncio
+import contextlib
 import logging
 import multiprocessing
 import os
 import signal
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .utils import wait_for_process_with_timeout
+if TYPE_CHECKING:
+    from .worker_pool import DownloadWorker
+
+PROCESS_POLL_INTERVAL: float = 0.1
+"Seconds between liveness checks when no exit fd can be watched."
 
 
 class ProcessManager:
@@ -17,6 +23,9 @@ class ProcessManager:
     Handles process creation, monitoring, graceful termination, and
     force-kill operations. Includes special handling for live streams
     which may not respond to standard termination signals.
+
+    Process exit is watched on the event loop through a pidfd (Linux) or the
+    process sentinel fd, so waiting for a download does not hold a thread.
     """
 
     def __init__(self, download_id: str, is_live: bool, logger: logging.Logger):
@@ -37,6 +46,11 @@ class ProcessManager:
         self._cancel_event: Any | None = None
         self.cancelled = False
         self.cancel_in_progress = False
+        self._exited: asyncio.Event | None = None
+        self._exit_fd: int | None = None
+        self._exit_fd_owned: bool = False
+        self._exit_poll: asyncio.Task | None = None
+        self.worker: DownloadWorker | None = None
 
     @property
     def cancel_event(self) -> Any:
@@ -59,17 +73,36 @@ class ProcessManager:
 
         """
         self.cancel_event.clear()
+        self._unwatch()
         self.proc = self._context.Process(name=f"download-{self.download_id}", target=target)
         return self.proc
 
+    def use_worker(self, worker: "DownloadWorker") -> None:
+        """
+        Run the download on a pooled worker instead of a dedicated process.
+
+        Cancellation signals and escalation target the worker process, which is retired afterwards.
+
+        Args:
+            worker: The worker that will run the job
+
+        """
+        self._unwatch()
+        self.worker = worker
+        self.proc = worker.proc
+        self._cancel_event = worker.cancel_event
+
     def start(self) -> None:
-        if self.proc:
+        if self.proc and self.worker is None:
             self.proc.start()
 
     def started(self) -> bool:
         return self.proc is not None
 
     def running(self) -> bool:
+        if self.worker is not None and not self.worker.busy:
+            return False
+
         try:
             return self.proc is not None and self.proc.is_alive()
         except ValueError:
@@ -78,7 +111,116 @@ class ProcessManager:
     def is_cancelled(self) -> bool:
         return self.cancelled
 
-    def cancel(self) -> bool:
+    def _open_exit_fd(self, proc: multiprocessing.Process) -> tuple[int | None, bool]:
+        """
+        Get a file descriptor that becomes readable once the process exits.
+
+        Returns:
+            tuple[int | None, bool]: The fd and whether it is owned (must be closed) by the manager.
+
+        """
+        if proc.pid and hasattr(os, "pidfd_open"):
+            try:
+                return os.pidfd_open(proc.pid), True
+            except OSError:
+                pass
+
+        try:
+            return proc.sentinel, False
+        except (AttributeError, ValueError):
+            return None, False
+
+    def _watch(self, proc: multiprocessing.Process) -> asyncio.Event:
+        """
+        Start watching the process for exit on the running event loop.
+
+        Returns:
+            asyncio.Event: Set once the process has exited, or once the job of a pooled worker has finished.
+
+        """
+        if self._exited is not None:
+            return self._exited
+
+        loop = asyncio.get_running_loop()
+        exited = asyncio.Event()
+        self._exited = exited
+
+        if self.worker is not None:
+            # A pooled worker outlives its job, so the job finishing ends the wait as well.
+            self.worker.on_job_done(lambda: self._exited is exited and self._unwatch())
+
+        fd, owned = self._open_exit_fd(proc)
+        if fd is not None:
+            try:
+                loop.add_reader(fd, self._on_exit)
+                self._exit_fd, self._exit_fd_owned = fd, owned
+                return exited
+            except (NotImplementedError, OSError, ValueError):
+                if owned:
+                    with contextlib.suppress(OSError):
+                        os.close(fd)
+
+        async def poll_exit() -> None:
+            while True:
+                if not self.running():
+                    exited.set()
+                    return
+                await asyncio.sleep(PROCESS_POLL_INTERVAL)
+
+        self._exit_poll = loop.create_task(poll_exit(), name=f"exit-watch-{self.download_id}")
+        return exited
+
+    def _on_exit(self) -> None:
+        self._unwatch()
+
+    def _unwatch(self) -> None:
+        """Stop watching the process and release the exit fd."""
+        if (fd := self._exit_fd) is not None:
+            with contextlib.suppress(Exception):
+                asyncio.get_running_loop().remove_reader(fd)
+            if self._exit_fd_owned:
+                with contextlib.suppress(OSError):
+                    os.close(fd)
+
+        if self._exit_poll is not None and not self._exit_poll.done():
+            self._exit_poll.cancel()
+
+        exited = self._exited
+        self._exit_fd = None
+        self._exit_fd_owned = False
+        self._exit_poll = None
+        self._exited = None
+
+        if exited is not None:
+            exited.set()
+
+    async def wait(self, seconds: float | None = None) -> bool:
+        """
+        Wait for the process to exit without blocking a thread.
+
+        Args:
+            seconds: Maximum time to wait, None to wait indefinitely
+
+        Returns:
+            True if the process has exited, False if the timeout was reached
+
+        """
+        proc = self.proc
+        if proc is None or not self.running():
+            return True
+
+        exited = self._watch(proc)
+        try:
+            await asyncio.wait_for(exited.wait(), seconds)
+        except TimeoutError:
+            return not self.running()
+
+        with contextlib.suppress(AssertionError, ValueError):
+            proc.join(0)
+
+        return not self.running()
+
+    async def cancel(self) -> bool:
         """
         Mark download as cancelled and kill the process.
 
@@ -90,9 +232,9 @@ class ProcessManager:
             return False
 
         self.cancelled = True
-        return self.kill()
+        return await self.kill()
 
-    def kill(self) -> bool:
+    async def kill(self) -> bool:
         """
         Kill the download process.
 
@@ -140,7 +282,7 @@ class ProcessManager:
                 )
                 self.cancel_event.set()
 
-                if wait_for_process_with_timeout(proc, 10):
+                if await self.wait(10):
                     self.logger.debug(
                         "Download process PID=%s stopped gracefully.",
                         proc.pid,
@@ -184,7 +326,7 @@ class ProcessManager:
                     )
                     os.kill(proc.pid, signal.SIGUSR1)
 
-                    if wait_for_process_with_timeout(proc, 5):
+                    if await self.wait(5):
                         self.logger.debug(
                             "Download process PID=%s stopped gracefully.",
                             proc.pid,
@@ -235,14 +377,14 @@ class ProcessManager:
                 )
                 proc.terminate()
 
-                if not wait_for_process_with_timeout(proc, 1 if self.is_live else 2):
+                if not await self.wait(1 if self.is_live else 2):
                     self.logger.warning(
                         "Download process PID=%s did not terminate; killing forcefully.",
                         proc.pid,
                         extra={"download": {"download_id": self.download_id, "process_id": proc.pid, "force": True}},
                     )
                     proc.kill()
-                    wait_for_process_with_timeout(proc, 1)
+                    await self.wait(1)
 
             self.logger.info(
                 "Download process PID=%s stopped.",
@@ -280,11 +422,15 @@ class ProcessManager:
         if not self.started() or self.cancel_in_progress:
             return False
 
+        if self.worker is not None:
+            return await self._release_worker()
+
         self.cancel_in_progress = True
         proc = self.proc
         procId: int | None = proc.ident if proc else None
 
         if not procId:
+            self._unwatch()
             if proc:
                 proc.close()
                 self.proc = None
@@ -298,11 +444,7 @@ class ProcessManager:
         )
 
         try:
-            self.kill()
-
-            import asyncio
-
-            loop = asyncio.get_running_loop()
+            await self.kill()
 
             current = self.proc
             if current is not None and current.is_alive():
@@ -311,13 +453,14 @@ class ProcessManager:
                     procId,
                     extra={"download": {"download_id": self.download_id, "process_ident": procId}},
                 )
-                await loop.run_in_executor(None, current.join)
+                await self.wait()
                 self.logger.debug(
                     "Download process PID='%s' closed.",
                     procId,
                     extra={"download": {"download_id": self.download_id, "process_ident": procId}},
                 )
 
+            self._unwatch()
             if self.proc:
                 self.proc.close()
                 self.proc = None
@@ -344,3 +487,29 @@ class ProcessManager:
             )
 
         return False
+
+    async def _release_worker(self) -> bool:
+        """
+        Detach from the pooled worker, aborting its job if it is still running.
+
+        Returns:
+            True once the worker has been handed back to the pool
+
+        """
+        from .worker_pool import WorkerPool
+
+        worker = self.worker
+        if worker is None:
+            return False
+
+        self.cancel_in_progress = True
+        try:
+            if self.running():
+                await self.kill()
+        finally:
+            self._unwatch()
+            self.worker = None
+            self.proc = None
+            WorkerPool.get_instance().release(worker, reusable=not (self.cancelled or self.is_live))
+
+        return True
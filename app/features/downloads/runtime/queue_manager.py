@@ -1,14 +1,16 @@
 import asyncio
 import functools
 import glob
+from collections.abc import AsyncIterable, AsyncIterator
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
 
 from app.features.downloads.items import Item, ItemDTO
 from app.features.downloads.repository import DownloadsRepository
+from app.features.ytdlp.extractor import ExtractorBatch
 from app.library.config import Config
 from app.library.Events import EventBus, Events
 from app.library.logging import get_logger
@@ -18,10 +20,19 @@ from app.library.Singleton import Singleton
 from app.library.Utils import calc_download_path
 
 from .core import Download
+from .info_cache import InfoCache
 from .item_adder import add as add_impl
-from .monitors import check_for_stale, check_live, check_retries, cleanup_thumbnails, delete_old_history
+from .monitors import (
+    check_for_stale,
+    check_live,
+    check_retries,
+    cleanup_thumbnails,
+    delete_old_history,
+    generate_trickplay,
+)
 from .pool_manager import PoolManager
 from .utils import handle_task_exception
+from .worker_pool import WorkerPool
 
 if TYPE_CHECKING:
     from app.features.downloads.store import StoreType
@@ -60,6 +71,24 @@ class DownloadQueue(metaclass=Singleton):
 
         self._notify.subscribe(Events.STARTED, event_handler, f"{DownloadQueue.__name__}.initialize")
 
+        if self.config.thumb_trickplay:
+
+            async def trickplay_handler(e, __):
+                if not isinstance(e.data, ItemDTO):
+                    return
+
+                task = asyncio.create_task(generate_trickplay(self, e.data), name=f"trickplay-{e.data._id}")
+                task.add_done_callback(lambda t: handle_task_exception(t, LOG))
+
+            self._notify.subscribe(Events.ITEM_COMPLETED, trickplay_handler, f"{DownloadQueue.__name__}.trickplay")
+
+        if self.config.download_worker_jobs > 0:
+
+            async def worker_pool_handler(_, __):
+                await WorkerPool.get_instance().shutdown()
+
+            self._notify.subscribe(Events.SHUTDOWN, worker_pool_handler, f"{WorkerPool.__name__}.shutdown")
+
         Scheduler.get_instance().add(
             timer="* * * * *",
             func=functools.partial(check_for_stale, self),
@@ -99,6 +128,7 @@ class DownloadQueue(metaclass=Singleton):
         return True
 
     async def initialize(self) -> None:
+        await asyncio.to_thread(InfoCache.get_instance().clear)
         await self.queue.load()
         LOG.info(
             f"Using '{self.config.max_workers}' workers for downloading and '{self.config.max_workers_per_extractor}' per extractor."
@@ -372,7 +402,13 @@ class DownloadQueue(metaclass=Singleton):
     async def on_shutdown(self, _: web.Application):
         await self.pool.shutdown()
 
-    async def add(self, item: Item, already: set | None = None, entry: dict | None = None) -> dict[str, str]:
+    async def add(
+        self,
+        item: Item,
+        already: set | None = None,
+        entry: dict | None = None,
+        batch: ExtractorBatch | None = None,
+    ) -> dict[str, str]:
         """
         Add an item to the download queue.
 
@@ -380,12 +416,13 @@ class DownloadQueue(metaclass=Singleton):
             item: Item to be added to the queue
             already: Set of already downloaded items
             entry: Entry associated with the item (if already extracted)
+            batch: Optional extractor batch shared with other adds
 
         Returns:
             dict[str, str]: Status dict with "status" and optional "msg" keys
 
         """
-        result = await add_impl(queue=self, item=item, already=already, entry=entry)
+        result = await add_impl(queue=self, item=item, already=already, entry=entry, batch=batch)
 
         if result.get("status") == "error" and not result.get("hidden"):
             self._notify.emit(
@@ -397,6 +434,85 @@ class DownloadQueue(metaclass=Singleton):
 
         return result
 
+    async def add_stream(
+        self,
+        items: AsyncIterable[tuple[int, Item | ValueError]],
+        concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[int, Item | None, dict[str, Any]]]:
+        """
+        Add items as they arrive, with a bounded number of concurrent adds sharing one extractor batch.
+
+        Items are read only as fast as workers free up, so a large upload is never held in memory at once.
+
+        Args:
+            items: Indexed items, or the error that made an entry invalid
+            concurrency: Number of concurrent adds, defaults to ``extract_info_concurrency``
+
+        Yields:
+            tuple: The index, the item (None if invalid) and its status dict, in completion order
+
+        """
+        workers: int = max(1, int(concurrency or self.config.extract_info_concurrency))
+        pending: asyncio.Queue[tuple[int, Item | ValueError] | None] = asyncio.Queue(maxsize=workers * 2)
+        results: asyncio.Queue[tuple[int, Item | None, dict[str, Any]] | None] = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                async for entry in items:
+                    await pending.put(entry)
+            except Exception as e:
+                LOG.warning(
+                    "Stopped reading bulk ingest items. %s",
+                    str(e),
+                    extra={"exception_type": type(e).__name__},
+                )
+
+            for _ in range(workers):
+                await pending.put(None)
+
+        async def work(batch: ExtractorBatch) -> None:
+            try:
+                while (entry := await pending.get()) is not None:
+                    index, item = entry
+                    if isinstance(item, ValueError):
+                        await results.put((index, None, {"status": "error", "msg": str(item)}))
+                        continue
+
+                    try:
+                        status: dict[str, Any] = await self.add(item=item, batch=batch)
+                    except Exception as e:
+                        LOG.exception(
+                            "Failed to add '%s' during bulk ingest.",
+                            item.url,
+                            extra={"url": item.url, "preset": item.preset, "exception_type": type(e).__name__},
+                        )
+                        status = {"status": "error", "msg": str(e)}
+
+                    await results.put((index, item, status))
+            finally:
+                await results.put(None)
+
+        async with ExtractorBatch() as batch:
+            producer = asyncio.create_task(produce(), name="bulk_ingest_reader")
+            tasks: list[asyncio.Task] = [
+                asyncio.create_task(work(batch), name=f"bulk_ingest_worker_{n}") for n in range(workers)
+            ]
+
+            try:
+                running: int = workers
+                while running > 0:
+                    if (result := await results.get()) is None:
+                        running -= 1
+                        continue
+
+                    yield result
+
+                await producer
+            finally:
+                for task in (producer, *tasks):
+                    task.cancel()
+                await asyncio.gather(producer, *tasks, return_exceptions=True)
+
     async def cancel(self, ids: list[str]) -> dict[str, str]:
         """
         Cancel the download.
@@ -432,7 +548,7 @@ class DownloadQueue(metaclass=Singleton):
                         }
                     },
                 )
-                item.cancel()
+                await item.cancel()
                 LOG.info(
                     "Cancelled running download '%s'.",
                     item.info.title,
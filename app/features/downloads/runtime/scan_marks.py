@@ -0,0 +1,134 @@
+"""Persisted high-water marks for incremental playlist scans."""
+
+import json
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from app.library.config import Config
+from app.library.logging import get_logger
+from app.library.Singleton import ThreadSafe
+
+LOG = get_logger()
+
+SCAN_MARKS_FILE = "scan_marks.json"
+
+
+def entry_archive_id(entry: dict) -> str | None:
+    """
+    Build the archive id of a flat playlist entry without running an extractor.
+
+    Args:
+        entry (dict): The playlist entry.
+
+    Returns:
+        str | None: The archive id, or None if the entry does not carry enough information.
+
+    """
+    ie_key = entry.get("ie_key") or entry.get("extractor_key")
+    entry_id = entry.get("id")
+    if not isinstance(ie_key, str) or not ie_key or entry_id is None:
+        return None
+
+    return f"{ie_key.lower()} {entry_id!s}"
+
+
+def entry_timestamp(entry: dict) -> float | None:
+    """
+    Get the upload time of a playlist entry, if known.
+
+    Args:
+        entry (dict): The playlist entry.
+
+    Returns:
+        float | None: The unix timestamp, or None.
+
+    """
+    for key in ("timestamp", "release_timestamp"):
+        if isinstance(value := entry.get(key), (int, float)) and not isinstance(value, bool):
+            return float(value)
+
+    if isinstance(value := entry.get("upload_date"), str) and 8 == len(value) and value.isdigit():
+        try:
+            return datetime.strptime(value, "%Y%m%d").replace(tzinfo=UTC).timestamp()
+        except ValueError:
+            return None
+
+    return None
+
+
+class ScanMarks(metaclass=ThreadSafe):
+    """
+    Remembers the newest entry seen by the last incremental scan of each playlist or channel.
+
+    Marks are keyed by the playlist archive id and stored as JSON in the config directory.
+    """
+
+    def __init__(self, file: Path | None = None) -> None:
+        self._file: Path = file or Path(Config.get_instance().config_path) / SCAN_MARKS_FILE
+        self._marks: dict[str, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_instance() -> "ScanMarks":
+        return ScanMarks()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._marks is not None:
+            return self._marks
+
+        try:
+            data = json.loads(self._file.read_text(encoding="utf-8"))
+            self._marks = {k: v for k, v in data.items() if isinstance(v, dict)} if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            self._marks = {}
+        except (OSError, ValueError) as e:
+            LOG.warning(
+                "Failed to read scan marks from '%s'.",
+                self._file,
+                extra={"file": str(self._file), "exception_type": type(e).__name__},
+            )
+            self._marks = {}
+
+        return self._marks
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Get the mark of a playlist.
+
+        Args:
+            key (str): The playlist archive id.
+
+        Returns:
+            dict | None: The mark with ``id``, ``timestamp`` and ``updated_at`` keys, or None.
+
+        """
+        with self._lock:
+            return self._load().get(key)
+
+    def set(self, key: str, entry_id: str, timestamp: float | None = None) -> None:
+        """
+        Persist the newest entry of a playlist.
+
+        Args:
+            key (str): The playlist archive id.
+            entry_id (str): The archive id of the newest entry.
+            timestamp (float | None): The upload time of the newest entry, if known.
+
+        """
+        with self._lock:
+            marks = self._load()
+            marks[key] = {"id": entry_id, "timestamp": timestamp, "updated_at": datetime.now(UTC).isoformat()}
+
+            try:
+                self._file.parent.mkdir(parents=True, exist_ok=True)
+                temp_file: Path = self._file.with_suffix(".tmp")
+                temp_file.write_text(json.dumps(marks, indent=2), encoding="utf-8")
+                temp_file.replace(self._file)
+            except OSError as e:
+                LOG.warning(
+                    "Failed to persist scan marks to '%s'.",
+                    self._file,
+                    extra={"file": str(self._file), "exception_type": type(e).__name__},
+                )
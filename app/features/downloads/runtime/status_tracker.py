@@ -306,6 +306,45 @@ class StatusTracker:
         else:
             self._emit_progress()
 
+    async def _next_status(self) -> Any:
+        """
+        Read the next status update from the queue.
+
+        Multiprocessing queues are read by waiting for their pipe to become readable on the event loop.
+        Other queues, or loops without reader support, fall back to a blocking get in the default executor.
+
+        Returns:
+            The next status update.
+
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            fd: int = self.status_queue._reader.fileno()
+        except (AttributeError, OSError, ValueError):
+            return await loop.run_in_executor(None, self.status_queue.get)
+
+        while True:
+            try:
+                return self.status_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            readable: asyncio.Future = loop.create_future()
+
+            def wake(fut: asyncio.Future = readable) -> None:
+                if not fut.done():
+                    fut.set_result(None)
+
+            try:
+                loop.add_reader(fd, wake)
+            except NotImplementedError:
+                return await loop.run_in_executor(None, self.status_queue.get)
+
+            try:
+                await readable
+            finally:
+                loop.remove_reader(fd)
+
     async def progress_update(self) -> None:
         """
         Continuous loop that processes status updates from the queue.
@@ -314,8 +353,8 @@ class StatusTracker:
         """
         while True:
             try:
-                update_task = asyncio.get_running_loop().run_in_executor(None, self.status_queue.get)
-                self.update_task = asyncio.ensure_future(update_task)
+                update_task = asyncio.ensure_future(self._next_status())
+                self.update_task = update_task
                 status = await update_task
                 if status is None or isinstance(status, Terminator):
                     self._flush_progress()
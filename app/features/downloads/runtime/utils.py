@@ -81,25 +81,6 @@ def is_safe_to_delete_dir(path: Path, root_path: str | Path) -> bool:
     return str(path) != str(root_path)
 
 
-def wait_for_process_with_timeout(proc, timeout: float, check_interval: float = 0.1) -> bool:
-    """
-    Wait for process to terminate with timeout.
-
-    Args:
-        proc: The multiprocessing.Process to wait for
-        timeout: Maximum time to wait in seconds
-        check_interval: How often to check process state
-
-    Returns:
-        bool: True if process terminated, False if timeout reached
-
-    """
-    start_time = time.time()
-    while proc.is_alive() and (time.time() - start_time) < timeout:
-        time.sleep(check_interval)
-    return not proc.is_alive()
-
-
 def parse_extractor_limit(
     extractor: str,
     default_limit: int,
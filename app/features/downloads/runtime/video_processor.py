@@ -13,6 +13,7 @@ from app.library.logging import get_logger
 from app.library.Utils import calc_download_path, merge_dict, str_to_dt
 
 from .core import Download
+from .playlist_processor import wait_queue_turn
 
 if TYPE_CHECKING:
     from app.features.downloads.items import Item
@@ -244,6 +245,8 @@ async def add_video(queue: "DownloadQueue", entry: dict, item: "Item", logs: lis
 
             if _requeue:
                 nEvent = Events.ITEM_ADDED
+                await dlInfo.spill_info_dict()
+                await wait_queue_turn()
                 itemDownload = await queue.queue.put(dlInfo)
                 if item.auto_start:
                     queue.pool.trigger_download()
@@ -258,6 +261,8 @@ async def add_video(queue: "DownloadQueue", entry: dict, item: "Item", logs: lis
             nEvent = Events.ITEM_ADDED
             nTitle = "Item Added"
             nMessage = f"Item '{dlInfo.info.title}' has been added to the download queue."
+            await dlInfo.spill_info_dict()
+            await wait_queue_turn()
             itemDownload = await queue.queue.put(dlInfo)
             if item.auto_start:
                 queue.pool.trigger_download()
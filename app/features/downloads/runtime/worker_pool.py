@@ -0,0 +1,269 @@
+"""Reusable download worker processes."""
+
+import asyncio
+import contextlib
+import itertools
+import multiprocessing
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from typing import Any, Protocol
+
+from app.library.config import Config
+from app.library.logging import get_logger
+from app.library.Singleton import Singleton
+
+LOG = get_logger()
+
+WORKER_STOP_TIMEOUT: float = 5.0
+"Seconds a retiring worker is given to exit before it is terminated."
+
+
+class WorkerJob(Protocol):
+    id: str
+    is_live: bool
+
+    def bind_worker(self, status_queue: Any, cancel_event: Any) -> None: ...
+
+    def _download(self) -> None: ...
+
+
+def _worker_main(jobs: Connection, results: Connection, status_queue: Any, cancel_event: Any, max_jobs: int) -> None:
+    """
+    Download worker entry point.
+
+    Runs jobs received over the pipe one at a time. The worker exits after ``max_jobs`` jobs, after a live
+    download (its cancel watcher cannot be reused), after a cancelled job, or when the pipe is closed.
+    """
+    from .bootstrap import ensure_download_runtime
+
+    ensure_download_runtime()
+
+    for _ in range(max(1, max_jobs)):
+        try:
+            job: WorkerJob | None = jobs.recv()
+        except (EOFError, OSError):
+            return
+
+        if job is None:
+            return
+
+        job.bind_worker(status_queue, cancel_event)
+        job._download()
+        results.send(job.id)
+
+        if job.is_live or cancel_event.is_set():
+            return
+
+
+class DownloadWorker:
+    """A long-lived download process with its own status queue, cancel event and job pipe."""
+
+    _counter = itertools.count(1)
+
+    def __init__(self, context: Any, max_jobs: int) -> None:
+        self.name: str = f"download-worker-{next(self._counter)}"
+        self.max_jobs: int = max(1, max_jobs)
+        self.status_queue: Any = context.Queue()
+        self.cancel_event: Any = context.Event()
+
+        job_reader, self._jobs = context.Pipe(duplex=False)
+        self._results, result_writer = context.Pipe(duplex=False)
+
+        self.proc: multiprocessing.Process = context.Process(
+            name=self.name,
+            target=_worker_main,
+            args=(job_reader, result_writer, self.status_queue, self.cancel_event, self.max_jobs),
+        )
+        self.proc.start()
+
+        job_reader.close()
+        result_writer.close()
+
+        self.jobs: int = 0
+        "Jobs submitted to this worker."
+        self.busy: bool = False
+        "Whether a job is in flight."
+        self._done: asyncio.Future[bool] | None = None
+
+    def alive(self) -> bool:
+        try:
+            return self.proc.is_alive()
+        except ValueError:
+            return False
+
+    def reusable(self) -> bool:
+        return not self.busy and self.jobs < self.max_jobs and self.alive()
+
+    def submit(self, job: WorkerJob) -> None:
+        """
+        Send a job to the worker.
+
+        Args:
+            job: The job, must be picklable without multiprocessing primitives.
+
+        """
+        self.cancel_event.clear()
+        self.busy = True
+        self.jobs += 1
+        self._jobs.send(job)
+
+    async def wait_job(self) -> bool:
+        """
+        Wait for the in-flight job to finish.
+
+        The result pipe becomes readable either when the worker reports the job done or when the worker
+        exits and the pipe reaches EOF, so no thread or polling is needed.
+
+        Returns:
+            True if the job completed, False if the worker died or was retired first.
+
+        """
+        loop = asyncio.get_running_loop()
+        done: asyncio.Future[bool] = loop.create_future()
+        self._done = done
+
+        def on_readable() -> None:
+            if done.done():
+                return
+            try:
+                self._results.recv()
+                result = True
+            except (EOFError, OSError):
+                result = False
+            self.busy = False
+            done.set_result(result)
+
+        fd: int = self._results.fileno()
+        loop.add_reader(fd, on_readable)
+        try:
+            return await done
+        finally:
+            with contextlib.suppress(Exception):
+                loop.remove_reader(fd)
+            self._done = None
+            self.busy = False
+
+    def on_job_done(self, callback: Callable[[], None]) -> None:
+        """
+        Call ``callback`` once the job awaited by :meth:`wait_job` finishes or the worker dies.
+
+        Args:
+            callback: Called on the event loop, never if no job is being waited on.
+
+        """
+        if (done := self._done) is not None:
+            done.add_done_callback(lambda _: callback())
+
+    async def stop(self) -> None:
+        """Ask the worker to exit and release its resources."""
+        if self._done is not None and not self._done.done():
+            self._done.set_result(False)
+
+        with contextlib.suppress(OSError, ValueError):
+            self._jobs.send(None)
+
+        from .process_manager import ProcessManager
+
+        manager = ProcessManager(download_id=self.name, is_live=False, logger=LOG)
+        manager.proc = self.proc
+        if not await manager.wait(WORKER_STOP_TIMEOUT) and self.alive():
+            LOG.warning("Download worker '%s' did not exit; terminating it.", self.name, extra={"worker": self.name})
+            self.proc.terminate()
+            if not await manager.wait(2):
+                self.proc.kill()
+                await manager.wait(1)
+
+        manager._unwatch()
+
+        for conn in (self._jobs, self._results):
+            with contextlib.suppress(OSError):
+                conn.close()
+
+        with contextlib.suppress(OSError, ValueError):
+            self.status_queue.close()
+            self.status_queue.cancel_join_thread()
+
+        with contextlib.suppress(ValueError):
+            self.proc.close()
+
+
+class WorkerPool(metaclass=Singleton):
+    """
+    Pool of reusable download worker processes.
+
+    Enabled by ``download_worker_jobs``. Workers are spawned on demand, kept idle up to ``max_workers``,
+    and recycled after ``download_worker_jobs`` jobs, a crash, a cancellation or a live download.
+    """
+
+    def __init__(self, config: Config | None = None) -> None:
+        self._config: Config = config or Config.get_instance()
+        self._context = multiprocessing.get_context()
+        self._idle: list[DownloadWorker] = []
+        self._workers: set[DownloadWorker] = set()
+        self._retiring: set[asyncio.Task] = set()
+
+    @staticmethod
+    def get_instance() -> "WorkerPool":
+        return WorkerPool()
+
+    def enabled(self) -> bool:
+        return int(self._config.download_worker_jobs) > 0
+
+    def acquire(self) -> DownloadWorker:
+        """
+        Get an idle worker or spawn a new one.
+
+        Returns:
+            DownloadWorker: A worker ready to take a job.
+
+        """
+        while self._idle:
+            worker: DownloadWorker = self._idle.pop()
+            if worker.reusable():
+                return worker
+
+            self._retire(worker)
+
+        worker = DownloadWorker(self._context, int(self._config.download_worker_jobs))
+        self._workers.add(worker)
+        LOG.debug(
+            "Spawned download worker '%s' (PID=%s).",
+            worker.name,
+            worker.proc.pid,
+            extra={"worker": worker.name, "process_id": worker.proc.pid, "max_jobs": worker.max_jobs},
+        )
+        return worker
+
+    def release(self, worker: DownloadWorker, reusable: bool = True) -> None:
+        """
+        Return a worker after its job.
+
+        Args:
+            worker: The worker.
+            reusable: False to retire the worker regardless of its state.
+
+        """
+        if reusable and worker.reusable() and len(self._idle) < max(1, int(self._config.max_workers)):
+            self._idle.append(worker)
+            return
+
+        self._retire(worker)
+
+    def pids(self) -> set[int]:
+        """Process ids of the live workers, busy or idle."""
+        return {pid for worker in list(self._workers) if (pid := worker.proc.pid)}
+
+    def _retire(self, worker: DownloadWorker) -> None:
+        self._workers.discard(worker)
+        task: asyncio.Task = asyncio.create_task(worker.stop(), name=f"retire-{worker.name}")
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+    async def shutdown(self) -> None:
+        """Stop all workers and wait for them to exit."""
+        self._idle = []
+        for worker in list(self._workers):
+            self._retire(worker)
+
+        if self._retiring:
+            await asyncio.gather(*list(self._retiring), return_exceptions=True)
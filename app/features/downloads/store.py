@@ -1,3 +1,5 @@
+import base64
+import json
 from collections import OrderedDict
 from collections.abc import Iterable
 from enum import Enum
@@ -6,6 +8,7 @@ from app.features.downloads.items import ItemDTO
 from app.features.downloads.repository import DownloadsRepository
 from app.features.downloads.runtime.core import Download
 from app.library.logging import get_logger
+from app.library.metrics import MetricsRegistry
 from app.library.operations import matches_condition
 
 LOG = get_logger()
@@ -31,6 +34,14 @@ class StoreType(str, Enum):
         return self.value
 
 
+def _record(store: StoreType, operation: str, size: int) -> None:
+    metrics: MetricsRegistry = MetricsRegistry.get_instance()
+    metrics.counter("store_operations_total", "Download store writes.", ("store", "operation")).inc(
+        store.value, operation
+    )
+    metrics.gauge("store_items", "Download items held in memory by each store.", ("store",)).set(size, store.value)
+
+
 class DataStore:
     def __init__(self, type: StoreType, connection: DownloadsRepository):
         self._type = type
@@ -41,6 +52,7 @@ class DataStore:
         saved = await self._connection.fetch_saved(str(self._type))
         for key, item in saved:
             self._dict[key] = Download(info=item)
+        _record(self._type, "load", len(self._dict))
 
     async def saved_items(self) -> list[tuple[str, ItemDTO]]:
         return await self._connection.fetch_saved(str(self._type))
@@ -159,11 +171,13 @@ class DataStore:
         _ = no_notify
         self._dict[value.info._id] = value
         await self._connection.enqueue_upsert(str(self._type), value.info.to_download_model(str(self._type)))
+        _record(self._type, "put", len(self._dict))
         return self._dict[value.info._id]
 
     async def delete(self, key: str) -> None:
         self._dict.pop(key, None)
         await self._connection.enqueue_delete(str(self._type), key)
+        _record(self._type, "delete", len(self._dict))
 
     async def position(self, ids: list[str], position: str) -> list[str]:
         """Move selected queue items to the front or back of pending items."""
@@ -211,7 +225,12 @@ class DataStore:
         return await self._connection.count(str(self._type), status_filter=status_filter)
 
     async def get_items_paginated(
-        self, page: int = 1, per_page: int = 50, order: str = "DESC", status_filter: str | None = None
+        self,
+        page: int = 1,
+        per_page: int = 50,
+        order: str = "DESC",
+        status_filter: str | None = None,
+        search: str | None = None,
     ) -> tuple[list[tuple[str, Download]], int, int, int]:
         if page < 1:
             msg = "page must be >= 1"
@@ -228,11 +247,44 @@ class DataStore:
 
         await self._connection.flush()
         items, total_items, current_page, total_pages = await self._connection.paginate(
-            str(self._type), page, per_page, order, status_filter
+            str(self._type), page, per_page, order, status_filter, search
         )
 
         return [(item_id, Download(info=item)) for item_id, item in items], total_items, current_page, total_pages
 
+    async def get_items_after(
+        self,
+        cursor: str | None = None,
+        per_page: int = 50,
+        order: str = "DESC",
+        status_filter: str | None = None,
+    ) -> tuple[list[tuple[str, Download]], int, str | None]:
+        # Keyset pagination: the cursor is the opaque position of the last item of the previous page.
+        if per_page < 1:
+            msg = "per_page must be >= 1"
+            raise ValueError(msg)
+
+        order = order.upper()
+        if order not in ("ASC", "DESC"):
+            msg = f"order must be 'ASC' or 'DESC', got '{order}'"
+            raise ValueError(msg)
+
+        position: tuple[str, str] | None = None
+        if cursor:
+            try:
+                created_at, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+                position = (str(created_at), str(item_id))
+            except Exception as exc:
+                msg = "cursor is invalid."
+                raise ValueError(msg) from exc
+
+        await self._connection.flush()
+        items, after = await self._connection.paginate_after(str(self._type), per_page, order, status_filter, position)
+        total: int = await self._connection.count(str(self._type), status_filter=status_filter)
+        next_cursor: str | None = base64.urlsafe_b64encode(json.dumps(after).encode()).decode() if after else None
+
+        return [(item_id, Download(info=item)) for item_id, item in items], total, next_cursor
+
     async def bulk_delete(self, ids: Iterable[str]) -> int:
         ids_list = list(ids)
         deleted = await self._connection.bulk_delete(str(self._type), ids_list)
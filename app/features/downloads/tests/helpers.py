@@ -14,10 +14,6 @@ class RepositoryDatabase:
     def __getattr__(self, name: str) -> Any:
         return getattr(self._repository, name)
 
-    @property
-    def _conn(self):
-        return self._store._conn
-
     async def execute_raw(self, query: str, params: dict | tuple | None = None) -> None:
         await self._store.execute_raw(query, params)
 
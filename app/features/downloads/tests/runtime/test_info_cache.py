@@ -0,0 +1,70 @@
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.features.downloads.runtime.info_cache import InfoCache
+from app.tests.helpers import temporary_test_dir
+
+
+@pytest.fixture
+def cache():
+    InfoCache._reset_singleton()
+    with temporary_test_dir("info-cache") as temp_dir:
+        yield InfoCache(temp_dir / "info_cache", expires=60)
+    InfoCache._reset_singleton()
+
+
+def test_put_pop_roundtrip(cache: InfoCache) -> None:
+    info = {"id": "abc", "formats": [{"format_id": "18", "url": "https://example.com/v"}] * 50, "tags": {"a"}}
+
+    assert cache.put("item-1", info) is True
+    file = cache._file("item-1")
+    assert file.exists()
+    assert file.stat().st_size < len(str(info)), "blob must be compressed"
+
+    loaded = cache.pop("item-1")
+
+    assert loaded is not None
+    assert loaded["formats"] == info["formats"]
+    assert loaded["tags"] == ["a"]
+    assert not file.exists(), "pop must remove the blob"
+    assert cache.pop("item-1") is None
+
+
+def test_expired_blob_is_dropped(cache: InfoCache) -> None:
+    cache.put("old", {"id": "old"})
+    stale: float = time.time() - 120
+    os.utime(cache._file("old"), (stale, stale))
+
+    assert cache.pop("old") is None
+    assert not cache._file("old").exists()
+
+
+def test_clear_and_unsafe_keys(cache: InfoCache) -> None:
+    cache.put("../escape", {"id": "x"})
+
+    assert cache._file("../escape").parent == cache._path
+    cache.clear()
+    assert not cache._path.exists()
+
+
+@pytest.mark.asyncio
+async def test_download_spills_and_restores(cache: InfoCache) -> None:
+    from app.features.downloads.items import ItemDTO
+    from app.features.downloads.runtime.core import Download
+
+    download = Download(
+        info=ItemDTO(id="v1", title="t", url="https://example.com/v1", folder=""), info_dict={"id": "v1"}
+    )
+
+    with patch.object(InfoCache, "get_instance", return_value=cache):
+        assert await download.spill_info_dict() is True
+        assert download.info_dict is None
+        assert cache._file(download.id).exists()
+
+        await download._restore_info_dict()
+
+    assert download.info_dict == {"id": "v1"}
+    assert not cache._file(download.id).exists()
@@ -0,0 +1,140 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.features.downloads.runtime import playlist_processor
+from app.features.downloads.runtime.playlist_processor import process_playlist
+from app.features.downloads.runtime.scan_marks import ScanMarks, entry_archive_id, entry_timestamp
+from app.tests.helpers import temporary_test_dir
+
+
+class FakeItem:
+    def __init__(self, archive_file: Path | None, extras: dict | None = None) -> None:
+        self.extras = {"source_handler": "Tasks"} if extras is None else extras
+        self._opts = {"download_archive": str(archive_file)} if archive_file else {}
+
+    def get_ytdlp_opts(self):
+        return Mock(get_all=Mock(return_value=dict(self._opts)))
+
+    def new_with(self, **kwargs):
+        return SimpleNamespace(extras=kwargs["extras"], url=kwargs["url"])
+
+
+def _channel(count: int, **extra: Any) -> dict:
+    return {
+        "_type": "playlist",
+        "id": "UC1",
+        "title": "Channel",
+        "extractor_key": "YoutubeTab",
+        "entries": [
+            {"_type": "url", "ie_key": "Youtube", "id": f"v{n}", "url": f"https://example.com/v{n}", **extra}
+            for n in range(count)
+        ],
+    }
+
+
+@pytest.fixture
+def scan_env():
+    ScanMarks._reset_singleton()
+    with temporary_test_dir("playlist-incremental") as temp_dir:
+        ScanMarks(temp_dir / "scan_marks.json")
+        queue = Mock(add=AsyncMock(return_value={"status": "ok"}), config=SimpleNamespace(playlist_incremental_stop=3))
+        yield temp_dir, queue
+    ScanMarks._reset_singleton()
+
+
+def _added(queue: Mock) -> list[str]:
+    return [call.kwargs["item"].url.rsplit("/", 1)[-1] for call in queue.add.await_args_list]
+
+
+def test_entry_helpers() -> None:
+    assert entry_archive_id({"ie_key": "Youtube", "id": "abc"}) == "youtube abc"
+    assert entry_archive_id({"id": "abc"}) is None
+    assert entry_timestamp({"timestamp": 10}) == 10.0
+    assert entry_timestamp({"upload_date": "19700102"}) == 86400.0
+    assert entry_timestamp({"upload_date": "bad"}) is None
+
+
+@pytest.mark.asyncio
+async def test_stops_after_consecutive_archived(scan_env) -> None:
+    temp_dir, queue = scan_env
+    archive = temp_dir / "archive.log"
+    archive.write_text("".join(f"youtube v{n}\n" for n in range(2, 100)))
+
+    with (
+        patch.object(playlist_processor, "ytdlp_reject", return_value=(True, "")),
+        patch.object(playlist_processor, "archive_read", wraps=playlist_processor.archive_read) as reader,
+    ):
+        result = await process_playlist(queue=queue, entry=_channel(100), item=FakeItem(archive))
+
+    assert result == {"status": "ok"}
+    assert _added(queue) == ["v0", "v1"]
+    assert reader.call_count == 1, "archive must be checked once for the whole playlist"
+    assert ScanMarks.get_instance().get("youtubetab UC1")["id"] == "youtube v0"
+
+
+@pytest.mark.asyncio
+async def test_high_water_mark_bounds_next_scan(scan_env) -> None:
+    temp_dir, queue = scan_env
+    archive = temp_dir / "archive.log"
+    archive.write_text("")
+    ScanMarks.get_instance().set("youtubetab UC1", "youtube v2")
+
+    with patch.object(playlist_processor, "ytdlp_reject", return_value=(True, "")):
+        await process_playlist(queue=queue, entry=_channel(50), item=FakeItem(archive))
+
+    assert _added(queue) == ["v0", "v1", "v2", "v3", "v4"], "entries behind the mark count towards the stop"
+
+
+@pytest.mark.asyncio
+async def test_orders_by_upload_time(scan_env) -> None:
+    temp_dir, queue = scan_env
+    archive = temp_dir / "archive.log"
+    archive.write_text("youtube v0\nyoutube v1\nyoutube v2\n")
+    entry = _channel(4)
+    for n, etr in enumerate(entry["entries"]):
+        etr["timestamp"] = 1000 + n
+
+    with patch.object(playlist_processor, "ytdlp_reject", return_value=(True, "")):
+        await process_playlist(queue=queue, entry=entry, item=FakeItem(archive))
+
+    assert _added(queue) == ["v3"]
+    assert ScanMarks.get_instance().get("youtubetab UC1")["timestamp"] == 1003.0
+
+
+@pytest.mark.asyncio
+async def test_manual_adds_scan_everything(scan_env) -> None:
+    temp_dir, queue = scan_env
+    archive = temp_dir / "archive.log"
+    archive.write_text("".join(f"youtube v{n}\n" for n in range(10)))
+
+    with patch.object(playlist_processor, "ytdlp_reject", return_value=(True, "")):
+        await process_playlist(queue=queue, entry=_channel(10), item=FakeItem(archive, extras={}))
+
+    assert queue.add.await_count == 10
+    assert ScanMarks.get_instance().get("youtubetab UC1") is None
+
+
+@pytest.mark.asyncio
+async def test_disabled_without_archive(scan_env) -> None:
+    _, queue = scan_env
+
+    with patch.object(playlist_processor, "ytdlp_reject", return_value=(True, "")):
+        await process_playlist(queue=queue, entry=_channel(5), item=FakeItem(None))
+
+    assert queue.add.await_count == 5
+
+
+def test_marks_persist(scan_env) -> None:
+    temp_dir, _ = scan_env
+    ScanMarks.get_instance().set("youtubetab UC1", "youtube v9", 123.0)
+    ScanMarks._reset_singleton()
+
+    mark = ScanMarks(temp_dir / "scan_marks.json").get("youtubetab UC1")
+
+    assert mark is not None
+    assert mark["id"] == "youtube v9"
+    assert mark["timestamp"] == 123.0
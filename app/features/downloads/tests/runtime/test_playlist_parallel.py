@@ -0,0 +1,74 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.features.downloads.runtime import playlist_processor
+from app.features.downloads.runtime.playlist_processor import process_playlist, wait_queue_turn
+
+
+class FakeItem:
+    def __init__(self, opts: dict | None = None) -> None:
+        self.extras = {}
+        self._opts = opts or {}
+
+    def get_ytdlp_opts(self):
+        return Mock(get_all=Mock(return_value=dict(self._opts)))
+
+    def new_with(self, **kwargs):
+        return SimpleNamespace(extras=kwargs["extras"], url=kwargs["url"])
+
+
+def _playlist(count: int) -> dict:
+    return {
+        "_type": "playlist",
+        "id": "PL1",
+        "title": "Playlist",
+        "entries": [{"_type": "url", "id": f"v{n}", "url": f"https://example.com/v{n}"} for n in range(1, count + 1)],
+    }
+
+
+class FakeQueue:
+    def __init__(self, concurrency: int) -> None:
+        self.config = SimpleNamespace(extract_info_concurrency=concurrency, playlist_incremental_stop=0)
+        self.active = 0
+        self.peak = 0
+        self.queued: list[int] = []
+
+    async def add(self, item, already=None, **_):
+        index: int = item.extras["playlist_index"]
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        # Later entries finish extracting first.
+        await asyncio.sleep(0.002 * (10 - index))
+        self.active -= 1
+
+        if 0 == index % 4:
+            return {"status": "error", "msg": f"bad {index}"}
+
+        await wait_queue_turn()
+        self.queued.append(index)
+        return {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_entries_run_concurrently_but_queue_in_order() -> None:
+    queue = FakeQueue(concurrency=3)
+
+    with patch.object(playlist_processor, "ytdlp_reject", return_value=(True, "")):
+        result = await process_playlist(queue=queue, entry=_playlist(9), item=FakeItem())
+
+    assert 1 < queue.peak <= 3
+    assert queue.queued == [1, 2, 3, 5, 6, 7, 9]
+    assert result == {"status": "error", "msg": "bad 4, bad 8"}
+
+
+@pytest.mark.asyncio
+async def test_max_downloads_is_respected() -> None:
+    queue = FakeQueue(concurrency=4)
+
+    with patch.object(playlist_processor, "ytdlp_reject", return_value=(True, "")):
+        await process_playlist(queue=queue, entry=_playlist(9), item=FakeItem({"max_downloads": 3}))
+
+    assert queue.queued == [1, 2, 3]
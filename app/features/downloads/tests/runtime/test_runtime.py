@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import logging
 import os
 import signal
@@ -391,7 +392,7 @@ class TestDownloadStale:
 
         # Create a mock process
         mock_proc = MagicMock()
-        mock_proc.join = MagicMock(return_value=0)
+        mock_proc.exitcode = 0
 
         # Create a proper mock for create_task that consumes the coroutine
         created_tasks = []
@@ -408,17 +409,11 @@ class TestDownloadStale:
             patch.object(d._process_manager, "create_process", return_value=mock_proc) as mock_create,
             patch.object(d._process_manager, "start") as mock_start,
             patch("asyncio.create_task", side_effect=mock_create_task) as mock_create_task_fn,
-            patch("asyncio.get_running_loop") as mock_loop,
+            patch.object(d._process_manager, "wait", AsyncMock(return_value=True)),
         ):
             # Set the mock proc on the process manager
             d._process_manager.proc = mock_proc
 
-            # Mock the join to return immediately
-            async def mock_executor(*args):
-                return 0
-
-            mock_loop.return_value.run_in_executor = mock_executor
-
             # Mock status tracker to prevent actual status updates
             d._status_tracker = MagicMock()
             d._status_tracker.final_update = True
@@ -444,10 +439,11 @@ class TestDownloadClose:
         download.id = download.info._id
         download.logger = Mock()
         download.status_queue = Mock()
+        download._info_key = None
         download._status_tracker = Mock()
         download._hook_handlers = Mock()
         download._temp_manager = Mock()
-        download._process_manager = Mock(cancel_in_progress=False)
+        download._process_manager = Mock(cancel_in_progress=False, worker=None)
         download._process_manager.started.return_value = started
         download._process_manager.close = AsyncMock()
         return download, download.status_queue, download._status_tracker
@@ -808,6 +804,8 @@ class TestDownloadFlow:
         download_mock._download = fake_download
 
         class InlineProcess:
+            exitcode = 0
+
             def __init__(self, target):
                 self._target = target
                 self.pid = 12345
@@ -910,6 +908,8 @@ class TestDownloadFlow:
         download_mock._download = fake_download
 
         class InlineProcess:
+            exitcode = 0
+
             def __init__(self, target):
                 self._target = target
                 self.pid = 12345
@@ -1006,14 +1006,14 @@ class TestDownloadFlow:
         download = Download(make_item(id="regular-id"))
         monkeypatch.setattr(download._process_manager, "create_queue", lambda: DummyQueue())
 
-        mock_proc = Mock()
+        mock_proc = Mock(exitcode=0)
 
-        def join_process():
+        async def wait_process(*_args):
             # Cancellation cleanup may clear the instance reference before start() resumes.
             download._status_tracker = None
-            return 0
+            return True
 
-        mock_proc.join = Mock(side_effect=join_process)
+        monkeypatch.setattr(download._process_manager, "wait", wait_process)
 
         def start_process():
             download._process_manager.cancelled = True
@@ -1297,31 +1297,35 @@ class TestProcessManager:
 
         assert pm.is_cancelled() is False, "Should return False by default"
 
-    def test_cancel_marks_as_cancelled(self) -> None:
+    @pytest.mark.asyncio
+    async def test_cancel_marks_as_cancelled(self) -> None:
         logger = logging.getLogger("test")
         pm = ProcessManager("test-id", is_live=False, logger=logger)
         pm.proc = Mock()
         pm.proc.is_alive = Mock(return_value=False)
 
-        result = pm.cancel()
+        result = await pm.cancel()
         assert pm.is_cancelled() is True, "Should mark as cancelled"
 
-    def test_cancel_not_started(self) -> None:
+    @pytest.mark.asyncio
+    async def test_cancel_not_started(self) -> None:
         logger = logging.getLogger("test")
         pm = ProcessManager("test-id", is_live=False, logger=logger)
 
-        result = pm.cancel()
+        result = await pm.cancel()
         assert result is False, "Should return False when process not started"
         assert pm.is_cancelled() is False, "Should not mark as cancelled when not started"
 
-    def test_kill_not_running(self) -> None:
+    @pytest.mark.asyncio
+    async def test_kill_not_running(self) -> None:
         logger = logging.getLogger("test")
         pm = ProcessManager("test-id", is_live=False, logger=logger)
 
-        result = pm.kill()
+        result = await pm.kill()
         assert result is False, "Should return False when process not running"
 
-    def test_kill_sends_sigusr1_posix(self) -> None:
+    @pytest.mark.asyncio
+    async def test_kill_sends_sigusr1_posix(self) -> None:
         if "posix" != os.name:
             pytest.skip("Test only runs on POSIX systems")
 
@@ -1333,11 +1337,12 @@ class TestProcessManager:
         pm.proc.is_alive = Mock(side_effect=[True, False, False])
 
         with patch("app.features.downloads.runtime.process_manager.os.kill") as mock_kill:
-            result = pm.kill()
+            result = await pm.kill()
             mock_kill.assert_called_once_with(12345, signal.SIGUSR1)
             assert result is True, "Should return True when process killed successfully"
 
-    def test_kill_live_uses_event(self) -> None:
+    @pytest.mark.asyncio
+    async def test_kill_live_uses_event(self) -> None:
         logger = logging.getLogger("test")
         pm_live = ProcessManager("test-id", is_live=True, logger=logger)
         pm_regular = ProcessManager("test-id", is_live=False, logger=logger)
@@ -1354,27 +1359,23 @@ class TestProcessManager:
 
         with (
             patch("app.features.downloads.runtime.process_manager.os.kill") as mock_kill,
-            patch(
-                "app.features.downloads.runtime.process_manager.wait_for_process_with_timeout", return_value=True
-            ) as mock_wait,
+            patch.object(pm_live, "wait", AsyncMock(return_value=True)) as mock_wait,
         ):
-            assert pm_live.kill() is True, "Live downloads should stop via the shared cancel event"
+            assert await pm_live.kill() is True, "Live downloads should stop via the shared cancel event"
             assert pm_live.cancel_event.is_set() is True, "Live kill should signal the worker cancel event"
             mock_kill.assert_not_called()
-            mock_wait.assert_called_once_with(pm_live.proc, 10)
+            mock_wait.assert_awaited_once_with(10)
 
         if "posix" != os.name:
             pytest.skip("Regular SIGUSR1 path only runs on POSIX systems")
 
         with (
             patch("app.features.downloads.runtime.process_manager.os.kill") as mock_kill,
-            patch(
-                "app.features.downloads.runtime.process_manager.wait_for_process_with_timeout", return_value=True
-            ) as mock_wait,
+            patch.object(pm_regular, "wait", AsyncMock(return_value=True)) as mock_wait,
         ):
-            assert pm_regular.kill() is True, "Regular downloads should keep SIGUSR1 behavior"
+            assert await pm_regular.kill() is True, "Regular downloads should keep SIGUSR1 behavior"
             mock_kill.assert_called_once_with(12346, signal.SIGUSR1)
-            mock_wait.assert_called_once_with(pm_regular.proc, 5)
+            mock_wait.assert_awaited_once_with(5)
 
     @pytest.mark.asyncio
     async def test_close_not_started(self) -> None:
@@ -1408,6 +1409,35 @@ class TestProcessManager:
         assert result is True, "Should return True on successful close"
         assert pm.proc is None, "Process reference should be cleared"
 
+    @pytest.mark.asyncio
+    async def test_wait_real_process(self) -> None:
+        pm = ProcessManager("test-id", is_live=False, logger=logging.getLogger("test"))
+        pm.create_process(functools.partial(time.sleep, 0.2))
+        pm.start()
+
+        first, second = await asyncio.gather(pm.wait(), pm.wait())
+
+        assert first is second is True, "Concurrent waiters must all be woken on exit"
+        assert pm.running() is False
+        assert pm.proc is not None
+        assert pm.proc.exitcode == 0
+        assert pm._exit_fd is None, "Exit fd must be released once the process exits"
+        assert await pm.close() is True
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_then_kill(self) -> None:
+        if "posix" != os.name:
+            pytest.skip("Test only runs on POSIX systems")
+
+        pm = ProcessManager("test-id", is_live=False, logger=logging.getLogger("test"))
+        pm.create_process(functools.partial(time.sleep, 30))
+        pm.start()
+
+        assert await pm.wait(0.1) is False, "Should time out while the process is alive"
+        assert await pm.kill() is True
+        assert pm.running() is False
+        assert await pm.close() is True
+
 
 class TestStatusTracker:
     @pytest.fixture
@@ -1429,6 +1459,27 @@ class TestStatusTracker:
         assert st.tmpfilename is None, "Should initialize tmpfilename as None"
         assert st.final_update is False, "Should initialize final_update as False"
 
+    @pytest.mark.asyncio
+    async def test_next_status_reads_pipe(self, mock_config: dict[str, Any]) -> None:
+        import multiprocessing
+
+        status_queue = multiprocessing.get_context().Queue()
+        st = StatusTracker(**{**mock_config, "status_queue": status_queue})
+
+        try:
+            with patch.object(
+                asyncio.get_running_loop(), "run_in_executor", side_effect=AssertionError("must not use a thread")
+            ):
+                reader = asyncio.ensure_future(st._next_status())
+                await asyncio.sleep(0.05)
+                assert reader.done() is False, "Should wait for the pipe to become readable"
+
+                status_queue.put({"id": "test-id", "status": "downloading"})
+                assert await asyncio.wait_for(reader, 2) == {"id": "test-id", "status": "downloading"}
+        finally:
+            status_queue.close()
+            status_queue.join_thread()
+
     @pytest.mark.asyncio
     async def test_status_ignores_bad_id(self, mock_config: dict[str, Any]) -> None:
         st = StatusTracker(**mock_config)
@@ -1755,7 +1806,9 @@ class TestQueueManager:
         from app.features.downloads.runtime.monitors import check_retries
 
         queue: Any = object.__new__(DownloadQueue)
-        queue.config = SimpleNamespace(retry=2, auto_clear_history_days=0)
+        queue.config = SimpleNamespace(
+            retry=2, auto_clear_history_days=0, thumb_trickplay=False, download_worker_jobs=0
+        )
         queue._notify = Mock()
 
         with (
@@ -1767,6 +1820,20 @@ class TestQueueManager:
         jobs = [call.kwargs["id"] for call in scheduler.get_instance.return_value.add.call_args_list]
         assert check_retries.__name__ in jobs
 
+    def test_attach_subscribes_trickplay(self) -> None:
+        queue: Any = object.__new__(DownloadQueue)
+        queue.config = SimpleNamespace(retry=0, auto_clear_history_days=0, thumb_trickplay=True, download_worker_jobs=0)
+        queue._notify = Mock()
+
+        with (
+            patch("app.features.downloads.runtime.queue_manager.Scheduler"),
+            patch("app.features.downloads.runtime.queue_manager.Services"),
+        ):
+            queue.attach(Mock())
+
+        events = [call.args[0] for call in queue._notify.subscribe.call_args_list]
+        assert Events.ITEM_COMPLETED in events
+
     class LiveStore:
         def __init__(self, items: dict[str, Download]) -> None:
             self._items = items
@@ -1859,7 +1926,9 @@ class TestQueueManager:
 
         def fake_download(*, info, info_dict, logs):
             seen.append(info_dict)
-            return SimpleNamespace(info=info, info_dict=info_dict, logs=logs)
+            return SimpleNamespace(
+                info=info, info_dict=info_dict, logs=logs, spill_info_dict=AsyncMock(return_value=False)
+            )
 
         monkeypatch.setattr("app.features.downloads.runtime.video_processor.Download", fake_download)
 
@@ -1885,7 +1954,9 @@ class TestQueueManager:
 
         def fake_download(*, info, info_dict, logs):
             seen.append(info_dict)
-            return SimpleNamespace(info=info, info_dict=info_dict, logs=logs)
+            return SimpleNamespace(
+                info=info, info_dict=info_dict, logs=logs, spill_info_dict=AsyncMock(return_value=False)
+            )
 
         monkeypatch.setattr("app.features.downloads.runtime.video_processor.Download", fake_download)
 
@@ -1910,7 +1981,9 @@ class TestQueueManager:
         def fake_download(*, info, info_dict, logs):  # noqa: ARG001
             seen_info.append(info_dict)
             seen_url.append(info.url)
-            return SimpleNamespace(info=info, info_dict=info_dict, logs=logs)
+            return SimpleNamespace(
+                info=info, info_dict=info_dict, logs=logs, spill_info_dict=AsyncMock(return_value=False)
+            )
 
         monkeypatch.setattr("app.features.downloads.runtime.video_processor.Download", fake_download)
 
@@ -1998,7 +2071,9 @@ class TestQueueManager:
 
         def fake_download(*, info, info_dict, logs):
             seen.append(info_dict)
-            return SimpleNamespace(info=info, info_dict=info_dict, logs=logs)
+            return SimpleNamespace(
+                info=info, info_dict=info_dict, logs=logs, spill_info_dict=AsyncMock(return_value=False)
+            )
 
         monkeypatch.setattr("app.features.downloads.runtime.video_processor.Download", fake_download)
 
@@ -2200,14 +2275,14 @@ class TestQueueManager:
         item.info = make_item(id="queued-id")
         item.is_live = True
         item.running.return_value = True
-        item.cancel.return_value = True
+        item.cancel = AsyncMock(return_value=True)
         item.close = AsyncMock()
 
         queue_manager.queue.get = AsyncMock(return_value=item)
 
         status = await DownloadQueue.cancel(queue_manager, [item.info._id])
 
-        item.cancel.assert_called_once()
+        item.cancel.assert_awaited_once()
         item.close.assert_not_awaited()
         assert status[item.info._id] == "ok", "Running cancel should still report success"
 
@@ -2222,14 +2297,14 @@ class TestQueueManager:
         item.info = make_item(id="queued-id")
         item.is_live = False
         item.running.return_value = True
-        item.cancel.return_value = True
+        item.cancel = AsyncMock(return_value=True)
         item.close = AsyncMock()
 
         queue_manager.queue.get = AsyncMock(return_value=item)
 
         status = await DownloadQueue.cancel(queue_manager, [item.info._id])
 
-        item.cancel.assert_called_once()
+        item.cancel.assert_awaited_once()
         item.close.assert_awaited_once()
         assert status[item.info._id] == "ok", "Regular running cancel should still report success"
 
@@ -16,7 +16,6 @@ from app.features.downloads.runtime.utils import (
     is_safe_to_delete_dir,
     parse_extractor_limit,
     safe_relative_path,
-    wait_for_process_with_timeout,
 )
 
 
@@ -72,46 +71,6 @@ class TestPathUtilities:
         assert result is False, "Should handle string root path"
 
 
-class TestProcessUtilities:
-    def test_wait_timeout_done(self) -> None:
-        proc = Mock()
-        proc.is_alive = Mock(return_value=False)
-        result = wait_for_process_with_timeout(proc, timeout=1.0)
-        assert result is True, "Should return True when process terminates immediately"
-
-    def test_wait_timeout_delay(self) -> None:
-        proc = Mock()
-        call_count = [0]
-
-        def is_alive_side_effect():
-            call_count[0] += 1
-            return call_count[0] < 3
-
-        proc.is_alive = Mock(side_effect=is_alive_side_effect)
-
-        with patch("time.sleep"):
-            result = wait_for_process_with_timeout(proc, timeout=1.0, check_interval=0.1)
-
-        assert result is True, "Should return True when process terminates during wait"
-        assert proc.is_alive.call_count >= 3, "Should check process multiple times"
-
-    def test_wait_process_timeout_expires(self) -> None:
-        proc = Mock()
-        proc.is_alive = Mock(return_value=True)
-
-        with patch("time.time") as mock_time, patch("time.sleep"):
-            mock_time.side_effect = [0, 0.5, 1.0, 1.5]
-            result = wait_for_process_with_timeout(proc, timeout=1.0, check_interval=0.1)
-
-        assert result is False, "Should return False when timeout reached"
-
-    def test_wait_process_custom_interval(self) -> None:
-        proc = Mock()
-        proc.is_alive = Mock(return_value=False)
-        result = wait_for_process_with_timeout(proc, timeout=5.0, check_interval=0.5)
-        assert result is True, "Should respect custom check interval"
-
-
 class TestConfigUtilities:
     def test_extractor_limit_valid_env(self) -> None:
         with patch.dict(os.environ, {"YTP_MAX_WORKERS_FOR_YOUTUBE": "3"}):
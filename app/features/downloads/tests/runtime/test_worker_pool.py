@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import os
+import signal
+import time
+from multiprocessing.reduction import ForkingPickler
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+import pytest_asyncio
+
+from app.features.downloads.runtime.process_manager import ProcessManager
+from app.features.downloads.runtime.types import Terminator
+from app.features.downloads.runtime.worker_pool import WorkerPool
+
+
+class PidJob:
+    def __init__(self, job_id: str, is_live: bool = False, crash: bool = False) -> None:
+        self.id = job_id
+        self.is_live = is_live
+        self.crash = crash
+        self.status_queue: Any = None
+
+    def bind_worker(self, status_queue: Any, cancel_event: Any) -> None:  # noqa: ARG002
+        self.status_queue = status_queue
+
+    def _download(self) -> None:
+        if self.crash:
+            os._exit(3)
+
+        self.status_queue.put({"id": self.id, "pid": os.getpid()})
+        self.status_queue.put(Terminator())
+
+
+class SleepJob(PidJob):
+    def _download(self) -> None:
+        stopped: list[int] = []
+        signal.signal(signal.SIGUSR1, lambda signum, _: stopped.append(signum))
+        self.status_queue.put({"id": self.id, "pid": os.getpid()})
+        while not stopped:
+            time.sleep(0.01)
+        self.status_queue.put(Terminator())
+
+
+def _read(worker) -> dict:
+    status = worker.status_queue.get(timeout=5)
+    assert isinstance(worker.status_queue.get(timeout=5), Terminator)
+    return status
+
+
+@pytest_asyncio.fixture
+async def pool():
+    WorkerPool._reset_singleton()
+    instance = WorkerPool(config=SimpleNamespace(download_worker_jobs=2, max_workers=1))
+    yield instance
+    await instance.shutdown()
+    WorkerPool._reset_singleton()
+
+
+@pytest.mark.asyncio
+async def test_worker_is_reused_then_recycled(pool: WorkerPool) -> None:
+    pids: list[int] = []
+    workers = []
+    for n in range(3):
+        worker = pool.acquire()
+        workers.append(worker)
+        worker.submit(PidJob(f"job-{n}"))
+        assert await worker.wait_job() is True
+        pids.append(_read(worker)["pid"])
+        pool.release(worker)
+
+    assert workers[0] is workers[1], "second job must reuse the idle worker"
+    assert pids[0] == pids[1]
+    assert workers[2] is not workers[0], "worker must be recycled after download_worker_jobs jobs"
+    assert pids[2] != pids[0]
+
+
+@pytest.mark.asyncio
+async def test_crashed_worker_is_retired(pool: WorkerPool) -> None:
+    worker = pool.acquire()
+    worker.submit(PidJob("crash", crash=True))
+
+    assert await worker.wait_job() is False
+
+    worker.proc.join(5)
+    assert 3 == worker.proc.exitcode
+    pool.release(worker)
+    assert worker not in pool._idle
+
+
+@pytest.mark.asyncio
+async def test_live_job_retires_worker(pool: WorkerPool) -> None:
+    worker = pool.acquire()
+    worker.submit(PidJob("live", is_live=True))
+
+    assert await worker.wait_job() is True
+    _read(worker)
+    pool.release(worker, reusable=False)
+
+    assert [] == pool._idle
+    assert pool.acquire() is not worker
+
+
+def test_idle_workers_are_capped() -> None:
+    WorkerPool._reset_singleton()
+    instance = WorkerPool(config=SimpleNamespace(download_worker_jobs=5, max_workers=1))
+    instance._retire = Mock()
+    first, second = Mock(reusable=Mock(return_value=True)), Mock(reusable=Mock(return_value=True))
+
+    instance.release(first)
+    instance.release(second)
+
+    assert [first] == instance._idle
+    instance._retire.assert_called_once_with(second)
+    WorkerPool._reset_singleton()
+
+
+@pytest.mark.asyncio
+async def test_process_manager_tracks_worker_job(pool: WorkerPool) -> None:
+    worker = pool.acquire()
+    pm = ProcessManager("job", is_live=False, logger=logging.getLogger("test"))
+    pm.use_worker(worker)
+    pm.start()
+
+    assert pm.proc is worker.proc
+    assert pm.cancel_event is worker.cancel_event
+    assert pm.running() is False, "an idle worker is not a running download"
+
+    worker.submit(PidJob("job"))
+    assert pm.running() is True
+    assert await worker.wait_job() is True
+    _read(worker)
+    assert pm.running() is False
+
+
+@pytest.mark.asyncio
+async def test_cancel_does_not_wait_for_pooled_worker_exit(pool: WorkerPool) -> None:
+    worker = pool.acquire()
+    pm = ProcessManager("sleep", is_live=False, logger=logging.getLogger("test"))
+    pm.use_worker(worker)
+    worker.submit(SleepJob("sleep"))
+    job = asyncio.create_task(worker.wait_job())
+    await asyncio.to_thread(worker.status_queue.get, True, 5)
+
+    started: float = time.monotonic()
+    assert await pm.kill() is True
+    assert time.monotonic() - started < 2, "the kill must end when the job does, not after the grace period"
+    assert await job is True
+    assert isinstance(worker.status_queue.get(timeout=5), Terminator)
+    assert worker.alive(), "a non-live cancel leaves the worker running"
+
+
+def test_download_job_is_picklable() -> None:
+    from app.features.downloads.items import ItemDTO
+    from app.features.downloads.runtime.core import Download
+    from app.features.downloads.runtime.hooks import HookHandlers
+
+    download = Download(info=ItemDTO(id="pickle", title="pickle", url="https://example.test/pickle", folder=""))
+    download.status_queue = download._process_manager.create_queue()
+    download._hook_handlers = HookHandlers(
+        download_id=download.id, status_queue=download.status_queue, logger=download.logger, debug=False
+    )
+
+    job = download._as_job()
+    restored = ForkingPickler.loads(ForkingPickler.dumps(job))
+
+    assert job.status_queue is None
+    assert job._process_manager is None
+    assert restored.id == download.id
+    assert restored.info.url == download.info.url
+    assert download.status_queue is not None, "the original download must keep its runtime state"
+    assert download._process_manager is not None
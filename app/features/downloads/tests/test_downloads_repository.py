@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from collections.abc import AsyncGenerator
 from email.utils import formatdate
@@ -10,6 +11,7 @@ import pytest_asyncio
 from app.features.downloads.repository import DownloadsRepository
 from app.features.downloads.store import StoreType
 from app.features.downloads.items import ItemDTO
+from app.library.metrics import MetricsRegistry
 from app.library.sqlite_store import SqliteStore
 
 
@@ -213,3 +215,21 @@ async def test_unknown_operation(repository: DownloadsRepository) -> None:
 async def test_empty_ids(repository: DownloadsRepository) -> None:
     assert await repository.get_many_by_ids(StoreType.HISTORY.value, []) == []
     assert await repository.bulk_delete(StoreType.HISTORY.value, []) == 0
+
+
+@pytest.mark.asyncio
+async def test_pending_gauge_rises_with_queued_writes(repository: DownloadsRepository) -> None:
+    MetricsRegistry._reset_singleton()
+    gauge = MetricsRegistry.get_instance().gauge("db_write_pending", "")
+    try:
+        async with repository._lock:
+            for n in range(3):
+                item = make_item(f"https://example.test/pending-{n}")
+                await repository.enqueue_upsert(StoreType.QUEUE.value, item.to_download_model(StoreType.QUEUE.value))
+            await asyncio.sleep(0)
+            assert gauge.value() >= 2
+
+        await repository.flush()
+        assert gauge.value() == 0
+    finally:
+        MetricsRegistry._reset_singleton()
@@ -1,10 +1,12 @@
 import json
+import pickle
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from app.features.downloads.items import Item, ItemDTO
+from app.library.Utils import clean_item
 
 
 def _archive_path(tmp_path: Path) -> str:
@@ -169,6 +171,26 @@ class TestItemDTO:
         assert data["download_skipped"] is True
         mock_opts.get_instance.assert_not_called()
 
+    def test_serialize_cache_tracks_changes(self):
+        dto = ItemDTO(id="vid", title="t", url="u", folder="f", extras={"tags": ["a"]})
+
+        with patch("app.features.downloads.items.clean_item", wraps=clean_item) as mock_clean:
+            first = dto.serialize()
+            first["extras"]["tags"].append("mutated")
+            assert dto.serialize()["extras"] == {"tags": ["a"]}, "callers must get independent copies"
+            assert 1 == mock_clean.call_count, "unchanged items must reuse the cached encoding"
+
+            dto.status = "downloading"
+            assert dto.serialize()["status"] == "downloading"
+            dto.extras["tags"].append("b")
+            assert dto.serialize()["extras"] == {"tags": ["a", "b"]}
+            assert 3 == mock_clean.call_count
+
+        clone = pickle.loads(pickle.dumps(dto))
+        assert "_serialized" not in clone.__dict__
+        assert clone.serialize() == dto.serialize()
+        assert dto.to_download_model("queue").data == {k: v for k, v in dto.serialize().items() if "datetime" != k}
+
     @patch("app.features.downloads.items.YTDLPOpts")
     def test_opts_uses_preset_cli(self, mock_opts):
         mock_opts.get_instance.return_value.preset.return_value = mock_opts.get_instance.return_value
@@ -26,7 +26,7 @@ async def reset_sqlite_store() -> None:
     if SqliteStore in SqliteStore._instances:
         instance = SqliteStore._instances[SqliteStore]
         # Only close if there's an active connection to avoid event loop issues
-        if instance._conn is not None:
+        if instance._engine is not None:
             try:
                 await instance.close()
             except RuntimeError:
@@ -21,7 +21,7 @@ async def reset_sqlite_store() -> None:
     if SqliteStore in SqliteStore._instances:
         instance = SqliteStore._instances[SqliteStore]
         # Only close if there's an active connection to avoid event loop issues
-        if instance._conn is not None:
+        if instance._engine is not None:
             try:
                 await instance.close()
             except RuntimeError:
@@ -392,3 +392,92 @@ class TestDataStorePagination:
             assert total_pages == 1
         finally:
             await db.close()
+
+    async def test_search_ranks_and_tracks_writes(self):
+        """Test full-text search ranking and index maintenance on updates and deletes."""
+        db = await make_db(data=20)
+        try:
+            datastore = DataStore(type=StoreType.HISTORY, connection=db)
+
+            items, total, _, _ = await datastore.get_items_paginated(page=1, per_page=5, search="video 1")
+            assert total == 11, "Every word is matched as a prefix"
+            assert len(items) == 5
+
+            await db.execute_raw(
+                """UPDATE "history" SET "data" = json_set("data", '$.title', 'Café "night" OR drive') WHERE "id" = ?""",
+                ("test-id-3",),
+            )
+            await db.execute_raw('DELETE FROM "history" WHERE "id" = ?', ("test-id-19",))
+
+            items, total, _, _ = await datastore.get_items_paginated(page=1, per_page=5, search='cafe "night" OR')
+            assert [item.info._id for _, item in items] == ["test-id-3"]
+            assert total == 1
+
+            _, total, _, _ = await datastore.get_items_paginated(page=1, per_page=5, search="video 19")
+            assert total == 0
+
+            _, total, _, _ = await datastore.get_items_paginated(
+                page=1, per_page=5, status_filter="!finished", search="video"
+            )
+            assert total == 0
+        finally:
+            await db.close()
+
+    async def test_cursor_pagination_walks_every_item_once(self):
+        """Test keyset pagination returns every item exactly once, in order, across same-second ties."""
+        db = await make_db(data=0)
+        try:
+            for i in range(7):
+                await db.execute_raw(
+                    'INSERT INTO "history" ("id", "type", "url", "data", "created_at") VALUES (?, ?, ?, ?, ?)',
+                    (
+                        f"id-{i}",
+                        "done",
+                        f"https://example.com/{i}",
+                        json.dumps({"id": str(i), "title": "t", "url": f"https://example.com/{i}", "folder": ""}),
+                        "2026-01-01 00:00:00",
+                    ),
+                )
+
+            datastore = DataStore(type=StoreType.HISTORY, connection=db)
+            seen: list[str] = []
+            cursor: str | None = None
+            while True:
+                items, total, cursor = await datastore.get_items_after(cursor=cursor, per_page=3, order="ASC")
+                seen.extend(item_id for item_id, _ in items)
+                assert total == 7
+                if not cursor:
+                    break
+
+            assert seen == [f"id-{i}" for i in range(7)]
+
+            with pytest.raises(ValueError, match="cursor is invalid"):
+                await datastore.get_items_after(cursor="not-a-cursor")
+        finally:
+            await db.close()
+
+    async def test_counts_follow_writes_and_reconcile(self):
+        """Test per-status counters follow inserts, updates and deletes, and drift gets reconciled."""
+        db = await make_db(data=4)
+        try:
+            datastore = DataStore(type=StoreType.HISTORY, connection=db)
+            await db.execute_raw(
+                """UPDATE "history" SET "data" = json_set("data", '$.status', 'error') WHERE "id" = ?""",
+                ("test-id-0",),
+            )
+            await db.execute_raw(
+                """UPDATE "history" SET "data" = json_remove("data", '$.status') WHERE "id" = ?""", ("test-id-1",)
+            )
+            await db.execute_raw('DELETE FROM "history" WHERE "id" = ?', ("test-id-2",))
+
+            assert await datastore.get_total_count() == 3
+            assert await datastore.get_total_count(status_filter="finished") == 1
+            assert await datastore.get_total_count(status_filter="error,finished") == 2
+            assert await datastore.get_total_count(status_filter="!finished") == 1, "items without status never match"
+
+            await db.execute_raw('UPDATE "history_counts" SET "total" = 50 WHERE "status" = ?', ("finished",))
+            assert await db.reconcile_counts() == 1
+            assert await db.reconcile_counts() == 0
+            assert await datastore.get_total_count(status_filter="finished") == 1
+        finally:
+            await db.close()
@@ -1,12 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import os
 import shutil
 import subprocess
 import sys
+import time
+from dataclasses import asdict, dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
+
+from app.library.logging import get_logger
+from app.library.Singleton import Singleton
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+LOG = get_logger()
+
+PROBE_VERSION: int = 1
+"Bumped when the probe changes, to discard persisted results."
+
+PROBE_TIMEOUT: float = 20.0
+"Seconds a single test encode may run."
 
 
 @lru_cache(maxsize=1)
@@ -123,6 +141,8 @@ def select_encoder(configured: str) -> str:
     """
     Select a concrete encoder.
 
+    Reads the probed capability matrix, and falls back to software encoding until the probe has finished.
+
     Args:
         configured (str): The configured encoder name, or empty for auto-detect.
 
@@ -134,7 +154,8 @@ def select_encoder(configured: str) -> str:
 
     configured = (configured or "").strip()
 
-    avail: set[str] = ffmpeg_encoders()
+    matrix: EncoderMatrix | None = EncoderCapabilities.get_instance().matrix
+    avail: set[str] = set(matrix.working) if matrix else set()
     if configured and configured in avail:
         return configured
 
@@ -323,3 +344,236 @@ def encoder_fallback_chain(codec: str) -> tuple[str, ...]:
     }
 
     return tuple(chains.get(codec, chains["libx264"]))
+
+
+def _check_encoder_args(codec: str, has_dri: bool, device: str) -> list[str] | None:
+    """
+    Build the arguments of a short test encode, or None if the encoder cannot work on this host.
+
+    The source is generated by lavfi, so hardware encoders upload the frames themselves instead of relying
+    on hardware decoding like the segment builders do.
+    """
+    source: list[str] = ["-f", "lavfi", "-i", "color=c=black:s=256x144:r=25:d=0.2"]
+    if codec in ("h264_vaapi", "h264_qsv") and not (sys.platform.startswith("linux") and has_dri):
+        return None
+
+    if "h264_vaapi" == codec:
+        return ["-vaapi_device", device, *source, "-vf", "format=nv12,hwupload", "-codec:v", codec]
+
+    if "h264_qsv" == codec:
+        return [
+            "-init_hw_device",
+            f"qsv=hw:{device}",
+            "-filter_hw_device",
+            "hw",
+            *source,
+            "-vf",
+            "format=nv12,hwupload=extra_hw_frames=64",
+            "-codec:v",
+            codec,
+        ]
+
+    return [*source, "-pix_fmt", "yuv420p", "-codec:v", codec]
+
+
+def check_encoder(ffmpeg: str, codec: str, has_dri: bool, device: str) -> bool:
+    """
+    Check whether an encoder works by encoding a few generated frames.
+
+    Args:
+        ffmpeg (str): The ffmpeg binary.
+        codec (str): The concrete codec name.
+        has_dri (bool): Whether /dev/dri devices are present.
+        device (str): The VAAPI/QSV render device.
+
+    Returns:
+        bool: True if the test encode succeeded.
+
+    """
+    if not (args := _check_encoder_args(codec, has_dri, device)):
+        return False
+
+    try:
+        result: subprocess.CompletedProcess[str] = subprocess.run(
+            [ffmpeg, "-hide_banner", "-loglevel", "error", *args, "-frames:v", "5", "-f", "null", "-"],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=PROBE_TIMEOUT,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+        )
+    except Exception as exc:
+        LOG.debug("Test encode with '%s' failed: %s", codec, exc, extra={"codec": codec})
+        return False
+
+    if 0 != result.returncode:
+        LOG.debug(
+            "Test encode with '%s' failed: %s",
+            codec,
+            (result.stderr or "").strip()[:500],
+            extra={"codec": codec, "returncode": result.returncode},
+        )
+
+    return 0 == result.returncode
+
+
+@dataclass(kw_only=True)
+class EncoderMatrix:
+    ffmpeg: str
+    "The resolved path of the probed ffmpeg binary."
+    mtime_ns: int
+    "The modification time of the binary when it was probed."
+    device: str
+    "The VAAPI/QSV render device used by the test encodes."
+    encoders: list[str] = field(default_factory=list)
+    "The supported encoders ffmpeg was built with."
+    working: list[str] = field(default_factory=list)
+    "The encoders that passed a test encode."
+    has_dri: bool = False
+    "Whether /dev/dri devices were present."
+    qsv: dict[str, dict[str, bool]] = field(default_factory=dict)
+    "The QSV encode entrypoints per codec, as reported by vainfo."
+    version: int = PROBE_VERSION
+    probed_at: float = 0.0
+
+    def fallback_chain(self, codec: str) -> tuple[str, ...]:
+        """
+        Return the fallback chain of a codec, without the encoders that failed their test encode.
+
+        Software encoding is kept as the last resort either way.
+        """
+        return tuple(name for name in encoder_fallback_chain(codec) if "libx264" == name or name in self.working)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def probe_encoders(ffmpeg: str, device: str) -> EncoderMatrix:
+    """
+    Probe the encoder capability matrix of an ffmpeg binary.
+
+    Args:
+        ffmpeg (str): The resolved ffmpeg binary.
+        device (str): The VAAPI/QSV render device.
+
+    Returns:
+        EncoderMatrix: The probed matrix.
+
+    """
+    from app.library.config import SUPPORTED_CODECS
+
+    has_dri: bool = has_dri_devices()
+    encoders: set[str] = ffmpeg_encoders()
+    matrix = EncoderMatrix(
+        ffmpeg=ffmpeg,
+        mtime_ns=Path(ffmpeg).stat().st_mtime_ns,
+        device=device,
+        encoders=[name for name in SUPPORTED_CODECS if name in encoders],
+        has_dri=has_dri,
+        qsv=detect_qsv_capabilities() if "h264_qsv" in encoders else {},
+        probed_at=time.time(),
+    )
+    matrix.working = [name for name in matrix.encoders if check_encoder(ffmpeg, name, has_dri, device)]
+    return matrix
+
+
+class EncoderCapabilities(metaclass=Singleton):
+    """
+    Holds the encoder capability matrix of the ffmpeg binary in use.
+
+    Probing lists the encoders, reads the QSV entrypoints and test encodes every listed encoder, which can
+    take seconds, so it runs once in the background at startup. The result is persisted and reused for as
+    long as the binary path, its mtime and the render device match. Segment streaming only reads the matrix
+    from memory, and uses software encoding until it is ready.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        from app.library.config import Config
+
+        config: Config = Config.get_instance()
+        self._path: Path = path or Path(config.config_path) / "cache" / "encoders.json"
+        self._device: str = config.vaapi_device
+        self._matrix: EncoderMatrix | None = None
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def get_instance() -> EncoderCapabilities:
+        return EncoderCapabilities()
+
+    @property
+    def matrix(self) -> EncoderMatrix | None:
+        return self._matrix
+
+    def attach(self, _app: web.Application) -> None:
+        from app.library.Events import EventBus, Events
+
+        async def on_started(_, __):
+            self.start()
+
+        EventBus.get_instance().subscribe(Events.STARTED, on_started, f"{EncoderCapabilities.__name__}.probe")
+
+    def start(self) -> asyncio.Task:
+        """Load or probe the matrix in a worker thread, once."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(asyncio.to_thread(self.load), name="encoder-probe")
+        return self._task
+
+    def load(self) -> EncoderMatrix | None:
+        """
+        Load the persisted matrix, probing the ffmpeg binary if it is missing or stale.
+
+        Returns:
+            EncoderMatrix|None: The matrix, or None if ffmpeg is not available.
+
+        """
+        if not (ffmpeg := shutil.which("ffmpeg")):
+            return None
+
+        ffmpeg = os.path.realpath(ffmpeg)
+        try:
+            mtime_ns: int = Path(ffmpeg).stat().st_mtime_ns
+        except OSError:
+            return None
+
+        if (matrix := self._read(ffmpeg, mtime_ns)) is None:
+            started: float = time.monotonic()
+            matrix = probe_encoders(ffmpeg, self._device)
+            LOG.info(
+                "Probed ffmpeg encoders in '%.1fs', working: %s.",
+                time.monotonic() - started,
+                ", ".join(matrix.working) or "none",
+                extra={"ffmpeg": ffmpeg, "encoders": matrix.encoders, "working": matrix.working},
+            )
+            self._write(matrix)
+
+        self._matrix = matrix
+        return matrix
+
+    def _read(self, ffmpeg: str, mtime_ns: int) -> EncoderMatrix | None:
+        try:
+            data: dict[str, Any] = json.loads(self._path.read_text())
+            matrix = EncoderMatrix(**data)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            LOG.warning("Ignoring unreadable encoder capabilities '%s': %s", self._path, exc)
+            return None
+
+        if (matrix.version, matrix.ffmpeg, matrix.mtime_ns, matrix.device) != (
+            PROBE_VERSION,
+            ffmpeg,
+            mtime_ns,
+            self._device,
+        ):
+            return None
+
+        return matrix
+
+    def _write(self, matrix: EncoderMatrix) -> None:
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp: Path = self._path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(matrix.to_dict(), indent=2))
+            tmp.replace(self._path)
+        except OSError as exc:
+            LOG.warning("Failed to persist encoder capabilities to '%s': %s", self._path, exc)
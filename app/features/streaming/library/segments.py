@@ -11,10 +11,9 @@ from aiohttp import web
 
 from app.features.streaming.library.ffprobe import ffmpeg_bin, ffprobe
 from app.features.streaming.library.segment_encoders import (
-    detect_qsv_capabilities,
+    EncoderCapabilities,
     encoder_fallback_chain,
     get_builder_for_codec,
-    has_dri_devices,
     select_encoder,
 )
 from app.features.streaming.types import FFProbeError, StreamingError
@@ -25,7 +24,7 @@ if TYPE_CHECKING:
     from asyncio.subprocess import Process
 
     from .ffprobe import FFProbeResult
-    from .segment_encoders import EncoderBuilder
+    from .segment_encoders import EncoderBuilder, EncoderMatrix
 
 LOG = get_logger()
 
@@ -88,14 +87,15 @@ class Segments:
 
         startTime: str = f"{0:.6f}" if self.index == 0 else f"{self.duration * self.index:.6f}"
 
+        matrix: EncoderMatrix | None = EncoderCapabilities.get_instance().matrix
         ctx = {
             "is_linux": sys.platform.startswith("linux"),
-            "has_dri": has_dri_devices(),
+            "has_dri": bool(matrix and matrix.has_dri),
             "vaapi_device": Config.get_instance().vaapi_device,
             "qsv": {"full": False, "lp": False},
         }
 
-        caps: dict[str, dict[str, bool]] = detect_qsv_capabilities()
+        caps: dict[str, dict[str, bool]] = matrix.qsv if matrix else {}
         base_codec: str = s_codec.split("_", maxsplit=1)[0]
         codec_caps: dict[str, bool] = caps.get(base_codec, {"full": False, "lp": False})
         ctx["qsv"] = codec_caps
@@ -260,10 +260,12 @@ class Segments:
 
         LOG.debug("Selected video codec '%s' for segment streaming.", codec, extra={"codec": codec})
 
+        matrix: EncoderMatrix | None = EncoderCapabilities.get_instance().matrix
         if Segments._cached_vcodec and Segments._cache_initialized:
             codecs: list[str] = [Segments._cached_vcodec]
         else:
-            codecs: list[str] = [codec, *list(encoder_fallback_chain(codec))]
+            chain = matrix.fallback_chain(codec) if matrix else encoder_fallback_chain(codec)
+            codecs: list[str] = [codec, *chain]
 
         stream_input = self._make_stream_input(file)
         try:
@@ -275,8 +277,10 @@ class Segments:
                 _, rc, client_disconnected, stderr_text = await self._run(resp, file, ffmpeg_args)
 
                 if 0 == rc:
-                    Segments._cached_vcodec = s_codec
-                    Segments._cache_initialized = True
+                    # Until the encoders are probed only software encoding is picked, so don't pin it.
+                    if matrix:
+                        Segments._cached_vcodec = s_codec
+                        Segments._cache_initialized = True
                     return
 
                 if client_disconnected:
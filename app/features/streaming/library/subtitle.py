@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import anyio
 import pysubs2
@@ -12,6 +15,9 @@ from pysubs2.time import ms_to_times
 from app.library.logging import get_logger
 from app.library.Utils import ALLOWED_SUBS_EXTENSIONS, get_file_sidecar
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 LOG = get_logger()
 
 SOURCE_FORMATS: tuple[str, ...] = ("vtt", "srt", "ass")
@@ -30,6 +36,11 @@ MEDIA_TYPES: dict[str, str] = {
     "ass": "text/x-ssa; charset=UTF-8",
 }
 TEXT_ENCODINGS: tuple[str, ...] = ("utf-8-sig", "utf-16", "utf-16-le", "utf-16-be", "cp1252")
+CACHE_BYTES: int = 32 * 1024 * 1024
+"How much converted subtitle text is kept in memory before the least recently used is dropped."
+
+CacheKey = tuple[str, int, int, str]
+"The file path, its mtime in nanoseconds, its size, and the output format."
 
 
 @dataclass(frozen=True, slots=True)
@@ -53,6 +64,67 @@ _substation_format: Any = SubstationFormat
 _substation_format.ms_to_timestamp = ms_to_timestamp
 
 
+class _ConversionCache:
+    """Converted subtitles, bounded by their total length."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit: int = limit
+        self._size: int = 0
+        self._items: OrderedDict[CacheKey, str] = OrderedDict()
+
+    def get(self, key: CacheKey) -> str | None:
+        if (text := self._items.get(key)) is not None:
+            self._items.move_to_end(key)
+        return text
+
+    def put(self, key: CacheKey, text: str) -> None:
+        if len(text) > self._limit:
+            return
+
+        if (old := self._items.pop(key, None)) is not None:
+            self._size -= len(old)
+
+        self._items[key] = text
+        self._size += len(text)
+        while self._size > self._limit:
+            _, dropped = self._items.popitem(last=False)
+            self._size -= len(dropped)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._size = 0
+
+
+_CACHE = _ConversionCache(CACHE_BYTES)
+_IN_PROCESS: dict[CacheKey, asyncio.Future[str]] = {}
+
+
+async def _cached(file: Path, fmt: str, convert: Callable[[Path], str]) -> str:
+    """
+    Get a file's converted text from the cache, or convert it in a worker thread.
+
+    The cache key includes the file's mtime and size, so a replaced file is converted again. Concurrent
+    requests for the same conversion share a single run, and a cancelled request does not cancel it for
+    the others.
+    """
+    stat = file.stat()
+    key: CacheKey = (str(file), stat.st_mtime_ns, stat.st_size, fmt)
+    if (text := _CACHE.get(key)) is not None:
+        return text
+
+    if (task := _IN_PROCESS.get(key)) is None:
+        task = _IN_PROCESS[key] = asyncio.ensure_future(asyncio.to_thread(convert, file))
+
+        def done(future: asyncio.Future[str]) -> None:
+            _IN_PROCESS.pop(key, None)
+            if not future.cancelled() and future.exception() is None:
+                _CACHE.put(key, future.result())
+
+        task.add_done_callback(done)
+
+    return await asyncio.shield(task)
+
+
 class Subtitle:
     @staticmethod
     def normalize_format(source_format: str) -> str | None:
@@ -68,6 +140,10 @@ class Subtitle:
 
         return self.decode_bytes(subtitle_bytes)
 
+    @classmethod
+    def _read(cls, file: Path) -> str:
+        return cls.decode_bytes(file.read_bytes())
+
     @staticmethod
     def decode_bytes(subtitle_bytes: bytes) -> str:
         for encoding in TEXT_ENCODINGS:
@@ -93,8 +169,12 @@ class Subtitle:
             raise Exception(msg)
 
         if fmt == "vtt":
-            return await self.read_text(file)
+            return await _cached(file, "text", self._read)
 
+        return await _cached(file, "vtt", self._to_vtt)
+
+    @staticmethod
+    def _to_vtt(file: Path) -> str:
         subs: pysubs2.SSAFile = pysubs2.load(path=str(file))
 
         if len(subs.events) < 1:
@@ -119,13 +199,28 @@ class Subtitle:
             raise Exception(msg)
 
         if fmt == "ass":
-            return await self.read_text(file), self.media_type(file)
+            return await _cached(file, "text", self._read), self.media_type(file)
 
         return await self.make(file), self.media_type(file)
 
 
 def get_subtitle_tracks(file: Path) -> list[SubtitleTrack]:
-    sidecars = get_file_sidecar(file).get("subtitle", [])
+    """
+    Get the subtitle tracks of a media file, best native format first.
+
+    Sidecars are looked up once per state of the containing directory, whose mtime changes whenever a
+    file in it is added, removed or renamed. As that already tells when to look again, the lookup skips
+    the time based cache of get_file_sidecar.
+    """
+    try:
+        return list(_subtitle_tracks(file, file.parent.stat().st_mtime_ns))
+    except OSError:
+        return []
+
+
+@lru_cache(maxsize=256)
+def _subtitle_tracks(file: Path, _dir_mtime: int) -> tuple[SubtitleTrack, ...]:
+    sidecars = getattr(get_file_sidecar, "__wrapped__", get_file_sidecar)(file).get("subtitle", [])
     indexed_tracks: list[tuple[int, SubtitleTrack]] = []
 
     for index, item in enumerate(sidecars):
@@ -152,4 +247,4 @@ def get_subtitle_tracks(file: Path) -> list[SubtitleTrack]:
         )
 
     indexed_tracks.sort(key=lambda item: (SOURCE_FORMATS.index(item[1].source_format), item[0]))
-    return [track for _, track in indexed_tracks]
+    return tuple(track for _, track in indexed_tracks)
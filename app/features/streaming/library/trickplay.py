@@ -0,0 +1,266 @@
+import asyncio
+import math
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+from app.features.streaming.library.ffprobe import ffmpeg_bin, ffprobe, ffprobe_bin
+from app.features.streaming.library.thumbnail import _get_semaphore
+from app.library.cache import Cache
+from app.library.config import Config
+from app.library.logging import get_logger
+
+LOG = get_logger()
+
+TRICKPLAY_DIR = "trickplay"
+TRICKPLAY_INDEX = "index.vtt"
+TRICKPLAY_SHEET = "sprite-{:03d}.jpg"
+TRICKPLAY_SHEET_PATTERN = "sprite-%03d.jpg"
+TRICKPLAY_FILE_RX: re.Pattern[str] = re.compile(r"^(index\.vtt|sprite-\d{3}\.jpg)$")
+TRICKPLAY_TILE_WIDTH = 240
+TRICKPLAY_COLUMNS = 10
+TRICKPLAY_ROWS = 10
+TRICKPLAY_MIN_INTERVAL = 1
+TRICKPLAY_MISS_TTL = 3600.0
+
+_LOCK = asyncio.Lock()
+_IN_PROCESS: dict[str, asyncio.Task[Path | None]] = {}
+
+
+def trickplay_path(cache_root: Path, item_id: str) -> Path:
+    """
+    Get the directory holding the sprite sheets and index for an item.
+
+    Args:
+        cache_root (Path): The thumbnails cache root.
+        item_id (str): The history item id.
+
+    Returns:
+        Path: The trickplay directory for the item.
+
+    """
+    return cache_root / TRICKPLAY_DIR / item_id
+
+
+def _tile_size(ff_info) -> tuple[int, int]:
+    width: int = TRICKPLAY_TILE_WIDTH
+    height: int = round(TRICKPLAY_TILE_WIDTH * 9 / 16)
+
+    for stream in ff_info.video:
+        try:
+            size = stream.frame_size()
+        except Exception:
+            size = None
+
+        if size and size[0] > 0 and size[1] > 0:
+            height = round(TRICKPLAY_TILE_WIDTH * size[1] / size[0])
+            break
+
+    return width, max(2, height - (height % 2))
+
+
+def _format_ts(seconds: float) -> str:
+    millis: int = round(seconds * 1000)
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
+
+def build_vtt(*, duration: float, interval: int, width: int, height: int, tiles: int | None = None) -> str:
+    """
+    Build the WebVTT index mapping time ranges to sprite sheet regions.
+
+    Args:
+        duration (float): The media duration in seconds.
+        interval (int): Seconds covered by each tile.
+        width (int): Tile width in pixels.
+        height (int): Tile height in pixels.
+        tiles (int | None): Upper bound of tiles actually rendered, if known.
+
+    Returns:
+        str: The WebVTT document.
+
+    """
+    count: int = max(1, math.ceil(duration / interval))
+    if tiles is not None:
+        count = min(count, tiles)
+
+    per_sheet: int = TRICKPLAY_COLUMNS * TRICKPLAY_ROWS
+    lines: list[str] = ["WEBVTT", ""]
+
+    for idx in range(count):
+        start: float = idx * interval
+        end: float = min((idx + 1) * interval, duration) if duration > start else start + interval
+        sheet, pos = divmod(idx, per_sheet)
+        row, col = divmod(pos, TRICKPLAY_COLUMNS)
+        lines.append(f"{_format_ts(start)} --> {_format_ts(end)}")
+        lines.append(f"{TRICKPLAY_SHEET.format(sheet + 1)}#xywh={col * width},{row * height},{width},{height}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def _build_ffmpeg_args(media_file: Path, output_dir: Path, *, interval: int, width: int, height: int) -> list[str]:
+    return [
+        "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-y",
+        "-skip_frame",
+        "nokey",
+        "-i",
+        str(media_file),
+        "-an",
+        "-sn",
+        "-vf",
+        f"fps=1/{interval},scale={width}:{height},tile={TRICKPLAY_COLUMNS}x{TRICKPLAY_ROWS}",
+        "-q:v",
+        "5",
+        str(output_dir / TRICKPLAY_SHEET_PATTERN),
+    ]
+
+
+async def _run_ffmpeg(media_file: Path, output_dir: Path, interval: int) -> Path | None:
+    binary = ffmpeg_bin()
+    if binary is None or ffprobe_bin() is None:
+        msg = "ffmpeg or ffprobe not found."
+        raise OSError(msg)
+
+    ff_info = await ffprobe(media_file)
+    if not ff_info.has_video():
+        LOG.debug(
+            "Skipping trickplay generation for '%s' because no video stream exists.",
+            media_file,
+            extra={"media_file": str(media_file)},
+        )
+        return None
+
+    try:
+        duration: float = float(ff_info.metadata.get("duration") or 0.0)
+    except (TypeError, ValueError):
+        duration = 0.0
+
+    if duration <= 0:
+        LOG.debug(
+            "Skipping trickplay generation for '%s' because the duration is unknown.",
+            media_file,
+            extra={"media_file": str(media_file)},
+        )
+        return None
+
+    width, height = _tile_size(ff_info)
+    temp_dir: Path = output_dir.with_name(f"{output_dir.name}.tmp")
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    temp_dir.mkdir(parents=True, exist_ok=True)
+
+    args: list[str] = _build_ffmpeg_args(media_file, temp_dir, interval=interval, width=width, height=height)
+    args[0] = binary
+
+    try:
+        async with _get_semaphore():
+            LOG.debug(
+                "Generating trickplay sprites for '%s'. interval=%ss tile=%sx%s",
+                media_file,
+                interval,
+                width,
+                height,
+                extra={"media_file": str(media_file), "interval": interval, "tile": f"{width}x{height}"},
+            )
+
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+                )
+            except FileNotFoundError as exc:
+                msg = "ffmpeg not found."
+                raise OSError(msg) from exc
+
+            _, stderr = await proc.communicate()
+
+        sheets: list[Path] = sorted(temp_dir.glob("sprite-*.jpg"))
+        if 0 != proc.returncode or not sheets:
+            msg: str = (
+                f"ffmpeg trickplay generation failed (rc={proc.returncode}).\n"
+                f"stderr:\n{stderr.decode('utf-8', errors='replace')}"
+            )
+            raise OSError(msg)
+
+        tiles: int = len(sheets) * TRICKPLAY_COLUMNS * TRICKPLAY_ROWS
+        (temp_dir / TRICKPLAY_INDEX).write_text(
+            build_vtt(duration=duration, interval=interval, width=width, height=height, tiles=tiles),
+            encoding="utf-8",
+        )
+
+        shutil.rmtree(output_dir, ignore_errors=True)
+        temp_dir.replace(output_dir)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    LOG.info(
+        "Generated %s trickplay sprite sheet(s) for '%s'.",
+        len(sheets),
+        media_file,
+        extra={"media_file": str(media_file), "output_dir": str(output_dir), "sheets": len(sheets)},
+    )
+
+    return output_dir / TRICKPLAY_INDEX
+
+
+async def ensure_trickplay(media_file: Path, cache_root: Path, item_id: str) -> Path | None:
+    """
+    Generate the trickplay sprite sheets for a media file if they do not exist yet.
+
+    Args:
+        media_file (Path): The media file.
+        cache_root (Path): The thumbnails cache root.
+        item_id (str): The history item id.
+
+    Returns:
+        Path | None: The WebVTT index path, or None if trickplay is disabled or not applicable.
+
+    """
+    config: Config = Config.get_instance()
+    cache: Cache = Cache.get_instance()
+    if bool(config.thumb_trickplay) is not True:
+        return None
+
+    output_dir: Path = trickplay_path(cache_root, item_id)
+    index_file: Path = output_dir / TRICKPLAY_INDEX
+    miss_key: str = f"trickplay-miss:{item_id}"
+
+    if index_file.exists():
+        return index_file
+
+    if cache.has(miss_key):
+        return None
+
+    async with _LOCK:
+        if index_file.exists():
+            return index_file
+
+        task = _IN_PROCESS.get(item_id)
+        if task is None or task.done():
+            interval: int = max(TRICKPLAY_MIN_INTERVAL, int(config.thumb_trickplay_interval))
+            task = asyncio.create_task(_run_ffmpeg(media_file, output_dir, interval), name=f"trickplay-{item_id}")
+            _IN_PROCESS[item_id] = task
+
+    try:
+        result: Path | None = await task
+        if result is None:
+            cache.set(miss_key, value=True, ttl=TRICKPLAY_MISS_TTL)
+        return result
+    except OSError:
+        cache.set(miss_key, value=True, ttl=TRICKPLAY_MISS_TTL)
+        raise
+    finally:
+        async with _LOCK:
+            if _IN_PROCESS.get(item_id) is task and task.done():
+                _IN_PROCESS.pop(item_id, None)
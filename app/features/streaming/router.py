@@ -340,6 +340,41 @@ async def segments_stream(request: Request, config: Config, app: web.Application
     return resp
 
 
+def _subtitle_headers(file: Path) -> dict[str, str]:
+    """
+    Get the validators of a subtitle file.
+
+    Subtitles are revalidated on every use rather than cached for a fixed time, which costs a 304 while the
+    file is unchanged and picks up a replaced file right away.
+
+    Args:
+        file (Path): The subtitle file.
+
+    Returns:
+        dict[str, str]: The ETag, Last-Modified and caching headers.
+
+    """
+    stat = file.stat()
+    return {
+        "ETag": f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+        "Last-Modified": time.strftime(
+            "%a, %d %b %Y %H:%M:%S GMT", datetime.fromtimestamp(stat.st_mtime, tz=UTC).timetuple()
+        ),
+        "Cache-Control": "public, no-cache",
+        "Access-Control-Allow-Origin": "*",
+    }
+
+
+def _not_modified(request: Request, headers: dict[str, str]) -> bool:
+    if (match := request.headers.get("If-None-Match")) is not None:
+        tags: list[str] = [tag.strip().removeprefix("W/") for tag in match.split(",")]
+        return "*" in tags or headers["ETag"] in tags
+
+    since: datetime | None = request.if_modified_since
+    modified: datetime = datetime.strptime(headers["Last-Modified"], "%a, %d %b %Y %H:%M:%S GMT").replace(tzinfo=UTC)
+    return since is not None and since >= modified
+
+
 @route("GET", "api/player/subtitle/{file:.*}.vtt", "subtitles_get")
 async def subtitles_get(request: Request, config: Config, app: web.Application) -> Response:
     """
@@ -383,27 +418,13 @@ async def subtitles_get(request: Request, config: Config, app: web.Application)
             params={"resource": "api.resources.file"},
         )
 
-    mtime = realFile.stat().st_mtime
-
-    if request.if_modified_since and request.if_modified_since.timestamp() == mtime:
-        lastMod = time.strftime("%a, %d %b %Y %H:%M:%S GMT", datetime.fromtimestamp(mtime, tz=UTC).timetuple())
-        return web.Response(status=web.HTTPNotModified.status_code, headers={"Last-Modified": lastMod})
+    headers: dict[str, str] = _subtitle_headers(realFile)
+    if _not_modified(request, headers):
+        return web.Response(status=web.HTTPNotModified.status_code, headers=headers)
 
     return web.Response(
         body=await Subtitle().make(file=realFile),
-        headers={
-            "Content-Type": "text/vtt; charset=UTF-8",
-            "X-Accel-Buffering": "no",
-            "Access-Control-Allow-Origin": "*",
-            "Pragma": "public",
-            "Cache-Control": f"public, max-age={time.time() + 31536000}",
-            "Last-Modified": time.strftime(
-                "%a, %d %b %Y %H:%M:%S GMT", datetime.fromtimestamp(mtime, tz=UTC).timetuple()
-            ),
-            "Expires": time.strftime(
-                "%a, %d %b %Y %H:%M:%S GMT", datetime.fromtimestamp(time.time() + 31536000, tz=UTC).timetuple()
-            ),
-        },
+        headers={**headers, "Content-Type": "text/vtt; charset=UTF-8", "X-Accel-Buffering": "no"},
         status=web.HTTPOk.status_code,
     )
 
@@ -537,27 +558,13 @@ async def subtitles_track_get(request: Request, config: Config, app: web.Applica
             params={"field": "api.fields.type"},
         )
 
-    mtime = realFile.stat().st_mtime
-
-    if request.if_modified_since and request.if_modified_since.timestamp() == mtime:
-        lastMod = time.strftime("%a, %d %b %Y %H:%M:%S GMT", datetime.fromtimestamp(mtime, tz=UTC).timetuple())
-        return web.Response(status=web.HTTPNotModified.status_code, headers={"Last-Modified": lastMod})
+    headers: dict[str, str] = _subtitle_headers(realFile)
+    if _not_modified(request, headers):
+        return web.Response(status=web.HTTPNotModified.status_code, headers=headers)
 
     body, content_type = await Subtitle().make_delivery(file=realFile)
     return web.Response(
         body=body,
-        headers={
-            "Content-Type": content_type,
-            "X-Accel-Buffering": "no",
-            "Access-Control-Allow-Origin": "*",
-            "Pragma": "public",
-            "Cache-Control": f"public, max-age={time.time() + 31536000}",
-            "Last-Modified": time.strftime(
-                "%a, %d %b %Y %H:%M:%S GMT", datetime.fromtimestamp(mtime, tz=UTC).timetuple()
-            ),
-            "Expires": time.strftime(
-                "%a, %d %b %Y %H:%M:%S GMT", datetime.fromtimestamp(time.time() + 31536000, tz=UTC).timetuple()
-            ),
-        },
+        headers={**headers, "Content-Type": content_type, "X-Accel-Buffering": "no"},
         status=web.HTTPOk.status_code,
     )
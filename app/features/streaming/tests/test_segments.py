@@ -1,11 +1,16 @@
 import asyncio
+import json
 import logging
+import os
+from collections.abc import Iterator
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
 from aiohttp import web
 
+from app.features.streaming.library.segment_encoders import EncoderCapabilities, EncoderMatrix
 from app.features.streaming.library.segments import Segments
 from app.tests.helpers import get_test_system_temp_root
 
@@ -27,8 +32,22 @@ def _ffmpeg_input_path(args: list[str]) -> Path:
 
 
 @pytest.fixture(autouse=True)
-def _patch_ffmpeg_bin(monkeypatch: pytest.MonkeyPatch) -> None:
+def _patch_ffmpeg_bin(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
     monkeypatch.setattr("app.features.streaming.library.segments.ffmpeg_bin", lambda: "/usr/bin/ffmpeg")
+    EncoderCapabilities._reset_singleton()
+    yield
+    EncoderCapabilities._reset_singleton()
+
+
+def _probed(working: list[str], has_dri: bool) -> None:
+    EncoderCapabilities.get_instance()._matrix = EncoderMatrix(
+        ffmpeg="/usr/bin/ffmpeg",
+        mtime_ns=1,
+        device="/dev/dri/renderD128",
+        encoders=[*working, "libx264"],
+        working=[*working, "libx264"],
+        has_dri=has_dri,
+    )
 
 
 @pytest.mark.asyncio
@@ -202,11 +221,7 @@ async def test_ffmpeg_args_no_dri(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
 
     monkeypatch.setattr("app.features.streaming.library.segments.ffprobe", fake_ffprobe)
     # Simulate no /dev/dri present but GPU encoders otherwise available
-    monkeypatch.setattr("app.features.streaming.library.segment_encoders.has_dri_devices", lambda: False)
-    monkeypatch.setattr(
-        "app.features.streaming.library.segment_encoders.ffmpeg_encoders",
-        lambda: {"h264_nvenc", "h264_qsv", "h264_amf"},
-    )
+    _probed(["h264_nvenc", "h264_qsv", "h264_amf"], has_dri=False)
 
     # reset encoder cache to ensure clean selection in this test
     from app.features.streaming.library.segments import Segments as _Seg
@@ -248,8 +263,7 @@ async def test_stream_gpu_fallback(
 
     monkeypatch.setattr("app.features.streaming.library.segments.ffprobe", fake_ffprobe)
     # Allow GPU usage and advertise an NVENC encoder so first pick is GPU
-    monkeypatch.setattr("app.features.streaming.library.segment_encoders.has_dri_devices", lambda: True)
-    monkeypatch.setattr("app.features.streaming.library.segment_encoders.ffmpeg_encoders", lambda: {"h264_nvenc"})
+    _probed(["h264_nvenc"], has_dri=True)
 
     # First process fails (no data, rc=1), second succeeds and outputs bytes
     proc_fail = _FakeProcFail(err=b"nvenc failure: encoder not available")
@@ -300,10 +314,7 @@ async def test_gpu_fallback_switches_codec(monkeypatch: pytest.MonkeyPatch, tmp_
 
     monkeypatch.setattr("app.features.streaming.library.segments.ffprobe", fake_ffprobe)
     # Only QSV advertised so initial build sets QSV
-    # Patch both where it's defined AND where it's imported/used
-    monkeypatch.setattr("app.features.streaming.library.segment_encoders.has_dri_devices", lambda: True)
-    monkeypatch.setattr("app.features.streaming.library.segments.has_dri_devices", lambda: True)
-    monkeypatch.setattr("app.features.streaming.library.segment_encoders.ffmpeg_encoders", lambda: {"h264_qsv"})
+    _probed(["h264_qsv"], has_dri=True)
 
     # Fail first, succeed second
     proc_fail = _FakeProcFail(err=b"qsv failure")
@@ -440,3 +451,44 @@ async def test_stream_cancelled(monkeypatch: pytest.MonkeyPatch, tmp_path: Path)
     # Inner branch treats it as client disconnected; no EOF and we terminate ffmpeg
     assert resp.eof is False
     assert proc.terminated is True
+
+
+def test_encoder_matrix_is_persisted_per_binary(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.features.streaming.library import segment_encoders
+
+    ffmpeg = tmp_path / "ffmpeg"
+    ffmpeg.write_text("")
+    monkeypatch.setattr(segment_encoders.shutil, "which", lambda _: str(ffmpeg))
+    monkeypatch.setattr(segment_encoders, "has_dri_devices", lambda: False)
+    monkeypatch.setattr(segment_encoders, "ffmpeg_encoders", lambda: {"h264_nvenc", "h264_vaapi", "libx264"})
+    monkeypatch.setattr(segment_encoders, "detect_qsv_capabilities", lambda: pytest.fail("qsv is not listed"))
+    probes: list[str] = []
+
+    def fake_run(args: list[str], **_kwargs: Any):
+        probes.append(args[args.index("-codec:v") + 1])
+        return SimpleNamespace(returncode=0 if "libx264" in args else 1, stderr="failed")
+
+    monkeypatch.setattr(segment_encoders.subprocess, "run", fake_run)
+    cache = tmp_path / "cache" / "encoders.json"
+
+    capabilities = EncoderCapabilities(path=cache)
+    assert segment_encoders.select_encoder("") == "libx264"
+    assert probes == []
+
+    matrix = capabilities.load()
+    assert matrix is not None
+    assert matrix.encoders == ["h264_nvenc", "h264_vaapi", "libx264"]
+    assert matrix.working == ["libx264"]
+    assert matrix.fallback_chain("h264_qsv") == ("libx264",)
+    assert probes == ["h264_nvenc", "libx264"], "vaapi is not tested without /dev/dri"
+    assert segment_encoders.select_encoder("h264_nvenc") == "libx264"
+
+    EncoderCapabilities._reset_singleton()
+    assert EncoderCapabilities(path=cache).load() == matrix
+    assert len(probes) == 2
+
+    os.utime(ffmpeg, ns=(1, 1))
+    EncoderCapabilities._reset_singleton()
+    EncoderCapabilities(path=cache).load()
+    assert len(probes) == 4
+    assert json.loads(cache.read_text())["mtime_ns"] == 1
@@ -1,3 +1,5 @@
+import asyncio
+import os
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
@@ -5,6 +7,7 @@ from unittest.mock import patch
 import pytest
 
 from app.features.streaming.library.subtitle import Subtitle, get_subtitle_tracks, ms_to_timestamp
+from app.library.Utils import get_file_sidecar
 
 
 class TestMsToTimestamp:
@@ -151,3 +154,43 @@ async def test_two_events_keep_both(tmp_path: Path) -> None:
         out = await subtitle.make(srt)
         assert out == "OUT"
         assert d.snapshot == [5000, 6000], "Both remain since ends differ"
+
+
+@pytest.mark.asyncio
+async def test_make_converts_once_per_file_version(tmp_path: Path) -> None:
+    srt = tmp_path / "cached.srt"
+    srt.write_text("dummy")
+
+    with patch(
+        "app.features.streaming.library.subtitle.pysubs2.load",
+        side_effect=lambda **_: _DummySubs(events=[SimpleNamespace(end=1000)]),
+    ) as mock_load:
+        subtitle = Subtitle()
+        results = await asyncio.gather(*(subtitle.make(srt) for _ in range(5)))
+        assert results == ["OUT"] * 5
+        assert await subtitle.make(srt) == "OUT"
+        assert mock_load.call_count == 1
+
+        srt.write_text("changed")
+        os.utime(srt, ns=(srt.stat().st_atime_ns, srt.stat().st_mtime_ns + 1_000_000_000))
+        assert await subtitle.make(srt) == "OUT"
+        assert mock_load.call_count == 2
+
+
+def test_tracks_follow_directory_changes(tmp_path: Path) -> None:
+    media = tmp_path / "video.mkv"
+    media.write_text("x", encoding="utf-8")
+    (tmp_path / "video.en.srt").write_text("1\n00:00:00,000 --> 00:00:01,000\nHello\n", encoding="utf-8")
+
+    with patch(
+        "app.features.streaming.library.subtitle.get_file_sidecar",
+        wraps=get_file_sidecar.__wrapped__,
+    ) as sidecars:
+        assert [track.lang for track in get_subtitle_tracks(media)] == ["en"]
+        assert [track.lang for track in get_subtitle_tracks(media)] == ["en"]
+        assert sidecars.call_count == 1
+
+        (tmp_path / "video.de.ass").write_text("[Script Info]\n", encoding="utf-8")
+        os.utime(tmp_path, ns=(tmp_path.stat().st_atime_ns, tmp_path.stat().st_mtime_ns + 1_000_000_000))
+        assert [track.lang for track in get_subtitle_tracks(media)] == ["en", "de"]
+        assert sidecars.call_count == 2
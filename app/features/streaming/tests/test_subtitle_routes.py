@@ -104,3 +104,36 @@ async def test_subtitles_track_bad_format(tmp_path: Path, monkeypatch: pytest.Mo
 
     assert response.status == web.HTTPBadRequest.status_code
     assert "does not match requested source format" in (await response.text())
+
+
+@pytest.mark.asyncio
+async def test_subtitles_track_revalidates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, test_client) -> None:
+    config = Config.get_instance()
+    config.download_path = str(tmp_path)
+
+    subtitle = tmp_path / "video.srt"
+    subtitle.write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        "app.features.streaming.router.get_file",
+        lambda **_kwargs: (subtitle, web.HTTPOk.status_code),
+    )
+
+    client = await test_client(_subtitle_handlers(config))
+    url = url_for("subtitles_track_get", source_format="srt", file="video.srt")
+    response = await client.get(url)
+
+    assert response.status == web.HTTPOk.status_code
+    assert (await response.text()).startswith("WEBVTT")
+    assert response.headers["Cache-Control"] == "public, no-cache"
+    etag = response.headers["ETag"]
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status == web.HTTPNotModified.status_code
+    assert response.headers["ETag"] == etag
+
+    response = await client.get(url, headers={"If-Modified-Since": response.headers["Last-Modified"]})
+    assert response.status == web.HTTPNotModified.status_code
+
+    response = await client.get(url, headers={"If-None-Match": '"stale"'})
+    assert response.status == web.HTTPOk.status_code
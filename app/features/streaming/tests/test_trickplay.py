@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.tests.helpers import temporary_test_dir
+
+
+def _config(**overrides: Any) -> Any:
+    values: dict[str, Any] = {
+        "thumb_trickplay": True,
+        "thumb_trickplay_interval": 10,
+        "thumb_concurrency": 1,
+        "thumb_generate": True,
+        "thumb_sidecar": False,
+    }
+    values.update(overrides)
+    return type("Cfg", (), values)()
+
+
+def test_build_vtt_layout() -> None:
+    from app.features.streaming.library.trickplay import TRICKPLAY_COLUMNS, TRICKPLAY_ROWS, build_vtt
+
+    vtt = build_vtt(duration=1005.0, interval=10, width=240, height=136)
+    lines = vtt.splitlines()
+
+    assert lines[0] == "WEBVTT"
+    assert lines[2] == "00:00:00.000 --> 00:00:10.000"
+    assert lines[3] == "sprite-001.jpg#xywh=0,0,240,136"
+    assert lines[6] == "sprite-001.jpg#xywh=240,0,240,136"
+
+    cues = [line for line in lines if "#xywh=" in line]
+    assert len(cues) == 101
+    assert cues[TRICKPLAY_COLUMNS] == "sprite-001.jpg#xywh=0,136,240,136"
+    assert cues[TRICKPLAY_COLUMNS * TRICKPLAY_ROWS] == "sprite-002.jpg#xywh=0,0,240,136"
+    assert "00:16:40.000 --> 00:16:45.000" in lines, "last cue must end at the media duration"
+
+
+def test_build_vtt_clamps_to_rendered_tiles() -> None:
+    from app.features.streaming.library.trickplay import build_vtt
+
+    vtt = build_vtt(duration=100.0, interval=10, width=240, height=136, tiles=4)
+
+    assert len([line for line in vtt.splitlines() if "#xywh=" in line]) == 4
+
+
+def test_ffmpeg_args_single_pass() -> None:
+    from app.features.streaming.library.trickplay import _build_ffmpeg_args
+
+    args = _build_ffmpeg_args(Path("/media/video.mp4"), Path("/cache/out"), interval=5, width=240, height=136)
+
+    assert args[args.index("-vf") + 1] == "fps=1/5,scale=240:136,tile=10x10"
+    assert args[-1] == str(Path("/cache/out") / "sprite-%03d.jpg")
+    assert "-an" in args
+
+
+@pytest.mark.asyncio
+async def test_run_ffmpeg_writes_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.features.streaming.library import thumbnail, trickplay
+    from app.features.streaming.library.ffprobe import FFProbeResult
+
+    thumbnail._SEM = None
+    thumbnail._SEM_LIMIT = None
+    monkeypatch.setattr(thumbnail.Config, "get_instance", staticmethod(lambda: _config()))
+
+    with temporary_test_dir("trickplay-run") as temp_dir:
+        media = temp_dir / "video.mp4"
+        media.write_text("video")
+        output_dir = temp_dir / "cache" / "trickplay" / "item-1"
+
+        ff_info: Any = FFProbeResult()
+        ff_info.metadata = {"duration": "25.0"}
+        ff_info.video = [
+            type("Video", (), {"codec_type": "video", "frame_size": lambda _self: (1920, 1080)})(),
+        ]
+        monkeypatch.setattr(trickplay, "ffprobe", AsyncMock(return_value=ff_info))
+        monkeypatch.setattr(trickplay, "ffmpeg_bin", lambda: "/usr/bin/ffmpeg")
+        monkeypatch.setattr(trickplay, "ffprobe_bin", lambda: "/usr/bin/ffprobe")
+
+        class DummyProc:
+            returncode = 0
+
+            def __init__(self, out_pattern: Path) -> None:
+                self._out = out_pattern
+
+            async def communicate(self) -> tuple[bytes, bytes]:
+                (self._out.parent / "sprite-001.jpg").write_text("sheet")
+                return b"", b""
+
+        async def fake_create_subprocess_exec(*args, **kwargs):
+            del kwargs
+            return DummyProc(Path(str(args[-1])))
+
+        monkeypatch.setattr(trickplay.asyncio, "create_subprocess_exec", fake_create_subprocess_exec)
+
+        result = await trickplay._run_ffmpeg(media, output_dir, 10)
+
+        assert result == output_dir / "index.vtt"
+        assert (output_dir / "sprite-001.jpg").exists()
+        assert not output_dir.with_name("item-1.tmp").exists()
+        assert "sprite-001.jpg#xywh=0,0,240,134" in result.read_text()
+
+
+@pytest.mark.asyncio
+async def test_run_ffmpeg_failure_cleans_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.features.streaming.library import thumbnail, trickplay
+    from app.features.streaming.library.ffprobe import FFProbeResult
+
+    thumbnail._SEM = None
+    thumbnail._SEM_LIMIT = None
+    monkeypatch.setattr(thumbnail.Config, "get_instance", staticmethod(lambda: _config()))
+
+    with temporary_test_dir("trickplay-fail") as temp_dir:
+        media = temp_dir / "video.mp4"
+        media.write_text("video")
+        output_dir = temp_dir / "cache" / "trickplay" / "item-1"
+
+        ff_info: Any = FFProbeResult()
+        ff_info.metadata = {"duration": "25.0"}
+        ff_info.video = [type("Video", (), {"codec_type": "video", "frame_size": lambda _self: None})()]
+        monkeypatch.setattr(trickplay, "ffprobe", AsyncMock(return_value=ff_info))
+        monkeypatch.setattr(trickplay, "ffmpeg_bin", lambda: "/usr/bin/ffmpeg")
+        monkeypatch.setattr(trickplay, "ffprobe_bin", lambda: "/usr/bin/ffprobe")
+
+        class DummyProc:
+            returncode = 1
+
+            async def communicate(self) -> tuple[bytes, bytes]:
+                return b"", b"boom"
+
+        monkeypatch.setattr(trickplay.asyncio, "create_subprocess_exec", AsyncMock(return_value=DummyProc()))
+
+        with pytest.raises(OSError, match="boom"):
+            await trickplay._run_ffmpeg(media, output_dir, 10)
+
+        assert not output_dir.exists()
+        assert not output_dir.with_name("item-1.tmp").exists()
+
+
+@pytest.mark.asyncio
+async def test_singleflight(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.features.streaming.library import trickplay
+
+    trickplay._IN_PROCESS.clear()
+    trickplay.Cache.get_instance().clear()
+    monkeypatch.setattr(trickplay.Config, "get_instance", staticmethod(lambda: _config()))
+
+    with temporary_test_dir("trickplay-singleflight") as temp_dir:
+        media = temp_dir / "video.mp4"
+        media.write_text("video")
+        calls = {"count": 0}
+
+        async def fake_run_ffmpeg(_file: Path, output_dir: Path, interval: int) -> Path:
+            assert interval == 10
+            calls["count"] += 1
+            await asyncio.sleep(0.01)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            (output_dir / "index.vtt").write_text("WEBVTT")
+            return output_dir / "index.vtt"
+
+        monkeypatch.setattr(trickplay, "_run_ffmpeg", fake_run_ffmpeg)
+
+        first, second = await asyncio.gather(
+            trickplay.ensure_trickplay(media, temp_dir / "cache", "item-1"),
+            trickplay.ensure_trickplay(media, temp_dir / "cache", "item-1"),
+        )
+
+        assert first == second == temp_dir / "cache" / "trickplay" / "item-1" / "index.vtt"
+        assert calls["count"] == 1
+        assert trickplay._IN_PROCESS == {}
+
+        assert await trickplay.ensure_trickplay(media, temp_dir / "cache", "item-1") == first
+        assert calls["count"] == 1, "existing sprites must be served without running ffmpeg"
+
+
+@pytest.mark.asyncio
+async def test_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.features.streaming.library import trickplay
+
+    monkeypatch.setattr(trickplay.Config, "get_instance", staticmethod(lambda: _config(thumb_trickplay=False)))
+    monkeypatch.setattr(trickplay, "_run_ffmpeg", AsyncMock(side_effect=AssertionError("must not run")))
+
+    with temporary_test_dir("trickplay-disabled") as temp_dir:
+        assert await trickplay.ensure_trickplay(temp_dir / "video.mp4", temp_dir / "cache", "item-1") is None
+
+
+@pytest.mark.asyncio
+async def test_miss_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.features.streaming.library import trickplay
+
+    trickplay._IN_PROCESS.clear()
+    trickplay.Cache.get_instance().clear()
+    monkeypatch.setattr(trickplay.Config, "get_instance", staticmethod(lambda: _config()))
+
+    run = AsyncMock(return_value=None)
+    monkeypatch.setattr(trickplay, "_run_ffmpeg", run)
+
+    with temporary_test_dir("trickplay-miss") as temp_dir:
+        media = temp_dir / "audio.mp3"
+        media.write_text("audio")
+
+        assert await trickplay.ensure_trickplay(media, temp_dir / "cache", "item-1") is None
+        assert await trickplay.ensure_trickplay(media, temp_dir / "cache", "item-1") is None
+        assert run.await_count == 1
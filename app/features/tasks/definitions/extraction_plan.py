@@ -0,0 +1,157 @@
+"""Pre-compiled extraction plans for generic task definitions."""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import jmespath
+from lxml import etree
+from parsel.csstranslator import css2xpath
+
+from app.features.tasks.definitions.schemas import ExtractionRule
+from app.library.logging import get_logger
+
+if TYPE_CHECKING:
+    from jmespath.parser import ParsedResult
+
+    from app.features.tasks.definitions.schemas import TaskDefinition
+
+LOG = get_logger()
+
+XPATH_NAMESPACES: dict[str, str] = {
+    "re": "http://exslt.org/regular-expressions",
+    "set": "http://exslt.org/sets",
+}
+"Namespaces parsel registers for every selector, needed to validate expressions using them."
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRule:
+    """An extraction rule with its expression and post-filter compiled."""
+
+    field: str
+    type: str
+    expression: str
+    attribute: str | None = None
+    pattern: re.Pattern[str] | None = None
+    "Compiled regex of ``regex`` rules."
+    xpath: str | None = None
+    "XPath of ``css`` and ``xpath`` rules, CSS already translated."
+    query: ParsedResult | None = None
+    "Compiled expression of ``jsonpath`` rules."
+    post_filter: re.Pattern[str] | None = None
+    post_filter_value: str | None = None
+    valid: bool = True
+    "False if the expression failed to compile; the rule then extracts nothing."
+
+    @classmethod
+    def compile(cls, field: str, data: ExtractionRule | dict[str, Any]) -> CompiledRule:
+        """
+        Validate and compile an extraction rule.
+
+        Args:
+            field (str): The field the rule extracts.
+            data (ExtractionRule | dict): The rule.
+
+        Returns:
+            CompiledRule: The compiled rule.
+
+        """
+        rule: ExtractionRule = ExtractionRule.model_validate(data)
+        kwargs: dict[str, Any] = {
+            "field": field,
+            "type": rule.type,
+            "expression": rule.expression,
+            "attribute": rule.attribute,
+        }
+
+        if rule.post_filter:
+            kwargs["post_filter"] = re.compile(rule.post_filter.filter)
+            kwargs["post_filter_value"] = rule.post_filter.value
+
+        try:
+            if "regex" == rule.type:
+                kwargs["pattern"] = re.compile(rule.expression, re.MULTILINE | re.DOTALL)
+            elif "jsonpath" == rule.type:
+                kwargs["query"] = jmespath.compile(rule.expression)
+            else:
+                xpath: str = css2xpath(rule.expression) if "css" == rule.type else rule.expression
+                etree.XPath(xpath, namespaces=XPATH_NAMESPACES)
+                kwargs["xpath"] = xpath
+        except Exception as exc:
+            LOG.error(
+                "Invalid %s expression '%s' for field '%s'.",
+                rule.type,
+                rule.expression,
+                field,
+                extra={
+                    "field": field,
+                    "expression": rule.expression,
+                    "error": str(exc),
+                    "exception_type": type(exc).__name__,
+                },
+            )
+            kwargs["valid"] = False
+
+        return cls(**kwargs)
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionPlan:
+    """
+    Everything needed to parse a response for a task definition, compiled once per definition.
+
+    Plans are immutable so they can be shared by concurrent parses running in worker threads.
+    """
+
+    name: str
+    response_type: str
+    match_patterns: tuple[re.Pattern[str], ...]
+    fields: tuple[CompiledRule, ...] = ()
+    "Direct field rules, used when the definition has no item container."
+    container: CompiledRule | None = None
+    "The item container selector compiled like a rule of the container type, None for direct field rules."
+    container_fields: tuple[CompiledRule, ...] = ()
+
+    @classmethod
+    def compile(cls, definition: TaskDefinition) -> ExtractionPlan:
+        """
+        Compile a task definition.
+
+        Args:
+            definition (TaskDefinition): The task definition.
+
+        Returns:
+            ExtractionPlan: The extraction plan.
+
+        """
+        match_patterns: tuple[re.Pattern[str], ...] = tuple(
+            re.compile(
+                matcher[1:-1]
+                if matcher.startswith("/") and matcher.endswith("/") and len(matcher) > 2
+                else fnmatch.translate(matcher)
+            )
+            for matcher in definition.match_url
+        )
+
+        parse = definition.definition.parse
+        if container := parse.get("items"):
+            return cls(
+                name=definition.name,
+                response_type=definition.definition.response.type,
+                match_patterns=match_patterns,
+                container=CompiledRule.compile("items", {"type": container.type, "expression": container.selector}),
+                container_fields=tuple(CompiledRule.compile(field, rule) for field, rule in container.fields.items()),
+            )
+
+        return cls(
+            name=definition.name,
+            response_type=definition.definition.response.type,
+            match_patterns=match_patterns,
+            fields=tuple(
+                CompiledRule.compile(field, rule) for field, rule in parse.field_items() if isinstance(rule, dict)
+            ),
+        )
@@ -0,0 +1,215 @@
+"""Conditional-GET validators for task handler feeds."""
+
+import hashlib
+import json
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from app.library.config import Config
+from app.library.logging import get_logger
+from app.library.Singleton import ThreadSafe
+
+if TYPE_CHECKING:
+    import httpx
+
+LOG = get_logger()
+
+FEED_VALIDATORS_FILE = "feed_validators.json"
+
+FEED_REVALIDATE_AFTER: int = 86400
+"Seconds after which stored validators are ignored, forcing a full fetch and parse of the feed."
+
+
+@dataclass(kw_only=True)
+class PendingValidators:
+    task_id: str | None
+    "The task being dispatched, validators are kept per task as tasks can share a feed."
+    feeds: dict[str, dict[str, Any]] = field(default_factory=dict)
+    "The validators of the changed feeds, keyed by URL."
+
+
+FEED_VALIDATION: ContextVar[PendingValidators | None] = ContextVar("feed_validation", default=None)
+"""
+Validators collected by the current task dispatch. Conditional requests are only made while this is set,
+so inspection and other callers always get the full feed.
+"""
+
+
+def _key(task_id: str | None, url: str) -> str:
+    return f"{task_id or ''}|{url}"
+
+
+class FeedUnchanged(Exception):  # noqa: N818
+    """Raised by a conditional request when the feed has not changed since the last full fetch."""
+
+    def __init__(self, url: str) -> None:
+        super().__init__(f"Feed '{url}' has not changed.")
+        self.url: str = url
+
+
+class FeedValidators(metaclass=ThreadSafe):
+    """
+    Remembers the ETag, Last-Modified and body hash of each task's feeds after a successful task run.
+
+    Validators are stored as JSON in the config directory and are only committed once the run that
+    fetched the feed has queued its items, so a failed run is fetched in full again next time.
+    """
+
+    def __init__(self, file: Path | None = None) -> None:
+        self._file: Path = file or Path(Config.get_instance().config_path) / FEED_VALIDATORS_FILE
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_instance() -> "FeedValidators":
+        return FeedValidators()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is not None:
+            return self._entries
+
+        try:
+            data = json.loads(self._file.read_text(encoding="utf-8"))
+            self._entries = {k: v for k, v in data.items() if isinstance(v, dict)} if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            self._entries = {}
+        except (OSError, ValueError) as e:
+            LOG.warning(
+                "Failed to read feed validators from '%s'.",
+                self._file,
+                extra={"file": str(self._file), "exception_type": type(e).__name__},
+            )
+            self._entries = {}
+
+        return self._entries
+
+    def _save(self) -> None:
+        try:
+            self._file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file: Path = self._file.with_suffix(".tmp")
+            temp_file.write_text(json.dumps(self._load(), indent=2), encoding="utf-8")
+            temp_file.replace(self._file)
+        except OSError as e:
+            LOG.warning(
+                "Failed to persist feed validators to '%s'.",
+                self._file,
+                extra={"file": str(self._file), "exception_type": type(e).__name__},
+            )
+
+    def get(self, task_id: str | None, url: str) -> dict[str, Any] | None:
+        """
+        Get the validators of a task's feed, unless they are older than ``FEED_REVALIDATE_AFTER``.
+
+        Args:
+            task_id (str | None): The task id.
+            url (str): The feed URL.
+
+        Returns:
+            dict | None: The validators with ``etag``, ``last_modified``, ``hash`` and ``updated_at`` keys, or None.
+
+        """
+        with self._lock:
+            entry: dict[str, Any] | None = self._load().get(_key(task_id, url))
+
+        if not entry:
+            return None
+
+        try:
+            age: float = (datetime.now(UTC) - datetime.fromisoformat(entry["updated_at"])).total_seconds()
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        return entry if age < FEED_REVALIDATE_AFTER else None
+
+    def headers(self, task_id: str | None, url: str) -> dict[str, str]:
+        """
+        Get the conditional request headers of a task's feed.
+
+        Args:
+            task_id (str | None): The task id.
+            url (str): The feed URL.
+
+        Returns:
+            dict[str, str]: ``If-None-Match`` and ``If-Modified-Since`` headers, if known.
+
+        """
+        headers: dict[str, str] = {}
+        if not (entry := self.get(task_id, url)):
+            return headers
+
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        return headers
+
+    def check(self, url: str, response: "httpx.Response", pending: PendingValidators) -> None:
+        """
+        Short-circuit unchanged feeds and collect the validators of changed ones.
+
+        Args:
+            url (str): The feed URL.
+            response (httpx.Response): The response.
+            pending (PendingValidators): Validators collected by the current dispatch.
+
+        Raises:
+            FeedUnchanged: If the server answered 304 or the body matches the last full fetch.
+
+        """
+        if 304 == response.status_code:
+            raise FeedUnchanged(url)
+
+        if not response.is_success:
+            return
+
+        body_hash: str = hashlib.sha256(response.content).hexdigest()
+        if (entry := self.get(pending.task_id, url)) and entry.get("hash") == body_hash:
+            raise FeedUnchanged(url)
+
+        pending.feeds[url] = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "hash": body_hash,
+        }
+
+    def commit(self, pending: PendingValidators) -> None:
+        """
+        Persist validators collected by a successful dispatch.
+
+        Args:
+            pending (PendingValidators): Validators collected by the dispatch.
+
+        """
+        if not pending.feeds:
+            return
+
+        now: str = datetime.now(UTC).isoformat()
+        with self._lock:
+            entries = self._load()
+            for url, validators in pending.feeds.items():
+                entries[_key(pending.task_id, url)] = {**validators, "task_id": pending.task_id, "updated_at": now}
+            self._save()
+
+    def forget_task(self, task_id: str) -> None:
+        """
+        Drop the validators of a task's feeds so its next run fetches and re-checks every item.
+
+        Args:
+            task_id (str): The task id.
+
+        """
+        with self._lock:
+            entries = self._load()
+            stale: list[str] = [key for key, entry in entries.items() if entry.get("task_id") == task_id]
+            if not stale:
+                return
+
+            for key in stale:
+                entries.pop(key, None)
+            self._save()
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Any
 
+from app.features.tasks.definitions.feed_validators import FEED_VALIDATION, FeedValidators
 from app.features.tasks.definitions.results import HandleTask, TaskFailure, TaskResult
 from app.library.config import Config
 from app.library.httpx_client import Globals, build_request_headers, get_async_client, resolve_curl_transport
@@ -38,6 +39,9 @@ class BaseHandler:
         """
         Make an HTTP request.
 
+        During a task dispatch, GET requests are conditional: stored ETag/Last-Modified validators are sent,
+        and a 304 or a body identical to the last full fetch raises ``FeedUnchanged``.
+
         Args:
             url (str): The URL to request.
             headers (dict | None): Additional headers to include in the request.
@@ -47,6 +51,9 @@ class BaseHandler:
         Returns:
             httpx.Response: The HTTP response.
 
+        Raises:
+            FeedUnchanged: If the feed has not changed since the last successful task run.
+
         """
         headers = {} if not isinstance(headers, dict) else headers
         ytdlp_opts = {} if not isinstance(ytdlp_opts, dict) else ytdlp_opts
@@ -62,10 +69,20 @@ class BaseHandler:
         client = get_async_client(proxy=proxy, use_curl=use_curl)
         method = kwargs.pop("method", "GET").upper()
         timeout = ytdlp_opts.get("timeout", ytdlp_opts.get("socket_timeout", 120))
-        return await client.request(
+
+        pending = FEED_VALIDATION.get() if "GET" == method else None
+        if pending is not None:
+            request_headers.update(FeedValidators.get_instance().headers(pending.task_id, url))
+
+        response = await client.request(
             method=method,
             url=url,
             headers=request_headers,
             timeout=timeout,
             **kwargs,
         )
+
+        if pending is not None:
+            FeedValidators.get_instance().check(url, response, pending)
+
+        return response
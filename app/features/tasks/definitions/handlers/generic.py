@@ -3,22 +3,21 @@
 from __future__ import annotations
 
 import asyncio
-import fnmatch
 import hashlib
 import json
 import logging
-import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin
 
 import httpx
-import jmespath
 from parsel import Selector
 
+from app.features.tasks.definitions.extraction_plan import CompiledRule, ExtractionPlan
+from app.features.tasks.definitions.feed_validators import FEED_VALIDATION, FeedUnchanged, FeedValidators
 from app.features.tasks.definitions.results import HandleTask, TaskFailure, TaskItem, TaskResult
 from app.features.tasks.definitions.schemas import (
     BrowserEngineOptions,
-    ExtractionRule,
     HttpEngineOptions,
     TaskDefinition,
 )
@@ -33,12 +32,13 @@ from app.library.Utils import validate_url
 from ._base_handler import BaseHandler
 
 if TYPE_CHECKING:
+    import re
     from pathlib import Path
 
-    from parsel.selector import SelectorList
-
 LOG = get_logger()
 CACHE: Cache = Cache()
+BROWSER_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="task-browser")
+"Browser sessions are pooled per thread, so pages load on a few dedicated threads to reuse them."
 
 
 class GenericTaskHandler(BaseHandler):
@@ -50,6 +50,9 @@ class GenericTaskHandler(BaseHandler):
     _sources_mtime: dict[Path, float] = {}
     """Modification times of source files to detect changes."""
 
+    _plans: dict[int, tuple[TaskDefinition, ExtractionPlan]] = {}
+    """Compiled extraction plans of stored definitions, keyed by definition id."""
+
     @classmethod
     async def refresh_definitions(cls, force: bool = False) -> list[TaskDefinition]:
         """
@@ -70,6 +73,7 @@ class GenericTaskHandler(BaseHandler):
             models = await repo.all()
 
             cls._definitions = [model_to_schema(model) for model in models]
+            cls._plans = {}
             return cls._definitions
         except Exception as exc:
             LOG.exception(
@@ -112,18 +116,35 @@ class GenericTaskHandler(BaseHandler):
 
         return None
 
+    @classmethod
+    def get_plan(cls, definition: TaskDefinition) -> ExtractionPlan:
+        """
+        Get the compiled extraction plan of a definition.
+
+        Plans of stored definitions are compiled once and dropped when the definitions are reloaded.
+
+        Args:
+            definition (TaskDefinition): The task definition.
+
+        Returns:
+            ExtractionPlan: The extraction plan.
+
+        """
+        if definition.id is None:
+            return ExtractionPlan.compile(definition)
+
+        cached: tuple[TaskDefinition, ExtractionPlan] | None = cls._plans.get(definition.id)
+        if cached and cached[0] is definition:
+            return cached[1]
+
+        plan: ExtractionPlan = ExtractionPlan.compile(definition)
+        cls._plans[definition.id] = (definition, plan)
+        return plan
+
     @staticmethod
     def matches_url(definition: TaskDefinition, url: str) -> bool:
         """Return whether a URL matches a definition's URL patterns."""
-        for matcher in definition.match_url:
-            pattern = (
-                matcher[1:-1]
-                if matcher.startswith("/") and matcher.endswith("/") and len(matcher) > 2
-                else fnmatch.translate(matcher)
-            )
-            if re.match(pattern, url):
-                return True
-        return False
+        return any(pattern.match(url) for pattern in GenericTaskHandler.get_plan(definition).match_patterns)
 
     @staticmethod
     async def can_handle(task: HandleTask) -> bool:
@@ -199,6 +220,8 @@ class GenericTaskHandler(BaseHandler):
             body_text, json_data = await GenericTaskHandler._fetch_content(
                 url=target_url, definition=definition, ytdlp_opts=ytdlp_opts
             )
+        except FeedUnchanged as exc:
+            return TaskResult(items=[], metadata={"feed_url": exc.url, "unchanged": True})
         except httpx.HTTPError as exc:
             return TaskFailure(message="Failed to fetch target URL.", error=str(exc))
         except Exception as exc:
@@ -220,8 +243,12 @@ class GenericTaskHandler(BaseHandler):
         if "json" != definition.definition.response.type and not body_text:
             return TaskFailure(message="Received empty response body.")
 
-        raw_items: list[dict[str, str]] = GenericTaskHandler._parse_items(
-            definition=definition, html=body_text or "", base_url=target_url, json_data=json_data
+        raw_items: list[dict[str, str]] = await asyncio.to_thread(
+            GenericTaskHandler._parse_items,
+            definition=definition,
+            html=body_text or "",
+            base_url=target_url,
+            json_data=json_data,
         )
 
         task_items: list[TaskItem] = []
@@ -419,8 +446,13 @@ class GenericTaskHandler(BaseHandler):
             curl_default_headers=options.curl_default_headers,
             enable_cf=options.flaresolverr,
         )
+        method: str = definition.definition.request.method.upper()
+        pending = FEED_VALIDATION.get() if "GET" == method else None
+        if pending is not None:
+            request_headers.update(FeedValidators.get_instance().headers(pending.task_id, url))
+
         response: httpx.Response = await client.request(
-            method=definition.definition.request.method.upper(),
+            method=method,
             url=url,
             params=definition.definition.request.params or None,
             data=form_data,
@@ -428,6 +460,10 @@ class GenericTaskHandler(BaseHandler):
             timeout=timeout_value,
             headers=request_headers,
         )
+
+        if pending is not None:
+            FeedValidators.get_instance().check(url, response, pending)
+
         response.raise_for_status()
 
         if "json" == definition.definition.response.type:
@@ -527,7 +563,7 @@ class GenericTaskHandler(BaseHandler):
             finally:
                 session.close()
 
-        return await asyncio.to_thread(load_page)
+        return await asyncio.get_running_loop().run_in_executor(BROWSER_EXECUTOR, load_page)
 
     @staticmethod
     def _parse_items(
@@ -549,14 +585,16 @@ class GenericTaskHandler(BaseHandler):
             (list[dict[str, str]]): A list of extracted items as dictionaries.
 
         """
-        if "json" == definition.definition.response.type:
-            return GenericTaskHandler._parse_json_items(definition, json_data, base_url)
+        plan: ExtractionPlan = GenericTaskHandler.get_plan(definition)
+
+        if "json" == plan.response_type:
+            return GenericTaskHandler._parse_json_items(plan, json_data, base_url)
 
         selector = Selector(text=html)
 
-        if definition.definition.parse.get("items"):
+        if plan.container:
             return GenericTaskHandler._parse_with_container(
-                definition=definition,
+                plan=plan,
                 selector=selector,
                 html=html,
                 base_url=base_url,
@@ -564,16 +602,12 @@ class GenericTaskHandler(BaseHandler):
 
         extracted: dict[str, list[str]] = {}
 
-        for _field, rule_data in definition.definition.parse.field_items():
-            if not isinstance(rule_data, dict):
-                continue
-            rule = ExtractionRule.model_validate(rule_data)
-            values: list[str] = GenericTaskHandler._execute_rule(field=_field, selector=selector, html=html, rule=rule)
-            extracted[_field] = values
+        for rule in plan.fields:
+            extracted[rule.field] = GenericTaskHandler._execute_rule(selector=selector, html=html, rule=rule)
 
         url_values: list[str] = extracted.get("url", [])
         if not url_values:
-            LOG.debug("Definition '%s' produced no URL values.", definition.name, extra={"definition": definition.name})
+            LOG.debug("Definition '%s' produced no URL values.", plan.name, extra={"definition": plan.name})
             return []
 
         total_items: int = len(url_values)
@@ -603,34 +637,31 @@ class GenericTaskHandler(BaseHandler):
 
     @staticmethod
     def _parse_json_items(
-        definition: TaskDefinition,
+        plan: ExtractionPlan,
         json_data: Any | None,
         base_url: str,
     ) -> list[dict[str, str]]:
         if json_data is None:
             LOG.debug(
                 "Definition '%s' expects JSON but no data was parsed.",
-                definition.name,
-                extra={"definition": definition.name},
+                plan.name,
+                extra={"definition": plan.name},
             )
             return []
 
-        if definition.definition.parse.get("items"):
-            return GenericTaskHandler._parse_json_with_container(definition, json_data, base_url)
+        if plan.container:
+            return GenericTaskHandler._parse_json_with_container(plan, json_data, base_url)
 
         items: list[dict[str, str]] = []
         entry: dict[str, str] = {}
 
-        for _field, rule_data in definition.definition.parse.field_items():
-            if not isinstance(rule_data, dict):
-                continue
-            rule = ExtractionRule.model_validate(rule_data)
-            values: list[str] = GenericTaskHandler._execute_json_rule(_field, json_data, rule)
+        for rule in plan.fields:
+            values: list[str] = GenericTaskHandler._execute_json_rule(json_data, rule)
             if values:
-                if "url" == _field:
+                if "url" == rule.field:
                     entry["url"] = urljoin(base_url, values[0])
                 else:
-                    entry[_field] = values[0]
+                    entry[rule.field] = values[0]
 
         if "url" in entry:
             items.append(entry)
@@ -639,53 +670,32 @@ class GenericTaskHandler(BaseHandler):
 
     @staticmethod
     def _parse_with_container(
-        definition: TaskDefinition,
+        plan: ExtractionPlan,
         selector: Selector,
         html: str,
         base_url: str,
     ) -> list[dict[str, str]]:
-        container: dict[str, Any] | None = definition.definition.parse.get("items")
-        if not container:
-            return []
-
-        container_type = container.get("type", "css")
-        container_selector = container.get("selector", "")
-        if not container_selector:
-            LOG.error(
-                "Task definition '%s' is missing an item container selector.",
-                definition.name,
-                extra={"definition": definition.name},
-            )
+        container: CompiledRule | None = plan.container
+        if not container or not container.xpath:
             return []
-        container_fields = container.get("fields", {})
-
-        selection: SelectorList[Selector] = (
-            selector.css(container_selector) if "css" == container_type else selector.xpath(container_selector)
-        )
 
         items: list[dict[str, str]] = []
 
-        for node in selection:
+        for node in selector.xpath(container.xpath):
             node_html: Any | str = node.get() or html
             entry: dict[str, str] = {}
 
-            for _field, rule_data in container_fields.items():
-                rule = ExtractionRule.model_validate(rule_data)
-                values: list[str] = GenericTaskHandler._execute_rule(
-                    field=_field,
-                    selector=node,
-                    html=node_html,
-                    rule=rule,
-                )
+            for rule in plan.container_fields:
+                values: list[str] = GenericTaskHandler._execute_rule(selector=node, html=node_html, rule=rule)
 
                 value: str | None = values[0] if values else None
                 if value is None:
                     continue
 
-                if "url" == _field:
+                if "url" == rule.field:
                     entry["url"] = urljoin(base_url, value)
                 else:
-                    entry[_field] = value
+                    entry[rule.field] = value
 
             if "url" not in entry:
                 continue
@@ -696,27 +706,23 @@ class GenericTaskHandler(BaseHandler):
 
     @staticmethod
     def _parse_json_with_container(
-        definition: TaskDefinition,
+        plan: ExtractionPlan,
         json_data: Any,
         base_url: str,
     ) -> list[dict[str, str]]:
-        container: dict[str, Any] | None = definition.definition.parse.get("items")
+        container: CompiledRule | None = plan.container
         if not container:
             return []
 
-        container_type = container.get("type", "css")
-        container_selector = container.get("selector", "")
-        container_fields = container.get("fields", {})
-
-        if "jsonpath" != container_type:
+        if "jsonpath" != container.type:
             LOG.error(
                 "JSON response requires container selector type 'jsonpath'. Definition '%s'.",
-                definition.name,
-                extra={"definition": definition.name, "container_type": container_type},
+                plan.name,
+                extra={"definition": plan.name, "container_type": container.type},
             )
             return []
 
-        nodes: Any = GenericTaskHandler._json_search(json_data, container_selector)
+        nodes: Any = GenericTaskHandler._json_search(json_data, container)
         if nodes is None:
             return []
 
@@ -728,16 +734,15 @@ class GenericTaskHandler(BaseHandler):
         for node in nodes:
             entry: dict[str, str] = {}
 
-            for _field, rule_data in container_fields.items():
-                rule = ExtractionRule.model_validate(rule_data)
-                values: list[str] = GenericTaskHandler._execute_json_rule(_field, node, rule)
+            for rule in plan.container_fields:
+                values: list[str] = GenericTaskHandler._execute_json_rule(node, rule)
                 if not values:
                     continue
 
-                if "url" == _field:
+                if "url" == rule.field:
                     entry["url"] = urljoin(base_url, values[0])
                 else:
-                    entry[_field] = values[0]
+                    entry[rule.field] = values[0]
 
             if "url" not in entry:
                 continue
@@ -747,11 +752,13 @@ class GenericTaskHandler(BaseHandler):
         return items
 
     @staticmethod
-    def _execute_json_rule(field: str, data: Any, rule: ExtractionRule) -> list[str]:
+    def _execute_json_rule(data: Any, rule: CompiledRule) -> list[str]:
         values: list[str] = []
+        if not rule.valid:
+            return values
 
         if "jsonpath" == rule.type:
-            result: Any = GenericTaskHandler._json_search(data, rule.expression)
+            result: Any = GenericTaskHandler._json_search(data, rule)
             candidates: list | list[Any] = result if isinstance(result, list) else [result]
             for candidate in candidates:
                 if candidate is None:
@@ -764,24 +771,9 @@ class GenericTaskHandler(BaseHandler):
 
             return values
 
-        if "regex" == rule.type:
+        if "regex" == rule.type and rule.pattern:
             target: str = GenericTaskHandler._coerce_to_string(data)
-            try:
-                pattern: re.Pattern[str] = re.compile(rule.expression, re.MULTILINE | re.DOTALL)
-            except re.error as exc:
-                LOG.exception(
-                    "Invalid regex expression '%s'.",
-                    rule.expression,
-                    extra={
-                        "field": field,
-                        "expression": rule.expression,
-                        "error": str(exc),
-                        "exception_type": type(exc).__name__,
-                    },
-                )
-                return values
-
-            for match in pattern.finditer(target):
+            for match in rule.pattern.finditer(target):
                 raw: str | None = GenericTaskHandler._regex_value(match=match, attribute=rule.attribute)
                 processed = GenericTaskHandler._apply_post_filter(raw, rule)
                 if processed is not None:
@@ -792,20 +784,23 @@ class GenericTaskHandler(BaseHandler):
         LOG.error(
             "Unsupported extraction type '%s' for JSON data in field '%s'.",
             rule.type,
-            field,
-            extra={"field": field, "rule_type": rule.type},
+            rule.field,
+            extra={"field": rule.field, "rule_type": rule.type},
         )
         return values
 
     @staticmethod
-    def _json_search(data: Any, expression: str) -> Any:
+    def _json_search(data: Any, rule: CompiledRule) -> Any:
+        if not rule.query:
+            return None
+
         try:
-            return jmespath.search(expression, data)
+            return rule.query.search(data)
         except Exception as exc:
             LOG.exception(
                 "JSONPath search failed for expression '%s'.",
-                expression,
-                extra={"expression": expression, "error": str(exc), "exception_type": type(exc).__name__},
+                rule.expression,
+                extra={"expression": rule.expression, "error": str(exc), "exception_type": type(exc).__name__},
             )
             return None
 
@@ -821,39 +816,25 @@ class GenericTaskHandler(BaseHandler):
             return str(value)
 
     @staticmethod
-    def _execute_rule(field: str, selector: Selector, html: str, rule: ExtractionRule) -> list[str]:
+    def _execute_rule(selector: Selector, html: str, rule: CompiledRule) -> list[str]:
         """
         Execute a single extraction rule and return the list of extracted values.
 
         Args:
-            field (str): The name of the field being extracted.
             selector (Selector): The parsel Selector for the HTML content.
             html (str): The raw HTML content.
-            rule (ExtractionRuleSchema): The extraction rule to execute.
+            rule (CompiledRule): The compiled extraction rule to execute.
 
         Returns:
             (list[str]): A list of extracted values.
 
         """
         values: list[str] = []
+        if not rule.valid:
+            return values
 
-        if "regex" == rule.type:
-            try:
-                pattern: re.Pattern[str] = re.compile(rule.expression, re.MULTILINE | re.DOTALL)
-            except re.error as exc:
-                LOG.exception(
-                    "Invalid regex expression '%s'.",
-                    rule.expression,
-                    extra={
-                        "field": field,
-                        "expression": rule.expression,
-                        "error": str(exc),
-                        "exception_type": type(exc).__name__,
-                    },
-                )
-                return values
-
-            for match in pattern.finditer(html):
+        if "regex" == rule.type and rule.pattern:
+            for match in rule.pattern.finditer(html):
                 raw: str | None = GenericTaskHandler._regex_value(match=match, attribute=rule.attribute)
                 processed: str | None = GenericTaskHandler._apply_post_filter(raw, rule)
                 if processed is not None:
@@ -861,16 +842,12 @@ class GenericTaskHandler(BaseHandler):
 
             return values
 
-        if "jsonpath" == rule.type:
-            LOG.error("Field '%s' uses 'jsonpath' on a non-JSON response.", field, extra={"field": field})
+        if "jsonpath" == rule.type or not rule.xpath:
+            LOG.error("Field '%s' uses 'jsonpath' on a non-JSON response.", rule.field, extra={"field": rule.field})
             return values
 
-        selection: SelectorList[Selector] = (
-            selector.css(rule.expression) if "css" == rule.type else selector.xpath(rule.expression)
-        )
-
-        for sel in selection:
-            raw = GenericTaskHandler._selector_value(field, sel, rule.attribute)
+        for sel in selector.xpath(rule.xpath):
+            raw = GenericTaskHandler._selector_value(rule.field, sel, rule.attribute)
             processed = GenericTaskHandler._apply_post_filter(raw, rule)
             if processed is not None:
                 values.append(processed)
@@ -969,13 +946,13 @@ class GenericTaskHandler(BaseHandler):
         return value if value is not None else None
 
     @staticmethod
-    def _apply_post_filter(value: str | None, rule: ExtractionRule) -> str | None:
+    def _apply_post_filter(value: str | None, rule: CompiledRule) -> str | None:
         """
         Apply the post-filter to the extracted value if defined.
 
         Args:
             value (str|None): The extracted value to filter.
-            rule (ExtractionRuleSchema): The extraction rule containing the post-filter.
+            rule (CompiledRule): The compiled extraction rule containing the post-filter.
 
         Returns:
             (str|None): The filtered value if applicable, None otherwise.
@@ -986,30 +963,25 @@ class GenericTaskHandler(BaseHandler):
 
         cleaned: str = value.strip()
         if rule.post_filter:
-            # Apply post-filter inline (removed helper method)
-            try:
-                pattern = re.compile(rule.post_filter.filter)
-                match = pattern.search(cleaned)
-                if not match:
-                    return None
+            match = rule.post_filter.search(cleaned)
+            if not match:
+                return None
 
-                if rule.post_filter.value:
-                    try:
-                        return match.group(rule.post_filter.value)
-                    except (IndexError, KeyError):
-                        return None
+            if rule.post_filter_value:
+                try:
+                    return match.group(rule.post_filter_value)
+                except (IndexError, KeyError):
+                    return None
 
-                if match.groupdict():
-                    # Prefer first named group when available
-                    for group_value in match.groupdict().values():
-                        if group_value is not None:
-                            return group_value
+            if match.groupdict():
+                # Prefer first named group when available
+                for group_value in match.groupdict().values():
+                    if group_value is not None:
+                        return group_value
 
-                if match.groups():
-                    return match.group(1)
+            if match.groups():
+                return match.group(1)
 
-                return match.group(0)
-            except re.error:
-                return None
+            return match.group(0)
 
         return cleaned or None
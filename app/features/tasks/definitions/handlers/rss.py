@@ -7,6 +7,7 @@ from xml.etree.ElementTree import Element
 
 import httpx
 
+from app.features.tasks.definitions.feed_validators import FeedUnchanged
 from app.features.tasks.definitions.results import HandleTask, TaskFailure, TaskItem, TaskResult
 from app.features.ytdlp.extractor import ExtractorBatch, fetch_info
 from app.features.ytdlp.utils import get_archive_id
@@ -224,6 +225,8 @@ class RssGenericHandler(BaseHandler):
 
         try:
             feed_url, items, real_count = await RssGenericHandler._get(task, params, parsed)
+        except FeedUnchanged as exc:
+            return TaskResult(items=[], metadata={"feed_url": exc.url, "unchanged": True})
         except httpx.HTTPError as exc:
             return TaskFailure(message="Failed to fetch RSS/Atom feed.", error=str(exc))
         except Exception as exc:
@@ -3,6 +3,7 @@ from urllib.parse import urljoin
 
 import httpx
 
+from app.features.tasks.definitions.feed_validators import FeedUnchanged
 from app.features.tasks.definitions.results import HandleTask, TaskFailure, TaskItem, TaskResult
 from app.features.ytdlp.utils import get_archive_id
 from app.library.config import Config
@@ -211,6 +212,8 @@ class TverHandler(BaseHandler):
 
         try:
             feed_url, items, has_items = await TverHandler._collect_feed(task, params, series_id)
+        except FeedUnchanged as exc:
+            return TaskResult(items=[], metadata={"feed_url": exc.url, "unchanged": True})
         except httpx.HTTPError as exc:
             return TaskFailure(message="Failed to fetch Tver feed.", error=str(exc))
         except Exception as exc:
@@ -6,6 +6,7 @@ from xml.etree.ElementTree import Element
 
 import httpx
 
+from app.features.tasks.definitions.feed_validators import FeedUnchanged
 from app.features.tasks.definitions.results import HandleTask, TaskFailure, TaskItem, TaskResult
 from app.features.ytdlp.utils import get_archive_id
 from app.library.config import Config
@@ -132,6 +133,8 @@ class TwitchHandler(BaseHandler):
 
         try:
             feed_url, items, has_items = await TwitchHandler._collect_feed(task, params, handle_name)
+        except FeedUnchanged as exc:
+            return TaskResult(items=[], metadata={"feed_url": exc.url, "unchanged": True})
         except httpx.HTTPError as exc:
             return TaskFailure(message="Failed to fetch Twitch feed.", error=str(exc))
         except Exception as exc:
@@ -4,6 +4,7 @@ from xml.etree.ElementTree import Element
 
 import httpx
 
+from app.features.tasks.definitions.feed_validators import FeedUnchanged
 from app.features.tasks.definitions.results import HandleTask, TaskFailure, TaskItem, TaskResult
 from app.features.ytdlp.utils import get_archive_id
 from app.library.config import Config
@@ -129,6 +130,8 @@ class YoutubeHandler(BaseHandler):
 
         try:
             feed_url, items, real_count = await YoutubeHandler._get(task, params, parsed)
+        except FeedUnchanged as exc:
+            return TaskResult(items=[], metadata={"feed_url": exc.url, "unchanged": True})
         except httpx.HTTPError as exc:
             return TaskFailure(message="Failed to fetch YouTube feed.", error=str(exc))
         except Exception as exc:
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 from app.features.downloads.items import Item, ItemDTO
 from app.features.downloads.runtime.queue_manager import DownloadQueue
+from app.features.tasks.definitions.feed_validators import FEED_VALIDATION, FeedValidators, PendingValidators
 from app.features.tasks.definitions.handlers._base_handler import BaseHandler
 from app.features.tasks.definitions.results import HandleTask, TaskFailure, TaskItem, TaskResult
 from app.features.tasks.models import TaskModel
@@ -266,6 +267,8 @@ class TaskHandle:
 
         services: Services = Services.get_instance()
 
+        pending_validators = PendingValidators(task_id=None if task.id is None else str(task.id))
+        token = FEED_VALIDATION.set(pending_validators)
         try:
             extraction: TaskResult | TaskFailure = await services.handle_async(
                 handler=handler.extract, task=task, config=self._config
@@ -296,6 +299,8 @@ class TaskHandle:
                 },
             )
             raise
+        finally:
+            FEED_VALIDATION.reset(token)
 
         if isinstance(extraction, TaskFailure):
             msg: str = extraction.message
@@ -331,6 +336,14 @@ class TaskHandle:
         raw_items: list[TaskItem] = extraction.items or []
         metadata: dict[str, Any] = extraction.metadata or {}
 
+        if metadata.get("unchanged"):
+            LOG.debug(
+                "Feed for task '%s' has not changed since the last run.",
+                task.name,
+                extra={"task_id": task.id, "task_name": task.name, "handler_name": handler.__name__},
+            )
+            return extraction
+
         handler_name: str = handler.__name__
         queued: set[str] = self._queued.setdefault(handler_name, set())
         failures: dict[str, int] = self._failure_count.setdefault(handler_name, {})
@@ -416,6 +429,7 @@ class TaskHandle:
                         "raw_count": len(raw_items),
                     },
                 )
+            FeedValidators.get_instance().commit(pending_validators)
             return TaskResult(items=[], metadata=metadata)
 
         LOG.info(
@@ -455,6 +469,8 @@ class TaskHandle:
                 data=base_item.new_with(url=item.url, extras=extras).serialize(),
             )
 
+        FeedValidators.get_instance().commit(pending_validators)
+
         return TaskResult(items=filtered, metadata=metadata)
 
     async def inspect(
@@ -671,6 +687,9 @@ class TaskHandle:
         if not handler_name:
             return
 
+        if source_id := extras.get("source_id"):
+            FeedValidators.get_instance().forget_task(str(source_id))
+
         archive_id: str | None = item.archive_id
         if not archive_id:
             return
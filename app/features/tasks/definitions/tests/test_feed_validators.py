@@ -0,0 +1,120 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.features.tasks.definitions.feed_validators import (
+    FEED_REVALIDATE_AFTER,
+    FEED_VALIDATION,
+    FeedUnchanged,
+    FeedValidators,
+    PendingValidators,
+)
+from app.features.tasks.definitions.handlers._base_handler import BaseHandler
+from app.tests.helpers import temporary_test_dir
+
+FEED_URL = "https://example.com/feed.xml"
+
+
+@pytest.fixture
+def store():
+    FeedValidators._reset_singleton()
+    with temporary_test_dir("feed-validators") as temp_dir:
+        yield FeedValidators(temp_dir / "feed_validators.json")
+    FeedValidators._reset_singleton()
+
+
+def _response(status: int = 200, body: bytes = b"<feed/>", headers: dict | None = None) -> httpx.Response:
+    return httpx.Response(status, content=body, headers=headers, request=httpx.Request("GET", FEED_URL))
+
+
+def _pending(task_id: str | None = "7", **feeds: dict) -> PendingValidators:
+    return PendingValidators(task_id=task_id, feeds={FEED_URL: v for v in feeds.values()})
+
+
+def test_changed_feed_collects_validators(store: FeedValidators) -> None:
+    pending = _pending()
+    store.check(
+        FEED_URL, _response(headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}), pending
+    )
+
+    assert pending.feeds[FEED_URL]["etag"] == '"v1"'
+    assert store.get("7", FEED_URL) is None, "validators must not be stored before the dispatch commits them"
+
+    store.commit(pending)
+    reopened = FeedValidators(store._file)
+    assert reopened.headers("7", FEED_URL) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+
+
+def test_not_modified_and_identical_body_short_circuit(store: FeedValidators) -> None:
+    pending = _pending()
+    store.check(FEED_URL, _response(), pending)
+    store.commit(pending)
+
+    with pytest.raises(FeedUnchanged):
+        store.check(FEED_URL, _response(304, b""), _pending())
+
+    with pytest.raises(FeedUnchanged):
+        store.check(FEED_URL, _response(), _pending())
+
+    pending = _pending()
+    store.check(FEED_URL, _response(body=b"<feed><entry/></feed>"), pending)
+    assert FEED_URL in pending.feeds
+
+
+def test_validators_are_kept_per_task(store: FeedValidators) -> None:
+    pending = _pending("7")
+    store.check(FEED_URL, _response(headers={"ETag": '"v1"'}), pending)
+    store.commit(pending)
+
+    other = _pending("8")
+    store.check(FEED_URL, _response(headers={"ETag": '"v1"'}), other)
+    assert store.headers("8", FEED_URL) == {}
+    assert FEED_URL in other.feeds
+
+    store.commit(other)
+    store.forget_task("7")
+    assert store.get("7", FEED_URL) is None
+    assert store.headers("8", FEED_URL) == {"If-None-Match": '"v1"'}
+
+
+def test_stale_and_forgotten_validators_are_ignored(store: FeedValidators) -> None:
+    store.commit(_pending(feed={"etag": '"v1"', "last_modified": None, "hash": "x"}))
+    assert store.headers("7", FEED_URL) == {"If-None-Match": '"v1"'}
+
+    stale = datetime.now(UTC) - timedelta(seconds=FEED_REVALIDATE_AFTER + 1)
+    store._load()[f"7|{FEED_URL}"]["updated_at"] = stale.isoformat()
+    assert store.get("7", FEED_URL) is None
+
+    store.commit(_pending(feed={"etag": '"v2"', "last_modified": None, "hash": "x"}))
+    store.forget_task("7")
+    assert store.get("7", FEED_URL) is None
+
+
+@pytest.mark.asyncio
+async def test_request_is_conditional_only_during_dispatch(store: FeedValidators) -> None:
+    store.commit(_pending(feed={"etag": '"v1"', "last_modified": None, "hash": "x"}))
+    client = AsyncMock()
+    client.request.return_value = _response(304, b"")
+
+    with (
+        patch.object(FeedValidators, "get_instance", return_value=store),
+        patch("app.features.tasks.definitions.handlers._base_handler.get_async_client", return_value=client),
+        patch("app.features.tasks.definitions.handlers._base_handler.resolve_curl_transport", return_value=False),
+    ):
+        response = await BaseHandler.request(url=FEED_URL)
+        assert 304 == response.status_code
+        assert "If-None-Match" not in client.request.call_args.kwargs["headers"]
+
+        token = FEED_VALIDATION.set(_pending())
+        try:
+            with pytest.raises(FeedUnchanged):
+                await BaseHandler.request(url=FEED_URL)
+        finally:
+            FEED_VALIDATION.reset(token)
+
+        assert client.request.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
@@ -1,4 +1,5 @@
 import logging
+import threading
 from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
@@ -24,6 +25,7 @@ from app.library.config import Config
 def reset_generic_handler(monkeypatch):
     monkeypatch.setattr(GenericTaskHandler, "_definitions", [])
     monkeypatch.setattr(GenericTaskHandler, "_sources_mtime", {})
+    monkeypatch.setattr(GenericTaskHandler, "_plans", {})
 
 
 @pytest.mark.parametrize("method", ["GET", "POST"])
@@ -136,13 +138,12 @@ async def test_browser_thread_cleanup(monkeypatch):
     )
     session = Mock()
     session.content.return_value = "<html>"
-    connect_mock = Mock(return_value=session)
+    threads: list[str] = []
+    connect_mock = Mock(side_effect=lambda *_: threads.append(threading.current_thread().name) or session)
     monkeypatch.setattr(
         "app.yt_dlp_plugins.extractor.generic_browser.CdpDriver.connect",
         connect_mock,
     )
-    to_thread = AsyncMock(side_effect=lambda function: function())
-    monkeypatch.setattr("app.features.tasks.definitions.handlers.generic.asyncio.to_thread", to_thread)
 
     result = await GenericTaskHandler._fetch_with_browser("https://example.com", definition)
 
@@ -157,7 +158,7 @@ async def test_browser_thread_cleanup(monkeypatch):
     )
     session.wait_for_selector.assert_called_once_with("css", ".ready", 15)
     session.close.assert_called_once_with()
-    to_thread.assert_awaited_once()
+    assert threads[0].startswith("task-browser")
 
 
 @pytest.mark.asyncio
@@ -187,10 +188,6 @@ async def test_browser_request(monkeypatch: pytest.MonkeyPatch) -> None:
         "app.yt_dlp_plugins.extractor.generic_browser.CdpDriver.connect",
         connect_mock,
     )
-    monkeypatch.setattr(
-        "app.features.tasks.definitions.handlers.generic.asyncio.to_thread",
-        AsyncMock(side_effect=lambda function: function()),
-    )
 
     result = await GenericTaskHandler._fetch_with_browser("https://example.com/feed?sort=new", definition)
 
@@ -228,10 +225,6 @@ async def test_browser_form(monkeypatch: pytest.MonkeyPatch) -> None:
         "app.yt_dlp_plugins.extractor.generic_browser.CdpDriver.connect",
         Mock(return_value=session),
     )
-    monkeypatch.setattr(
-        "app.features.tasks.definitions.handlers.generic.asyncio.to_thread",
-        AsyncMock(side_effect=lambda function: function()),
-    )
 
     result = await GenericTaskHandler._fetch_with_browser("https://example.com/search", definition)
 
@@ -284,6 +277,37 @@ def test_parse_items_basic():
     assert items[1]["url"] == "https://example.com/article-102"
 
 
+def test_extraction_plan_is_cached_per_definition():
+    def make() -> TaskDefinition:
+        return TaskDefinition(
+            id=9,
+            name="planned",
+            match_url=["https://example.com/*"],
+            definition=Definition(
+                parse=Parse.model_validate(
+                    {
+                        "url": {"type": "css", "expression": "a::attr(href)"},
+                        "title": {"type": "regex", "expression": "<b>(.+?)</b>"},
+                        "broken": {"type": "xpath", "expression": "//a[", "attribute": "text"},
+                    }
+                ),
+            ),
+        )
+
+    definition = make()
+    plan = GenericTaskHandler.get_plan(definition)
+
+    assert GenericTaskHandler.get_plan(definition) is plan
+    assert GenericTaskHandler.matches_url(definition, "https://example.com/list")
+    assert [rule.field for rule in plan.fields] == ["url", "title", "broken"]
+    assert plan.fields[0].xpath, "CSS rules must be translated to XPath once"
+
+    items = GenericTaskHandler._parse_items(definition, '<a href="/v/1"><b>One</b></a>', "https://example.com/")
+    assert items == [{"url": "https://example.com/v/1", "title": "One"}]
+
+    assert GenericTaskHandler.get_plan(make()) is not plan, "an updated definition must get a new plan"
+
+
 def test_parse_items_cards():
     definition = TaskDefinition(
         id=5,
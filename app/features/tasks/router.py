@@ -14,6 +14,7 @@ from app.features.tasks.definitions.service import TaskHandle
 from app.features.tasks.definitions.utils import model_to_schema
 from app.features.tasks.repository import TasksRepository
 from app.features.tasks.schemas import Task, TaskList, TaskPatch
+from app.features.tasks.service import Tasks
 from app.features.ytdlp.utils import parse_outtmpl
 from app.library.ag_utils import ag
 from app.library.config import Config
@@ -361,6 +362,31 @@ async def tasks_get(request: Request, repo: TasksRepository, encoder: Encoder) -
     return web.json_response(data=_serialize(model), status=web.HTTPOk.status_code, dumps=encoder.encode)
 
 
+@route("GET", r"api/tasks/{id:\d+}/runs", "tasks_runs")
+async def tasks_runs(request: Request, repo: TasksRepository, tasks_service: Tasks, encoder: Encoder) -> Response:
+    if not (identifier := request.match_info.get("id")):
+        return api_error_response(
+            "ID required",
+            code="BAD_REQUEST",
+            status=web.HTTPBadRequest.status_code,
+        )
+
+    model = await repo.get(identifier)
+    if not model:
+        return api_error_response(
+            "Task not found",
+            code="NOT_FOUND",
+            status=web.HTTPNotFound.status_code,
+            params={"resource": "api.resources.task"},
+        )
+
+    return web.json_response(
+        data={"id": model.id, "timer": model.timer, **tasks_service.run_stats(model.id)},
+        status=web.HTTPOk.status_code,
+        dumps=encoder.encode,
+    )
+
+
 @route("DELETE", r"api/tasks/{id:\d+}", "tasks_delete")
 async def tasks_delete(request: Request, repo: TasksRepository, encoder: Encoder, notify: EventBus) -> Response:
     if not (identifier := request.match_info.get("id")):
@@ -0,0 +1,253 @@
+"""Staggered, load-aware execution of scheduled tasks."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import zlib
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from app.library.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from app.library.config import Config
+
+LOG = get_logger()
+
+TASK_HISTORY_SIZE: int = 20
+"How many runs to keep per task."
+
+TASK_LOAD_POLL: float = 5.0
+"Seconds between load checks while a run is deferred."
+
+
+@dataclass(kw_only=True, frozen=True)
+class TaskRun:
+    started_at: str
+    """When the task started executing (after jitter and deferral)."""
+
+    duration: float
+    """How long the run took in seconds."""
+
+    jitter: float
+    """The stagger delay applied before the run."""
+
+    deferred: float
+    """How long the run waited for capacity in seconds."""
+
+    status: str
+    """The run outcome."""
+
+
+def cron_period(timer: str) -> float | None:
+    """
+    Get the number of seconds between two consecutive fires of a cron expression.
+
+    Args:
+        timer (str): The cron expression.
+
+    Returns:
+        float | None: The period in seconds, or None if the expression is invalid.
+
+    """
+    try:
+        from cronsim import CronSim
+
+        it = CronSim(timer, datetime.now(UTC))
+        first: datetime = next(it)
+        return (next(it) - first).total_seconds()
+    except Exception:
+        return None
+
+
+class TaskScheduler:
+    """
+    Spreads scheduled task runs that share a cron slot and holds them back while the system is busy.
+
+    Tasks registered on the same timer get a deterministic offset inside the stagger window, runs are capped
+    by ``task_concurrency`` and each run waits (up to ``task_max_defer`` seconds) while the download pool or
+    the extractor is saturated.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._config: Config = config
+        "The configuration instance."
+        self._timers: dict[int, str] = {}
+        "The registered timer of each task."
+        self._running: set[int] = set()
+        "Tasks with an in-flight run."
+        self._history: dict[int, deque[TaskRun]] = {}
+        "Recent runs per task."
+        self._sem: asyncio.Semaphore | None = None
+        self._sem_limit: int | None = None
+
+    def register(self, task_id: int, timer: str) -> None:
+        self._timers[task_id] = timer
+
+    def unregister(self, task_id: int) -> None:
+        self._timers.pop(task_id, None)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        limit: int = max(1, int(self._config.task_concurrency))
+        if self._sem is None or self._sem_limit != limit:
+            self._sem = asyncio.Semaphore(limit)
+            self._sem_limit = limit
+
+        return self._sem
+
+    def jitter(self, task_id: int) -> float:
+        """
+        Get the stagger delay for a task.
+
+        Peers sharing the same timer are ordered by a stable hash of their id and spread evenly
+        across the stagger window, which is capped at half the cron period.
+
+        Args:
+            task_id (int): The task id.
+
+        Returns:
+            float: The delay in seconds.
+
+        """
+        if not (timer := self._timers.get(task_id)):
+            return 0.0
+
+        peers: list[int] = sorted(
+            (tid for tid, t in self._timers.items() if t == timer),
+            key=lambda tid: (zlib.crc32(str(tid).encode()), tid),
+        )
+        if len(peers) < 2:
+            return 0.0
+
+        window: float = max(0.0, float(self._config.task_stagger_window))
+        if (period := cron_period(timer)) is not None:
+            window = min(window, period / 2)
+
+        return round(window * peers.index(task_id) / len(peers), 3)
+
+    def is_saturated(self) -> bool:
+        """
+        Check whether the download pool or the extractor has no free slot.
+
+        Returns:
+            bool: True if a task run should be deferred.
+
+        """
+        from app.features.downloads.runtime.queue_manager import DownloadQueue
+        from app.features.ytdlp.extractor import ExtractorPool
+
+        if ExtractorPool.get_instance().is_busy():
+            return True
+
+        active: int = len(DownloadQueue.get_instance().pool.get_active_downloads())
+        return active >= max(1, int(self._config.max_workers))
+
+    async def _wait_for_capacity(self, task_id: int, name: str) -> float:
+        started: float = time.monotonic()
+        max_defer: float = max(0.0, float(self._config.task_max_defer))
+        logged: bool = False
+
+        while self.is_saturated():
+            waited: float = time.monotonic() - started
+            if waited >= max_defer:
+                LOG.warning(
+                    "Running task '%s' after waiting %.0fs for the download pool to free up.",
+                    name,
+                    waited,
+                    extra={"task_id": task_id, "task_name": name, "deferred_s": round(waited, 2)},
+                )
+                break
+
+            if not logged:
+                LOG.info(
+                    "Deferring task '%s' while the download pool is saturated.",
+                    name,
+                    extra={"task_id": task_id, "task_name": name},
+                )
+                logged = True
+
+            await asyncio.sleep(min(TASK_LOAD_POLL, max_defer - waited))
+
+        return time.monotonic() - started
+
+    async def run(self, task_id: int, name: str, func: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Run a task with stagger, concurrency cap and load deferral applied.
+
+        Args:
+            task_id (int): The task id.
+            name (str): The task name, used for logging.
+            func (Callable): The coroutine factory performing the run. It may return a status dict.
+
+        """
+        if task_id in self._running:
+            LOG.warning(
+                "Skipping task '%s' because its previous run is still in progress.",
+                name,
+                extra={"task_id": task_id, "task_name": name},
+            )
+            return
+
+        self._running.add(task_id)
+        try:
+            if (jitter := self.jitter(task_id)) > 0:
+                LOG.debug(
+                    "Staggering task '%s' by %.1fs.",
+                    name,
+                    jitter,
+                    extra={"task_id": task_id, "task_name": name, "jitter_s": jitter},
+                )
+                await asyncio.sleep(jitter)
+
+            async with self._get_semaphore():
+                deferred: float = await self._wait_for_capacity(task_id, name)
+                started_at: str = datetime.now(UTC).isoformat()
+                started: float = time.monotonic()
+                status: str = "error"
+                try:
+                    result = await func()
+                    status = str(result.get("status") or "ok") if isinstance(result, dict) else "ok"
+                finally:
+                    self._record(
+                        task_id,
+                        TaskRun(
+                            started_at=started_at,
+                            duration=round(time.monotonic() - started, 3),
+                            jitter=jitter,
+                            deferred=round(deferred, 3),
+                            status=status,
+                        ),
+                    )
+        finally:
+            self._running.discard(task_id)
+
+    def _record(self, task_id: int, run: TaskRun) -> None:
+        if task_id not in self._history:
+            self._history[task_id] = deque(maxlen=TASK_HISTORY_SIZE)
+
+        self._history[task_id].append(run)
+
+    def stats(self, task_id: int) -> dict[str, Any]:
+        """
+        Get the scheduling state and recent run history of a task.
+
+        Args:
+            task_id (int): The task id.
+
+        Returns:
+            dict: The jitter, running state, average duration and recent runs (newest first).
+
+        """
+        runs: list[TaskRun] = list(self._history.get(task_id, ()))
+        return {
+            "jitter": self.jitter(task_id),
+            "running": task_id in self._running,
+            "avg_duration": round(sum(r.duration for r in runs) / len(runs), 3) if runs else None,
+            "max_duration": max((r.duration for r in runs), default=None),
+            "runs": [asdict(r) for r in reversed(runs)],
+        }
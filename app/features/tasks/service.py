@@ -4,7 +4,9 @@ from typing import TYPE_CHECKING
 
 from app.features.core.schemas import CEAction, CEFeature, ConfigEvent
 from app.features.tasks.models import TaskModel
+from app.features.tasks.scheduling import TaskScheduler
 from app.features.tasks.utils import cron_time
+from app.library.config import Config
 from app.library.Events import Event, EventBus, Events
 from app.library.logging import get_logger
 from app.library.Scheduler import Scheduler
@@ -25,6 +27,7 @@ class Tasks(metaclass=Singleton):
         self._loaded: bool = False
         self._handlers_service = None
         self._scheduler = Scheduler.get_instance()
+        self._runs = TaskScheduler(Config.get_instance())
 
     @staticmethod
     def get_instance() -> Tasks:
@@ -58,7 +61,7 @@ class Tasks(metaclass=Singleton):
                 continue
 
             try:
-                self._scheduler.add(timer=task.timer, func=self._runner, args=(task,), id=f"task-cronjob-{task.id}")
+                self._schedule(task, f"task-cronjob-{task.id}")
                 LOG.info(
                     "Queued task '%s' to run at '%s'.",
                     task.name,
@@ -83,7 +86,6 @@ class Tasks(metaclass=Singleton):
             return
 
         from app.features.tasks.definitions.service import TaskHandle
-        from app.library.config import Config
 
         config = Config.get_instance()
         self._handlers_service = TaskHandle(scheduler, self._repo, config)
@@ -96,6 +98,7 @@ class Tasks(metaclass=Singleton):
         task_id: str = f"task-cronjob-{task_data['id']}"
 
         if CEAction.DELETE == event_data.action:
+            self._runs.unregister(int(task_data["id"]))
             if self._scheduler.has(task_id):
                 self._scheduler.remove(task_id)
 
@@ -103,11 +106,12 @@ class Tasks(metaclass=Singleton):
             if not (task := await self._repo.get(int(task_data["id"]))):
                 return
 
+            self._runs.unregister(task.id)
             if self._scheduler.has(task_id):
                 self._scheduler.remove(task_id)
 
             if task.timer and task.enabled:
-                self._scheduler.add(timer=task.timer, func=self._runner, args=(task,), id=task_id)
+                self._schedule(task, task_id)
                 LOG.info(
                     "Queued task '%s' to run at '%s'.",
                     task.name,
@@ -115,20 +119,49 @@ class Tasks(metaclass=Singleton):
                     extra={"task_id": task.id, "task_name": task.name, "timer": task.timer},
                 )
 
-    async def _runner(self, task: TaskModel) -> None:
+    def _schedule(self, task: TaskModel, job_id: str) -> None:
+        self._runs.register(task.id, task.timer)
+        self._scheduler.add(timer=task.timer, func=self._scheduled, args=(task,), id=job_id)
+
+    async def _scheduled(self, task: TaskModel) -> None:
+        """
+        Cron entry point, runs the task through the staggered, load-aware scheduler.
+
+        Args:
+            task: The TaskModel to execute.
+
+        """
+        await self._runs.run(task.id, task.name, lambda: self._runner(task))
+
+    def run_stats(self, task_id: int) -> dict:
+        """
+        Get the scheduling state and recent run durations of a task.
+
+        Args:
+            task_id: The task id.
+
+        Returns:
+            dict: The task run statistics.
+
+        """
+        return self._runs.stats(task_id)
+
+    async def _runner(self, task: TaskModel) -> dict | None:
         """
         Execute a scheduled task.
 
         Args:
             task: The TaskModel to execute.
 
+        Returns:
+            dict | None: The queue add status, or None if the task was not dispatched.
+
         """
         import time
         from datetime import UTC, datetime
 
         from app.features.downloads.items import Item
         from app.features.downloads.runtime.queue_manager import DownloadQueue
-        from app.library.config import Config
 
         timeNow: str = datetime.now(UTC).isoformat()
         task_id = task.id
@@ -137,7 +170,7 @@ class Tasks(metaclass=Singleton):
             current_task = await self._repo.get(task_id)
             if not current_task:
                 LOG.info("Task '%s' no longer exists.", task_name, extra={"task_id": task_id, "task_name": task_name})
-                return
+                return None
             task = current_task
 
             if not task.enabled:
@@ -146,7 +179,7 @@ class Tasks(metaclass=Singleton):
                     task.name,
                     extra={"task_id": task.id, "task_name": task.name},
                 )
-                return
+                return None
 
             if not task.url:
                 LOG.error(
@@ -154,7 +187,7 @@ class Tasks(metaclass=Singleton):
                     task.name,
                     extra={"task_id": task.id, "task_name": task.name},
                 )
-                return
+                return None
 
             started: float = time.time()
 
@@ -212,6 +245,8 @@ class Tasks(metaclass=Singleton):
                 title="Task completed",
                 message=f"Task '{task.name}' completed in '{ended - started:.2f}'.",
             )
+
+            return status
         except Exception as e:
             LOG.exception(
                 "Failed to execute scheduled task '%s'.",
@@ -231,6 +266,8 @@ class Tasks(metaclass=Singleton):
                 message=f"Failed to execute '{task.name}'. '{e!s}'",
             )
 
+            return {"status": "error", "msg": str(e)}
+
     @property
     def handlers(self):
         """Get the handlers service instance."""
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.features.tasks import scheduling
+from app.features.tasks.scheduling import TaskScheduler, cron_period
+
+
+def _config(**overrides) -> SimpleNamespace:
+    values = {"task_concurrency": 2, "task_stagger_window": 300, "task_max_defer": 900, "max_workers": 4}
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _scheduler(**overrides) -> TaskScheduler:
+    sched = TaskScheduler(_config(**overrides))
+    sched.is_saturated = lambda: False
+    return sched
+
+
+def test_cron_period() -> None:
+    assert cron_period("0 * * * *") == 3600.0
+    assert cron_period("*/5 * * * *") == 300.0
+    assert cron_period("not a cron") is None
+
+
+def test_single_task_has_no_jitter() -> None:
+    sched = _scheduler()
+    sched.register(1, "0 * * * *")
+    sched.register(2, "30 * * * *")
+
+    assert sched.jitter(1) == 0.0
+    assert sched.jitter(2) == 0.0
+    assert sched.jitter(99) == 0.0
+
+
+def test_shared_slot_is_spread_deterministically() -> None:
+    sched = _scheduler()
+    for task_id in range(1, 11):
+        sched.register(task_id, "0 * * * *")
+
+    offsets = sorted(sched.jitter(task_id) for task_id in range(1, 11))
+
+    assert offsets == [i * 30.0 for i in range(10)], "ten peers must be spread evenly over the 300s window"
+    assert [sched.jitter(t) for t in range(1, 11)] == [sched.jitter(t) for t in range(1, 11)]
+
+    other = _scheduler()
+    for task_id in reversed(range(1, 11)):
+        other.register(task_id, "0 * * * *")
+
+    assert [other.jitter(t) for t in range(1, 11)] == [sched.jitter(t) for t in range(1, 11)], (
+        "offsets must not depend on registration order"
+    )
+
+
+def test_window_capped_to_half_period() -> None:
+    sched = _scheduler(task_stagger_window=3600)
+    sched.register(1, "*/2 * * * *")
+    sched.register(2, "*/2 * * * *")
+
+    assert max(sched.jitter(1), sched.jitter(2)) == 30.0
+
+
+def test_unregister_removes_peer() -> None:
+    sched = _scheduler()
+    sched.register(1, "0 * * * *")
+    sched.register(2, "0 * * * *")
+    sched.unregister(2)
+
+    assert sched.jitter(1) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_run_records_history() -> None:
+    sched = _scheduler()
+    sched.register(1, "0 * * * *")
+
+    async def ok():
+        return {"status": "ok"}
+
+    async def fail():
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    await sched.run(1, "task", ok)
+    with pytest.raises(RuntimeError):
+        await sched.run(1, "task", fail)
+
+    stats = sched.stats(1)
+    assert [run["status"] for run in stats["runs"]] == ["error", "ok"]
+    assert stats["running"] is False
+    assert stats["avg_duration"] is not None
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap() -> None:
+    sched = _scheduler(task_concurrency=2)
+    active = {"now": 0, "max": 0}
+
+    async def work():
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+
+    await asyncio.gather(*(sched.run(task_id, f"t{task_id}", work) for task_id in range(6)))
+
+    assert active["max"] == 2
+
+
+@pytest.mark.asyncio
+async def test_overlapping_run_skipped() -> None:
+    sched = _scheduler()
+    calls = {"count": 0}
+    gate = asyncio.Event()
+
+    async def work():
+        calls["count"] += 1
+        await gate.wait()
+
+    first = asyncio.create_task(sched.run(1, "task", work))
+    await asyncio.sleep(0)
+    await sched.run(1, "task", work)
+    gate.set()
+    await first
+
+    assert calls["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_defers_while_saturated(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scheduling, "TASK_LOAD_POLL", 0.01)
+    sched = _scheduler()
+    checks = iter([True, True, False])
+    sched.is_saturated = lambda: next(checks)
+
+    async def work():
+        return None
+
+    await sched.run(1, "task", work)
+
+    run = sched.stats(1)["runs"][0]
+    assert run["deferred"] >= 0.02
+    assert run["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_defer_gives_up_after_max(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scheduling, "TASK_LOAD_POLL", 0.01)
+    sched = _scheduler(task_max_defer=0.03)
+    sched.is_saturated = lambda: True
+    calls = {"count": 0}
+
+    async def work():
+        calls["count"] += 1
+
+    await sched.run(1, "task", work)
+
+    assert calls["count"] == 1, "a saturated pool must only delay a run, never drop it"
@@ -0,0 +1,445 @@
+"""Persistent cache of yt-dlp extraction results shared by all ``fetch_info`` callers."""
+
+import asyncio
+import contextlib
+import copy
+import gzip
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+from aiohttp import web
+
+from app.library.config import Config
+from app.library.logging import get_logger
+from app.library.Scheduler import Scheduler
+from app.library.Singleton import ThreadSafe
+
+LOG = get_logger()
+
+EXTRACT_CACHE_DIR = "extract_cache"
+
+TTL_ENV_PREFIX: str = "YTP_EXTRACT_INFO_CACHE_TTL_FOR_"
+"Prefix of the env variables overriding the TTL of one extractor, e.g. YTP_EXTRACT_INFO_CACHE_TTL_FOR_YOUTUBE."
+
+EXPIRE_MARGIN: int = 600
+"Seconds subtracted from signed format URL expiry times, so cached formats are still valid when used."
+
+CREATE_TABLE: str = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    extractor TEXT,
+    created REAL NOT NULL,
+    expires REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+"""
+
+CREATE_INDEX: str = "CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires);"
+
+_EXPIRE_PARAM = re.compile(r"[?&/]expire[=/](\d{10})\b")
+
+type ExtractResult = tuple[dict[str, Any] | None, list[str]]
+
+
+def _encode(obj: Any) -> Any:
+    if isinstance(obj, (set, frozenset, Sequence)):
+        return list(obj)
+
+    return repr(obj)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for use in a cache key.
+
+    Scheme and host are lower-cased and the fragment is dropped; the path and query are kept as-is since
+    extractors may treat them case-sensitively.
+
+    Args:
+        url (str): The URL.
+
+    Returns:
+        str: The normalized URL.
+
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
+
+
+def file_digest(path: str | os.PathLike[str]) -> str | None:
+    """
+    Get the SHA-256 digest of a file, for keys that must follow its contents rather than its path.
+
+    Args:
+        path (str | PathLike): The file path.
+
+    Returns:
+        str | None: The hex digest, or None if the file cannot be read.
+
+    """
+    try:
+        with Path(path).open("rb") as fp:
+            return hashlib.file_digest(fp, "sha256").hexdigest()
+    except OSError:
+        return None
+
+
+def format_expiry(info: dict[str, Any]) -> float | None:
+    """
+    Get the earliest expiry time advertised by the signed format URLs of an info dict.
+
+    Args:
+        info (dict): The info dict.
+
+    Returns:
+        float | None: The unix timestamp, or None if no format URL carries one.
+
+    """
+    earliest: float | None = None
+    for fmt in info.get("formats") or []:
+        if not isinstance(fmt, dict) or not isinstance(url := fmt.get("url"), str):
+            continue
+
+        if match := _EXPIRE_PARAM.search(url):
+            value = float(match.group(1))
+            earliest = value if earliest is None else min(earliest, value)
+
+    return earliest
+
+
+@dataclass(kw_only=True)
+class _Inflight:
+    task: asyncio.Task[ExtractResult]
+    callers: int = 0
+    "How many callers await the task, results are copied for each of them once it is shared."
+
+
+def parse_extractor_ttls(environ: Mapping[str, str]) -> dict[str, int]:
+    """
+    Parse the per extractor TTL overrides.
+
+    Args:
+        environ (Mapping): The environment variables.
+
+    Returns:
+        dict[str, int]: The TTL in seconds, keyed by the upper-cased extractor key.
+
+    """
+    ttls: dict[str, int] = {}
+    for name, value in environ.items():
+        if not name.startswith(TTL_ENV_PREFIX) or not (extractor := name.removeprefix(TTL_ENV_PREFIX)):
+            continue
+
+        if not value.strip().isdigit():
+            LOG.warning(
+                "Invalid extraction cache TTL '%s' for '%s'; using the default TTL.",
+                value,
+                extractor,
+                extra={"extractor": extractor, "env_ttl": value},
+            )
+            continue
+
+        ttls[extractor.upper()] = int(value)
+
+    return ttls
+
+
+class ExtractCache(metaclass=ThreadSafe):
+    """
+    Stores single-video extraction results as gzip'd JSON blobs indexed by a SQLite table.
+
+    Entries are keyed by the normalized URL plus a fingerprint of the yt-dlp options. The TTL is
+    ``extract_info_cache_ttl``, or the extractor's ``YTP_EXTRACT_INFO_CACHE_TTL_FOR_<EXTRACTOR>`` override,
+    capped by ``download_info_expires`` and by the expiry of signed format URLs.
+    Playlists and live streams are never cached, and concurrent requests for the same key share one extraction.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        ttl: int | None = None,
+        max_age: int | None = None,
+        extractor_ttls: dict[str, int] | None = None,
+    ) -> None:
+        config: Config = Config.get_instance()
+        self._path: Path = path or Path(config.config_path) / "cache" / EXTRACT_CACHE_DIR
+        self._ttl: int = int(config.extract_info_cache_ttl if ttl is None else ttl)
+        self._extractor_ttls: dict[str, int] = (
+            parse_extractor_ttls(os.environ) if extractor_ttls is None else extractor_ttls
+        )
+        "Per extractor TTL overrides, keyed by the upper-cased extractor key."
+        self._max_age: int = int(config.download_info_expires if max_age is None else max_age)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._inflight: dict[str, _Inflight] = {}
+
+    @staticmethod
+    def get_instance() -> "ExtractCache":
+        return ExtractCache()
+
+    def attach(self, app: web.Application) -> None:
+        if not self.enabled():
+            return
+
+        Scheduler.get_instance().add(
+            timer="17 */1 * * *",
+            func=self.prune,
+            id=f"{type(self).__name__}.{type(self).prune.__name__}",
+        )
+
+        async def on_shutdown(_: web.Application) -> None:
+            self.close()
+
+        app.on_shutdown.append(on_shutdown)
+
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    @staticmethod
+    def make_key(url: str, config: dict[str, Any], **flags: Any) -> str:
+        """
+        Build the cache key of an extraction.
+
+        Args:
+            url (str): The URL to extract.
+            config (dict): The sanitized yt-dlp options.
+            **flags: Other arguments that change the extraction result.
+
+        Returns:
+            str: The cache key.
+
+        """
+        fingerprint: str = json.dumps({"config": config, "flags": flags}, sort_keys=True, default=str)
+        return hashlib.sha256(f"{normalize_url(url)}\n{fingerprint}".encode()).hexdigest()
+
+    def ttl_for(self, info: Any) -> int:
+        """
+        Get how long an extraction result may be cached.
+
+        Args:
+            info: The extraction result.
+
+        Returns:
+            int: The TTL in seconds, 0 if the result must not be cached.
+
+        """
+        from app.features.ytdlp.extractor import REEXTRACT_INFO_KEY, needs_reextract
+
+        if not isinstance(info, dict) or "video" != info.get("_type", "video"):
+            return 0
+
+        if info.get(REEXTRACT_INFO_KEY) or needs_reextract(info) or "is_upcoming" == info.get("live_status"):
+            return 0
+
+        ttl: float = self._extractor_ttls.get(str(info.get("extractor_key") or "").upper(), self._ttl)
+        if self._max_age > 0:
+            ttl = min(ttl, self._max_age)
+
+        if (expires := format_expiry(info)) is not None:
+            ttl = min(ttl, expires - time.time() - EXPIRE_MARGIN)
+
+        return max(0, int(ttl))
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self._path / "index.db"), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(CREATE_TABLE)
+            self._conn.execute(CREATE_INDEX)
+            self._conn.commit()
+
+        return self._conn
+
+    def _file(self, key: str) -> Path:
+        return self._path / key[:2] / f"{key}.json.gz"
+
+    def get(self, key: str) -> ExtractResult | None:
+        """
+        Get a cached extraction result.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            tuple | None: The info dict and captured logs, or None on a miss.
+
+        """
+        try:
+            with self._lock:
+                row = self._db().execute("SELECT expires FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+
+                if row[0] <= time.time():
+                    self._delete(key)
+                    return None
+
+            data = json.loads(gzip.decompress(self._file(key).read_bytes()))
+            return (data["info"], list(data.get("logs") or []))
+        except (OSError, EOFError, ValueError, KeyError, TypeError, sqlite3.Error) as e:
+            LOG.warning(
+                "Failed to read extraction cache entry '%s'.",
+                key,
+                extra={"cache_key": key, "exception_type": type(e).__name__},
+            )
+            with self._lock, contextlib.suppress(sqlite3.Error):
+                self._delete(key)
+            return None
+
+    def put(self, key: str, url: str, result: ExtractResult) -> bool:
+        """
+        Cache an extraction result if it is cacheable.
+
+        Args:
+            key (str): The cache key.
+            url (str): The extracted URL.
+            result (tuple): The info dict and captured logs.
+
+        Returns:
+            bool: True if the result was cached.
+
+        """
+        info, logs = result
+        if (ttl := self.ttl_for(info)) < 1:
+            return False
+
+        file: Path = self._file(key)
+        try:
+            payload = {"info": info, "logs": logs}
+            data: bytes = gzip.compress(json.dumps(payload, separators=(",", ":"), default=_encode).encode(), 3)
+            file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file: Path = file.with_suffix(".tmp")
+            temp_file.write_bytes(data)
+            temp_file.replace(file)
+
+            now: float = time.time()
+            with self._lock:
+                db = self._db()
+                db.execute(
+                    "INSERT OR REPLACE INTO entries (key, url, extractor, created, expires, size) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, url, info.get("extractor_key") if info else None, now, now + ttl, len(data)),
+                )
+                db.commit()
+            return True
+        except (OSError, TypeError, ValueError, sqlite3.Error) as e:
+            LOG.warning(
+                "Failed to cache extraction result for '%s'.",
+                url,
+                extra={"url": url, "cache_key": key, "exception_type": type(e).__name__},
+            )
+            return False
+
+    def _delete(self, key: str) -> None:
+        db = self._db()
+        db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        db.commit()
+        with contextlib.suppress(OSError):
+            self._file(key).unlink(missing_ok=True)
+
+    def prune(self) -> int:
+        """
+        Remove expired entries.
+
+        Returns:
+            int: The number of removed entries.
+
+        """
+        try:
+            with self._lock:
+                db = self._db()
+                keys: list[str] = [
+                    row[0] for row in db.execute("SELECT key FROM entries WHERE expires <= ?", (time.time(),))
+                ]
+                for key in keys:
+                    self._delete(key)
+        except sqlite3.Error as e:
+            LOG.warning("Failed to prune the extraction cache.", extra={"exception_type": type(e).__name__})
+            return 0
+
+        if keys:
+            LOG.debug("Pruned %d expired extraction cache entries.", len(keys), extra={"count": len(keys)})
+
+        return len(keys)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def fetch(
+        self,
+        key: str,
+        url: str,
+        extract: Callable[[], Awaitable[ExtractResult]],
+        refresh: bool = False,
+    ) -> ExtractResult:
+        """
+        Get an extraction result from the cache, or run the extraction and cache its result.
+
+        Concurrent calls for the same key share a single extraction, which runs in its own task so a
+        cancelled caller does not cancel it for the others.
+
+        Args:
+            key (str): The cache key.
+            url (str): The URL to extract.
+            extract (Callable): Runs the extraction.
+            refresh (bool): Skip the cache lookup and replace the cached result.
+
+        Returns:
+            tuple: The info dict and captured logs.
+
+        """
+        if (inflight := self._inflight.get(key)) is None:
+            task: asyncio.Task[ExtractResult] = asyncio.ensure_future(self._fetch(key, url, extract, refresh))
+            inflight = self._inflight[key] = _Inflight(task=task)
+
+            def done(future: asyncio.Future[ExtractResult]) -> None:
+                if self._inflight.get(key) is inflight:
+                    self._inflight.pop(key, None)
+                if not future.cancelled():
+                    future.exception()
+
+            task.add_done_callback(done)
+
+        inflight.callers += 1
+        info, logs = await asyncio.shield(inflight.task)
+        if inflight.callers > 1:
+            return (copy.deepcopy(info), list(logs))
+
+        return (info, logs)
+
+    async def _fetch(
+        self,
+        key: str,
+        url: str,
+        extract: Callable[[], Awaitable[ExtractResult]],
+        refresh: bool,
+    ) -> ExtractResult:
+        cached: ExtractResult | None = None if refresh else await asyncio.to_thread(self.get, key)
+        if cached is not None:
+            return cached
+
+        result: ExtractResult = await extract()
+        if self.ttl_for(result[0]) > 0:
+            await asyncio.to_thread(self.put, key, url, result)
+
+        return result
@@ -4,15 +4,18 @@ import logging
 import multiprocessing
 import pickle
 import sys
+import time
 from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Self
 
 from aiohttp import web
 
+from app.features.ytdlp.extract_cache import ExtractCache, file_digest
 from app.features.ytdlp.utils import _DATA, LogWrapper, get_archive_id
 from app.features.ytdlp.ytdlp import YTDLP
 from app.library.logging import get_logger
+from app.library.metrics import MetricsRegistry
 from app.library.Services import Services
 from app.library.Singleton import Singleton
 
@@ -179,6 +182,30 @@ class ExtractorPool(metaclass=Singleton):
             raise RuntimeError(msg)
         return self._semaphore
 
+    def is_busy(self) -> bool:
+        """
+        Check whether every extraction slot is in use.
+
+        Returns:
+            bool: True if a new extraction would have to wait.
+
+        """
+        return self._semaphore is not None and self._semaphore.locked()
+
+    def pids(self) -> set[int]:
+        """
+        Get the process ids of the extractor workers.
+
+        Returns:
+            set[int]: The pids of the persistent and lazy pools' worker processes.
+
+        """
+        pids: set[int] = set()
+        for pool in [self._pool, *list(self._transient_pools)]:
+            if pool is not None:
+                pids.update((getattr(pool, "_processes", None) or {}).keys())
+        return pids
+
     def release_pool(self, pool: ProcessPoolExecutor) -> None:
         """Release a lazy executor after its work is complete."""
         if pool is self._pool:
@@ -446,11 +473,87 @@ async def fetch_info(
     extractor_config: ExtractorConfig | None = None,
     batch: ExtractorBatch | None = None,
     budget_sleep: bool = False,
+    refresh: bool = False,
     **kwargs,
 ) -> tuple[dict[str, Any] | None, list[str]]:
     """
     Extract video information from a URL.
 
+    Results are served from, and stored in, the persistent extraction cache when it is enabled.
+
+    Args:
+        config: yt-dlp configuration options
+        url: URL to extract information from
+        debug: Enable debug logging
+        no_archive: Disable download archive
+        follow_redirect: Follow URL redirects
+        sanitize_info: Sanitize the extracted information
+        capture_logs: If provided (e.g., logging.WARNING), capture logs
+        extractor_config: Configuration for the extractor
+        batch: Optional batch that shares a lazily-created process pool
+        budget_sleep: Whether to add extra timeout budget for request-sleep-heavy extraction
+        refresh: Bypass cached results and replace them with a fresh extraction
+        **kwargs: Additional arguments
+
+    Returns:
+        tuple[dict | None, list[str]]: Extracted information and captured logs.
+
+    """
+    extract = functools.partial(
+        _fetch_info,
+        config=config,
+        url=url,
+        debug=debug,
+        no_archive=no_archive,
+        follow_redirect=follow_redirect,
+        sanitize_info=sanitize_info,
+        capture_logs=capture_logs,
+        extractor_config=extractor_config,
+        batch=batch,
+        budget_sleep=budget_sleep,
+        **kwargs,
+    )
+
+    cache: ExtractCache = ExtractCache.get_instance()
+    if not cache.enabled():
+        return await extract()
+
+    key_config: dict[str, Any] = _sanitize_config(config)
+    if cookie_file := key_config.get("cookiefile"):
+        # Cookie files get a fresh name on every add, so the key follows their contents instead.
+        if not (digest := await asyncio.to_thread(file_digest, cookie_file)):
+            return await extract()
+        key_config["cookiefile"] = digest
+
+    key: str = cache.make_key(
+        url,
+        key_config,
+        no_archive=no_archive,
+        follow_redirect=follow_redirect,
+        sanitize_info=sanitize_info,
+        capture_logs=capture_logs,
+        kwargs=_sanitize_picklable(kwargs),
+    )
+
+    return await cache.fetch(key, url, extract, refresh=refresh)
+
+
+async def _fetch_info(
+    config: dict[str, Any],
+    url: str,
+    debug: bool = False,
+    no_archive: bool = False,
+    follow_redirect: bool = False,
+    sanitize_info: bool = False,
+    capture_logs: int | None = None,
+    extractor_config: ExtractorConfig | None = None,
+    batch: ExtractorBatch | None = None,
+    budget_sleep: bool = False,
+    **kwargs,
+) -> tuple[dict[str, Any] | None, list[str]]:
+    """
+    Extract video information from a URL, bypassing the extraction cache.
+
     This function uses a process pool to avoid blocking the event loop.
     If the process pool fails, it falls back to using a thread pool.
 
@@ -490,7 +593,18 @@ async def fetch_info(
     pool_manager: ExtractorPool = ExtractorPool.get_instance()
     semaphore: asyncio.Semaphore = pool_manager.get_semaphore(extractor_config)
 
-    await semaphore.acquire()
+    metrics: MetricsRegistry = MetricsRegistry.get_instance()
+    waiting = metrics.gauge("extractor_waiting", "Extractions waiting for a free extractor slot.")
+    waiting.inc()
+    started: float = time.perf_counter()
+    try:
+        await semaphore.acquire()
+    finally:
+        waiting.inc(amount=-1)
+    metrics.histogram("extractor_wait_seconds", "Time extractions waited for a free extractor slot.").observe(
+        time.perf_counter() - started
+    )
+    started = time.perf_counter()
     loop = asyncio.get_running_loop()
     executor: ProcessPoolExecutor | None = None
     owns_executor = batch is None
@@ -574,3 +688,8 @@ async def fetch_info(
         if owns_executor and executor is not None:
             pool_manager.release_pool(executor)
         semaphore.release()
+        metrics.histogram(
+            "extractor_duration_seconds",
+            "Time spent extracting information.",
+            buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+        ).observe(time.perf_counter() - started)
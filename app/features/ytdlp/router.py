@@ -528,6 +528,7 @@ async def get_info(request: Request, cache: Cache, config: Config) -> Response:
             follow_redirect=True,
             sanitize_info=not include_entries,
             capture_logs=logging.WARNING,
+            refresh=bool(request.query.get("force", False)),
         )
 
         if not data or not isinstance(data, dict):
@@ -0,0 +1,159 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.features.ytdlp.extract_cache import ExtractCache, format_expiry, normalize_url, parse_extractor_ttls
+from app.features.ytdlp.extractor import fetch_info
+from app.tests.helpers import temporary_test_dir
+
+
+@pytest.fixture
+def cache():
+    ExtractCache._reset_singleton()
+    with temporary_test_dir("extract-cache") as temp_dir:
+        instance = ExtractCache(temp_dir / "extract_cache", ttl=600, max_age=0, extractor_ttls={})
+        yield instance
+        instance.close()
+    ExtractCache._reset_singleton()
+
+
+def _video(**extra) -> dict:
+    return {"id": "abc", "title": "Video", "extractor_key": "Youtube", "formats": [{"url": "https://cdn/v"}], **extra}
+
+
+class TestExtractCache:
+    def test_normalize_url(self) -> None:
+        assert normalize_url(" HTTPS://Example.COM/Watch?v=AbC#t=10 ") == "https://example.com/Watch?v=AbC"
+
+    def test_key_depends_on_options(self) -> None:
+        url = "https://example.com/v"
+        assert ExtractCache.make_key(url, {"format": "best"}) == ExtractCache.make_key(url + "#x", {"format": "best"})
+        assert ExtractCache.make_key(url, {"format": "best"}) != ExtractCache.make_key(url, {"format": "worst"})
+        assert ExtractCache.make_key(url, {}, no_archive=True) != ExtractCache.make_key(url, {}, no_archive=False)
+
+    def test_ttl_rules(self, cache: ExtractCache) -> None:
+        assert 600 == cache.ttl_for(_video())
+        assert 0 == cache.ttl_for({"_type": "playlist", "entries": []})
+        assert 0 == cache.ttl_for(_video(live_status="is_live"))
+        assert 0 == cache.ttl_for(None)
+
+        expires = int(time.time()) + 900
+        signed = _video(formats=[{"url": f"https://cdn/v?expire={expires}&sig=x"}])
+        assert format_expiry(signed) == float(expires)
+        assert 250 <= cache.ttl_for(signed) <= 300, "signed URL expiry must cap the TTL"
+
+        cache._max_age = 60
+        assert 60 == cache.ttl_for(_video())
+
+    def test_extractor_ttl_overrides(self, cache: ExtractCache) -> None:
+        cache._extractor_ttls = parse_extractor_ttls(
+            {
+                "YTP_EXTRACT_INFO_CACHE_TTL_FOR_YOUTUBE": "3600",
+                "YTP_EXTRACT_INFO_CACHE_TTL_FOR_TWITCH": "0",
+                "YTP_EXTRACT_INFO_CACHE_TTL_FOR_VIMEO": "soon",
+                "YTP_EXTRACT_INFO_CACHE_TTL": "1",
+            }
+        )
+        assert {"YOUTUBE": 3600, "TWITCH": 0} == cache._extractor_ttls
+
+        assert 3600 == cache.ttl_for(_video())
+        assert 0 == cache.ttl_for(_video(extractor_key="Twitch"))
+        assert 600 == cache.ttl_for(_video(extractor_key="Vimeo"))
+
+        cache._max_age = 60
+        assert 60 == cache.ttl_for(_video()), "download_info_expires still caps overrides"
+
+    def test_put_get_persists(self, cache: ExtractCache) -> None:
+        assert cache.put("k1", "https://example.com/v", (_video(), ["warn"])) is True
+
+        reopened = ExtractCache(cache._path, ttl=600, max_age=0)
+        try:
+            assert reopened.get("k1") == (_video(), ["warn"])
+        finally:
+            reopened.close()
+
+    def test_expired_entries_are_pruned(self, cache: ExtractCache) -> None:
+        cache.put("k1", "https://example.com/v", (_video(), []))
+        cache._db().execute("UPDATE entries SET expires = ?", (time.time() - 1,))
+
+        assert 1 == cache.prune()
+        assert cache.get("k1") is None
+        assert not cache._file("k1").exists()
+
+    @pytest.mark.asyncio
+    async def test_fetch_coalesces_and_caches(self, cache: ExtractCache) -> None:
+        calls = 0
+        release = asyncio.Event()
+
+        async def extract():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return (_video(), [])
+
+        tasks = [asyncio.create_task(cache.fetch("k", "https://example.com/v", extract)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert 1 == calls, "concurrent requests must share one extraction"
+        assert all(r[0] == _video() for r in results)
+        assert results[0][0] is not results[1][0], "waiters must get their own copy"
+
+        await cache.fetch("k", "https://example.com/v", extract)
+        assert 1 == calls
+
+        await cache.fetch("k", "https://example.com/v", extract, refresh=True)
+        assert 2 == calls
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_caller_keeps_shared_extraction(self, cache: ExtractCache) -> None:
+        release = asyncio.Event()
+
+        async def extract():
+            await release.wait()
+            return (_video(), [])
+
+        first = asyncio.create_task(cache.fetch("k", "https://example.com/v", extract))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.fetch("k", "https://example.com/v", extract))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert (await second)[0] == _video()
+        assert first.cancelled()
+        assert cache.get("k") is not None, "the extraction must still be cached"
+
+    @pytest.mark.asyncio
+    async def test_fetch_info_uses_cache(self, cache: ExtractCache) -> None:
+        with (
+            patch.object(ExtractCache, "get_instance", return_value=cache),
+            patch("app.features.ytdlp.extractor._fetch_info", return_value=(_video(), [])) as extract,
+        ):
+            first = await fetch_info({"format": "best"}, "https://example.com/v")
+            second = await fetch_info({"format": "best"}, "https://EXAMPLE.com/v")
+
+        assert first == second
+        assert 1 == extract.await_count
+
+    @pytest.mark.asyncio
+    async def test_fetch_info_keys_cookies_by_contents(self, cache: ExtractCache) -> None:
+        with (
+            temporary_test_dir("extract-cache-cookies") as temp_dir,
+            patch.object(ExtractCache, "get_instance", return_value=cache),
+            patch("app.features.ytdlp.extractor._fetch_info", return_value=(_video(), [])) as extract,
+        ):
+            for name, contents in (("c_1.txt", "a"), ("c_2.txt", "a"), ("c_3.txt", "b")):
+                (temp_dir / name).write_text(contents)
+                await fetch_info({"cookiefile": str(temp_dir / name)}, "https://example.com/v")
+
+            assert 2 == extract.await_count, "same cookies under a new name must hit the cache"
+
+            await fetch_info({"cookiefile": str(temp_dir / "missing.txt")}, "https://example.com/v")
+            await fetch_info({"cookiefile": str(temp_dir / "missing.txt")}, "https://example.com/v")
+            assert 4 == extract.await_count, "unreadable cookie files must bypass the cache"
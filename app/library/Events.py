@@ -1,5 +1,6 @@
 import asyncio
 import datetime
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
@@ -8,6 +9,8 @@ from app.features.core.utils import gen_random
 from app.library.logging import get_logger
 
 from .BackgroundWorker import BackgroundWorker
+from .loop_monitor import ACTIVITY
+from .metrics import MetricsRegistry
 from .Singleton import Singleton
 
 LOG = get_logger()
@@ -345,8 +348,14 @@ class EventBus(metaclass=Singleton):
         try:
             loop = asyncio.get_running_loop()
 
+            duration = MetricsRegistry.get_instance().histogram(
+                "event_handler_duration_seconds", "Time spent by event listeners handling an event.", ("event",)
+            )
+
             async def execute_handlers():
                 for _, handler in self._listeners[event]:
+                    started: float = time.perf_counter()
+                    ACTIVITY.set(f"event:{ev.event}/{handler.name}")
                     try:
                         if handler.is_coroutine:
                             coro = handler.call_back(ev, handler.name, **kwargs)
@@ -373,6 +382,8 @@ class EventBus(metaclass=Singleton):
                                 "exception_type": type(e).__name__,
                             },
                         )
+                    finally:
+                        duration.observe(time.perf_counter() - started, ev.event)
 
             loop.create_task(execute_handlers())
         except RuntimeError:
@@ -1,5 +1,5 @@
-import inspect
 import re
+import time
 from pathlib import Path
 from typing import Any, cast
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
@@ -16,12 +16,14 @@ from app.features.auth.middleware import auth_middleware, cors_headers
 from app.features.auth.service import AuthService
 from app.features.core.utils import api_error_response
 from app.library.logging import get_logger
-from app.library.Services import Services
+from app.library.Services import Services, injection_plan
 
 from .cache import Cache
 from .config import Config
 from .encoder import Encoder
 from .Events import EventBus
+from .loop_monitor import ACTIVITY
+from .metrics import MetricsRegistry
 from .router import RouteType, get_routes
 from .Utils import get_file, load_modules
 
@@ -186,9 +188,23 @@ class HttpAPI:
         async def options_handler(_: Request) -> Response:
             return web.Response(status=204)
 
-        def _handle(handler):
+        metrics: MetricsRegistry = MetricsRegistry.get_instance()
+        latency = metrics.histogram(
+            "http_request_duration_seconds", "Time spent handling HTTP requests.", ("route", "method")
+        )
+        requests = metrics.counter("http_requests_total", "HTTP requests handled.", ("route", "method", "status"))
+
+        def _handle(handler, name: str, method: str):
             async def wrapped(request):
-                return await self._handle(handler, request)
+                started: float = time.perf_counter()
+                token = ACTIVITY.set(f"route:{name}")
+                try:
+                    response = await self._handle(handler, request)
+                finally:
+                    ACTIVITY.reset(token)
+                latency.observe(time.perf_counter() - started, name, method)
+                requests.inc(name, method, str(response.status))
+                return response
 
             return wrapped
 
@@ -209,7 +225,9 @@ class HttpAPI:
                     extra={"route_name": route.name, "method": route.method, "path": route.path},
                 )
 
-            app.router.add_route(route.method, route.path, handler=_handle(route.handler), name=route.name)
+            app.router.add_route(
+                route.method, route.path, handler=_handle(route.handler, route.name, route.method), name=route.name
+            )
 
             if route.path in registered_options:
                 continue
@@ -291,11 +309,10 @@ class HttpAPI:
 
         """
         try:
-            sig = inspect.signature(handler)
-            expected_args = sig.parameters.keys()
+            params = injection_plan(handler).params
 
             try:
-                if 1 == len(expected_args) and "request" in expected_args:
+                if 1 == len(params) and "request" == params[0].name:
                     response = await handler(request)
                 else:
                     response = await Services.get_instance().handle_async(handler, request=request)
@@ -14,7 +14,7 @@ from app.library.Services import Services
 from app.library.Utils import load_modules
 
 from .config import Config
-from .encoder import Encoder
+from .encoder import Encoder, RawJSON
 from .Events import Event, EventBus, Events
 
 LOG = get_logger()
@@ -86,8 +86,7 @@ class HttpSocket:
         self.rootPath: Path = root_path
 
         async def event_handler(e: Event, _, **kwargs):
-            payload = json.loads(encoder.encode(e))
-            await self.sio.emit(event=e.event, data=payload, **kwargs)
+            await self.sio.emit(event=e.event, data=RawJSON(encoder.encode(e)), **kwargs)
 
         services: Services = Services.get_instance()
         services.add_all(
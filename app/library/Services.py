@@ -41,9 +41,87 @@ class ServiceEntry:
     instance: Any
 
 
+@dataclass(frozen=True, slots=True)
+class PlannedParam:
+    name: str
+    lookup_name: str
+    "The name without leading underscores, also accepted for overrides and services."
+    annotation: Any
+    "The unwrapped type hint, used to resolve the service by type."
+    required: bool
+
+
+@dataclass(frozen=True, slots=True)
+class InjectionPlan:
+    key: Any
+    "The plan cache key, None for unhashable handlers which are planned on every call."
+    name: str
+    params: tuple[PlannedParam, ...]
+
+
+_UNRESOLVED = object()
+_PLANS: dict[Any, InjectionPlan] = {}
+
+
+def injection_plan(handler: Callable[..., Any], registering: bool = False) -> InjectionPlan:
+    """
+    Get the injection plan of a handler, inspecting its signature only the first time.
+
+    Bound methods share the plan of their function, so handlers like ``cls.can_handle``
+    are planned once no matter how many times they are bound.
+
+    Args:
+        handler (Callable): The handler.
+        registering (bool): Whether the handler is being registered, in which case a plan whose type
+            hints do not resolve yet is not kept, as names defined later in the module may resolve them.
+
+    Returns:
+        InjectionPlan: The parameters to inject, in signature order.
+
+    """
+    is_method: bool = inspect.ismethod(handler)
+    func: Any = handler.__func__ if is_method else handler
+    key: tuple[Any, bool] | None = (func, is_method)
+
+    try:
+        if plan := _PLANS.get(key):
+            return plan
+    except TypeError:
+        key = None
+
+    try:
+        type_hints: dict[str, Any] = get_type_hints(func)
+        final: bool = True
+    except Exception:
+        type_hints = {}
+        final = not registering
+
+    params: list[PlannedParam] = []
+    for name, param in inspect.signature(handler).parameters.items():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+
+        params.append(
+            PlannedParam(
+                name=name,
+                lookup_name=name.lstrip("_") if name.startswith("_") else name,
+                annotation=_unwrap_annotation(type_hints.get(name, param.annotation)),
+                required=param.default is inspect._empty,
+            )
+        )
+
+    plan = InjectionPlan(key=key, name=getattr(handler, "__name__", str(handler)), params=tuple(params))
+    if final and key is not None:
+        _PLANS[key] = plan
+
+    return plan
+
+
 class Services(metaclass=Singleton):
     def __init__(self):
         self._services: list[ServiceEntry] = []
+        self._resolved: dict[tuple[Any, str], Any] = {}
+        "Services resolved per handler parameter, cleared whenever the registered services change."
 
     @staticmethod
     def get_instance() -> "Services":
@@ -66,6 +144,7 @@ class Services(metaclass=Singleton):
             declared_type = type(service)
 
         self.remove(name)
+        self._resolved.clear()
         self._services.append(ServiceEntry(name=name, declared_type=declared_type, instance=service))
         return self
 
@@ -75,9 +154,11 @@ class Services(metaclass=Singleton):
 
     def remove(self, name: str):
         self._services = [e for e in self._services if e.name != name]
+        self._resolved.clear()
 
     def clear(self):
         self._services.clear()
+        self._resolved.clear()
 
     def get(self, name: str) -> Any | None:
         for e in reversed(self._services):
@@ -118,59 +199,54 @@ class Services(metaclass=Singleton):
 
         return candidates[0]
 
-    def _build_call_args(self, handler: Callable[..., Any], overrides: dict[str, Any]) -> dict[str, Any]:
-        sig: inspect.Signature = inspect.signature(handler)
+    def _resolve(self, plan: "InjectionPlan", param: "PlannedParam") -> Any:
+        """
+        Resolve a parameter from the registered services, by name first and then by type.
 
-        try:
-            type_hints: dict[str, Any] = get_type_hints(handler)
-        except Exception:
-            type_hints = {}
+        Successful lookups are memoized per handler until the registered services change.
 
-        resolved: dict[str, Any] = {}
+        Args:
+            plan (InjectionPlan): The plan of the handler.
+            param (PlannedParam): The parameter to resolve.
 
-        for name, param in sig.parameters.items():
-            if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
-                continue
+        Returns:
+            Any: The service, or _UNRESOLVED if none matches.
 
-            lookup_name: str = name
-            if name.startswith("_"):
-                lookup_name = name.lstrip("_")
+        """
+        key: tuple[Any, str] = (plan.key, param.name)
+        if plan.key is not None and (value := self._resolved.get(key, _UNRESOLVED)) is not _UNRESOLVED:
+            return value
 
-            if name in overrides or lookup_name in overrides:
-                resolved[name] = overrides.get(name, overrides.get(lookup_name))
-                continue
+        value = self.get(param.name) or self.get(param.lookup_name)
+        if value is None:
+            value = self.get_by_type(param.annotation)
 
-            by_name: Any | None = self.get(name) or self.get(lookup_name)
-            if by_name is not None:
-                resolved[name] = by_name
-                continue
+        if value is None:
+            return _UNRESOLVED
 
-            ann: Any | None = type_hints.get(name, param.annotation)
-            by_type: Any | None = self.get_by_type(ann)
-            if by_type is not None:
-                resolved[name] = by_type
-                continue
+        if plan.key is not None:
+            self._resolved[key] = value
 
-            if param.default is not inspect._empty:
-                continue
+        return value
 
+    def _build_call_args(self, handler: Callable[..., Any], overrides: dict[str, Any]) -> dict[str, Any]:
+        plan: InjectionPlan = injection_plan(handler)
+        resolved: dict[str, Any] = {}
         missing_required: list[str] = []
-        for name, param in sig.parameters.items():
-            if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
-                continue
 
-            if param.default is not inspect._empty:
+        for param in plan.params:
+            if param.name in overrides or param.lookup_name in overrides:
+                resolved[param.name] = overrides.get(param.name, overrides.get(param.lookup_name))
                 continue
 
-            if name not in resolved:
-                missing_required.append(name)
+            value: Any = self._resolve(plan, param)
+            if value is not _UNRESOLVED:
+                resolved[param.name] = value
+            elif param.required:
+                missing_required.append(param.name)
 
         if missing_required:
-            LOG.error(
-                "Missing arguments for handler '%s': %s",
-                getattr(handler, "__name__", str(handler)),
-                missing_required,
-            )
+            LOG.error("Missing arguments for handler '%s': %s", plan.name, missing_required)
 
         return resolved
 
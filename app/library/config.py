@@ -91,6 +91,9 @@ class Config(metaclass=Singleton):
     max_workers_per_extractor: int = 2
     """The maximum number of concurrent downloads per extractor."""
 
+    download_worker_jobs: int = 0
+    """Reuse download worker processes for up to this many downloads before recycling them. 0 spawns one process per download."""
+
     streamer_vcodec: str = ""
     """The video codec to use for streaming. If empty, auto-detect."""
 
@@ -134,11 +137,14 @@ class Config(metaclass=Singleton):
     """The timeout to use for extracting video information."""
 
     extract_info_concurrency: int = 4
-    """The number of concurrent extract_info calls allowed."""
+    """The number of concurrent extract_info calls allowed, also the number of playlist entries processed at once."""
 
     extract_info_keep_alive: bool = False
     """Keep extract_info worker processes alive between requests."""
 
+    extract_info_cache_ttl: int = 0
+    """How long to cache single-video extraction results of every caller on disk, in seconds. 0 disables the cache."""
+
     thumb_concurrency: int = 2
     """The number of concurrent ffmpeg thumbnail generations allowed."""
 
@@ -148,9 +154,36 @@ class Config(metaclass=Singleton):
     thumb_sidecar: bool = False
     """Save generated thumbnails next to the media file instead of temp cache."""
 
+    thumb_trickplay: bool = False
+    """Generate timeline preview sprite sheets for finished downloads."""
+
+    thumb_trickplay_interval: int = 10
+    """The number of seconds each timeline preview tile covers."""
+
     db_file: str = "{config_path}{os_sep}ytptube.db"
     """The path to the database file."""
 
+    db_read_connections: int = 0
+    """The number of read-only database connections to split reads onto, 0 to share one pool with writes."""
+
+    db_synchronous: str = "NORMAL"
+    """The database synchronous pragma, one of OFF, NORMAL, FULL or EXTRA."""
+
+    db_mmap_size: int = 134217728
+    """The number of bytes of the database file to memory-map, 0 to disable."""
+
+    db_cache_size: int = 16384
+    """The page cache size of each database connection, in KiB."""
+
+    db_temp_store: str = "MEMORY"
+    """Where the database keeps temporary tables and indices, one of DEFAULT, FILE or MEMORY."""
+
+    db_maintenance_wal_mb: int = 64
+    """Checkpoint and truncate the database WAL file once it grows past this many MiB."""
+
+    db_maintenance_freelist: int = 10
+    """Reclaim free database pages once they make up this percentage of the file. 0 to disable."""
+
     archive_file: str = "{config_path}{os_sep}archive.log"
     """The path to the download archive file."""
 
@@ -241,6 +274,18 @@ class Config(metaclass=Singleton):
     task_handler_random_delay: float = 60.0
     """The maximum random delay in seconds before starting a task handler."""
 
+    task_concurrency: int = 2
+    """The number of scheduled tasks allowed to run at the same time."""
+
+    task_stagger_window: int = 300
+    """The window in seconds over which tasks sharing the same timer are spread."""
+
+    task_max_defer: int = 900
+    """The maximum seconds a scheduled task waits while the download pool is saturated."""
+
+    playlist_incremental_stop: int = 0
+    """Stop scheduled playlist re-scans after this many consecutive archived entries, 0 to scan everything."""
+
     ignore_archived_items: bool = False
     """Dont report archived items in the download history."""
 
@@ -269,6 +314,9 @@ class Config(metaclass=Singleton):
     monitor_interval: int = 30
     "Sampling interval in seconds for app resource monitoring."
 
+    loop_lag_threshold: int = 100
+    "Record event loop stalls longer than this many milliseconds. 0 to disable."
+
     monitor_retention_hours: int = 24
     "How many hours to retain raw monitor samples in the stats database."
 
@@ -297,6 +345,7 @@ class Config(metaclass=Singleton):
         "port",
         "max_workers",
         "max_workers_per_extractor",
+        "download_worker_jobs",
         "extract_info_timeout",
         "debugpy_port",
         "download_info_expires",
@@ -305,13 +354,25 @@ class Config(metaclass=Singleton):
         "default_pagination",
         "queue_display_limit",
         "extract_info_concurrency",
+        "extract_info_cache_ttl",
         "thumb_concurrency",
+        "thumb_trickplay_interval",
+        "task_concurrency",
+        "task_stagger_window",
+        "task_max_defer",
+        "playlist_incremental_stop",
         "flaresolverr_max_timeout",
         "flaresolverr_client_timeout",
         "flaresolverr_cache_ttl",
         "monitor_interval",
         "monitor_retention_hours",
+        "loop_lag_threshold",
         "auth_session_days",
+        "db_read_connections",
+        "db_mmap_size",
+        "db_cache_size",
+        "db_maintenance_wal_mb",
+        "db_maintenance_freelist",
     )
     "The variables that are integers."
 
@@ -336,6 +397,7 @@ class Config(metaclass=Singleton):
         "check_for_updates",
         "thumb_generate",
         "thumb_sidecar",
+        "thumb_trickplay",
         "disable_auth",
         "extract_info_keep_alive",
         "monitor_enabled",
@@ -376,6 +438,7 @@ class Config(metaclass=Singleton):
         "new_version",
         "yt_new_version",
         "monitor_enabled",
+        "thumb_trickplay",
     )
     "The variables that are relevant to the frontend."
 
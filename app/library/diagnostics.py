@@ -20,6 +20,7 @@ from app.library.config import Config
 from app.library.httpx_client import resolve_curl_transport
 from app.library.monitor import ResourceTracker
 from app.library.monitor_bottlenecks import detect as detect_bottlenecks
+from app.library.Services import Services
 
 CheckStatus = Literal["pass", "fail", "warn", "skip"]
 ReportStatus = Literal["ok", "degraded", "error"]
@@ -646,7 +647,7 @@ def _avg(rows: list[dict[str, Any]], key: str) -> float | None:
 
 
 def _max(rows: list[dict[str, Any]], key: str) -> float | None:
-    values = [value for row in rows if (value := row.get(key)) is not None]
+    values = [value for row in rows if (value := row.get(f"{key}_max", row.get(key))) is not None]
     return round(max(values), 2) if values else None
 
 
@@ -713,6 +714,14 @@ def _stats(config: Config) -> dict[str, Any]:
         return {"enabled": True, "error": f"Stats unavailable. {exc!s}"}
 
 
+def _database() -> dict[str, Any]:
+    store = Services.get_instance().get("sqlite_store")
+    if not store:
+        return {"maintenance": None}
+
+    return {"maintenance": store.maintenance_status()}
+
+
 def _summarize(checks: list[DiagnosticCheck]) -> tuple[ReportStatus, dict[str, int]]:
     summary = {"total": len(checks), "pass": 0, "fail": 0, "warn": 0, "skip": 0, "required_failed": 0}
 
@@ -740,6 +749,7 @@ def _make_report(config: Config, checks: list[DiagnosticCheck]) -> dict[str, Any
         "runtime": _make_runtime(config),
         "requirements": _requirements(),
         "stats": _stats(config),
+        "database": _database(),
         "checks": [check.to_dict() for check in checks],
     }
 
@@ -1,21 +1,74 @@
 import json
+import re
+import secrets
+import threading
 from datetime import date
 from pathlib import Path
+from typing import Any
 
 from yt_dlp.networking.impersonate import ImpersonateTarget
 from yt_dlp.utils import DateRange
 
 
+class RawJSON:
+    """
+    Already encoded JSON, spliced verbatim by the Encoder instead of being decoded and encoded again.
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str) -> None:
+        self.text: str = text
+
+    def serialize(self) -> Any:
+        return json.loads(self.text)
+
+
 class Encoder(json.JSONEncoder):
     """
     This class is used to serialize objects to JSON.
     The only difference between this and the default JSONEncoder is that this one
     will call the __dict__ method of an object if it exists.
+
+    ``RawJSON`` values, and items through their cached encoding, are spliced into the output of ``encode()``
+    as-is. Indented output and ``iterencode()`` callers get them decoded instead.
     """
 
+    _local = threading.local()
+    "The raw values collected by the encode() calls running on this thread."
+
+    def encode(self, o: Any) -> str:
+        if self.indent is not None:
+            return super().encode(o)
+
+        previous: tuple[str, list[str]] | None = getattr(Encoder._local, "raw", None)
+        prefix: str = f"__raw_json_{secrets.token_hex(8)}_"
+        raw: list[str] = []
+        Encoder._local.raw = (prefix, raw)
+        try:
+            text: str = super().encode(o)
+        finally:
+            Encoder._local.raw = previous
+
+        if not raw:
+            return text
+
+        return re.sub(f'"{prefix}(\\d+)"', lambda m: raw[int(m.group(1))], text)
+
+    def _raw(self, text: str) -> Any:
+        if (state := getattr(Encoder._local, "raw", None)) is None or self.indent is not None:
+            return json.loads(text)
+
+        prefix, raw = state
+        raw.append(text)
+        return f"{prefix}{len(raw) - 1}"
+
     def default(self, o):
         from app.features.downloads.items import ItemDTO
 
+        if isinstance(o, RawJSON):
+            return self._raw(o.text)
+
         if isinstance(o, DateRange):
             return {"start": str(o.start).replace("-", ""), "end": str(o.end).replace("-", "")}
 
@@ -23,7 +76,7 @@ class Encoder(json.JSONEncoder):
             return str(o)
 
         if isinstance(o, ItemDTO):
-            return o.serialize()
+            return self._raw(o.encoded())
 
         if isinstance(o, object):
             if hasattr(o, "serialize"):
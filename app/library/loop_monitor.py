@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from app.library.config import Config
+from app.library.logging import get_logger
+from app.library.metrics import MetricsRegistry
+from app.library.Services import Services
+from app.library.Singleton import Singleton
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+LOG = get_logger()
+
+ACTIVITY: ContextVar[str | None] = ContextVar("loop_activity", default=None)
+"What the current task is doing, such as 'route:history.list' or 'event:item_added/Notifications'."
+
+_SLOW_CALLBACK: str = "Executing %s took %.3f seconds"
+"The message asyncio logs in debug mode for callbacks slower than loop.slow_callback_duration."
+
+
+@dataclass(kw_only=True)
+class LoopStall:
+    at: float
+    "When the stall was recorded, as a unix timestamp."
+    lag_ms: float
+    "How long the loop was blocked, for the sampler a lower bound short of up to one interval."
+    source: str
+    "Either 'sampler' for scheduling drift, or 'slow_callback' for the asyncio debug hook."
+    task: str | None = None
+    "The name of the task, or the callback, that was running while the loop was blocked."
+    activity: str | None = None
+    "The route or event that task was handling."
+    stack: list[str] = field(default_factory=list)
+    "The innermost frames of the loop thread while it was blocked."
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class _SlowCallbackHandler(logging.Handler):
+    def __init__(self, monitor: LoopMonitor) -> None:
+        super().__init__(logging.WARNING)
+        self._monitor = monitor
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.msg != _SLOW_CALLBACK or not isinstance(record.args, tuple) or 2 != len(record.args):
+            return
+
+        handle, seconds = record.args
+        if float(seconds) >= self._monitor.threshold:
+            self._monitor.record(float(seconds), source="slow_callback", task=str(handle)[:300])
+
+
+class LoopMonitor(metaclass=Singleton):
+    """
+    Records event loop stalls.
+
+    A sampler task sleeps for a fixed interval and measures how late it wakes up, which is how long
+    something held the loop. A watchdog thread notices when the sampler is overdue while the loop is
+    still blocked, and captures the running task, its route or event, and the loop thread's stack, so
+    the stall can be attributed once the sampler wakes up. In debug mode, asyncio's slow callback
+    warnings are recorded as well.
+    """
+
+    INTERVAL: float = 0.25
+    "Seconds between sampler wake ups."
+
+    @staticmethod
+    def get_instance() -> LoopMonitor:
+        return LoopMonitor()
+
+    def __init__(self, capacity: int = 100) -> None:
+        self._config: Config = Config.get_instance()
+        self._stalls: deque[LoopStall] = deque(maxlen=capacity)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._due: float = 0.0
+        "When the sampler is expected to wake up, in time.monotonic() seconds."
+        self._suspect: LoopStall | None = None
+        "What the watchdog saw running while the loop was blocked, until the sampler records it."
+        self._handler: _SlowCallbackHandler | None = None
+        self._max_lag: float = 0.0
+
+    @property
+    def threshold(self) -> float:
+        return max(0, self._config.loop_lag_threshold) / 1000
+
+    def attach(self, _app: web.Application) -> None:
+        if self.threshold <= 0:
+            return
+
+        from app.library.Events import EventBus, Events
+
+        Services.get_instance().add("loop_monitor", self)
+
+        async def on_started(_, __):
+            self.start()
+
+        EventBus.get_instance().subscribe(Events.STARTED, on_started, f"{LoopMonitor.__name__}.start")
+
+        async def on_shutdown(_, __):
+            await self.stop()
+
+        EventBus.get_instance().subscribe(Events.SHUTDOWN, on_shutdown, f"{LoopMonitor.__name__}.stop")
+
+    def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._due = time.monotonic() + self.INTERVAL
+        self._stop.clear()
+        self._task = self._loop.create_task(self._sample(), name="loop-monitor")
+        self._thread = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._thread.start()
+
+        self._handler = _SlowCallbackHandler(self)
+        logging.getLogger("asyncio").addHandler(self._handler)
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._handler:
+            logging.getLogger("asyncio").removeHandler(self._handler)
+            self._handler = None
+
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def stalls(self) -> list[dict[str, Any]]:
+        return [stall.to_dict() for stall in reversed(self._stalls)]
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "threshold_ms": round(self.threshold * 1000, 2),
+            "interval_ms": round(self.INTERVAL * 1000, 2),
+            "max_lag_ms": round(self._max_lag * 1000, 2),
+            "stalls": self.stalls(),
+        }
+
+    def record(self, lag: float, source: str, task: str | None = None, suspect: LoopStall | None = None) -> None:
+        stall = LoopStall(at=time.time(), lag_ms=round(lag * 1000, 2), source=source, task=task)
+        if suspect:
+            stall.task, stall.activity, stall.stack = suspect.task, suspect.activity, suspect.stack
+
+        self._stalls.append(stall)
+        MetricsRegistry.get_instance().counter(
+            "event_loop_stalls_total", "Event loop stalls longer than the configured threshold.", ("source",)
+        ).inc(source)
+        LOG.warning(
+            "Event loop was blocked for '%sms' by '%s'.",
+            stall.lag_ms,
+            stall.activity or stall.task or "unknown",
+            extra={"lag_ms": stall.lag_ms, "source": source, "task": stall.task, "activity": stall.activity},
+        )
+
+    async def _sample(self) -> None:
+        lag_metric = MetricsRegistry.get_instance().histogram(
+            "event_loop_lag_seconds",
+            "How late the event loop ran a timer scheduled by the lag sampler.",
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+        )
+        while True:
+            self._due = time.monotonic() + self.INTERVAL
+            await asyncio.sleep(self.INTERVAL)
+            lag: float = max(0.0, time.monotonic() - self._due)
+            suspect, self._suspect = self._suspect, None
+
+            lag_metric.observe(lag)
+            self._max_lag = max(self._max_lag, lag)
+            if lag >= self.threshold:
+                self.record(lag, source="sampler", suspect=suspect)
+
+    def _watch(self) -> None:
+        while not self._stop.wait(max(0.01, self.threshold / 2)):
+            if self._suspect is None and time.monotonic() - self._due >= self.threshold:
+                self._suspect = self._snapshot()
+
+    def _snapshot(self) -> LoopStall:
+        stall = LoopStall(at=time.time(), lag_ms=0.0, source="sampler")
+        with contextlib.suppress(Exception):
+            if self._loop and (task := asyncio.current_task(self._loop)):
+                stall.task = task.get_name()
+                stall.activity = task.get_context().get(ACTIVITY)
+
+        with contextlib.suppress(Exception):
+            if self._loop_thread and (frame := sys._current_frames().get(self._loop_thread)):
+                stall.stack = [
+                    f"{entry.filename}:{entry.lineno} in {entry.name}" for entry in traceback.extract_stack(frame)[-8:]
+                ]
+
+        return stall
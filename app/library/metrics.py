@@ -0,0 +1,208 @@
+"""In-process metrics, rendered in the Prometheus text exposition format."""
+
+import bisect
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from app.library.Singleton import Singleton
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"The default histogram buckets, in seconds."
+
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+"The content type of the text exposition format."
+
+PREFIX: str = "ytptube_"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs: list[str] = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric(ABC):
+    kind: str = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labels: tuple[str, ...] = labels
+
+    def _check(self, values: tuple[str, ...]) -> None:
+        if len(values) != len(self.labels):
+            msg: str = f"Metric '{self.name}' expects labels {self.labels}, got {values}."
+            raise ValueError(msg)
+
+    @abstractmethod
+    def lines(self) -> Iterator[str]: ...
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self.lines()
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        try:
+            self._values[labels] += amount
+        except KeyError:
+            self._check(labels)
+            self._values[labels] = amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def lines(self) -> Iterator[str]:
+        for values, value in list(self._values.items()):
+            yield f"{self.name}{_labels(self.labels, values)} {_number(value)}"
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        callback: Callable[[], dict[tuple[str, ...], float]] | None = None,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._callback = callback
+        "Called on render to read the current values, for gauges cheaper to read than to track."
+
+    def set(self, value: float, *labels: str) -> None:
+        if labels not in self._values:
+            self._check(labels)
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self.set(self._values.get(labels, 0.0) + amount, *labels)
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def lines(self) -> Iterator[str]:
+        values: dict[tuple[str, ...], float] = dict(self._values)
+        if self._callback:
+            values.update(self._callback())
+        for labels, value in values.items():
+            yield f"{self.name}{_labels(self.labels, labels)} {_number(value)}"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], list[float]] = {}
+        "Per label values, the count of each bucket and +Inf, then the sum."
+
+    def observe(self, value: float, *labels: str) -> None:
+        series: list[float] | None = self._series.get(labels)
+        if series is None:
+            self._check(labels)
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        series: list[float] | None = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def lines(self) -> Iterator[str]:
+        for labels, series in list(self._series.items()):
+            cumulative: float = 0
+            for bound, count in zip((*self.buckets, math.inf), series[:-1], strict=True):
+                cumulative += count
+                le: str = f'le="{_number(bound)}"'
+                yield f"{self.name}_bucket{_labels(self.labels, labels, le)} {_number(cumulative)}"
+            yield f"{self.name}_sum{_labels(self.labels, labels)} {_number(series[-1])}"
+            yield f"{self.name}_count{_labels(self.labels, labels)} {_number(cumulative)}"
+
+
+class MetricsRegistry(metaclass=Singleton):
+    """
+    Holds the application metrics.
+
+    Metrics are created on first use and looked up by name after that, so hooks can ask for their
+    metric inline. Recording is a dict lookup and an addition, without locks, as every hook runs on
+    the event loop.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    @staticmethod
+    def get_instance() -> "MetricsRegistry":
+        return MetricsRegistry()
+
+    def _get[T: Metric](self, kind: type[T], name: str, factory: Callable[[str], T]) -> T:
+        name = f"{PREFIX}{name}"
+        if (metric := self._metrics.get(name)) is None:
+            metric = self._metrics[name] = factory(name)
+        if not isinstance(metric, kind):
+            msg: str = f"Metric '{name}' is already registered as a {metric.kind}."
+            raise ValueError(msg)
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> Counter:
+        return self._get(Counter, name, lambda n: Counter(n, documentation, labels))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        callback: Callable[[], dict[tuple[str, ...], float]] | None = None,
+    ) -> Gauge:
+        return self._get(Gauge, name, lambda n: Gauge(n, documentation, labels, callback))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get(Histogram, name, lambda n: Histogram(n, documentation, labels, buckets))
+
+    def get(self, name: str) -> Any | None:
+        return self._metrics.get(f"{PREFIX}{name}")
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
@@ -79,6 +79,7 @@ class ResourceSample:
 
     children: list[dict[str, Any]]
     children_count: int
+    child_groups: dict[str, dict[str, Any]]
 
     active_jobs: int
     queued_jobs: int
@@ -141,6 +142,7 @@ class _TreeStats:
     connections: int | None
     children: list[dict[str, Any]]
     children_count: int
+    groups: dict[str, dict[str, Any]]
     cpu: dict[ProcKey, float]
     io: dict[ProcKey, dict[str, Any]]
 
@@ -201,6 +203,42 @@ def _thread_names(proc: psutil.Process, limit: int = 5) -> list[str]:
     return result
 
 
+FFMPEG_NAMES: tuple[str, ...] = ("ffmpeg", "ffprobe")
+"Process name prefixes grouped as 'ffmpeg' wherever they run in the tree."
+
+
+class _ProcessHandles:
+    """
+    Keeps one psutil.Process per live process across samples.
+
+    psutil hands out fresh Process objects for every children() call, so details that never change,
+    the name and command line, are read once per process here instead of once per sample. Processes
+    that were not seen in the latest walk have exited and are dropped.
+    """
+
+    def __init__(self) -> None:
+        self._procs: dict[ProcKey, psutil.Process] = {}
+        self._details: dict[ProcKey, tuple[str, str | None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._procs)
+
+    def resolve(self, procs: list[psutil.Process]) -> list[tuple[ProcKey, psutil.Process]]:
+        seen: dict[ProcKey, psutil.Process] = {}
+        for proc in procs:
+            key: ProcKey = _proc_key(proc)
+            seen[key] = self._procs.get(key, proc)
+
+        self._procs = seen
+        self._details = {key: value for key, value in self._details.items() if key in seen}
+        return list(seen.items())
+
+    def details(self, key: ProcKey, proc: psutil.Process) -> tuple[str, str | None]:
+        if (details := self._details.get(key)) is None:
+            details = self._details[key] = (_safe(lambda: proc.name()) or "unknown", _short_cmdline(proc))
+        return details
+
+
 def _process_tree_stats(
     proc: psutil.Process,
     *,
@@ -209,13 +247,25 @@ def _process_tree_stats(
     elapsed: float | None,
     effective_cpus: float,
     labels: dict[int, str] | None = None,
+    groups: dict[int, str] | None = None,
+    handles: _ProcessHandles | None = None,
     limit: int = 10,
 ) -> _TreeStats:
+    """
+    Sum the resource usage of a process and all of its descendants.
+
+    Children are also aggregated per group: the pids in ``groups`` are classified up front, ffmpeg and
+    ffprobe are always 'ffmpeg', and any other descendant joins the group of its parent, or 'other'.
+    """
     try:
         child_procs = proc.children(recursive=True)
     except Exception:
         child_procs = []
 
+    handles = _ProcessHandles() if handles is None else handles
+    parents: dict[int, str] = {}
+    totals: dict[str, dict[str, Any]] = {}
+
     new_cpu: dict[ProcKey, float] = {}
     new_io: dict[ProcKey, dict[str, Any]] = {}
     children: list[dict[str, Any]] = []
@@ -234,11 +284,10 @@ def _process_tree_stats(
     open_files: int | None = None
     connections: int | None = None
 
-    for item in [proc, *child_procs]:
+    for key, item in handles.resolve([proc, *child_procs]):
         is_child = item.pid != proc.pid
         try:
             with item.oneshot():
-                key = _proc_key(item)
                 item_cpu = _cpu_seconds(item)
                 if item_cpu is not None:
                     new_cpu[key] = item_cpu
@@ -280,13 +329,28 @@ def _process_tree_stats(
                 connections = _add(connections, _safe_len(lambda item=item: item.net_connections(kind="inet")))
 
                 if is_child:
-                    name = _safe(lambda item=item: item.name()) or "unknown"
+                    name, cmdline = handles.details(key, item)
+                    group: str = (
+                        (groups or {}).get(item.pid)
+                        or ("ffmpeg" if name.startswith(FFMPEG_NAMES) else None)
+                        or parents.get(_safe(lambda item=item: item.ppid()))
+                        or "other"
+                    )
+                    parents[item.pid] = group
+
+                    total = totals.setdefault(group, {"count": 0, "cpu_percent": 0.0, "rss_mb": 0.0, "threads": 0})
+                    total["count"] += 1
+                    total["cpu_percent"] = round(total["cpu_percent"] + item_cpu_percent, 2)
+                    total["rss_mb"] = round(total["rss_mb"] + (_mb(getattr(mem, "rss", None)) or 0), 2)
+                    total["threads"] += item_threads or 0
+
                     children.append(
                         {
                             "pid": item.pid,
                             "name": name,
                             "display_name": (labels or {}).get(item.pid) or name,
-                            "cmdline": _short_cmdline(item),
+                            "group": group,
+                            "cmdline": cmdline,
                             "status": _safe(lambda item=item: item.status()) or "unknown",
                             "cpu_percent": round(item_cpu_percent, 2),
                             "rss_mb": _mb(getattr(mem, "rss", None) if mem is not None else None),
@@ -313,6 +377,7 @@ def _process_tree_stats(
         connections=connections,
         children=children[:limit],
         children_count=len(child_procs),
+        groups=totals,
         cpu=new_cpu,
         io=new_io,
     )
@@ -357,6 +422,7 @@ class ResourceTracker(metaclass=Singleton):
         self._last_ts: float | None = None
         self._last_proc_cpu: dict[ProcKey, float] = {}
         self._last_proc_io: dict[ProcKey, dict[str, Any]] = {}
+        self._handles = _ProcessHandles()
         self._last_disk_io: Any = None
         self._last_net_io: Any = None
         self._prune_lock = threading.Lock()
@@ -449,7 +515,9 @@ class ResourceTracker(metaclass=Singleton):
             last_io=self._last_proc_io,
             elapsed=elapsed,
             effective_cpus=self._effective_cpus,
-            labels=self._worker_labels(),
+            labels=(labels := self._worker_labels()),
+            groups=self._worker_groups(labels),
+            handles=self._handles,
         )
         disk_io = psutil.disk_io_counters()
         net_io = psutil.net_io_counters()
@@ -499,6 +567,7 @@ class ResourceTracker(metaclass=Singleton):
             connections=tree.connections,
             children=tree.children,
             children_count=tree.children_count,
+            child_groups=tree.groups,
             active_jobs=active_jobs,
             queued_jobs=queued_jobs,
             is_paused=bool(is_paused),
@@ -557,6 +626,22 @@ class ResourceTracker(metaclass=Singleton):
             return labels
         return labels
 
+    def _worker_groups(self, labels: dict[int, str]) -> dict[int, str]:
+        groups: dict[int, str] = dict.fromkeys(labels, "download")
+        try:
+            from app.features.downloads.runtime.worker_pool import WorkerPool
+
+            groups.update(dict.fromkeys(WorkerPool.get_instance().pids(), "download"))
+        except Exception:
+            pass
+
+        try:
+            if (pool := Services.get_instance().get("ExtractorPool")) is not None:
+                groups.update(dict.fromkeys(pool.pids(), "extractor"))
+        except Exception:
+            pass
+        return groups
+
     def latest(self) -> dict[str, Any]:
         h = list(self._history)
         if not h:
@@ -569,7 +654,9 @@ class ResourceTracker(metaclass=Singleton):
             cutoff = time.time() - range_seconds
 
         if self._store:
-            stored: list[dict[str, Any]] = self._store.query(limit=900, since=cutoff)
+            stored: list[dict[str, Any]] = self._store.query(
+                limit=900, since=cutoff, interval=max(1, self._config.monitor_interval)
+            )
             if stored:
                 return stored
 
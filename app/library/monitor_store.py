@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 import time
 from pathlib import Path
 from typing import Any
@@ -29,23 +30,6 @@ CREATE TABLE IF NOT EXISTS resource_samples (
 );
 """
 
-MIGRATIONS: list[tuple[int, list[str]]] = [
-    (1, [CREATE_TABLE]),
-]
-
-PRUNE_SQL: str = "DELETE FROM resource_samples WHERE ts < ?"
-INSERT_SQL: str = """
-INSERT INTO resource_samples (
-    ts, process_cpu_percent, system_cpu_percent,
-    rss_mb, uss_mb, memory_percent,
-    process_read_bps, process_write_bps,
-    disk_read_bps, disk_write_bps,
-    network_recv_bps, network_sent_bps,
-    threads, open_files, connections,
-    active_jobs, queued_jobs, is_paused, children_count
-) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-"""
-
 COLUMNS: list[str] = [
     "ts",
     "process_cpu_percent",
@@ -68,17 +52,92 @@ COLUMNS: list[str] = [
     "children_count",
 ]
 
+METRICS: list[str] = COLUMNS[1:]
+"The sampled values, every column but ts."
+
+ROLLUPS: list[tuple[int, str, float]] = [
+    (60, "resource_rollup_1m", 7 * 86400),
+    (300, "resource_rollup_5m", 30 * 86400),
+    (3600, "resource_rollup_1h", 365 * 86400),
+]
+"The rollup resolutions in seconds, finest first, with their table and how many seconds they are kept."
+
+BATCH_SIZE: int = 20
+"Buffered samples are written once there are this many."
+
+BATCH_AGE: float = 120.0
+"Or once the oldest buffered sample is this many seconds old."
+
+
+def _rollup_table(table: str) -> str:
+    fields: str = ", ".join(f"{m} REAL, {m}_min REAL, {m}_max REAL" for m in METRICS)
+    return f"CREATE TABLE IF NOT EXISTS {table} (ts REAL PRIMARY KEY, samples INTEGER NOT NULL, {fields});"
+
+
+def _rollup_sql(table: str, source: str, resolution: int, raw: bool) -> str:
+    """
+    Aggregate the source rows from a bucket start on into the rollup table.
+
+    Raw samples are aggregated directly. Finer rollups are combined with their averages weighted by
+    sample count, so every resolution holds the same values aggregating the raw samples would give.
+    """
+    if raw:
+        weight: str = "count(*)"
+        fields: list[str] = [f"avg({m}), min({m}), max({m})" for m in METRICS]
+    else:
+        weight = "sum(samples)"
+        fields = [
+            f"sum({m} * samples) / nullif(sum(CASE WHEN {m} IS NULL THEN 0 ELSE samples END), 0), "
+            f"min({m}_min), max({m}_max)"
+            for m in METRICS
+        ]
+    columns: str = ", ".join(f"{m}, {m}_min, {m}_max" for m in METRICS)
+    bucket: str = f"CAST(ts / {resolution} AS INTEGER) * {resolution}"
+    return (
+        f"INSERT OR REPLACE INTO {table} (ts, samples, {columns}) "  # noqa: S608
+        f"SELECT {bucket} AS bucket, {weight}, {', '.join(fields)} FROM {source} "
+        "WHERE ts >= ? AND ts < ? GROUP BY bucket"
+    )
+
+
+MIGRATIONS: list[tuple[int, list[str]]] = [
+    (1, [CREATE_TABLE]),
+    (2, [_rollup_table(table) for _, table, _ in ROLLUPS]),
+]
+
+PRUNE_SQL: str = "DELETE FROM resource_samples WHERE ts < ?"
+INSERT_SQL: str = """
+INSERT OR REPLACE INTO resource_samples (
+    ts, process_cpu_percent, system_cpu_percent,
+    rss_mb, uss_mb, memory_percent,
+    process_read_bps, process_write_bps,
+    disk_read_bps, disk_write_bps,
+    network_recv_bps, network_sent_bps,
+    threads, open_files, connections,
+    active_jobs, queued_jobs, is_paused, children_count
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 def _row_to_dict(row: tuple) -> dict[str, Any]:
     return dict(zip(COLUMNS, row, strict=False))
 
 
 class MonitorStore:
-    """SQLite time-series store for resource samples."""
+    """
+    SQLite time-series store for resource samples.
+
+    Samples are buffered and written in batches. As they age they are aggregated into 1 minute,
+    5 minute and 1 hour rollups holding the average, minimum and maximum of every value, which are
+    kept long after the raw samples are pruned.
+    """
 
     def __init__(self, db_path: str):
         self._db_path: str = db_path
         self._conn: sqlite3.Connection | None = None
+        self._buffer: list[tuple[Any, ...]] = []
+        self._lock = threading.RLock()
+        "Samples are written by the tracker thread and read from the event loop."
 
     def open(self) -> None:
         Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -105,37 +164,99 @@ class MonitorStore:
                 raise
 
     def close(self) -> None:
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        with self._lock:
+            if self._conn:
+                self.flush()
+                self._conn.close()
+                self._conn = None
 
     def insert(self, sample: dict[str, Any]) -> None:
         if not self._conn:
             return
-        values = tuple(sample.get(col) for col in COLUMNS)
-        self._conn.execute(INSERT_SQL, values)
-        self._conn.commit()
+        with self._lock:
+            self._buffer.append(tuple(sample.get(col) for col in COLUMNS))
+            if len(self._buffer) >= BATCH_SIZE or time.time() - (self._buffer[0][0] or 0) >= BATCH_AGE:
+                self.flush()
+
+    def flush(self, now: float | None = None) -> None:
+        """
+        Write the buffered samples, then roll up every bucket that closed since the last rollup.
+
+        The newest bucket of each rollup is recomputed, so samples arriving late are not lost.
+        """
+        with self._lock:
+            if not self._conn:
+                return
+            now = time.time() if now is None else now
+            with self._conn:
+                if self._buffer:
+                    self._conn.executemany(INSERT_SQL, self._buffer)
+                    self._buffer.clear()
+
+                source: str = "resource_samples"
+                for resolution, table, _ in ROLLUPS:
+                    last: float | None = self._conn.execute(f"SELECT MAX(ts) FROM {table}").fetchone()[0]  # noqa: S608
+                    closed: float = (now // resolution) * resolution
+                    start: float = last if last is not None else 0.0
+                    if start < closed:
+                        self._conn.execute(
+                            _rollup_sql(table, source, resolution, "resource_samples" == source), (start, closed)
+                        )
+                    source = table
 
-    def query(self, limit: int = 900, since: float | None = None) -> list[dict[str, Any]]:
+    def query(
+        self, limit: int = 900, since: float | None = None, interval: float | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Read samples, oldest first.
+
+        When reading a range with the sampling interval known, the raw samples are used if the range
+        holds no more than limit of them, otherwise the finest rollup that does. Rollup rows carry the
+        average under each value name, plus its min and max under '<name>_min' and '<name>_max'.
+        """
         if not self._conn:
             return []
-        if since is not None:
+        with self._lock:
+            self.flush()
+            if since is None:
+                rows = self._conn.execute(
+                    "SELECT * FROM resource_samples ORDER BY ts DESC LIMIT ?",
+                    (limit,),
+                ).fetchall()
+                rows.reverse()
+                return [_row_to_dict(r) for r in rows]
+
+            span: float = max(0.0, time.time() - since)
+            if interval and span / interval > limit:
+                for resolution, table, _ in ROLLUPS:
+                    if span / resolution <= limit or table == ROLLUPS[-1][1]:
+                        cursor = self._conn.execute(
+                            f"SELECT * FROM {table} WHERE ts >= ? ORDER BY ts ASC LIMIT ?",  # noqa: S608
+                            ((since // resolution) * resolution, limit),
+                        )
+                        names: list[str] = [column[0] for column in cursor.description]
+                        return [
+                            {**dict(zip(names, row, strict=True)), "resolution": resolution}
+                            for row in cursor.fetchall()
+                        ]
+
             rows = self._conn.execute(
                 "SELECT * FROM resource_samples WHERE ts >= ? ORDER BY ts ASC LIMIT ?",
                 (since, limit),
             ).fetchall()
-        else:
-            rows = self._conn.execute(
-                "SELECT * FROM resource_samples ORDER BY ts DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
-            rows.reverse()
-        return [_row_to_dict(r) for r in rows]
+            return [_row_to_dict(r) for r in rows]
 
     def prune(self, retention_hours: float) -> int:
         if not self._conn:
             return 0
-        cutoff = time.time() - (retention_hours * 3600)
-        cursor = self._conn.execute(PRUNE_SQL, (cutoff,))
-        self._conn.commit()
-        return cursor.rowcount
+        with self._lock:
+            self.flush()
+            now: float = time.time()
+            cursor = self._conn.execute(PRUNE_SQL, (now - (retention_hours * 3600),))
+            for _, table, keep in ROLLUPS:
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE ts < ?",  # noqa: S608
+                    (now - max(keep, retention_hours * 3600),),
+                )
+            self._conn.commit()
+            return cursor.rowcount
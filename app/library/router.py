@@ -5,6 +5,7 @@ from functools import wraps
 from typing import Any
 
 from app.library.logging import get_logger
+from app.library.Services import injection_plan
 
 LOG = get_logger()
 
@@ -109,6 +110,8 @@ def route(
         async def wrapper(*args, **kwargs):
             return await func(*args, **kwargs)
 
+        injection_plan(wrapper, registering=True)
+
         for m in methods:
             route_name = name or make_route_name(m, path)
             route_type: str = RouteType.SOCKET if RouteType.SOCKET == m else RouteType.HTTP
@@ -177,6 +180,7 @@ def add_route(
 
     """
     methods = [method] if isinstance(method, (str, RouteType)) else method
+    injection_plan(handler, registering=True)
 
     for m in methods:
         route_name: str = name or make_route_name(m, path)
@@ -1,17 +1,33 @@
 import os
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
 from urllib.parse import quote_plus
 
 from aiohttp import web
-from sqlalchemy import text
+from sqlalchemy import Select, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.pool import NullPool
 
 from app.library.Events import EventBus, Events
 from app.library.logging import get_logger
+from app.library.Scheduler import Scheduler
 from app.library.Services import Services
 from app.library.Singleton import ThreadSafe
 
 LOG = get_logger()
 
+SYNCHRONOUS_MODES: tuple[str, ...] = ("OFF", "NORMAL", "FULL", "EXTRA")
+TEMP_STORE_MODES: tuple[str, ...] = ("DEFAULT", "FILE", "MEMORY")
+
+VACUUM_TIME_LIMIT: float = 4.0
+"Seconds a scheduled full VACUUM may hold the write lock, below the busy_timeout writers wait for it."
+
+type VacuumHook = Callable[[AsyncConnection], Awaitable[Any]]
+
 
 def _memory_db_url(db_path: str) -> str:
     if db_path == ":memory:":
@@ -20,6 +36,78 @@ def _memory_db_url(db_path: str) -> str:
     return f"sqlite+aiosqlite:///file:{quote_plus(memory_name)}?mode=memory&cache=shared&uri=true"
 
 
+def _pragmas(config: Any) -> list[str]:
+    synchronous: str = str(config.db_synchronous).upper()
+    if synchronous not in SYNCHRONOUS_MODES:
+        msg: str = f"db_synchronous must be one of {', '.join(SYNCHRONOUS_MODES)}, got '{config.db_synchronous}'."
+        raise ValueError(msg)
+
+    temp_store: str = str(config.db_temp_store).upper()
+    if temp_store not in TEMP_STORE_MODES:
+        msg: str = f"db_temp_store must be one of {', '.join(TEMP_STORE_MODES)}, got '{config.db_temp_store}'."
+        raise ValueError(msg)
+
+    return [
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA foreign_keys=ON",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA temp_store={temp_store}",
+        f"PRAGMA mmap_size={max(0, int(config.db_mmap_size))}",
+        f"PRAGMA cache_size=-{max(0, int(config.db_cache_size))}",
+    ]
+
+
+def _on_connect(engine: AsyncEngine, pragmas: list[str]) -> None:
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_pragmas(dbapi_connection, _) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+class RoutingSession(Session):
+    """
+    Session sending reads to the reader pool and writes to the writer connection.
+
+    Once a transaction writes, every following statement of that transaction goes to the writer as well,
+    so it reads its own uncommitted changes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs: Any) -> Engine:
+        binds: tuple[Engine, Engine] | None = self.info.get("binds")
+        if not binds:
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+        writer, reader = binds
+        if self.info.get("writing") or self._flushing or not isinstance(clause, Select):
+            self.info["writing"] = True
+            return writer
+
+        return reader
+
+
+def _downloads_idle() -> bool:
+    queue = Services.get_instance().get("queue")
+    pool = getattr(queue, "pool", None)
+    return pool is None or not pool.get_active_downloads()
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _end_writing(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop("writing", None)
+
+
 class SqliteStore(metaclass=ThreadSafe):
     @staticmethod
     def get_instance(db_path: str | None = None) -> "SqliteStore":
@@ -28,8 +116,12 @@ class SqliteStore(metaclass=ThreadSafe):
     def __init__(self, db_path: str | None):
         self._db_path = db_path
         self._engine: AsyncEngine | None = None
-        self._conn: AsyncConnection | None = None
+        "The engine used for writes, holding a single connection when reads are split off."
+        self._reader: AsyncEngine | None = None
+        "The read-only connection pool, the same engine as the writer unless reads are split off."
         self._sessionmaker: async_sessionmaker[AsyncSession] | None = None
+        self._maintenance: dict[str, Any] = {"last_run": None, "last_skipped": None}
+        self._vacuum_hooks: list[VacuumHook] = []
 
     def attach(self, app: web.Application) -> None:
         Services.get_instance().add("sqlite_store", self)
@@ -39,6 +131,11 @@ class SqliteStore(metaclass=ThreadSafe):
 
         EventBus.get_instance().subscribe(Events.STARTED, handle_event, "SqliteStore.get_connection")
         app.on_shutdown.append(self.on_shutdown)
+        Scheduler.get_instance().add(
+            timer="*/15 * * * *",
+            func=self.maintenance,
+            id=f"{type(self).__name__}.{type(self).maintenance.__name__}",
+        )
 
     async def on_shutdown(self, _: web.Application) -> None:
         await self.close()
@@ -56,69 +153,281 @@ class SqliteStore(metaclass=ThreadSafe):
             raise RuntimeError(msg)
         return self._sessionmaker
 
+    @staticmethod
+    def _bind_params(query: str, params: dict | tuple | None) -> tuple[str, dict]:
+        if not isinstance(params, tuple):
+            return query, params or {}
+
+        if query.count("?") != len(params):
+            msg = "Parameter count mismatch"
+            raise ValueError(msg)
+
+        values = {f"p{i}": value for i, value in enumerate(params)}
+        for i in range(len(params)):
+            query = query.replace("?", f":p{i}", 1)
+
+        return query, values
+
     async def execute_raw(self, query: str, params: dict | tuple | None = None) -> None:
-        conn = await self.get_connection()
-        if isinstance(params, tuple):
-            if query.count("?") != len(params):
-                msg = "Parameter count mismatch"
-                raise ValueError(msg)
-            values = {f"p{i}": value for i, value in enumerate(params)}
-            for i in range(len(params)):
-                query = query.replace("?", f":p{i}", 1)
+        engine: AsyncEngine = await self.get_connection()
+        query, values = self._bind_params(query, params)
+        async with engine.begin() as conn:
             await conn.execute(text(query), values)
-        else:
-            await conn.execute(text(query), params or {})
-        await conn.commit()
 
     async def fetch_raw(self, query: str, params: dict | tuple | None = None):
-        conn = await self.get_connection()
-        if isinstance(params, tuple):
-            if query.count("?") != len(params):
-                msg = "Parameter count mismatch"
-                raise ValueError(msg)
-            values = {f"p{i}": value for i, value in enumerate(params)}
-            for i in range(len(params)):
-                query = query.replace("?", f":p{i}", 1)
+        await self.get_connection()
+        query, values = self._bind_params(query, params)
+        async with self._reader.connect() as conn:
             result = await conn.execute(text(query), values)
-        else:
-            result = await conn.execute(text(query), params or {})
-        return result.mappings().all()
+            return result.mappings().all()
+
+    def maintenance_status(self) -> dict[str, Any]:
+        return dict(self._maintenance)
+
+    def add_vacuum_hook(self, hook: VacuumHook) -> None:
+        """
+        Run a hook on the maintenance connection after every full VACUUM.
+
+        Args:
+            hook (VacuumHook): Called with the connection, e.g. to rebuild an index that follows rowids,
+                as VACUUM may renumber them.
+
+        """
+        if hook not in self._vacuum_hooks:
+            self._vacuum_hooks.append(hook)
+
+    def _maintenance_engine(self) -> tuple[AsyncEngine, bool]:
+        """
+        Get an engine for maintenance that does not take connections from the session pools.
+
+        Returns:
+            tuple[AsyncEngine, bool]: The engine and whether it is owned, and must be disposed, by the caller.
+
+        """
+        if not self._engine or not self._db_path or self._db_path.startswith(":memory"):
+            return self._engine, False
+
+        from app.library.config import Config
+
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{self._db_path}",
+            echo=False,
+            poolclass=NullPool,
+            connect_args={"check_same_thread": False},
+        )
+        _on_connect(engine, _pragmas(Config.get_instance()))
+        return engine, True
+
+    async def _full_vacuum(self, conn: AsyncConnection, limit: float | None) -> bool:
+        """
+        Switch the file to incremental auto vacuum, which takes one full VACUUM, then run the vacuum hooks.
+
+        Args:
+            conn (AsyncConnection): The maintenance connection.
+            limit (float | None): Seconds after which the VACUUM is interrupted, None for no limit.
+
+        Returns:
+            bool: True if the VACUUM finished, False if it was interrupted.
+
+        """
+        driver = (await conn.get_raw_connection()).driver_connection
+        if limit:
+            deadline: float = time.monotonic() + limit
+            await driver.set_progress_handler(lambda: time.monotonic() > deadline, 1000)
+
+        try:
+            await conn.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+            await conn.execute(text("VACUUM"))
+        except OperationalError as exc:
+            if "interrupted" not in str(exc):
+                raise
+            return False
+        finally:
+            if limit:
+                await driver.set_progress_handler(None, 0)
+
+        for hook in list(self._vacuum_hooks):
+            await hook(conn)
+
+        return True
+
+    async def maintenance(self, force: bool = False) -> dict[str, Any]:
+        """
+        Keep the database file healthy, running only while no download is active unless forced.
+
+        - Refreshes query planner statistics, a full ANALYZE the first time and PRAGMA optimize after.
+        - Reclaims free pages once they pass db_maintenance_freelist percent of the file. The first time
+          this switches the file to incremental auto vacuum, which needs one full VACUUM followed by the
+          vacuum hooks. Unless forced, it is deferred if downloads started meanwhile and interrupted after
+          VACUUM_TIME_LIMIT seconds, so writers waiting on the lock do not time out.
+        - Checkpoints and truncates the WAL file once it passes db_maintenance_wal_mb.
+
+        Maintenance runs on its own connection, so it never holds one the sessions are waiting for.
+
+        Args:
+            force (bool): Run every step now, regardless of thresholds and activity.
+
+        Returns:
+            dict: The maintenance status, also exposed through diagnostics.
+
+        """
+        if not self._engine:
+            return self.maintenance_status()
+
+        if not force and not _downloads_idle():
+            self._maintenance["last_skipped"] = int(time.time())
+            return self.maintenance_status()
+
+        from app.library.config import Config
+
+        config = Config.get_instance()
+        started: float = time.perf_counter()
+        result: dict[str, Any] = {"checkpoint": None, "analyze": None, "vacuum": None, "error": None}
+
+        engine, owned = self._maintenance_engine()
+        try:
+            async with engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+                step: float = time.perf_counter()
+                await conn.execute(text("PRAGMA analysis_limit=400"))
+                stats = await conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"))
+                analyzed: bool = force or stats.first() is None
+                await conn.execute(text("ANALYZE" if analyzed else "PRAGMA optimize"))
+                result["analyze"] = {
+                    "mode": "analyze" if analyzed else "optimize",
+                    "duration_ms": round((time.perf_counter() - step) * 1000, 2),
+                }
+
+                page_count: int = (await conn.execute(text("PRAGMA page_count"))).scalar() or 0
+                freelist: int = (await conn.execute(text("PRAGMA freelist_count"))).scalar() or 0
+                ratio: float = freelist / page_count if page_count else 0.0
+                threshold: int = config.db_maintenance_freelist
+                if freelist > 0 and threshold > 0 and (force or ratio * 100 >= threshold):
+                    step = time.perf_counter()
+                    interrupted: bool = False
+                    if 2 == (await conn.execute(text("PRAGMA auto_vacuum"))).scalar():
+                        mode = "incremental"
+                        await conn.execute(text("PRAGMA incremental_vacuum"))
+                    elif not force and not _downloads_idle():
+                        mode = "deferred"
+                    else:
+                        mode = "full"
+                        interrupted = not await self._full_vacuum(conn, None if force else VACUUM_TIME_LIMIT)
+                        if interrupted:
+                            LOG.warning(
+                                "Full database VACUUM did not finish within '%ss'; it will be retried.",
+                                VACUUM_TIME_LIMIT,
+                            )
+
+                    remaining: int = (await conn.execute(text("PRAGMA freelist_count"))).scalar() or 0
+                    result["vacuum"] = {
+                        "mode": mode,
+                        "interrupted": interrupted,
+                        "freelist_pages": freelist,
+                        "freelist_ratio": round(ratio, 4),
+                        "reclaimed_pages": freelist - remaining,
+                        "duration_ms": round((time.perf_counter() - step) * 1000, 2),
+                    }
+
+                wal_bytes: int = _file_size(f"{self._db_path}-wal")
+                if force or wal_bytes >= max(1, config.db_maintenance_wal_mb) * 1024 * 1024:
+                    step = time.perf_counter()
+                    busy, log, checkpointed = (await conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))).one()
+                    result["checkpoint"] = {
+                        "wal_bytes": wal_bytes,
+                        "busy": bool(busy),
+                        "log_frames": log,
+                        "checkpointed_frames": checkpointed,
+                        "duration_ms": round((time.perf_counter() - step) * 1000, 2),
+                    }
+
+                result["page_count"] = (await conn.execute(text("PRAGMA page_count"))).scalar() or 0
+                result["freelist_count"] = (await conn.execute(text("PRAGMA freelist_count"))).scalar() or 0
+                result["wal_bytes"] = _file_size(f"{self._db_path}-wal")
+        except Exception as exc:
+            LOG.exception("Database maintenance failed.")
+            result["error"] = str(exc)
+        finally:
+            if owned:
+                await engine.dispose()
+
+        result["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        self._maintenance.update(result, last_run=int(time.time()))
+        if not result["error"]:
+            LOG.debug("Database maintenance finished in '%sms'.", result["duration_ms"])
+
+        return self.maintenance_status()
 
     async def close(self) -> None:
-        if self._conn:
-            await self._conn.close()
-            self._conn = None
+        if self._reader and self._reader is not self._engine:
+            await self._reader.dispose()
+        self._reader = None
         if self._engine:
             await self._engine.dispose()
             self._engine = None
         self._sessionmaker = None
 
-    async def get_connection(self) -> AsyncConnection:
-        if self._conn:
-            return self._conn
+    async def get_connection(self) -> AsyncEngine:
+        """
+        Open the database, migrating it on first use.
+
+        Reads and writes share one pooled engine, unless db_read_connections is set for a file database.
+        That splits them into a writer engine holding a single connection, which every write session
+        waits for in turn, and a bounded pool of read-only connections reading from WAL snapshots.
+
+        Returns:
+            AsyncEngine: The engine used for writes.
+
+        """
+        if self._engine:
+            return self._engine
         if not self._db_path:
             msg = "No database path specified for SqliteStore."
             raise RuntimeError(msg)
 
         from app.library import migrate
+        from app.library.config import Config
         from app.main import ROOT_PATH
 
-        if self._db_path.startswith(":memory"):
-            db_url = _memory_db_url(self._db_path)
+        config = Config.get_instance()
+        pragmas: list[str] = _pragmas(config)
+        in_memory: bool = self._db_path.startswith(":memory")
+        connect_args: dict[str, Any] = {"check_same_thread": False, "uri": in_memory}
+
+        readers: int = max(0, int(config.db_read_connections))
+        if in_memory:
+            engine = create_async_engine(_memory_db_url(self._db_path), echo=False, connect_args=connect_args)
+            _on_connect(engine, pragmas)
+            reader = engine
         else:
             os.makedirs(os.path.dirname(self._db_path) or ".", exist_ok=True)
             db_url = f"sqlite+aiosqlite:///{self._db_path}"
-        self._engine = create_async_engine(
-            db_url, echo=False, connect_args={"check_same_thread": False, "uri": self._db_path.startswith(":memory")}
-        )
-        self._conn = await self._engine.connect()
-        version = await migrate.get_version(self._conn)
-        await migrate.upgrade(self._conn, ROOT_PATH / "migrations")
+            pool: dict[str, int] = {"pool_size": 1, "max_overflow": 0} if readers else {}
+            engine = create_async_engine(db_url, echo=False, connect_args=connect_args, **pool)
+            _on_connect(engine, ["PRAGMA journal_mode=wal", *pragmas])
+            reader = engine
+            if readers:
+                reader = create_async_engine(
+                    db_url, echo=False, connect_args=connect_args, pool_size=readers, max_overflow=0
+                )
+                _on_connect(reader, [*pragmas, "PRAGMA query_only=ON"])
+
+        async with engine.connect() as conn:
+            version = await migrate.get_version(conn)
+            await migrate.upgrade(conn, ROOT_PATH / "migrations")
+            await conn.commit()
+
         if version:
             LOG.debug("Database schema version is '%s'.", version)
-        await self._conn.execute(text("PRAGMA journal_mode=wal"))
-        await self._conn.execute(text("PRAGMA busy_timeout=5000"))
-        await self._conn.execute(text("PRAGMA foreign_keys=ON"))
-        await self._conn.commit()
-        self._sessionmaker = async_sessionmaker(bind=self._engine, class_=AsyncSession, expire_on_commit=False)
-        return self._conn
+
+        self._engine = engine
+        self._reader = reader
+        self._sessionmaker = async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            expire_on_commit=False,
+            info={"binds": (engine.sync_engine, reader.sync_engine)} if reader is not engine else None,
+        )
+        return engine
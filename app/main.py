@@ -27,8 +27,10 @@ from app.features.downloads.repository import DownloadsRepository
 from app.features.downloads.runtime.queue_manager import DownloadQueue
 from app.features.notifications.service import Notifications
 from app.features.presets.deps import get_presets_repo
+from app.features.streaming.library.segment_encoders import EncoderCapabilities
 from app.features.tasks.definitions.deps import get_task_definitions_repo
 from app.features.tasks.service import Tasks
+from app.features.ytdlp.extract_cache import ExtractCache
 from app.features.ytdlp.extractor import ExtractorPool
 from app.library.BackgroundWorker import BackgroundWorker
 from app.library.cache import Cache
@@ -38,6 +40,7 @@ from app.library.HttpAPI import HttpAccessLogger, HttpAPI
 from app.library.HttpSocket import HttpSocket
 from app.library.httpx_client import close_shared_clients
 from app.library.logging import get_logger
+from app.library.loop_monitor import LoopMonitor
 from app.library.monitor import ResourceTracker
 from app.library.Scheduler import Scheduler
 from app.library.Services import Services
@@ -148,9 +151,12 @@ class Main:
         DLFields.get_instance().attach(self._app)
         get_task_definitions_repo().attach(self._app)
         ExtractorPool.get_instance().attach(self._app)
+        ExtractCache.get_instance().attach(self._app)
         DownloadQueue.get_instance().attach(self._app)
         UpdateChecker.get_instance().attach(self._app)
         ResourceTracker.get_instance().attach(self._app)
+        LoopMonitor.get_instance().attach(self._app)
+        EncoderCapabilities.get_instance().attach(self._app)
         self._app.on_shutdown.append(close_shared_clients)
 
         EventBus.get_instance().emit(
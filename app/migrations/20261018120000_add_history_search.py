@@ -0,0 +1,108 @@
+"""
+This module contains a db migration.
+
+Migration Name: add_history_search
+Migration Version: 20261018120000
+"""
+
+from sqlalchemy import text
+
+
+async def upgrade(c):
+    """
+    Add a full-text search index over the history.
+
+    The index is an external-content FTS5 table reading from a view that extracts the searchable
+    fields from the JSON data, so the text is not stored twice. Triggers keep it in sync with every
+    write to the history table, including bulk deletes, and updates only touch the index when one
+    of the searchable fields changed.
+    """
+    sql: list[str] = [
+        """
+        CREATE VIEW IF NOT EXISTS "history_search_source" AS
+        SELECT
+            "rowid" AS "rid",
+            json_extract("data", '$.title') AS "title",
+            trim(
+                coalesce(json_extract("data", '$.extras.uploader'), '')
+                || ' '
+                || coalesce(json_extract("data", '$.extras.channel'), '')
+            ) AS "channel",
+            "url" AS "url",
+            json_extract("data", '$.filename') AS "filename",
+            json_extract("data", '$.preset') AS "preset"
+        FROM "history";
+        """,
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS "history_search" USING fts5(
+            "title", "channel", "url", "filename", "preset",
+            content='history_search_source',
+            content_rowid='rid',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        );
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "history_search_insert" AFTER INSERT ON "history" BEGIN
+            INSERT INTO "history_search" ("rowid", "title", "channel", "url", "filename", "preset")
+            SELECT "rid", "title", "channel", "url", "filename", "preset"
+            FROM "history_search_source" WHERE "rid" = new."rowid";
+        END;
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "history_search_delete" BEFORE DELETE ON "history" BEGIN
+            INSERT INTO "history_search" ("history_search", "rowid", "title", "channel", "url", "filename", "preset")
+            SELECT 'delete', "rid", "title", "channel", "url", "filename", "preset"
+            FROM "history_search_source" WHERE "rid" = old."rowid";
+        END;
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "history_search_update_before" BEFORE UPDATE OF "url", "data" ON "history"
+        WHEN old."url" IS NOT new."url"
+            OR json_extract(old."data", '$.title') IS NOT json_extract(new."data", '$.title')
+            OR json_extract(old."data", '$.extras.uploader') IS NOT json_extract(new."data", '$.extras.uploader')
+            OR json_extract(old."data", '$.extras.channel') IS NOT json_extract(new."data", '$.extras.channel')
+            OR json_extract(old."data", '$.filename') IS NOT json_extract(new."data", '$.filename')
+            OR json_extract(old."data", '$.preset') IS NOT json_extract(new."data", '$.preset')
+        BEGIN
+            INSERT INTO "history_search" ("history_search", "rowid", "title", "channel", "url", "filename", "preset")
+            SELECT 'delete', "rid", "title", "channel", "url", "filename", "preset"
+            FROM "history_search_source" WHERE "rid" = old."rowid";
+        END;
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "history_search_update_after" AFTER UPDATE OF "url", "data" ON "history"
+        WHEN old."url" IS NOT new."url"
+            OR json_extract(old."data", '$.title') IS NOT json_extract(new."data", '$.title')
+            OR json_extract(old."data", '$.extras.uploader') IS NOT json_extract(new."data", '$.extras.uploader')
+            OR json_extract(old."data", '$.extras.channel') IS NOT json_extract(new."data", '$.extras.channel')
+            OR json_extract(old."data", '$.filename') IS NOT json_extract(new."data", '$.filename')
+            OR json_extract(old."data", '$.preset') IS NOT json_extract(new."data", '$.preset')
+        BEGIN
+            INSERT INTO "history_search" ("rowid", "title", "channel", "url", "filename", "preset")
+            SELECT "rid", "title", "channel", "url", "filename", "preset"
+            FROM "history_search_source" WHERE "rid" = new."rowid";
+        END;
+        """,
+        """INSERT INTO "history_search" ("history_search") VALUES ('rebuild');""",
+    ]
+    for sql_stmt in sql:
+        await c.execute(text(sql_stmt))
+
+    await c.commit()
+
+
+async def downgrade(c):
+    """
+    Remove the full-text search index.
+    """
+    sql: list[str] = [
+        'DROP TRIGGER IF EXISTS "history_search_update_after";',
+        'DROP TRIGGER IF EXISTS "history_search_update_before";',
+        'DROP TRIGGER IF EXISTS "history_search_delete";',
+        'DROP TRIGGER IF EXISTS "history_search_insert";',
+        'DROP TABLE IF EXISTS "history_search";',
+        'DROP VIEW IF EXISTS "history_search_source";',
+    ]
+    for sql_stmt in sql:
+        await c.execute(text(sql_stmt))
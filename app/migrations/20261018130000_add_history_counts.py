@@ -0,0 +1,76 @@
+"""
+This module contains a db migration.
+
+Migration Name: add_history_counts
+Migration Version: 20261018130000
+"""
+
+from sqlalchemy import text
+
+
+async def upgrade(c):
+    """
+    Add per type and status item counters, and an index for keyset pagination.
+
+    Counters are kept in sync by triggers on every write to the history table, so totals can be
+    read without scanning it. Items without a status are counted under an empty status.
+    """
+    sql: list[str] = [
+        """
+        CREATE TABLE IF NOT EXISTS "history_counts" (
+            "type" TEXT NOT NULL,
+            "status" TEXT NOT NULL,
+            "total" INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY ("type", "status")
+        );
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "history_counts_insert" AFTER INSERT ON "history" BEGIN
+            INSERT INTO "history_counts" ("type", "status", "total")
+            VALUES (new."type", ifnull(json_extract(new."data", '$.status'), ''), 1)
+            ON CONFLICT ("type", "status") DO UPDATE SET "total" = "total" + 1;
+        END;
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "history_counts_delete" AFTER DELETE ON "history" BEGIN
+            UPDATE "history_counts" SET "total" = "total" - 1
+            WHERE "type" = old."type" AND "status" = ifnull(json_extract(old."data", '$.status'), '');
+        END;
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "history_counts_update" AFTER UPDATE OF "type", "data" ON "history"
+        WHEN old."type" IS NOT new."type"
+            OR json_extract(old."data", '$.status') IS NOT json_extract(new."data", '$.status')
+        BEGIN
+            UPDATE "history_counts" SET "total" = "total" - 1
+            WHERE "type" = old."type" AND "status" = ifnull(json_extract(old."data", '$.status'), '');
+            INSERT INTO "history_counts" ("type", "status", "total")
+            VALUES (new."type", ifnull(json_extract(new."data", '$.status'), ''), 1)
+            ON CONFLICT ("type", "status") DO UPDATE SET "total" = "total" + 1;
+        END;
+        """,
+        """
+        INSERT INTO "history_counts" ("type", "status", "total")
+        SELECT "type", ifnull(json_extract("data", '$.status'), ''), count(*) FROM "history" GROUP BY 1, 2;
+        """,
+        'CREATE INDEX IF NOT EXISTS "history_type_created" ON "history" ("type", "created_at", "id");',
+    ]
+    for sql_stmt in sql:
+        await c.execute(text(sql_stmt))
+
+    await c.commit()
+
+
+async def downgrade(c):
+    """
+    Remove the counters and the keyset pagination index.
+    """
+    sql: list[str] = [
+        'DROP INDEX IF EXISTS "history_type_created";',
+        'DROP TRIGGER IF EXISTS "history_counts_update";',
+        'DROP TRIGGER IF EXISTS "history_counts_delete";',
+        'DROP TRIGGER IF EXISTS "history_counts_insert";',
+        'DROP TABLE IF EXISTS "history_counts";',
+    ]
+    for sql_stmt in sql:
+        await c.execute(text(sql_stmt))
@@ -1,6 +1,12 @@
 import asyncio
+import concurrent.futures
+import contextlib
+import hashlib
+import threading
+from collections.abc import AsyncIterator, Iterable
+from email.utils import formatdate
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote_plus
 
 from aiohttp import web
@@ -17,8 +23,17 @@ from app.library.logging import get_logger
 from app.library.router import route
 from app.library.Utils import delete_dir, get_file, get_file_sidecar, get_files, get_mime_type, move_file, rename_file
 
+if TYPE_CHECKING:
+    from zipstream import ZipStream
+
 LOG = get_logger()
 
+ZIP_QUEUE_SIZE: int = 16
+"Chunks the zip worker thread may run ahead of the client before it waits."
+
+ZIP_TOKEN_TTL: int = 600
+"Seconds a download token stays valid, renewed on every request so interrupted downloads can resume."
+
 
 @route("GET", "api/file/ffprobe/{file:.*}", "ffprobe")
 async def get_ffprobe(request: Request, config: Config, encoder: Encoder, app: web.Application) -> Response:
@@ -711,7 +726,7 @@ async def prepare_zip_file(request: Request, config: Config, cache: Cache):
 
     token = str(uuid.uuid4())
 
-    cache.set(f"download:{token}", files, ttl=600)
+    cache.set(f"download:{token}", files, ttl=ZIP_TOKEN_TTL)
 
     return web.json_response(
         data={"token": token, "files": [str(f.relative_to(config.download_path)) for f in files]},
@@ -719,6 +734,77 @@ async def prepare_zip_file(request: Request, config: Config, cache: Cache):
     )
 
 
+def _zip_archive(files: list[Path], root: Path) -> tuple["ZipStream", str]:
+    """
+    Build the archive for a download token.
+
+    Entries are stored, not deflated: media is already compressed, and stored entries let the archive
+    size be known up front. The entry order is the token's file order, so the same files always produce
+    the same bytes, which is what lets a range request resume an interrupted download.
+
+    Returns:
+        tuple[ZipStream, str]: The sized archive, and an ETag derived from each entry's name, size and mtime.
+
+    """
+    from zipstream import ZipStream
+
+    zs = ZipStream(sized=True)
+    digest = hashlib.sha1(usedforsecurity=False)
+    for file in dict.fromkeys(files):
+        name: str = file.relative_to(root).as_posix()
+        stat = file.stat()
+        digest.update(f"{name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        zs.add_path(str(file), name)
+
+    return zs, f'"{digest.hexdigest()}"'
+
+
+async def _iterate_in_thread(chunks: Iterable[bytes], start: int, stop: int) -> AsyncIterator[bytes]:
+    """
+    Iterate a blocking byte stream in a worker thread, yielding the bytes in [start, stop).
+
+    The thread hands chunks over through a bounded queue, so it never runs more than ZIP_QUEUE_SIZE chunks
+    ahead of the client. Leaving the iteration early stops the thread at its next chunk.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[bytes | BaseException | None] = asyncio.Queue(maxsize=ZIP_QUEUE_SIZE)
+    stopped = threading.Event()
+
+    def put(item: bytes | BaseException | None) -> bool:
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while not stopped.is_set():
+            try:
+                future.result(timeout=0.5)
+                return True
+            except concurrent.futures.TimeoutError:
+                continue
+        future.cancel()
+        return False
+
+    def produce() -> None:
+        position: int = 0
+        try:
+            for chunk in chunks:
+                end: int = position + len(chunk)
+                if end > start and not put(chunk[max(0, start - position) : stop - position]):
+                    return
+                position = end
+                if position >= stop:
+                    break
+            put(None)
+        except Exception as e:
+            put(e)
+
+    threading.Thread(target=produce, name="zip-stream", daemon=True).start()
+    try:
+        while (item := await queue.get()) is not None:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
+
 @route("GET", "api/file/download/{token}", "browser.download.stream")
 async def stream_zip_download(request: Request, config: Config, cache: Cache) -> Response | web.StreamResponse:
     token: str | None = request.match_info.get("token")
@@ -737,34 +823,62 @@ async def stream_zip_download(request: Request, config: Config, cache: Cache) ->
             "Invalid or expired download token.", code="BAD_REQUEST", status=web.HTTPBadRequest.status_code
         )
 
+    cache.set(f"download:{token}", files, ttl=ZIP_TOKEN_TTL)
     files: list[Path] = [p for p in files if p.is_file() and p.exists()]
 
     if len(files) < 1:
         return api_error_response("No valid files.", code="BAD_REQUEST", status=web.HTTPBadRequest.status_code)
 
-    from zipstream import ZipStream
+    zs, etag = await asyncio.to_thread(_zip_archive, files, Path(config.download_path).resolve())
+    total: int = len(zs)
+    headers: dict[str, str] = {
+        "Content-Type": "application/zip",
+        "Content-Disposition": f'attachment; filename="{token}.zip"',
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Last-Modified": formatdate(zs.last_modified.timestamp(), usegmt=True),
+    }
+
+    start, stop, status = 0, total, web.HTTPOk.status_code
+    requested: slice | None = None
+    if "Range" in request.headers and request.headers.get("If-Range", etag) == etag:
+        with contextlib.suppress(ValueError):
+            # An unparseable Range header is ignored and the whole archive is sent.
+            requested = request.http_range
+
+    if requested is not None:
+        if requested.start is not None and requested.start < 0:
+            start = max(0, total + requested.start)
+        else:
+            start = requested.start or 0
+            stop = min(total, requested.stop) if requested.stop is not None else total
+
+        if start >= stop:
+            return web.Response(
+                status=web.HTTPRequestRangeNotSatisfiable.status_code,
+                headers={"Content-Range": f"bytes */{total}", "ETag": etag},
+            )
 
-    rootPath = Path(config.download_path).resolve()
-    zs = ZipStream()
-    for file in files:
-        zs.add_path(str(file), str(file.relative_to(rootPath)))
-
-    response = web.StreamResponse(
-        status=200,
-        headers={
-            "Content-Type": "application/zip",
-            "Content-Disposition": f'attachment; filename="{token}.zip"',
-        },
-    )
+        status = web.HTTPPartialContent.status_code
+        headers["Content-Range"] = f"bytes {start}-{stop - 1}/{total}"
+
+    response = web.StreamResponse(status=status, headers=headers)
+    response.content_length = stop - start
     await response.prepare(request)
 
     try:
         LOG.info(
             "Started streaming a ZIP download with %d file(s).",
             len(files),
-            extra={"route": "browser.download.stream", "token": token, "file_count": len(files)},
+            extra={
+                "route": "browser.download.stream",
+                "token": token,
+                "file_count": len(files),
+                "size": total,
+                "offset": start,
+            },
         )
-        for chunk in zs:
+        async for chunk in _iterate_in_thread(zs, start, stop):
             if request.transport is None or request.transport.is_closing():
                 LOG.info(
                     "Stopped streaming the ZIP download because the client disconnected.",
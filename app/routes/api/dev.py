@@ -7,6 +7,7 @@ from app.features.core.utils import api_error_response
 from app.library.config import Config
 from app.library.encoder import Encoder
 from app.library.logging import get_logger
+from app.library.loop_monitor import LoopMonitor
 from app.library.router import route
 
 LOG = get_logger()
@@ -43,6 +44,22 @@ async def debug_asyncio(config: Config, encoder: Encoder) -> Response:
     )
 
 
+@route("GET", "api/dev/loop/stalls", "debug_loop_stalls")
+async def debug_loop_stalls(config: Config, encoder: Encoder) -> Response:
+    if not config.is_dev():
+        return api_error_response(
+            "This endpoint is only available in development mode.",
+            code="FORBIDDEN",
+            status=web.HTTPForbidden.status_code,
+        )
+
+    return web.json_response(
+        data=LoopMonitor.get_instance().summary(),
+        status=web.HTTPOk.status_code,
+        dumps=encoder.encode,
+    )
+
+
 @route("GET", "api/dev/pip", "check_pip_packages")
 async def check_pip_packages(config: Config, encoder: Encoder) -> Response:
     pkgs = config.pip_packages.split(" ") if config.pip_packages else []
@@ -1,4 +1,7 @@
 import asyncio
+import contextlib
+import json
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
@@ -10,11 +13,17 @@ from app.features.core.utils import api_error_response
 from app.features.downloads.items import Item
 from app.features.downloads.runtime.core import Download
 from app.features.downloads.runtime.queue_manager import DownloadQueue
-from app.features.downloads.runtime.utils import safe_relative_path
+from app.features.downloads.runtime.utils import handle_task_exception, safe_relative_path
 from app.features.downloads.store import StoreType
 from app.features.presets.schemas import Preset
 from app.features.presets.service import Presets
 from app.features.streaming.library.thumbnail import ensure_thumb, pick_local_thumb
+from app.features.streaming.library.trickplay import (
+    TRICKPLAY_FILE_RX,
+    TRICKPLAY_INDEX,
+    ensure_trickplay,
+    trickplay_path,
+)
 from app.library.cache import Cache
 from app.library.config import Config
 from app.library.encoder import Encoder
@@ -47,6 +56,10 @@ async def items_list(request: Request, queue: DownloadQueue, encoder: Encoder, c
         order (str): Sort order - "ASC" or "DESC". Default: "DESC". Only used when type != "all"
         status (str): Filter by status. Use "!status" to exclude a status. Only used when type != "all"
                       Examples: "?status=finished" or "?status=!finished"
+        q (str): Full-text search over title, uploader/channel, url, filename and preset. Every word is
+                 matched as a prefix, results are ranked by relevance then ordered by date.
+        cursor (str): Use keyset pagination instead of page numbers, empty for the first page then the
+                      returned next_cursor. Deep pages cost the same as the first one. Cannot be combined with q.
 
     """
     from app.features.downloads.store import StoreType
@@ -101,10 +114,60 @@ async def items_list(request: Request, queue: DownloadQueue, encoder: Encoder, c
         )
 
     status_filter = request.query.get("status", None)
+    search: str = request.query.get("q", "").strip()
 
-    items, total, current_page, total_pages = await ds.get_items_paginated(
-        page=page, per_page=per_page, order=order, status_filter=status_filter
-    )
+    if len(search) > 256:
+        return api_error_response(
+            "q must be at most 256 characters.",
+            code="INVALID",
+            status=web.HTTPBadRequest.status_code,
+            params={"field": "api.fields.q"},
+        )
+
+    cursor: str | None = request.query.get("cursor")
+
+    if cursor is not None and search:
+        return api_error_response(
+            "cursor cannot be combined with q.",
+            code="INVALID",
+            status=web.HTTPBadRequest.status_code,
+            params={"field": "api.fields.cursor"},
+        )
+
+    if cursor is not None:
+        try:
+            items, total, next_cursor = await ds.get_items_after(
+                cursor=cursor or None, per_page=per_page, order=order, status_filter=status_filter
+            )
+        except ValueError as e:
+            return api_error_response(
+                str(e),
+                code="INVALID",
+                status=web.HTTPBadRequest.status_code,
+                params={"field": "api.fields.cursor"},
+            )
+
+        pagination: dict = {
+            "per_page": per_page,
+            "total": total,
+            "total_pages": max(1, (total + per_page - 1) // per_page),
+            "cursor": cursor or None,
+            "next_cursor": next_cursor,
+            "has_next": next_cursor is not None,
+            "has_prev": bool(cursor),
+        }
+    else:
+        items, total, current_page, total_pages = await ds.get_items_paginated(
+            page=page, per_page=per_page, order=order, status_filter=status_filter, search=search or None
+        )
+        pagination = {
+            "page": current_page,
+            "per_page": per_page,
+            "total": total,
+            "total_pages": total_pages,
+            "has_next": current_page < total_pages,
+            "has_prev": current_page > 1,
+        }
 
     if store_type == StoreType.HISTORY:
         for _, download in items:
@@ -119,14 +182,7 @@ async def items_list(request: Request, queue: DownloadQueue, encoder: Encoder, c
     return web.json_response(
         data={
             "type": store_type.value,
-            "pagination": {
-                "page": current_page,
-                "per_page": per_page,
-                "total": total,
-                "total_pages": total_pages,
-                "has_next": current_page < total_pages,
-                "has_prev": current_page > 1,
-            },
+            "pagination": pagination,
             "items": [download.info for _, download in items],
         },
         status=web.HTTPOk.status_code,
@@ -419,6 +475,56 @@ async def item_thumbnail(request: Request, queue: DownloadQueue, config: Config)
     )
 
 
+@route(["GET", "HEAD"], r"api/history/{id}/trickplay/{file}", "history.item.trickplay")
+async def item_trickplay(request: Request, queue: DownloadQueue, config: Config) -> StreamResponse:
+    if not (id := request.match_info.get("id")):
+        return api_error_response("id is required.", code="BAD_REQUEST", status=web.HTTPBadRequest.status_code)
+
+    file: str = request.match_info.get("file") or ""
+    if not TRICKPLAY_FILE_RX.match(file):
+        return api_error_response(
+            "invalid trickplay file.",
+            code="INVALID",
+            status=web.HTTPBadRequest.status_code,
+            params={"field": "api.fields.file"},
+        )
+
+    item: Download | None = await queue.done.get_by_id(id)
+    if not item or not item.info:
+        return api_error_response(
+            "item not found.",
+            code="NOT_FOUND",
+            status=web.HTTPNotFound.status_code,
+            params={"resource": "api.resources.item"},
+        )
+
+    cache_root = Path(config.temp_path) / "thumbnails"
+    target: Path = trickplay_path(cache_root, item.info._id) / file
+    if target.is_file():
+        return web.FileResponse(
+            path=str(target),
+            headers={
+                "Content-Type": "text/vtt; charset=UTF-8" if TRICKPLAY_INDEX == file else "image/jpeg",
+                "Cache-Control": "public, max-age=86400",
+            },
+        )
+
+    if TRICKPLAY_INDEX == file and config.thumb_trickplay:
+        filepath: Path | None = item.info.get_file(download_path=Path(config.download_path))
+        if filepath and filepath.is_file():
+            task = asyncio.create_task(
+                ensure_trickplay(filepath, cache_root, item.info._id), name=f"trickplay-request-{item.info._id}"
+            )
+            task.add_done_callback(lambda t: handle_task_exception(t, LOG))
+
+    return api_error_response(
+        "trickplay not found.",
+        code="NOT_FOUND",
+        status=web.HTTPNotFound.status_code,
+        params={"resource": "api.resources.file"},
+    )
+
+
 @route("POST", r"api/history/{id}/rename", "history.item.rename")
 async def item_rename(
     request: Request,
@@ -701,8 +807,6 @@ async def items_add(request: Request, queue: DownloadQueue, encoder: Encoder) ->
 
         return web.json_response(data=response, status=web.HTTPOk.status_code, dumps=encoder.encode)
 
-    from app.features.downloads.runtime.utils import handle_task_exception
-
     batch_id: str = f"batch_{asyncio.get_running_loop().time():.0f}"
 
     for idx, item in enumerate(items):
@@ -729,6 +833,69 @@ async def items_add(request: Request, queue: DownloadQueue, encoder: Encoder) ->
     )
 
 
+@route("POST", "api/history/ingest", "items_ingest")
+async def items_ingest(request: Request, queue: DownloadQueue, encoder: Encoder) -> StreamResponse:
+    """
+    Add items from a newline-delimited JSON body, streaming back one result line per item.
+
+    Lines are parsed as they arrive and added by a bounded set of workers sharing one extractor batch,
+    results are written in completion order and carry the index of their input line.
+
+    Args:
+        request (Request): The request object.
+        queue (DownloadQueue): The download queue instance.
+        encoder (Encoder): The encoder instance.
+
+    Returns:
+        StreamResponse: The NDJSON response.
+
+    """
+
+    async def read_items() -> AsyncIterator[tuple[int, Item | ValueError]]:
+        index: int = 0
+        while line := await request.content.readline():
+            if not (line := line.strip()):
+                continue
+
+            try:
+                data: Any = json.loads(line)
+                item: Item | ValueError = (
+                    Item.format(data) if isinstance(data, dict) else ValueError("Each line must be a JSON object.")
+                )
+            except ValueError as e:
+                item = e
+
+            yield index, item
+            index += 1
+
+    response = web.StreamResponse(
+        status=web.HTTPOk.status_code,
+        headers={"Content-Type": "application/x-ndjson", "Cache-Control": "no-cache"},
+    )
+    await response.prepare(request)
+
+    async with contextlib.aclosing(queue.add_stream(read_items())) as results:
+        async for index, item, status in results:
+            line: dict[str, Any] = {
+                "index": index,
+                "item": item,
+                "status": "ok" == status.get("status"),
+                "msg": status.get("msg"),
+            }
+            if status.get("hidden"):
+                line["hidden"] = True
+
+            try:
+                await response.write(f"{encoder.encode(line)}\n".encode())
+            except ConnectionResetError:
+                break
+
+    with contextlib.suppress(ConnectionResetError):
+        await response.write_eof()
+
+    return response
+
+
 @route("POST", "api/history/start", "items_start")
 async def items_start(request: Request, queue: DownloadQueue, encoder: Encoder) -> Response:
     """
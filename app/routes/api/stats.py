@@ -8,6 +8,7 @@ from aiohttp import web
 from app.features.core.utils import api_error_response
 from app.library.config import Config
 from app.library.encoder import Encoder
+from app.library.metrics import CONTENT_TYPE, MetricsRegistry
 from app.library.monitor import ResourceSample, ResourceTracker
 from app.library.monitor_bottlenecks import detect as detect_bottlenecks
 from app.library.router import route
@@ -178,3 +179,8 @@ async def stats_stream(request: Request, encoder: Encoder, config: Config) -> St
             pass
 
     return response
+
+
+@route("GET", "api/metrics", "stats.metrics")
+async def stats_metrics() -> Response:
+    return web.Response(body=MetricsRegistry.get_instance().render().encode(), headers={"Content-Type": CONTENT_TYPE})
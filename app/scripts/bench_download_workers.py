@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+APP_ROOT = str((Path(__file__).parent / ".." / "..").resolve())
+if APP_ROOT not in sys.path:
+    sys.path.insert(0, APP_ROOT)
+
+from app.features.downloads.runtime.types import Terminator
+from app.features.downloads.runtime.worker_pool import WorkerPool
+from app.library.logging import get_logger
+
+LOG = get_logger()
+
+
+class BenchJob:
+    """A short job that pays the same per-download setup cost as a real download, without any network I/O."""
+
+    def __init__(self, n: int) -> None:
+        self.id: str = f"bench-{n}"
+        self.is_live: bool = False
+        self.status_queue: Any = None
+
+    def bind_worker(self, status_queue: Any, cancel_event: Any) -> None:  # noqa: ARG002
+        self.status_queue = status_queue
+
+    def _download(self) -> None:
+        from app.features.downloads.runtime.bootstrap import ensure_download_runtime
+        from app.features.ytdlp.ytdlp import YTDLP
+
+        ensure_download_runtime()
+        YTDLP(params={"quiet": True, "simulate": True, "color": "no_color"})
+        self.status_queue.put({"id": self.id, "status": "finished"})
+        self.status_queue.put(Terminator())
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare per-download processes with pooled download workers.")
+    parser.add_argument("--count", type=int, default=50, help="Number of jobs to run in each mode (default: 50).")
+    parser.add_argument(
+        "--jobs-per-worker",
+        type=int,
+        default=25,
+        help="Jobs a pooled worker runs before it is recycled (default: 25).",
+    )
+    return parser.parse_args()
+
+
+def _drain(status_queue: Any) -> None:
+    while not isinstance(status_queue.get(), Terminator):
+        pass
+
+
+def run_per_process(count: int) -> float:
+    context = multiprocessing.get_context()
+    start: float = time.perf_counter()
+
+    for n in range(count):
+        status_queue = context.Queue()
+        job = BenchJob(n)
+        job.bind_worker(status_queue, None)
+        proc = context.Process(target=job._download, name=f"bench-{n}")
+        proc.start()
+        _drain(status_queue)
+        proc.join()
+        proc.close()
+        status_queue.close()
+        status_queue.join_thread()
+
+    return time.perf_counter() - start
+
+
+async def run_pooled(count: int, jobs_per_worker: int) -> float:
+    pool = WorkerPool(config=SimpleNamespace(download_worker_jobs=jobs_per_worker, max_workers=1))
+    start: float = time.perf_counter()
+
+    try:
+        for n in range(count):
+            worker = pool.acquire()
+            worker.submit(BenchJob(n))
+            if not await worker.wait_job():
+                LOG.error("Worker '%s' died while running job %d.", worker.name, n)
+                pool.release(worker, reusable=False)
+                continue
+
+            _drain(worker.status_queue)
+            pool.release(worker)
+    finally:
+        await pool.shutdown()
+
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    per_process: float = run_per_process(args.count)
+    LOG.info("Per-process: %d jobs in %.2fs (%.1f ms/job).", args.count, per_process, per_process / args.count * 1000)
+
+    pooled: float = await run_pooled(args.count, args.jobs_per_worker)
+    LOG.info("Pooled: %d jobs in %.2fs (%.1f ms/job).", args.count, pooled, pooled / args.count * 1000)
+
+    LOG.info("Speedup: %.2fx.", per_process / pooled if pooled else 0.0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
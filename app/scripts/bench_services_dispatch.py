@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, get_type_hints
+
+APP_ROOT = str((Path(__file__).parent / ".." / "..").resolve())
+if APP_ROOT not in sys.path:
+    sys.path.insert(0, APP_ROOT)
+
+from app.library.logging import get_logger
+from app.library.Services import Services
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LOG = get_logger()
+
+
+class PerCallServices(Services):
+    """Services as it was before injection plans: the handler signature and type hints are inspected on every call."""
+
+    def _build_call_args(self, handler: Callable[..., Any], overrides: dict[str, Any]) -> dict[str, Any]:
+        sig: inspect.Signature = inspect.signature(handler)
+
+        try:
+            type_hints: dict[str, Any] = get_type_hints(handler)
+        except Exception:
+            type_hints = {}
+
+        resolved: dict[str, Any] = {}
+
+        for name, param in sig.parameters.items():
+            if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                continue
+
+            lookup_name: str = name.lstrip("_") if name.startswith("_") else name
+
+            if name in overrides or lookup_name in overrides:
+                resolved[name] = overrides.get(name, overrides.get(lookup_name))
+                continue
+
+            by_name: Any | None = self.get(name) or self.get(lookup_name)
+            if by_name is not None:
+                resolved[name] = by_name
+                continue
+
+            by_type: Any | None = self.get_by_type(type_hints.get(name, param.annotation))
+            if by_type is not None:
+                resolved[name] = by_type
+
+        missing_required: list[str] = [
+            name
+            for name, param in sig.parameters.items()
+            if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+            and param.default is inspect._empty
+            and name not in resolved
+        ]
+        if missing_required:
+            LOG.error("Missing arguments for handler '%s': %s", getattr(handler, "__name__", handler), missing_required)
+
+        return resolved
+
+
+class Library:
+    pass
+
+
+class Notifier:
+    pass
+
+
+async def handler(request: Any, library: Library, notifier: Notifier, config: Any, limit: int = 10) -> tuple:
+    return (request, library, notifier, config, limit)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare per-call handler inspection with cached injection plans.")
+    parser.add_argument("--iterations", type=int, default=50_000, help="Dispatches per mode (default: 50000).")
+    parser.add_argument(
+        "--services",
+        type=int,
+        default=20,
+        help="Unrelated services registered besides the ones the handler uses (default: 20).",
+    )
+    return parser.parse_args()
+
+
+def _register(services: Services, extra: int) -> None:
+    services.clear()
+    for n in range(extra):
+        services.add(f"service_{n}", type(f"Service{n}", (), {})())
+
+    services.add("library", Library()).add("notifier_instance", Notifier()).add("config", object())
+
+
+async def run(services: Services, iterations: int) -> float:
+    request = object()
+    start: float = time.perf_counter()
+
+    for _ in range(iterations):
+        await services.handle_async(handler, request=request)
+
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    results: dict[str, float] = {}
+    for label, cls in (("Per-call inspection", PerCallServices), ("Injection plan", Services)):
+        services: Services = cls()
+        _register(services, args.services)
+        await run(services, 1_000)
+
+        results[label] = await run(services, args.iterations)
+        LOG.info(
+            "%s: %d dispatches in %.2fs (%.1f us/dispatch).",
+            label,
+            args.iterations,
+            results[label],
+            results[label] / args.iterations * 1_000_000,
+        )
+        cls._reset_singleton()
+
+    planned: float = results["Injection plan"]
+    LOG.info("Speedup: %.2fx.", results["Per-call inspection"] / planned if planned else 0.0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select, text
+
+APP_ROOT = str((Path(__file__).parent / ".." / "..").resolve())
+if APP_ROOT not in sys.path:
+    sys.path.insert(0, APP_ROOT)
+
+from app.features.downloads.models import DownloadModel
+from app.library.config import Config
+from app.library.logging import get_logger
+from app.library.sqlite_store import SqliteStore
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+LOG = get_logger()
+
+INSERT_SQL = 'INSERT INTO "history" ("id", "type", "url", "data") VALUES (:id, :type, :url, :data)'
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure history read latency while other tasks write, with a shared or split database engine."
+    )
+    parser.add_argument("--rows", type=int, default=20_000, help="History rows to seed (default: 20000).")
+    parser.add_argument("--reads", type=int, default=600, help="Total page reads to measure (default: 600).")
+    parser.add_argument("--readers", type=int, default=4, help="Concurrent reader tasks (default: 4).")
+    parser.add_argument("--writers", type=int, default=2, help="Concurrent writer tasks (default: 2).")
+    parser.add_argument("--batch", type=int, default=50, help="Rows per write transaction (default: 50).")
+    parser.add_argument("--page", type=int, default=50, help="Rows per page read (default: 50).")
+    parser.add_argument(
+        "--write-interval",
+        type=float,
+        default=0.02,
+        help="Seconds each writer waits between transactions, so both modes see the same write load (default: 0.02).",
+    )
+    parser.add_argument(
+        "--read-connections",
+        type=int,
+        default=0,
+        help="Read-only connections to split reads onto, 0 for one shared engine (default: 0).",
+    )
+    parser.add_argument("db_file", type=Path, nargs="?", help="Database file to create (default: a temp file).")
+    return parser.parse_args()
+
+
+def _rows(count: int) -> list[dict[str, str]]:
+    data: str = json.dumps({"title": "Benchmark item", "status": "finished", "folder": "/downloads"})
+    return [
+        {"id": str(uuid.uuid4()), "type": "done", "url": f"https://example.com/{uuid.uuid4().hex}", "data": data}
+        for _ in range(count)
+    ]
+
+
+async def seed(sessionmaker: async_sessionmaker[AsyncSession], count: int) -> None:
+    for start in range(0, count, 1000):
+        async with sessionmaker() as session:
+            await session.execute(text(INSERT_SQL), _rows(min(1000, count - start)))
+            await session.commit()
+
+
+async def reader(
+    sessionmaker: async_sessionmaker[AsyncSession], reads: int, page: int, rows: int, latencies: list[float]
+) -> None:
+    for n in range(reads):
+        start: float = time.perf_counter()
+        async with sessionmaker() as session:
+            result = await session.execute(
+                select(DownloadModel.id, DownloadModel.data)
+                .where(DownloadModel.type == "done")
+                .order_by(DownloadModel.created_at.desc())
+                .limit(page)
+                .offset((n * page) % max(1, rows - page))
+            )
+            result.fetchall()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def writer(
+    sessionmaker: async_sessionmaker[AsyncSession], batch: int, interval: float, stop: asyncio.Event
+) -> int:
+    written: int = 0
+    while not stop.is_set():
+        async with sessionmaker() as session:
+            await session.execute(text(INSERT_SQL), _rows(batch))
+            await session.commit()
+        written += batch
+        await asyncio.sleep(interval)
+
+    return written
+
+
+async def run(args: argparse.Namespace, db_file: Path) -> None:
+    Config.get_instance().db_read_connections = args.read_connections
+    store = SqliteStore.get_instance(db_path=str(db_file))
+    await store.get_connection()
+    sessionmaker: async_sessionmaker[AsyncSession] = store.sessionmaker()
+
+    try:
+        await seed(sessionmaker, args.rows)
+
+        latencies: list[float] = []
+        stop = asyncio.Event()
+        writers = [
+            asyncio.create_task(writer(sessionmaker, args.batch, args.write_interval, stop))
+            for _ in range(args.writers)
+        ]
+        per_reader: int = max(1, args.reads // max(1, args.readers))
+        start: float = time.perf_counter()
+        await asyncio.gather(
+            *(reader(sessionmaker, per_reader, args.page, args.rows, latencies) for _ in range(args.readers))
+        )
+        elapsed: float = time.perf_counter() - start
+        stop.set()
+        written: int = sum(await asyncio.gather(*writers))
+    finally:
+        await store.close()
+
+    cuts: list[float] = statistics.quantiles(latencies, n=100)
+    LOG.info(
+        "%s: %d reads in %.2fs, p50 %.1fms, p95 %.1fms, p99 %.1fms, %d rows written meanwhile.",
+        f"Writer/reader split ({args.read_connections} readers)" if args.read_connections else "Shared engine",
+        len(latencies),
+        elapsed,
+        cuts[49],
+        cuts[94],
+        cuts[98],
+        written,
+    )
+
+
+async def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    if args.db_file:
+        await run(args, args.db_file)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="ytptube-bench-") as temp_dir:
+        await run(args, Path(temp_dir) / "bench.db")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,3 +1,6 @@
+import io
+import os
+import zipfile
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
@@ -5,8 +8,9 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from aiohttp import web
 
+from app.library.cache import Cache
 from app.library.encoder import Encoder
-from app.routes.api.browser import get_file_info, get_ffprobe, path_actions
+from app.routes.api.browser import get_file_info, get_ffprobe, path_actions, stream_zip_download
 from app.tests.helpers import url_for
 
 
@@ -85,3 +89,56 @@ async def test_ffprobe_endpoint_unavailable(tmp_path: Path, test_client) -> None
     assert response.status == web.HTTPServiceUnavailable.status_code
     body = await response.json()
     assert body["code"] == "FFPROBE_UNAVAILABLE"
+
+
+@pytest.mark.asyncio
+async def test_zip_download_is_sized_and_resumable(tmp_path: Path, test_client) -> None:
+    """The archive is stored with a known size, and a range request resumes it byte for byte."""
+    (tmp_path / "show").mkdir()
+    (tmp_path / "show" / "episode.mkv").write_bytes(os.urandom(300_000))
+    (tmp_path / "show" / "episode.srt").write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n")
+    config = SimpleNamespace(download_path=str(tmp_path))
+    cache = Cache()
+    files = [tmp_path / "show" / "episode.mkv", tmp_path / "show" / "episode.srt", tmp_path / "show" / "episode.mkv"]
+    cache.set("download:resume-token", files, ttl=60)
+
+    async def handler(request):
+        return await stream_zip_download(request, config, cache)
+
+    client = await test_client({"browser.download.stream": handler})
+    url = url_for("browser.download.stream", token="resume-token")
+
+    response = await client.get(url)
+    assert response.status == 200
+    assert response.headers["Accept-Ranges"] == "bytes"
+    body = await response.read()
+    assert int(response.headers["Content-Length"]) == len(body)
+    etag = response.headers["ETag"]
+
+    with zipfile.ZipFile(io.BytesIO(body)) as archive:
+        assert archive.namelist() == ["show/episode.mkv", "show/episode.srt"]
+        assert {info.compress_type for info in archive.infolist()} == {zipfile.ZIP_STORED}
+        assert archive.read("show/episode.mkv") == (tmp_path / "show" / "episode.mkv").read_bytes()
+
+    response = await client.get(url, headers={"Range": "bytes=1000-", "If-Range": etag})
+    assert response.status == 206
+    assert response.headers["Content-Range"] == f"bytes 1000-{len(body) - 1}/{len(body)}"
+    assert await response.read() == body[1000:]
+
+    response = await client.get(url, headers={"Range": "bytes=10-19"})
+    assert response.status == 206
+    assert await response.read() == body[10:20]
+
+    response = await client.get(url, headers={"Range": "bytes=1000-", "If-Range": '"stale"'})
+    assert response.status == 200
+    assert await response.read() == body
+
+    response = await client.get(url, headers={"Range": f"bytes={len(body)}-"})
+    assert response.status == 416
+    assert response.headers["Content-Range"] == f"bytes */{len(body)}"
+
+    for malformed in ("bytes=oops", "bytes=20-10", "items=0-10"):
+        response = await client.get(url, headers={"Range": malformed})
+        assert response.status == 200, malformed
+        assert "Content-Range" not in response.headers
+        assert await response.read() == body
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from app.library.encoder import Encoder
+from app.library.encoder import Encoder, RawJSON
 
 
 class TestEncoder:
@@ -136,6 +136,26 @@ class TestEncoder:
         finally:
             builtins.isinstance = original_isinstance
 
+    def test_raw_json_is_spliced(self):
+        """Test that pre-encoded JSON is embedded as-is, and decoded when indenting."""
+        data = {"event": "item_updated", "data": RawJSON('{"b":1,"a":[true]}'), "nested": [RawJSON("null")]}
+
+        assert self.encoder.encode(data) == '{"event": "item_updated", "data": {"b":1,"a":[true]}, "nested": [null]}'
+        assert json.loads(Encoder(indent=2).encode(data))["data"] == {"b": 1, "a": [True]}
+        assert json.loads(self.encoder.encode(RawJSON('"x"'))) == "x"
+
+    def test_items_reuse_cached_encoding(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that items are spliced from their cached JSON instead of being re-encoded."""
+        from app.features.downloads.items import ItemDTO
+
+        item = ItemDTO(id="vid", title="t", url="u", folder="f")
+        expected = item.serialize()
+        monkeypatch.setattr(ItemDTO, "serialize", lambda _: pytest.fail("items must not be decoded"))
+
+        payload = self.encoder.encode({"data": [item, item]})
+        assert json.loads(payload) == {"data": [expected, expected]}
+        assert item.encoded() in payload
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
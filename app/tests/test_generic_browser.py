@@ -27,7 +27,6 @@ def _make_ie(config: dict[str, str | None] | None = None) -> Any:
     ie.write_debug = Mock()
     ie._downloader = Mock()
     ie._downloader.params = {}
-    ie._failed = False
     return ie
 
 
@@ -136,10 +135,13 @@ def test_log_connect_fail(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert result == {"id": "fallback"}
     ie.report_warning.assert_called_once_with(
-        "Remote browser unavailable: remote browser down, marking as failed.", "vid"
+        "Remote browser unavailable: remote browser down, falling back to generic extractor.", "vid"
     )
     ie.to_screen.assert_called_once_with("Using remote browser for https://example.com/watch")
 
+    ie._real_extract("https://example.com/watch")
+    assert 2 == ie.to_screen.call_count, "later entries must try the browser again, the driver backs off"
+
 
 def test_log_session_fail(monkeypatch: pytest.MonkeyPatch) -> None:
     ie = _make_ie()
@@ -450,6 +452,13 @@ def test_select_driver_rejects(monkeypatch: pytest.MonkeyPatch, url: str) -> Non
         _make_ie()._select_driver(url)
 
 
+@pytest.fixture(autouse=True)
+def _reset_cdp_pool():
+    yield
+    generic_browser.CdpDriver.close_all()
+    generic_browser.CdpDriver._failures.clear()
+
+
 def _cdp_mocks(monkeypatch: pytest.MonkeyPatch, contexts: list[Mock]) -> tuple[Mock, Mock]:
     from playwright import sync_api
 
@@ -458,6 +467,9 @@ def _cdp_mocks(monkeypatch: pytest.MonkeyPatch, contexts: list[Mock]) -> tuple[M
     starter.start.return_value = playwright
     browser = Mock()
     browser.contexts = contexts
+    browser.is_connected.return_value = True
+    for context in [*contexts, browser.new_context.return_value]:
+        context.new_page.return_value.is_closed.return_value = False
     playwright.chromium.connect_over_cdp.return_value = browser
 
     monkeypatch.setattr(sync_api, "sync_playwright", lambda: starter)
@@ -476,6 +488,11 @@ def test_cdp_reuses_context(monkeypatch: pytest.MonkeyPatch) -> None:
 
     context.new_page.assert_called_once_with()
     browser.new_context.assert_not_called()
+    page.close.assert_not_called()
+    page.goto.assert_called_once_with("about:blank")
+    playwright.stop.assert_not_called()
+
+    generic_browser.CdpDriver.close_all()
     page.close.assert_called_once_with()
     context.close.assert_not_called()
     browser.close.assert_called_once_with()
@@ -489,6 +506,7 @@ def test_cdp_owns_context(monkeypatch: pytest.MonkeyPatch) -> None:
 
     session = generic_browser.CdpDriver.connect("http://browser")
     session.close()
+    generic_browser.CdpDriver.close_all()
 
     browser.new_context.assert_called_once_with()
     page.close.assert_called_once_with()
@@ -497,6 +515,87 @@ def test_cdp_owns_context(monkeypatch: pytest.MonkeyPatch) -> None:
     playwright.stop.assert_called_once_with()
 
 
+def test_cdp_pools_pages_and_resets_capture(monkeypatch: pytest.MonkeyPatch) -> None:
+    context = Mock()
+    page = context.new_page.return_value
+    playwright, _ = _cdp_mocks(monkeypatch, [context])
+
+    first = generic_browser.CdpDriver.connect("http://browser")
+    first.goto("https://example.com/a", headers={"Referer": "https://example.com"})
+    on_request = page.on.call_args_list[0].args[1]
+    on_request(Mock(resource_type="media", url="https://cdn.example.com/a.mp4", method="GET", headers={}))
+    first.close()
+
+    second = generic_browser.CdpDriver.connect("http://browser")
+    assert [r["url"] for r in first.get_requests()] == ["https://cdn.example.com/a.mp4"]
+    assert second.get_requests() == []
+    assert second.get_page() is page
+    second.close()
+
+    playwright.chromium.connect_over_cdp.assert_called_once()
+    context.new_page.assert_called_once_with()
+    page.remove_listener.assert_any_call("request", on_request)
+    page.set_extra_http_headers.assert_called_with({})
+    page.close.assert_not_called()
+
+
+def test_cdp_replaces_unhealthy_pages_and_connections(monkeypatch: pytest.MonkeyPatch) -> None:
+    context = Mock()
+    page = context.new_page.return_value
+    playwright, browser = _cdp_mocks(monkeypatch, [context])
+
+    generic_browser.CdpDriver.connect("http://browser").close()
+    page.is_closed.return_value = True
+    generic_browser.CdpDriver.connect("http://browser").close()
+    assert context.new_page.call_count == 2
+
+    browser.is_connected.return_value = False
+    generic_browser.CdpDriver.connect("http://browser").close()
+    assert playwright.chromium.connect_over_cdp.call_count == 2
+    playwright.stop.assert_called_once_with()
+
+
+def test_cdp_evicts_idle_pages_and_connections(monkeypatch: pytest.MonkeyPatch) -> None:
+    context = Mock()
+    page = context.new_page.return_value
+    playwright, _ = _cdp_mocks(monkeypatch, [context])
+    clock = [1000.0]
+    monkeypatch.setattr(generic_browser.time, "monotonic", lambda: clock[0])
+
+    generic_browser.CdpDriver.connect("http://browser").close()
+    clock[0] += generic_browser.BROWSER_POOL_IDLE_SECONDS
+    generic_browser.CdpDriver.evict_idle()
+
+    page.close.assert_called_once_with()
+    playwright.stop.assert_called_once_with()
+    assert generic_browser.CdpDriver._connections == {}
+
+
+def test_cdp_connect_backs_off(monkeypatch: pytest.MonkeyPatch) -> None:
+    playwright, _ = _cdp_mocks(monkeypatch, [])
+    playwright.chromium.connect_over_cdp.side_effect = RuntimeError("connect failed")
+    clock = [1000.0]
+    monkeypatch.setattr(generic_browser.time, "monotonic", lambda: clock[0])
+
+    with pytest.raises(RuntimeError, match="connect failed"):
+        generic_browser.CdpDriver.connect("http://browser")
+    with pytest.raises(ConnectionError, match="retrying in 2s"):
+        generic_browser.CdpDriver.connect("http://browser")
+
+    clock[0] += generic_browser.BROWSER_RETRY_SECONDS
+    with pytest.raises(RuntimeError, match="connect failed"):
+        generic_browser.CdpDriver.connect("http://browser")
+    with pytest.raises(ConnectionError, match="retrying in 4s"):
+        generic_browser.CdpDriver.connect("http://browser")
+
+    assert playwright.chromium.connect_over_cdp.call_count == 2
+
+    playwright.chromium.connect_over_cdp.side_effect = None
+    clock[0] += 4
+    generic_browser.CdpDriver.connect("http://browser").close()
+    assert "http://browser" not in generic_browser.CdpDriver._failures
+
+
 def test_cdp_post(monkeypatch: pytest.MonkeyPatch) -> None:
     context = Mock()
     page = context.new_page.return_value
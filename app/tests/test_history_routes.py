@@ -1,3 +1,5 @@
+import asyncio
+import json
 from types import SimpleNamespace
 from pathlib import Path
 from typing import Any
@@ -10,7 +12,14 @@ from app.library.cache import Cache
 from app.features.downloads.items import ItemDTO
 from app.library.encoder import Encoder
 from app.routes.api import history
-from app.routes.api.history import item_rename, item_thumbnail, items_delete, items_live, items_retry
+from app.routes.api.history import (
+    item_rename,
+    item_thumbnail,
+    item_trickplay,
+    items_delete,
+    items_live,
+    items_retry,
+)
 from app.tests.helpers import temporary_test_dir, url_for
 
 
@@ -463,6 +472,59 @@ async def test_item_thumbnail_missing_cache(test_client) -> None:
     assert seen["count"] == 1
 
 
+@pytest.mark.asyncio
+async def test_item_trickplay_serves_cached_files(test_client) -> None:
+    with temporary_test_dir("history-trickplay") as temp_dir:
+        item = _make_download(filename="video.mp4", download_dir=str(temp_dir))
+        sprites = temp_dir / "tmp" / "thumbnails" / "trickplay" / item.info._id
+        sprites.mkdir(parents=True)
+        (sprites / "index.vtt").write_text("WEBVTT")
+        (sprites / "sprite-001.jpg").write_text("sheet")
+
+        queue = SimpleNamespace(done=SimpleNamespace(get_by_id=AsyncMock(return_value=item)))
+        config = SimpleNamespace(download_path=str(temp_dir), temp_path=str(temp_dir / "tmp"), thumb_trickplay=True)
+
+        async def handler(request):
+            return await item_trickplay(request, queue, config)
+
+        client = await test_client({"history.item.trickplay": handler})
+        index = await client.get(url_for("history.item.trickplay", id=item.info._id, file="index.vtt"))
+        sheet = await client.get(url_for("history.item.trickplay", id=item.info._id, file="sprite-001.jpg"))
+        invalid = await client.get(url_for("history.item.trickplay", id=item.info._id, file="..%2Fitem-1.jpg"))
+
+        assert index.status == 200
+        assert index.headers["Content-Type"].startswith("text/vtt")
+        assert await index.text() == "WEBVTT"
+        assert sheet.status == 200
+        assert await sheet.text() == "sheet"
+        assert invalid.status == 400
+
+
+@pytest.mark.asyncio
+async def test_item_trickplay_missing_schedules_generation(monkeypatch: pytest.MonkeyPatch, test_client) -> None:
+    with temporary_test_dir("history-trickplay-miss") as temp_dir:
+        media = temp_dir / "video.mp4"
+        media.write_text("video")
+        item = _make_download(filename="video.mp4", download_dir=str(temp_dir))
+        queue = SimpleNamespace(done=SimpleNamespace(get_by_id=AsyncMock(return_value=item)))
+        config = SimpleNamespace(download_path=str(temp_dir), temp_path=str(temp_dir / "tmp"), thumb_trickplay=True)
+
+        generate = AsyncMock(return_value=None)
+        monkeypatch.setattr(history, "ensure_trickplay", generate)
+
+        async def handler(request):
+            return await item_trickplay(request, queue, config)
+
+        response = await _request(
+            test_client, "history.item.trickplay", handler, params={"id": item.info._id, "file": "index.vtt"}
+        )
+
+        assert response.status == 404
+        await asyncio.sleep(0)
+        generate.assert_awaited_once()
+        assert generate.await_args.args[0] == media
+
+
 @pytest.mark.asyncio
 async def test_item_info_without_ffprobe(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, test_client) -> None:
     """Item info must still return 200 with empty probe data when ffprobe is missing."""
@@ -494,3 +556,43 @@ async def test_item_info_without_ffprobe(tmp_path: Path, monkeypatch: pytest.Mon
     assert response.status == 200
     body = await response.json()
     assert body["ffprobe"] == {}
+
+
+@pytest.mark.asyncio
+async def test_items_ingest_streams_bounded_results(test_client) -> None:
+    from app.features.downloads.runtime.queue_manager import DownloadQueue
+    from app.routes.api.history import items_ingest
+
+    active = 0
+    peak = 0
+
+    async def add(item, batch=None):
+        nonlocal active, peak
+        assert batch is not None, "adds must share the ingest extractor batch"
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"status": "ok"} if "bad" not in item.url else {"status": "error", "msg": "nope"}
+
+    queue = SimpleNamespace(config=SimpleNamespace(extract_info_concurrency=2), add=add)
+    queue.add_stream = lambda items: DownloadQueue.add_stream(queue, items)
+
+    async def handler(request):
+        return await items_ingest(request, queue, Encoder())
+
+    client = await test_client({"items_ingest": handler})
+    lines = [f'{{"url": "https://example.com/v/{n}"}}' for n in range(6)]
+    lines += ['{"url": "https://example.com/bad"}', "not json", "", '{"preset": "default"}']
+    response = await client.post(url_for("items_ingest"), data="\n".join(lines).encode())
+
+    assert response.status == 200
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+
+    results = {r["index"]: r for r in (json.loads(line) for line in (await response.text()).splitlines())}
+    assert sorted(results) == list(range(9))
+    assert all(results[n]["status"] for n in range(6))
+    assert results[6] == {"index": 6, "item": results[6]["item"], "status": False, "msg": "nope"}
+    assert results[7]["item"] is None
+    assert results[8]["status"] is False
+    assert peak <= 2
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from app.library.config import Config
+from app.library.loop_monitor import ACTIVITY, LoopMonitor
+from app.library.metrics import MetricsRegistry
+
+
+class TestLoopMonitor:
+    def setup_method(self):
+        Config._reset_singleton()
+        LoopMonitor._reset_singleton()
+        MetricsRegistry._reset_singleton()
+        Config.get_instance().loop_lag_threshold = 50
+
+    def teardown_method(self):
+        LoopMonitor._reset_singleton()
+        MetricsRegistry._reset_singleton()
+        Config._reset_singleton()
+
+    @pytest.mark.asyncio
+    async def test_records_and_attributes_blocking_work(self):
+        monitor = LoopMonitor.get_instance()
+        monitor.start()
+        try:
+            await asyncio.sleep(monitor.INTERVAL * 2)
+
+            async def blocking_handler():
+                ACTIVITY.set("route:test.blocking")
+                time.sleep(0.6)
+
+            await asyncio.create_task(blocking_handler(), name="blocking-task")
+            await asyncio.sleep(monitor.INTERVAL * 2)
+        finally:
+            await monitor.stop()
+
+        summary = monitor.summary()
+        assert summary["running"] is False
+        assert summary["max_lag_ms"] >= 300
+
+        stall = next(stall for stall in summary["stalls"] if stall["source"] == "sampler")
+        assert stall["lag_ms"] >= 300
+        assert stall["task"] == "blocking-task"
+        assert stall["activity"] == "route:test.blocking"
+        assert any("blocking_handler" in frame for frame in stall["stack"])
+
+        metrics = MetricsRegistry.get_instance()
+        assert metrics.get("event_loop_stalls_total").value("sampler") >= 1
+        assert metrics.get("event_loop_lag_seconds").count() >= 2
+
+    @pytest.mark.asyncio
+    async def test_records_slow_callback_warnings(self):
+        monitor = LoopMonitor.get_instance()
+        monitor.start()
+        try:
+            logger = logging.getLogger("asyncio")
+            logger.warning("Executing %s took %.3f seconds", "<Handle slow()>", 0.2)
+            logger.warning("Executing %s took %.3f seconds", "<Handle fast()>", 0.01)
+        finally:
+            await monitor.stop()
+
+        stalls = [stall for stall in monitor.stalls() if stall["source"] == "slow_callback"]
+        assert [(stall["task"], stall["lag_ms"]) for stall in stalls] == [("<Handle slow()>", 200.0)]
+
+    def test_disabled_monitor_is_not_attached(self):
+        Config.get_instance().loop_lag_threshold = 0
+        monitor = LoopMonitor.get_instance()
+        monitor.attach(None)
+        assert monitor.summary()["running"] is False
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from app.library.Events import EventBus, Events
+from app.library.metrics import MetricsRegistry
+from app.routes.api.stats import stats_metrics
+
+
+class TestMetricsRegistry:
+    def setup_method(self):
+        MetricsRegistry._reset_singleton()
+
+    def teardown_method(self):
+        MetricsRegistry._reset_singleton()
+
+    def test_renders_counters_gauges_and_cumulative_histograms(self):
+        metrics = MetricsRegistry.get_instance()
+        requests = metrics.counter("requests_total", "Requests.", ("route",))
+        requests.inc("a")
+        requests.inc("a", amount=2)
+        metrics.gauge("depth", "Depth.", callback=lambda: {(): 7}).set(1)
+        latency = metrics.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value, 'quo"te')
+
+        assert metrics.counter("requests_total", "Requests.", ("route",)) is requests
+        assert requests.value("a") == 3
+        assert latency.count('quo"te') == 4
+        assert metrics.render().splitlines() == [
+            "# HELP ytptube_depth Depth.",
+            "# TYPE ytptube_depth gauge",
+            "ytptube_depth 7",
+            "# HELP ytptube_latency_seconds Latency.",
+            "# TYPE ytptube_latency_seconds histogram",
+            'ytptube_latency_seconds_bucket{route="quo\\"te",le="0.1"} 2',
+            'ytptube_latency_seconds_bucket{route="quo\\"te",le="1"} 3',
+            'ytptube_latency_seconds_bucket{route="quo\\"te",le="+Inf"} 4',
+            'ytptube_latency_seconds_sum{route="quo\\"te"} 3.65',
+            'ytptube_latency_seconds_count{route="quo\\"te"} 4',
+            "# HELP ytptube_requests_total Requests.",
+            "# TYPE ytptube_requests_total counter",
+            'ytptube_requests_total{route="a"} 3',
+        ]
+
+    def test_rejects_wrong_labels_and_kinds(self):
+        metrics = MetricsRegistry.get_instance()
+        counter = metrics.counter("things_total", "Things.", ("kind",))
+
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.inc()
+
+        with pytest.raises(ValueError, match="already registered as a counter"):
+            metrics.gauge("things_total", "Things.")
+
+    @pytest.mark.asyncio
+    async def test_event_handlers_and_endpoint(self):
+        bus = EventBus.get_instance()
+        bus.subscribe(Events.TEST, lambda *_, **__: None, "metrics_test_listener")
+        try:
+            bus.emit(Events.TEST)
+            await asyncio.sleep(0.01)
+        finally:
+            bus.unsubscribe(Events.TEST, "metrics_test_listener")
+
+        histogram = MetricsRegistry.get_instance().get("event_handler_duration_seconds")
+        assert histogram is not None
+        assert histogram.count(Events.TEST) == 1
+
+        response = await stats_metrics()
+        assert response.content_type == "text/plain"
+        assert 'ytptube_event_handler_duration_seconds_count{event="test"} 1' in response.text
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import shutil
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -9,9 +10,9 @@ import pytest
 
 from app.library.config import Config
 from app.library.encoder import Encoder
-from app.library.monitor import _disk_usage, _process_tree_stats
+from app.library.monitor import _disk_usage, _process_tree_stats, _ProcessHandles
 from app.library.monitor_bottlenecks import detect
-from app.library.monitor_store import MonitorStore
+from app.library.monitor_store import BATCH_SIZE, MonitorStore
 from app.tests.helpers import make_test_temp_dir
 
 
@@ -65,8 +66,11 @@ class FakeProcess:
         status: str = "sleeping",
         cmdline: list[str] | None = None,
         thread_names: list[str] | None = None,
+        ppid: int = 0,
     ):
         self.pid = pid
+        self._ppid = ppid
+        self.name_calls = 0
         self.created = created
         self.cpu = cpu
         self.rss = rss
@@ -121,8 +125,12 @@ class FakeProcess:
         return [object()] * self.conns
 
     def name(self):
+        self.name_calls += 1
         return self._name
 
+    def ppid(self):
+        return self._ppid
+
     def status(self):
         return self._status
 
@@ -167,7 +175,7 @@ class TestMonitorStore:
         store.open()
         assert store._conn is not None
         version = store._conn.execute("SELECT MAX(version) FROM schema_version").fetchone()[0]
-        assert version == 1
+        assert version == 2
         store.close()
 
     def test_insert_and_query(self):
@@ -230,6 +238,65 @@ class TestMonitorStore:
         assert results[0]["ts"] == 9999999999.0
         store.close()
 
+    def test_insert_buffers_until_batch_is_full(self):
+        store = MonitorStore(self.db_path)
+        store.open()
+        assert store._conn is not None
+        now = time.time()
+
+        for index in range(BATCH_SIZE - 1):
+            store.insert({**self._min_sample(), "ts": now + index})
+        assert store._conn.execute("SELECT count(*) FROM resource_samples").fetchone()[0] == 0
+
+        store.insert({**self._min_sample(), "ts": now + BATCH_SIZE})
+        assert store._conn.execute("SELECT count(*) FROM resource_samples").fetchone()[0] == BATCH_SIZE
+        store.close()
+
+    def test_rollups_aggregate_closed_buckets(self):
+        store = MonitorStore(self.db_path)
+        store.open()
+        assert store._conn is not None
+
+        for ts in range(0, 600, 30):
+            store.insert({**self._min_sample(), "ts": float(ts), "rss_mb": float(ts), "threads": ts // 60})
+        store.flush(now=630.0)
+
+        minutes = store._conn.execute(
+            "SELECT ts, samples, rss_mb, rss_mb_min, rss_mb_max FROM resource_rollup_1m"
+        ).fetchall()
+        assert len(minutes) == 10
+        assert minutes[1] == (60.0, 2, 75.0, 60.0, 90.0)
+
+        five = store._conn.execute(
+            "SELECT ts, samples, rss_mb, rss_mb_min, rss_mb_max FROM resource_rollup_5m"
+        ).fetchall()
+        assert five == [(0.0, 10, 135.0, 0.0, 270.0), (300.0, 10, 435.0, 300.0, 570.0)]
+        assert store._conn.execute("SELECT ts, samples FROM resource_rollup_1h").fetchall() == [(0.0, 20)]
+        store.close()
+
+    def test_query_picks_resolution_for_range(self):
+        store = MonitorStore(self.db_path)
+        store.open()
+        now = time.time()
+        start = now - 4 * 3600
+
+        for ts in range(int(start), int(now), 30):
+            store.insert({**self._min_sample(), "ts": float(ts), "process_cpu_percent": 10.0})
+
+        raw = store.query(limit=900, since=now - 3600, interval=30)
+        assert "resolution" not in raw[0]
+        assert 119 <= len(raw) <= 120
+
+        minutes = store.query(limit=100, since=now - 3600, interval=30)
+        assert {row["resolution"] for row in minutes} == {60}
+        assert minutes[0]["process_cpu_percent"] == 10.0
+        assert minutes[0]["process_cpu_percent_max"] == 10.0
+
+        five = store.query(limit=100, since=start, interval=30)
+        assert {row["resolution"] for row in five} == {300}
+        assert 45 <= len(five) <= 49
+        store.close()
+
     @staticmethod
     def _min_sample() -> dict:
         return {
@@ -279,7 +346,7 @@ class TestResourceTracker:
         with patch("app.library.monitor.time.time", return_value=200.0):
             result = tracker.snapshot(range_seconds=120)
 
-        tracker._store.query.assert_called_once_with(limit=900, since=80.0)
+        tracker._store.query.assert_called_once_with(limit=900, since=80.0, interval=tracker._config.monitor_interval)
         assert len(result) == 2
 
 
@@ -301,6 +368,7 @@ class TestMonitorHelpers:
             status="running",
             cmdline=["ffmpeg", "-i", "input"],
             thread_names=["ffmpeg-main", "ffmpeg-io"],
+            ppid=2,
         )
         child = FakeProcess(
             2,
@@ -317,6 +385,7 @@ class TestMonitorHelpers:
             children=[grandchild],
             cmdline=["python", "worker.py"],
             thread_names=["worker-main", "status-updates"],
+            ppid=1,
         )
         root = FakeProcess(
             1,
@@ -344,6 +413,7 @@ class TestMonitorHelpers:
             elapsed=2,
             effective_cpus=2,
             labels={2: "download-abc: Example title"},
+            groups={2: "download"},
         )
 
         assert stats.process_cpu_percent == 125
@@ -365,6 +435,64 @@ class TestMonitorHelpers:
         assert stats.children[1]["display_name"] == "download-abc: Example title"
         assert stats.children[1]["cmdline"] == "python worker.py"
         assert stats.children[1]["thread_names"] == ["worker-main", "status-updates"]
+        assert stats.children[1]["group"] == "download"
+        assert stats.groups == {
+            "download": {"count": 1, "cpu_percent": 50, "rss_mb": 200, "threads": 3},
+            "ffmpeg": {"count": 1, "cpu_percent": 100, "rss_mb": 300, "threads": 2},
+        }
+
+    def test_tree_handles_are_reused_and_pruned(self):
+        def process(pid: int, created: float, ppid: int, children: list | None = None) -> FakeProcess:
+            return FakeProcess(
+                pid,
+                created=created,
+                cpu=1,
+                rss=MB,
+                uss=MB,
+                vms=MB,
+                read=0,
+                write=0,
+                threads=1,
+                files=0,
+                conns=0,
+                children=children,
+                name="aria2c",
+                ppid=ppid,
+            )
+
+        handles = _ProcessHandles()
+        cached = process(3, 3, 2)
+        root = process(1, 1, 0, [process(2, 2, 1, [cached])])
+        stats = _process_tree_stats(
+            root,  # type: ignore
+            last_cpu={},
+            last_io={},
+            elapsed=None,
+            effective_cpus=1,
+            groups={2: "extractor"},
+            handles=handles,
+        )
+        assert len(handles) == 3
+        assert stats.groups["extractor"]["count"] == 2
+
+        fresh = process(3, 3, 2)
+        root = process(1, 1, 0, [process(2, 2, 1, [fresh]), process(4, 4, 1)])
+        stats = _process_tree_stats(
+            root,  # type: ignore
+            last_cpu={},
+            last_io={},
+            elapsed=None,
+            effective_cpus=1,
+            groups={2: "extractor"},
+            handles=handles,
+        )
+        assert cached.name_calls == 1
+        assert fresh.name_calls == 0
+        assert stats.groups["other"]["count"] == 1
+
+        root = process(1, 1, 0, [process(3, 30, 1)])
+        _process_tree_stats(root, last_cpu={}, last_io={}, elapsed=None, effective_cpus=1, handles=handles)  # type: ignore
+        assert len(handles) == 2
 
     def test_disk_labels(self, tmp_path: Path) -> None:
         downloads = tmp_path / "downloads"
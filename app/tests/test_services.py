@@ -1,3 +1,4 @@
+import inspect
 from unittest.mock import patch
 
 import pytest
@@ -331,6 +332,51 @@ class TestServices:
         result = services.handle_sync(lambda_handler)
         assert result == "Lambda: lambda_value"
 
+    def test_handler_plan_is_reused_and_follows_service_changes(self):
+        """Test that handler signatures are inspected once and resolved services follow registry changes."""
+        services = Services()
+        services.add("db", "first")
+
+        class Handler:
+            @classmethod
+            def run(cls, db, user_id=None):
+                return db, user_id
+
+        with patch("app.library.Services.inspect.signature", wraps=inspect.signature) as mock_signature:
+            assert services.handle_sync(Handler.run) == ("first", None)
+            assert services.handle_sync(Handler.run, user_id=1) == ("first", 1)
+            assert mock_signature.call_count == 1, "Bound methods should share a single plan"
+
+        services.add("db", "second")
+        assert services.handle_sync(Handler.run) == ("second", None)
+        services.remove("db")
+        assert services.handle_sync(Handler.run, db="override") == ("override", None)
+
+    @pytest.mark.asyncio
+    async def test_http_handler_uses_cached_plan(self, tmp_path):
+        """Test that HTTP requests reuse the handler plan instead of inspecting the signature each time."""
+        from aiohttp import web
+        from aiohttp.test_utils import make_mocked_request
+
+        from app.library.HttpAPI import HttpAPI
+
+        api = HttpAPI(root_path=tmp_path)
+        Services.get_instance().add("db", "value")
+
+        async def injected(request, db):
+            return web.json_response({"path": request.path, "db": db})
+
+        async def plain(request):
+            return web.json_response({"path": request.path})
+
+        calls = [(handler, make_mocked_request("GET", "/plan")) for handler in (injected, plain, injected, plain)]
+        with patch("app.library.Services.inspect.signature", wraps=inspect.signature) as mock_signature:
+            for handler, request in calls:
+                response = await api._handle(handler, request)
+                assert 200 == response.status
+
+        assert mock_signature.call_count == 2, "Each handler should be inspected once"
+
     def test_service_container_isolation(self):
         """Test that services don't interfere with each other."""
         services = Services()
@@ -1,7 +1,14 @@
+import asyncio
+from unittest.mock import patch
+
 import pytest
+from sqlalchemy import literal, select, text
+from sqlalchemy.exc import OperationalError
 
+from app.features.downloads.repository import rebuild_search_index
+from app.library.config import Config
 from app.library.sqlite_store import SqliteStore
-from app.tests.helpers import make_in_memory_db_path
+from app.tests.helpers import make_in_memory_db_path, temporary_test_dir
 
 
 @pytest.mark.asyncio
@@ -62,3 +69,150 @@ async def test_memory_databases_are_isolated() -> None:
     rows = await second.fetch_raw('SELECT "id" FROM "history" WHERE "id" = ?', ("first",))
     assert rows == []
     await second.close()
+
+
+@pytest.mark.asyncio
+async def test_file_database_shares_one_engine_by_default() -> None:
+    SqliteStore._reset_singleton()
+    with temporary_test_dir("sqlite-shared") as path:
+        store = SqliteStore.get_instance(db_path=str(path / "shared.db"))
+        await store.get_connection()
+        assert store._reader is store._engine
+
+        async with store.sessionmaker()() as session:
+            assert session.sync_session.get_bind(clause=select(literal(1))) is store._engine.sync_engine
+
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_file_database_routes_reads_to_read_only_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Config.get_instance(), "db_read_connections", 2)
+    SqliteStore._reset_singleton()
+    with temporary_test_dir("sqlite-routing") as path:
+        store = SqliteStore.get_instance(db_path=str(path / "routing.db"))
+        await store.get_connection()
+        assert store._reader is not store._engine
+
+        with pytest.raises(OperationalError, match="readonly"):
+            async with store._reader.begin() as conn:
+                await conn.execute(text('DELETE FROM "history"'))
+
+        async with store.sessionmaker()() as session:
+            assert session.sync_session.get_bind(clause=select(literal(1))) is store._reader.sync_engine
+            await session.execute(
+                text('INSERT INTO "history" ("id", "type", "url", "data") VALUES (:id, :type, :url, :data)'),
+                {"id": "routed", "type": "done", "url": "https://example.com/r", "data": "{}"},
+            )
+            assert session.sync_session.get_bind(clause=select(literal(1))) is store._engine.sync_engine
+            assert (await session.execute(text('SELECT count(*) FROM "history"'))).scalar() == 1
+            await session.commit()
+
+            assert session.sync_session.get_bind(clause=select(literal(1))) is store._reader.sync_engine
+
+        rows = await store.fetch_raw('SELECT "id" FROM "history"')
+        assert [row["id"] for row in rows] == ["routed"]
+        await store.close()
+        assert store._reader is None
+
+
+@pytest.mark.asyncio
+async def test_maintenance_checkpoints_analyzes_and_reclaims_pages() -> None:
+    SqliteStore._reset_singleton()
+    with temporary_test_dir("sqlite-maintenance") as path:
+        store = SqliteStore.get_instance(db_path=str(path / "maintenance.db"))
+        assert (await store.maintenance())["last_run"] is None
+
+        rebuilds: list[int] = []
+
+        async def rebuild(conn) -> None:
+            rebuilds.append(1)
+            await rebuild_search_index(conn)
+
+        store.add_vacuum_hook(rebuild)
+        await store.get_connection()
+        for index in range(200):
+            await store.execute_raw(
+                'INSERT INTO "history" ("id", "type", "url", "data") VALUES (?, ?, ?, ?)',
+                (f"item-{index}", "done", f"https://example.com/{index}", '{"title": "' + "x" * 2000 + '"}'),
+            )
+        await store.execute_raw('DELETE FROM "history" WHERE "id" != ?', ("item-0",))
+
+        status = await store.maintenance()
+        assert status["error"] is None
+        assert status["checkpoint"] is None
+        assert status["analyze"]["mode"] == "analyze"
+        assert status["vacuum"]["mode"] == "full"
+        assert status["vacuum"]["interrupted"] is False
+        assert status["vacuum"]["reclaimed_pages"] > 0
+        assert rebuilds == [1], "vacuum hooks run after the full VACUUM"
+
+        await store.execute_raw(
+            'INSERT INTO "history" ("id", "type", "url", "data") VALUES (?, ?, ?, ?)',
+            ("item-1", "done", "https://example.com/1", '{"title": "Searchable"}'),
+        )
+        await store.execute_raw('DELETE FROM "history" WHERE "id" = ?', ("item-0",))
+
+        status = await store.maintenance(force=True)
+        assert status["error"] is None
+        assert status["checkpoint"]["busy"] is False
+        assert status["wal_bytes"] == 0
+        assert status["vacuum"]["mode"] == "incremental"
+        assert status["vacuum"]["reclaimed_pages"] > 0
+        assert store.maintenance_status() == status
+
+        rows = await store.fetch_raw(
+            'SELECT "rowid" FROM "history_search" WHERE "history_search" MATCH ?', ("searchable",)
+        )
+        assert len(rows) == 1
+        await store.close()
+
+
+async def _fragmented_store(path, name: str) -> SqliteStore:
+    SqliteStore._reset_singleton()
+    store = SqliteStore.get_instance(db_path=str(path / f"{name}.db"))
+    await store.get_connection()
+    for index in range(200):
+        await store.execute_raw(
+            'INSERT INTO "history" ("id", "type", "url", "data") VALUES (?, ?, ?, ?)',
+            (f"item-{index}", "done", f"https://example.com/{index}", '{"title": "' + "x" * 2000 + '"}'),
+        )
+    await store.execute_raw('DELETE FROM "history" WHERE "rowid" % 2 = 0')
+    return store
+
+
+@pytest.mark.asyncio
+async def test_full_vacuum_is_deferred_and_bounded() -> None:
+    with temporary_test_dir("sqlite-vacuum-bounds") as path:
+        store = await _fragmented_store(path, "bounds")
+
+        with patch("app.library.sqlite_store._downloads_idle", side_effect=[True, False]):
+            status = await store.maintenance()
+        assert status["vacuum"]["mode"] == "deferred", "downloads started after the first idle check"
+        assert status["vacuum"]["reclaimed_pages"] == 0
+
+        with patch("app.library.sqlite_store.VACUUM_TIME_LIMIT", 1e-6):
+            status = await store.maintenance()
+        assert status["error"] is None
+        assert status["vacuum"]["mode"] == "full"
+        assert status["vacuum"]["interrupted"] is True
+        assert status["vacuum"]["reclaimed_pages"] == 0
+
+        status = await store.maintenance()
+        assert status["vacuum"]["interrupted"] is False
+        assert status["vacuum"]["reclaimed_pages"] > 0
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_maintenance_does_not_wait_for_the_writer_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Config.get_instance(), "db_read_connections", 1)
+    with temporary_test_dir("sqlite-vacuum-writer") as path:
+        store = await _fragmented_store(path, "writer")
+
+        async with store._engine.connect():
+            status = await asyncio.wait_for(store.maintenance(), timeout=10)
+
+        assert status["error"] is None
+        assert status["vacuum"]["mode"] == "full"
+        await store.close()
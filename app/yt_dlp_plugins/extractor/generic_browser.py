@@ -1,8 +1,10 @@
+import atexit
 import base64
 import importlib.util
 import math
 import os
 import re
+import threading
 import time
 import urllib.parse
 from typing import Any
@@ -73,6 +75,10 @@ BROWSER_WAIT_SECONDS = 60.0
 BROWSER_WAIT_MAX_SECONDS = 300.0
 NETWORK_IDLE_SLICE_MS = 500
 HARD_HTTP_STATUSES: set[int] = {404, 410, 500, 502, 503, 504}
+BROWSER_POOL_PAGES = 2
+BROWSER_POOL_IDLE_SECONDS = 120.0
+BROWSER_RETRY_SECONDS = 2.0
+BROWSER_RETRY_MAX_SECONDS = 120.0
 
 MEDIA_CANDIDATE_EXTS: list[str] = [
     "m3u8",
@@ -192,7 +198,296 @@ def _build_media_requests(requests_list: list[dict], media_elements: list[dict])
     return result
 
 
+def _quietly(fn, *args) -> None:
+    try:
+        fn(*args)
+    except Exception:
+        pass
+
+
+class _CdpConnection:
+    """A Playwright instance and its CDP connection, with the pages kept open for reuse."""
+
+    def __init__(self, browser_url: str, timeout: int | None = None) -> None:
+        from playwright.sync_api import sync_playwright
+
+        self.playwright = sync_playwright().start()
+        self.browser = None
+        self.context = None
+        self.owns_context = False
+        self.idle: list[tuple[Any, float]] = []
+        "Pages ready for reuse, with when they were released."
+        self.in_use = 0
+        self.last_used: float = time.monotonic()
+
+        try:
+            self.browser = self.playwright.chromium.connect_over_cdp(browser_url, timeout=timeout or 30000)
+            if self.browser.contexts:
+                self.context = self.browser.contexts[0]
+            else:
+                self.context = self.browser.new_context()
+                self.owns_context = True
+        except Exception:
+            self.close()
+            raise
+
+    def healthy(self) -> bool:
+        try:
+            return self.browser is not None and bool(self.browser.is_connected())
+        except Exception:
+            return False
+
+    def acquire(self):
+        while self.idle:
+            page, _ = self.idle.pop()
+            try:
+                closed = page.is_closed()
+            except Exception:
+                closed = True
+            if not closed:
+                self.in_use += 1
+                return page
+
+        page = self.context.new_page()
+        self.in_use += 1
+        return page
+
+    def release(self, page, reusable: bool = True) -> None:
+        self.in_use = max(0, self.in_use - 1)
+        self.last_used = time.monotonic()
+        if reusable and len(self.idle) < BROWSER_POOL_PAGES:
+            self.idle.append((page, self.last_used))
+            return
+
+        _quietly(page.close)
+
+    def evict(self, now: float) -> bool:
+        """
+        Close the pages idle for longer than BROWSER_POOL_IDLE_SECONDS.
+
+        Returns:
+            bool: True if the connection itself has been unused for that long and should be closed.
+
+        """
+        keep: list[tuple[Any, float]] = []
+        for page, since in self.idle:
+            if now - since >= BROWSER_POOL_IDLE_SECONDS:
+                _quietly(page.close)
+            else:
+                keep.append((page, since))
+        self.idle = keep
+        return self.in_use < 1 and now - self.last_used >= BROWSER_POOL_IDLE_SECONDS
+
+    def close(self) -> None:
+        for page, _ in self.idle:
+            _quietly(page.close)
+        self.idle = []
+        if self.owns_context and self.context is not None:
+            _quietly(self.context.close)
+        if self.browser is not None:
+            _quietly(self.browser.close)
+        _quietly(self.playwright.stop)
+
+
+class _CdpSession:
+    """
+    One extraction on a pooled page.
+
+    Request capture is registered per session, and closing the session removes it, clears the extra
+    headers and parks the page on about:blank, so the next session starts from a clean page.
+    """
+
+    def __init__(self, connection: _CdpConnection, page) -> None:
+        self.closed = False
+        self._connection = connection
+        self._page = page
+        self._requests: list[dict] = []
+        self._pending_api: set[str] = set()
+        self._last_response = None
+        self._headers_set = False
+
+        page.on("request", self._on_request)
+        page.on("response", self._on_response)
+
+    def _on_request(self, request) -> None:
+        resource_type = request.resource_type
+        if resource_type not in REQUEST_RESOURCE_TYPES:
+            return
+        url_str = request.url
+        if resource_type in API_RESOURCE_TYPES:
+            self._pending_api.add(url_str)
+        self._requests.append(
+            {
+                "url": url_str,
+                "method": request.method,
+                "resourceType": resource_type,
+                "headers": dict(request.headers),
+            }
+        )
+
+    def _on_response(self, response) -> None:
+        request = response.request
+        if request.resource_type not in REQUEST_RESOURCE_TYPES:
+            return
+        url_str = response.url
+        self._pending_api.discard(url_str)
+        existing = next(
+            (r for r in self._requests if r.get("url") == url_str and not r.get("response")),
+            None,
+        )
+        payload = {"status": response.status, "headers": dict(response.headers)}
+        if existing:
+            existing["response"] = payload
+        else:
+            self._requests.append(
+                {
+                    "url": url_str,
+                    "method": request.method,
+                    "resourceType": request.resource_type,
+                    "headers": dict(request.headers),
+                    "response": payload,
+                }
+            )
+
+    def goto(
+        self,
+        target_url: str,
+        *,
+        method: str = "GET",
+        headers: dict[str, str] | None = None,
+        data: str | bytes | None = None,
+        timeout: int | None = None,
+    ) -> int | None:
+        page = self._page
+        if headers:
+            page.set_extra_http_headers(headers)
+            self._headers_set = True
+
+        route_handler = None
+        method = method.upper()
+        if method != "GET" or data is not None:
+            main_request_seen = False
+
+            def route_handler(route, request):
+                nonlocal main_request_seen
+                if main_request_seen or not request.is_navigation_request() or request.frame != page.main_frame:
+                    route.continue_()
+                    return
+
+                main_request_seen = True
+                options: dict[str, Any] = {}
+                if method != "GET":
+                    options["method"] = method
+                if data is not None:
+                    options["post_data"] = data
+                route.continue_(**options)
+
+            page.route("**/*", route_handler)
+
+        try:
+            self._last_response = page.goto(target_url, wait_until="domcontentloaded", timeout=timeout)
+        finally:
+            if route_handler is not None:
+                page.unroute("**/*", route_handler)
+        return self._last_response.status if self._last_response else None
+
+    def response_text(self) -> str | None:
+        return self._last_response.text() if self._last_response else None
+
+    def wait_for_selector(self, selector_type: str, expression: str, timeout: float) -> None:
+        selector = f"xpath={expression}" if selector_type == "xpath" else expression
+        self._page.wait_for_selector(selector, timeout=timeout * 1000)
+
+    def wait_for_network_idle(
+        self,
+        idle_timeout=30000,
+        api_poll_interval=500,
+        api_poll_attempts=10,
+        max_total_timeout=60,
+    ):
+        page = self._page
+
+        def wait_fn(timeout_ms):
+            try:
+                page.wait_for_load_state("networkidle", timeout=timeout_ms)
+                return True
+            except Exception:
+                return False
+
+        def wait_for_media_fn(timeout_ms):
+            try:
+                page.wait_for_function(
+                    """() => {
+                        const videos = document.querySelectorAll('video[src], video > source[src]');
+                        const audios = document.querySelectorAll('audio[src], audio > source[src]');
+                        return videos.length > 0 || audios.length > 0;
+                    }""",
+                    timeout=timeout_ms,
+                )
+                return True
+            except Exception:
+                return False
+
+        _wait_for_network_idle(
+            self._requests,
+            wait_fn,
+            wait_for_media_fn,
+            idle_timeout,
+            api_poll_interval,
+            api_poll_attempts,
+            max_total_timeout,
+            self._pending_api,
+        )
+
+    def content(self) -> str:
+        return self._page.content()
+
+    def get_page(self):
+        return self._page
+
+    def get_requests(self) -> list[dict]:
+        return list(self._requests)
+
+    def get_media_requests(self) -> list[dict]:
+        return _build_media_requests(self._requests, self._page.evaluate(MEDIA_ELEMENT_JS))
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+
+        page = self._page
+        reusable = True
+        try:
+            page.remove_listener("request", self._on_request)
+            page.remove_listener("response", self._on_response)
+            if self._headers_set:
+                page.set_extra_http_headers({})
+            page.goto("about:blank")
+        except Exception:
+            reusable = False
+
+        self._connection.release(page, reusable=reusable and self._connection.healthy())
+
+
 class CdpDriver:
+    """
+    Connects to a remote browser over CDP.
+
+    The Playwright sync API is bound to the thread that started it, so connections are pooled per process
+    and thread: each keeps its Playwright instance and CDP connection open, with up to BROWSER_POOL_PAGES
+    idle pages for reuse. Unhealthy connections are replaced and failed connects are retried with an
+    exponential backoff.
+
+    Playwright objects can only be closed from their own thread, so pages and connections idle for longer
+    than BROWSER_POOL_IDLE_SECONDS are evicted when that thread connects again, and a thread that stops
+    using the browser keeps its connection until ``close_all()`` runs on it or the process exits.
+    """
+
+    _connections: dict[tuple[int, int, str], _CdpConnection] = {}
+    _failures: dict[str, tuple[int, float]] = {}
+    "Per browser URL, the consecutive failed connects and when to try again."
+
     @staticmethod
     def is_available() -> bool:
         return importlib.util.find_spec("playwright.sync_api") is not None
@@ -212,216 +507,66 @@ class CdpDriver:
             msg = "Invalid CDP browser URL. Use an absolute http(s) URL"
             raise ValueError(msg)
 
-        from playwright.sync_api import sync_playwright
-
-        playwright = sync_playwright().start()
-        browser = None
-        context = None
-        page = None
-        owns_context = False
-        try:
-            browser = playwright.chromium.connect_over_cdp(browser_url, timeout=timeout or 30000)
-            if browser.contexts:
-                context = browser.contexts[0]
-            else:
-                context = browser.new_context()
-                owns_context = True
-            page = context.new_page()
-        except Exception:
-            if page is not None:
-                try:
-                    page.close()
-                except Exception:
-                    pass
-            if owns_context and context is not None:
-                try:
-                    context.close()
-                except Exception:
-                    pass
-            if browser is not None:
-                try:
-                    browser.close()
-                except Exception:
-                    pass
-            try:
-                playwright.stop()
-            except Exception:
-                pass
-            raise
-
-        requests_list: list[dict] = []
-        pending_api: set[str] = set()
-        last_response = None
+        key = (os.getpid(), threading.get_ident(), browser_url)
+        CdpDriver.evict_idle(keep=key)
 
-        def on_request(request):
-            resource_type = request.resource_type
-            if resource_type not in REQUEST_RESOURCE_TYPES:
-                return
-            url_str = request.url
-            if resource_type in API_RESOURCE_TYPES:
-                pending_api.add(url_str)
-            requests_list.append(
-                {
-                    "url": url_str,
-                    "method": request.method,
-                    "resourceType": resource_type,
-                    "headers": dict(request.headers),
-                }
-            )
+        connection = CdpDriver._connections.get(key)
+        if connection is not None and not connection.healthy():
+            CdpDriver._discard(key)
+            connection = None
 
-        def on_response(response):
-            request = response.request
-            if request.resource_type not in REQUEST_RESOURCE_TYPES:
-                return
-            url_str = response.url
-            pending_api.discard(url_str)
-            existing = next(
-                (r for r in requests_list if r.get("url") == url_str and not r.get("response")),
-                None,
-            )
-            payload = {"status": response.status, "headers": dict(response.headers)}
-            if existing:
-                existing["response"] = payload
-            else:
-                requests_list.append(
-                    {
-                        "url": url_str,
-                        "method": request.method,
-                        "resourceType": request.resource_type,
-                        "headers": dict(request.headers),
-                        "response": payload,
-                    }
-                )
+        if connection is None:
+            failures, retry_at = CdpDriver._failures.get(browser_url, (0, 0.0))
+            if (wait := retry_at - time.monotonic()) > 0:
+                msg = f"Remote browser connection failed {failures} time(s), retrying in {math.ceil(wait)}s"
+                raise ConnectionError(msg)
 
-        page.on("request", on_request)
-        page.on("response", on_response)
-
-        class Session:
-            closed = False
-
-            def goto(
-                self,
-                target_url: str,
-                *,
-                method: str = "GET",
-                headers: dict[str, str] | None = None,
-                data: str | bytes | None = None,
-                timeout: int | None = None,
-            ) -> int | None:
-                nonlocal last_response
-
-                if headers:
-                    page.set_extra_http_headers(headers)
-
-                route_handler = None
-                method = method.upper()
-                if method != "GET" or data is not None:
-                    main_request_seen = False
-
-                    def route_handler(route, request):
-                        nonlocal main_request_seen
-                        if main_request_seen or not request.is_navigation_request() or request.frame != page.main_frame:
-                            route.continue_()
-                            return
-
-                        main_request_seen = True
-                        options: dict[str, Any] = {}
-                        if method != "GET":
-                            options["method"] = method
-                        if data is not None:
-                            options["post_data"] = data
-                        route.continue_(**options)
-
-                    page.route("**/*", route_handler)
+            try:
+                connection = _CdpConnection(browser_url, timeout)
+            except Exception:
+                delay = min(BROWSER_RETRY_MAX_SECONDS, BROWSER_RETRY_SECONDS * 2**failures)
+                CdpDriver._failures[browser_url] = (failures + 1, time.monotonic() + delay)
+                raise
 
-                try:
-                    last_response = page.goto(target_url, wait_until="domcontentloaded", timeout=timeout)
-                finally:
-                    if route_handler is not None:
-                        page.unroute("**/*", route_handler)
-                return last_response.status if last_response else None
-
-            def response_text(self) -> str | None:
-                return last_response.text() if last_response else None
-
-            def wait_for_selector(self, selector_type: str, expression: str, timeout: float) -> None:
-                selector = f"xpath={expression}" if selector_type == "xpath" else expression
-                page.wait_for_selector(selector, timeout=timeout * 1000)
-
-            def wait_for_network_idle(
-                self,
-                idle_timeout=30000,
-                api_poll_interval=500,
-                api_poll_attempts=10,
-                max_total_timeout=60,
-            ):
-                def wait_fn(timeout_ms):
-                    try:
-                        page.wait_for_load_state("networkidle", timeout=timeout_ms)
-                        return True
-                    except Exception:
-                        return False
-
-                def wait_for_media_fn(timeout_ms):
-                    try:
-                        page.wait_for_function(
-                            """() => {
-                                const videos = document.querySelectorAll('video[src], video > source[src]');
-                                const audios = document.querySelectorAll('audio[src], audio > source[src]');
-                                return videos.length > 0 || audios.length > 0;
-                            }""",
-                            timeout=timeout_ms,
-                        )
-                        return True
-                    except Exception:
-                        return False
-
-                _wait_for_network_idle(
-                    requests_list,
-                    wait_fn,
-                    wait_for_media_fn,
-                    idle_timeout,
-                    api_poll_interval,
-                    api_poll_attempts,
-                    max_total_timeout,
-                    pending_api,
-                )
+            CdpDriver._failures.pop(browser_url, None)
+            CdpDriver._connections[key] = connection
 
-            def content(self) -> str:
-                return page.content()
+        try:
+            page = connection.acquire()
+        except Exception:
+            CdpDriver._discard(key)
+            raise
 
-            def get_page(self):
-                return page
+        return _CdpSession(connection, page)
 
-            def get_requests(self) -> list[dict]:
-                return list(requests_list)
+    @staticmethod
+    def evict_idle(keep: tuple[int, int, str] | None = None) -> None:
+        """Close idle pages, and idle connections other than ``keep``, owned by the calling thread."""
+        now = time.monotonic()
+        for key, connection in list(CdpDriver._connections.items()):
+            if key[:2] != (os.getpid(), threading.get_ident()):
+                continue
+            if connection.evict(now) and key != keep:
+                CdpDriver._discard(key)
 
-            def get_media_requests(self) -> list[dict]:
-                return _build_media_requests(requests_list, page.evaluate(MEDIA_ELEMENT_JS))
+    @staticmethod
+    def close_all() -> None:
+        """Close every connection owned by the calling thread."""
+        for key in list(CdpDriver._connections):
+            if key[:2] == (os.getpid(), threading.get_ident()):
+                CdpDriver._discard(key)
 
-            def close(self):
-                if self.closed:
-                    return
-                self.closed = True
+    @staticmethod
+    def _discard(key: tuple[int, int, str]) -> None:
+        if (connection := CdpDriver._connections.pop(key, None)) is not None:
+            connection.close()
 
-                try:
-                    page.close()
-                finally:
-                    try:
-                        if owns_context:
-                            context.close()
-                    finally:
-                        try:
-                            browser.close()
-                        finally:
-                            playwright.stop()
 
-        return Session()
+atexit.register(CdpDriver.close_all)
 
 
 class GenericBrowserIE(GenericIE, plugin_name="browser"):
     _WORKING = True
-    _failed: bool = False
     _remote_browser_failures: dict[str, str] = {}
     _url: str = ""
     __wrapped__: Any
@@ -475,7 +620,7 @@ class GenericBrowserIE(GenericIE, plugin_name="browser"):
     def _real_extract(self, url: str) -> dict[str, Any]:
         self._url = url
 
-        if not (browser_url := self._get_config("url", "YTP_BROWSER_URL")) or self._failed:
+        if not (browser_url := self._get_config("url", "YTP_BROWSER_URL")):
             return self._fallback_extract(url)
 
         video_id: str = self._generic_id(url)
@@ -501,9 +646,7 @@ class GenericBrowserIE(GenericIE, plugin_name="browser"):
         try:
             session = driver.connect(browser_url, timeout)
         except Exception as e:
-            message = str(e)
-            self._failed = True
-            self.report_warning(f"Remote browser unavailable: {message}, marking as failed.", video_id)
+            self.report_warning(f"Remote browser unavailable: {e!s}, falling back to generic extractor.", video_id)
             return self._fallback_extract(url)
 
         fallback_status: int | None = None
@@ -22,6 +22,7 @@ const state = reactive<ConfigState>({
     instance_title: null,
     console_enabled: false,
     monitor_enabled: false,
+    thumb_trickplay: false,
     browser_control_enabled: false,
     file_logging: false,
     is_native: false,
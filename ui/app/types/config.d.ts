@@ -23,6 +23,8 @@ type AppConfig = {
   console_enabled: boolean;
   /** Indicates if resource monitoring is enabled */
   monitor_enabled: boolean;
+  /** Indicates if timeline preview sprites are generated for finished downloads */
+  thumb_trickplay: boolean;
   /** Indicates if the file browser control is enabled */
   browser_control_enabled: boolean;
   /** Indicates if file logging is enabled */
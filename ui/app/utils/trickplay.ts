@@ -0,0 +1,70 @@
+type TrickplayCue = {
+  start: number;
+  end: number;
+  url: string;
+  x: number;
+  y: number;
+  w: number;
+  h: number;
+};
+
+const parseTimestamp = (value: string): number => {
+  const parts = value.trim().split(':').map(Number);
+  if (parts.some((part) => !Number.isFinite(part))) {
+    return Number.NaN;
+  }
+
+  return parts.reduce((total, part) => total * 60 + part, 0);
+};
+
+const parseTrickplay = (vtt: string, baseUrl: string): Array<TrickplayCue> => {
+  const cues: Array<TrickplayCue> = [];
+  const base = baseUrl.endsWith('/') ? baseUrl : `${baseUrl}/`;
+
+  for (const block of vtt.replace(/\r\n/g, '\n').split(/\n{2,}/)) {
+    const lines = block.trim().split('\n');
+    const timeIndex = lines.findIndex((line) => line.includes('-->'));
+    if (timeIndex < 0 || !lines[timeIndex + 1]) {
+      continue;
+    }
+
+    const [startRaw = '', endRaw = ''] = (lines[timeIndex] as string).split('-->');
+    const [file = '', fragment = ''] = (lines[timeIndex + 1] as string).trim().split('#xywh=');
+    const [x, y, w, h] = fragment.split(',').map(Number);
+    const start = parseTimestamp(startRaw);
+    const end = parseTimestamp(endRaw);
+
+    if (!file || [start, end, x, y, w, h].some((value) => !Number.isFinite(value))) {
+      continue;
+    }
+
+    cues.push({ start, end, url: `${base}${file}`, x: x!, y: y!, w: w!, h: h! });
+  }
+
+  return cues;
+};
+
+const findTrickplayCue = (cues: Array<TrickplayCue>, time: number): TrickplayCue | null => {
+  let low = 0;
+  let high = cues.length - 1;
+
+  while (low <= high) {
+    const mid = (low + high) >> 1;
+    const cue = cues[mid] as TrickplayCue;
+
+    if (time < cue.start) {
+      high = mid - 1;
+    } else if (time >= cue.end) {
+      low = mid + 1;
+    } else {
+      return cue;
+    }
+  }
+
+  return cues.length > 0 && time >= (cues[cues.length - 1] as TrickplayCue).end
+    ? (cues[cues.length - 1] as TrickplayCue)
+    : null;
+};
+
+export { findTrickplayCue, parseTrickplay };
+export type { TrickplayCue };
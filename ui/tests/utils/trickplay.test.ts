@@ -0,0 +1,54 @@
+import { describe, expect, it } from 'bun:test';
+
+const VTT = [
+  'WEBVTT',
+  '',
+  '00:00:00.000 --> 00:00:10.000',
+  'sprite-001.jpg#xywh=0,0,240,136',
+  '',
+  '00:00:10.000 --> 00:00:20.000',
+  'sprite-001.jpg#xywh=240,0,240,136',
+  '',
+  '01:00:00.000 --> 01:00:05.500',
+  'sprite-002.jpg#xywh=0,136,240,136',
+  '',
+].join('\n');
+
+describe('trickplay utils', () => {
+  it('parse_cues', async () => {
+    const { parseTrickplay } = await import('~/utils/trickplay');
+
+    const cues = parseTrickplay(VTT, '/api/history/abc/trickplay');
+
+    expect(cues).toHaveLength(3);
+    expect(cues[0]).toEqual({
+      start: 0,
+      end: 10,
+      url: '/api/history/abc/trickplay/sprite-001.jpg',
+      x: 0,
+      y: 0,
+      w: 240,
+      h: 136,
+    });
+    expect(cues[2]?.start).toBe(3600);
+    expect(cues[2]?.end).toBe(3605.5);
+  });
+
+  it('skip_invalid_cues', async () => {
+    const { parseTrickplay } = await import('~/utils/trickplay');
+
+    expect(parseTrickplay('WEBVTT\n\n00:00:00.000 --> 00:00:10.000\nsprite-001.jpg\n', '/x/')).toHaveLength(0);
+  });
+
+  it('find_cue', async () => {
+    const { findTrickplayCue, parseTrickplay } = await import('~/utils/trickplay');
+
+    const cues = parseTrickplay(VTT, '/t/');
+
+    expect(findTrickplayCue(cues, 12)?.x).toBe(240);
+    expect(findTrickplayCue(cues, 10)?.x).toBe(240);
+    expect(findTrickplayCue(cues, 9999)?.url).toBe('/t/sprite-002.jpg');
+    expect(findTrickplayCue(cues, 30)).toBeNull();
+    expect(findTrickplayCue([], 1)).toBeNull();
+  });
+});